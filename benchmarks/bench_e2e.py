@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput and overhead benchmarks, run against the local
+`magic_hour.testing.MockMagicHour` stand-in (no network, no credits).
+
+WHAT IT MEASURES:
+- `overhead`: microseconds the SDK adds per `create()` and per `get()`, compared with
+  a bare `httpx` request sent through the same mock transport
+- `throughput`: jobs per second, CPU time and per-job latency percentiles for N
+  concurrent `generate()` calls (upload-free image jobs, with downloads), using
+  sync threads sharing one `Client` and async tasks sharing one `AsyncClient`
+- `transfer`: upload and download throughput and the peak RSS of the uploading /
+  downloading process, per file size, over real HTTP to `MockMagicHour.serve()`
+  (the server runs in this process and streams bodies, so the RSS is the SDK's)
+- `import`: the `import` and `client` scenarios of `bench_import.py`
+- `scheduler`: N jobs tracked at once by async `generate()` calls (each polling its
+  own project), reporting wall time beyond the render time, polls and requests per
+  second, CPU time and event-loop lag
+
+USAGE:
+    python benchmarks/bench_e2e.py                                  # everything
+    python benchmarks/bench_e2e.py --sections overhead,throughput --output e2e.json
+    python benchmarks/bench_e2e.py --sections transfer --transfer-sizes 100MB,1GB,5GB
+    python benchmarks/bench_e2e.py --sections scheduler --scheduler-jobs 100,1000,10000
+
+Results are printed as JSON with the SDK version, so runs can be compared across
+releases.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import httpx
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import typing
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from magic_hour.testing import MOCK_BASE_URL, MockMagicHour
+
+import bench_import
+
+
+SECTIONS = ("overhead", "throughput", "transfer", "import", "scheduler")
+
+_CREATE_ARGS: typing.Dict[str, typing.Any] = {
+    "image_count": 1,
+    "orientation": "square",
+    "style": {"prompt": "a lighthouse at golden hour"},
+}
+_CREATE_BODY = {"name": "bench", **_CREATE_ARGS}
+_AUTH = {"Authorization": "Bearer mock-token"}
+
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?B)\s*$", re.IGNORECASE)
+_UNITS = {"B": 1, "KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+
+_TRANSFER_CHILD = """
+import json, resource, sys, time, types
+from magic_hour import Client
+from magic_hour.helpers.download import download_files_sync
+
+mode, url, path = sys.argv[1:4]
+client = Client(token="mock-token", base_url=url)
+before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if mode == "upload":
+    client.v1.files.upload_file(path)
+else:
+    download = types.SimpleNamespace(url=url + "/cdn/bench/bench.mp4")
+    download_files_sync([download], download_directory=path)
+seconds = time.perf_counter() - start
+after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": seconds, "before_kb": before_kb, "after_kb": after_kb}))
+"""
+
+
+def sdk_version() -> str:
+    with open(os.path.join(REPO_ROOT, "pyproject.toml")) as f:
+        match = re.search(r'^version = "([^"]+)"', f.read(), re.MULTILINE)
+    return match.group(1) if match else "unknown"
+
+
+def parse_size(value: str) -> int:
+    match = _SIZE.match(value)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+
+def _ints(value: str) -> typing.List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def _percentiles(values: typing.List[float]) -> typing.Dict[str, float]:
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+    return {"p50": at(0.5), "p95": at(0.95), "max": round(ordered[-1], 4)}
+
+
+def bench_overhead(number: int, repeat: int) -> typing.Dict[str, typing.Any]:
+    mock = MockMagicHour()
+    client = mock.client()
+    raw = httpx.Client(transport=mock.transport())
+    project_id = client.v1.ai_image_generator.create(**_CREATE_ARGS).id
+
+    calls: typing.Dict[str, typing.Callable[[], typing.Any]] = {
+        "create": lambda: client.v1.ai_image_generator.create(**_CREATE_ARGS),
+        "create_raw": lambda: raw.post(
+            f"{MOCK_BASE_URL}/v1/ai-image-generator", json=_CREATE_BODY, headers=_AUTH
+        ),
+        "get": lambda: client.v1.image_projects.get(id=project_id),
+        "get_raw": lambda: raw.get(
+            f"{MOCK_BASE_URL}/v1/image-projects/{project_id}", headers=_AUTH
+        ),
+    }
+    results: typing.Dict[str, typing.Any] = {}
+    for name, fn in calls.items():
+        best = min(timeit.repeat(fn, number=number, repeat=repeat))
+        results[f"{name}_us"] = round(best / number * 1e6, 2)
+        mock.requests.clear()
+    for name in ("create", "get"):
+        results[f"{name}_overhead_us"] = round(
+            results[f"{name}_us"] - results[f"{name}_raw_us"], 2
+        )
+    return results
+
+
+def _throughput_result(
+    concurrency: int,
+    latencies: typing.List[float],
+    seconds: float,
+    cpu_seconds: float,
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "concurrency": concurrency,
+        "jobs": len(latencies),
+        "seconds": round(seconds, 3),
+        "jobs_per_second": round(len(latencies) / seconds, 2),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "latency_seconds": _percentiles(latencies),
+    }
+
+
+def bench_throughput_sync(
+    mock: MockMagicHour, concurrency: int, jobs: int, directory: str
+) -> typing.Dict[str, typing.Any]:
+    client = mock.client()
+
+    def job() -> float:
+        start = time.perf_counter()
+        client.v1.ai_image_generator.generate(
+            **_CREATE_ARGS, download_directory=directory
+        )
+        return time.perf_counter() - start
+
+    cpu, start = time.process_time(), time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda _: job(), range(jobs)))
+    return _throughput_result(
+        concurrency, latencies, time.perf_counter() - start, time.process_time() - cpu
+    )
+
+
+async def bench_throughput_async(
+    mock: MockMagicHour, concurrency: int, jobs: int, directory: str
+) -> typing.Dict[str, typing.Any]:
+    client = mock.async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def job() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.v1.ai_image_generator.generate(
+                **_CREATE_ARGS, download_directory=directory
+            )
+            return time.perf_counter() - start
+
+    cpu, start = time.process_time(), time.perf_counter()
+    latencies = await asyncio.gather(*(job() for _ in range(jobs)))
+    return _throughput_result(
+        concurrency,
+        list(latencies),
+        time.perf_counter() - start,
+        time.process_time() - cpu,
+    )
+
+
+def bench_throughput(
+    levels: typing.List[int],
+    jobs_per_worker: int,
+    render_seconds: float,
+    latency_seconds: float,
+) -> typing.Dict[str, typing.Any]:
+    results: typing.Dict[str, typing.Any] = {
+        "render_seconds": render_seconds,
+        "latency_seconds": latency_seconds,
+        "sync_threads": [],
+        "async_tasks": [],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for concurrency in levels:
+            jobs = concurrency * jobs_per_worker
+            mock = MockMagicHour(
+                render_seconds=render_seconds, latency_seconds=latency_seconds
+            )
+            results["sync_threads"].append(
+                bench_throughput_sync(mock, concurrency, jobs, directory)
+            )
+            mock = MockMagicHour(
+                render_seconds=render_seconds, latency_seconds=latency_seconds
+            )
+            results["async_tasks"].append(
+                asyncio.run(bench_throughput_async(mock, concurrency, jobs, directory))
+            )
+    return results
+
+
+def _run_transfer_child(mode: str, url: str, path: str) -> typing.Dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _TRANSFER_CHILD, mode, url, path],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return typing.cast(
+        typing.Dict[str, float], json.loads(out.stdout.strip().splitlines()[-1])
+    )
+
+
+def bench_transfer(
+    sizes: typing.List[int],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    results = []
+    mock = MockMagicHour()
+    with mock.serve() as url, tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            source = os.path.join(directory, "source.mp4")
+            with open(source, "wb") as f:
+                f.truncate(size)  # sparse, so creating multi-gigabyte files is cheap
+            mock.output_bytes = size
+
+            result: typing.Dict[str, typing.Any] = {"bytes": size}
+            for mode, path in (("upload", source), ("download", directory)):
+                child = _run_transfer_child(mode, url, path)
+                result[mode] = {
+                    "seconds": round(child["seconds"], 3),
+                    "mb_per_second": round(size / (1 << 20) / child["seconds"], 1),
+                    "peak_rss_mb": round(child["after_kb"] / 1024, 1),
+                    "rss_growth_mb": round(
+                        (child["after_kb"] - child["before_kb"]) / 1024, 1
+                    ),
+                }
+            results.append(result)
+            os.remove(source)
+            downloaded = os.path.join(directory, "bench.mp4")
+            if os.path.exists(downloaded):
+                os.remove(downloaded)
+    return results
+
+
+def bench_imports(runs: int) -> typing.Dict[str, typing.Any]:
+    return {
+        name: bench_import.run_scenario(bench_import.SCENARIOS[name], runs)
+        for name in ("import", "client")
+    }
+
+
+async def _track_jobs(jobs: int, render_seconds: float) -> typing.Dict[str, typing.Any]:
+    mock = MockMagicHour(render_seconds=render_seconds)
+    client = mock.async_client()
+    lags: typing.List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        # how late the event loop wakes a task that asked to sleep for 10ms
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    lag_task = asyncio.ensure_future(ticker())
+    cpu, start = time.process_time(), time.perf_counter()
+    await asyncio.gather(
+        *(
+            client.v1.ai_image_generator.generate(
+                **_CREATE_ARGS, download_outputs=False
+            )
+            for _ in range(jobs)
+        )
+    )
+    seconds = time.perf_counter() - start
+    cpu_seconds = time.process_time() - cpu
+    done.set()
+    await lag_task
+
+    polls = sum(1 for r in mock.requests if r.method == "GET")
+    return {
+        "jobs": jobs,
+        "seconds": round(seconds, 3),
+        "overhead_seconds": round(seconds - render_seconds, 3),
+        "polls_per_job": round(polls / jobs, 2),
+        "requests_per_second": round(len(mock.requests) / seconds, 1),
+        "cpu_seconds": round(cpu_seconds, 3),
+        "loop_lag_seconds": _percentiles(lags or [0.0]),
+    }
+
+
+def bench_scheduler(
+    levels: typing.List[int], render_seconds: float
+) -> typing.Dict[str, typing.Any]:
+    return {
+        "render_seconds": render_seconds,
+        "poll_interval": float(os.environ["MAGIC_HOUR_POLL_INTERVAL"]),
+        "levels": [asyncio.run(_track_jobs(jobs, render_seconds)) for jobs in levels],
+    }
+
+
+def run(args: argparse.Namespace) -> typing.Dict[str, typing.Any]:
+    sections = [s for s in args.sections.split(",") if s]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        raise SystemExit(f"unknown sections: {', '.join(sorted(unknown))}")
+
+    results: typing.Dict[str, typing.Any] = {
+        "benchmark": "e2e",
+        "sdk_version": sdk_version(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+    }
+    if "overhead" in sections:
+        results["overhead"] = bench_overhead(args.number, args.repeat)
+    if "throughput" in sections:
+        results["throughput"] = bench_throughput(
+            _ints(args.concurrency),
+            args.jobs_per_worker,
+            args.render_seconds,
+            args.latency_seconds,
+        )
+    if "transfer" in sections:
+        results["transfer"] = bench_transfer(
+            [parse_size(s) for s in args.transfer_sizes.split(",") if s]
+        )
+    if "import" in sections:
+        results["import"] = bench_imports(args.import_runs)
+    if "scheduler" in sections:
+        results["scheduler"] = bench_scheduler(
+            _ints(args.scheduler_jobs), args.render_seconds
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SDK end-to-end benchmark")
+    parser.add_argument(
+        "--sections",
+        default=",".join(SECTIONS),
+        help=f"Comma-separated subset of: {', '.join(SECTIONS)}",
+    )
+    parser.add_argument("--number", type=int, default=500, help="Calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds (best is kept)")
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--jobs-per-worker", type=int, default=4)
+    parser.add_argument("--render-seconds", type=float, default=0.5)
+    parser.add_argument("--latency-seconds", type=float, default=0.01)
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--transfer-sizes", default="100MB")
+    parser.add_argument("--import-runs", type=int, default=3)
+    parser.add_argument("--scheduler-jobs", default="100,1000,10000")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    os.environ["MAGIC_HOUR_POLL_INTERVAL"] = str(args.poll_interval)
+    rendered = json.dumps(run(args), indent=2)
+    print(rendered)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(rendered + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Import-time and memory benchmark for the SDK.
+
+WHAT IT MEASURES:
+Each scenario runs in a fresh interpreter (so module caches don't leak between runs)
+and reports the median over `--runs`:
+- `import`: `import magic_hour`
+- `client`: `import magic_hour` + `Client(token=...)`
+- `first_resource`: the above + first access of one resource client (`client.v1.face_swap`)
+- `all_resources`: the above + every resource client on `client.v1`
+
+For every scenario it records wall-clock milliseconds, the number of `magic_hour`
+modules imported, the peak Python heap allocated while importing (tracemalloc) and
+the process max RSS.
+
+USAGE:
+    python benchmarks/bench_import.py                      # print JSON results
+    python benchmarks/bench_import.py --runs 10 --output bench_output.txt
+    python benchmarks/bench_import.py --max-client-ms 800  # exit 1 on regression
+
+The `--max-*` flags make the script usable as a CI regression gate.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import typing
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS: typing.Dict[str, str] = {
+    "import": "",
+    "client": "client = magic_hour.Client(token='bench')",
+    "first_resource": (
+        "client = magic_hour.Client(token='bench')\nclient.v1.face_swap"
+    ),
+    "all_resources": (
+        "client = magic_hour.Client(token='bench')\n"
+        "for name in [n for n in dir(type(client.v1)) if not n.startswith('_')]:\n"
+        "    getattr(client.v1, name)"
+    ),
+}
+
+_CHILD_TEMPLATE = """
+import json, sys, time, tracemalloc
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+import magic_hour
+{body}
+elapsed_ms = (time.perf_counter() - start) * 1000
+_, peak = tracemalloc.get_traced_memory()
+try:
+    import resource
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss_kb //= 1024
+except ImportError:
+    max_rss_kb = None
+print(json.dumps({{
+    "elapsed_ms": elapsed_ms,
+    "sdk_modules": len([m for m in sys.modules if m.split(".")[0] == "magic_hour"]),
+    "total_modules": len(sys.modules),
+    "traced_peak_kb": peak / 1024,
+    "max_rss_kb": max_rss_kb,
+}}))
+"""
+
+
+def _run_child(body: str, trace: bool) -> typing.Dict[str, typing.Any]:
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD_TEMPLATE.format(body=body, trace=trace)],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return typing.cast(
+        typing.Dict[str, typing.Any], json.loads(out.stdout.strip().splitlines()[-1])
+    )
+
+
+def run_scenario(body: str, runs: int) -> typing.Dict[str, typing.Any]:
+    # tracemalloc slows imports down considerably, so timings come from untraced
+    # runs and the heap peak from a single traced run.
+    samples = [_run_child(body, trace=False) for _ in range(runs)]
+    traced = _run_child(body, trace=True)
+
+    def median(key: str) -> typing.Optional[float]:
+        values = [s[key] for s in samples if s[key] is not None]
+        return round(statistics.median(values), 2) if values else None
+
+    return {
+        "runs": runs,
+        "elapsed_ms": median("elapsed_ms"),
+        "elapsed_ms_min": round(min(s["elapsed_ms"] for s in samples), 2),
+        "sdk_modules": samples[-1]["sdk_modules"],
+        "total_modules": samples[-1]["total_modules"],
+        "traced_peak_kb": round(traced["traced_peak_kb"], 2),
+        "max_rss_kb": median("max_rss_kb"),
+    }
+
+
+def run(runs: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "benchmark": "import",
+        "python": sys.version.split()[0],
+        "scenarios": {
+            name: run_scenario(body, runs) for name, body in SCENARIOS.items()
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SDK import-time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument(
+        "--max-client-ms",
+        type=float,
+        help="Fail if the median `client` scenario exceeds this many milliseconds",
+    )
+    parser.add_argument(
+        "--max-client-modules",
+        type=int,
+        help="Fail if the `client` scenario imports more magic_hour modules than this",
+    )
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    rendered = json.dumps(results, indent=2)
+    print(rendered)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(rendered + "\n")
+
+    client = results["scenarios"]["client"]
+    failures: typing.List[str] = []
+    if args.max_client_ms is not None and client["elapsed_ms"] > args.max_client_ms:
+        failures.append(
+            f"client scenario took {client['elapsed_ms']}ms (max {args.max_client_ms}ms)"
+        )
+    if (
+        args.max_client_modules is not None
+        and client["sdk_modules"] > args.max_client_modules
+    ):
+        failures.append(
+            f"client scenario imported {client['sdk_modules']} SDK modules "
+            f"(max {args.max_client_modules})"
+        )
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Response parsing microbenchmarks.
+
+WHAT IT MEASURES:
+The CPU cost of turning one JSON response body into an SDK model, per response
+type, with each strategy:
+- `from_encodable`: the generic `make_api_request` path, `json.loads` followed by
+  validation through a pydantic model class that is built on every call
+- `loads_validate`: `json.loads` followed by a cached `TypeAdapter`
+- `validate_json`: the SDK's path, decoding and validating the body in one pass
+  with a cached `TypeAdapter`
+- `construct`: `json.loads` + unvalidated `model_construct` of the top-level model
+  (nested models left as dicts), for reference
+
+For project responses it also measures:
+- `poll_in_progress`: what `check_result` pays per poll while a project is still
+  rendering (only `status` is decoded)
+- `dump_rebuild` / `copy_with_fields`: turning a get response into the
+  `...WithDownloads` model returned by `check_result`, the old and the new way
+
+All numbers are microseconds per call (best of `--repeat` rounds of `--number` calls).
+
+USAGE:
+    python benchmarks/bench_parse.py
+    python benchmarks/bench_parse.py --number 5000 --output bench_parse.json
+"""
+
+import argparse
+import httpx
+import json
+import os
+import sys
+import timeit
+import typing
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from magic_hour.helpers.response_parsing import (
+    _type_adapter,
+    copy_with_fields,
+    decode_poll,
+    parse_json_model,
+)
+from magic_hour.resources.v1.audio_projects import (
+    V1AudioProjectsGetResponseWithDownloads,
+)
+from magic_hour.resources.v1.image_projects import (
+    V1ImageProjectsGetResponseWithDownloads,
+)
+from magic_hour.resources.v1.video_projects import (
+    V1VideoProjectsGetResponseWithDownloads,
+)
+from magic_hour.types import models
+from make_api_request import from_encodable
+
+
+_DOWNLOADS = [
+    {
+        "expires_at": "2024-10-19T05:16:19.027Z",
+        "url": f"https://videos.magichour.ai/id/output-{i}.mp4",
+    }
+    for i in range(3)
+]
+_PROJECT_COMMON: typing.Dict[str, typing.Any] = {
+    "created_at": "2024-10-18T05:16:19.027Z",
+    "credits_charged": 450,
+    "downloads": _DOWNLOADS,
+    "enabled": True,
+    "error": None,
+    "id": "cuid-example",
+    "name": "Example Name",
+    "status": "complete",
+}
+
+PAYLOADS: typing.Dict[
+    str, typing.Tuple[typing.Type[typing.Any], typing.Dict[str, typing.Any]]
+] = {
+    "video_project": (
+        models.V1VideoProjectsGetResponse,
+        {
+            **_PROJECT_COMMON,
+            "download": _DOWNLOADS[0],
+            "end_seconds": 15.0,
+            "fps": 30.0,
+            "height": 960,
+            "start_seconds": 0.0,
+            "total_frame_cost": 450,
+            "type": "FACE_SWAP",
+            "width": 512,
+        },
+    ),
+    "image_project": (
+        models.V1ImageProjectsGetResponse,
+        {
+            **_PROJECT_COMMON,
+            "image_count": 3,
+            "total_frame_cost": 5,
+            "type": "AI_IMAGE",
+        },
+    ),
+    "audio_project": (
+        models.V1AudioProjectsGetResponse,
+        {**_PROJECT_COMMON, "type": "VOICE_GENERATOR"},
+    ),
+    "face_detection": (
+        models.V1FaceDetectionGetResponse,
+        {
+            "credits_charged": 0,
+            "faces": [
+                {
+                    "path": f"api-assets/id/{i}.png",
+                    "url": f"https://videos.magichour.ai/id/{i}.png",
+                }
+                for i in range(4)
+            ],
+            "id": "uuid-example",
+            "status": "complete",
+        },
+    ),
+    "upload_urls": (
+        models.V1FilesUploadUrlsCreateResponse,
+        {
+            "items": [
+                {
+                    "expires_at": "2024-07-25T16:56:21.932Z",
+                    "file_path": f"api-assets/id/video-{i}.mp4",
+                    "upload_url": f"https://videos.magichour.ai/api-assets/id/video-{i}.mp4?auth-value=1234567890",
+                }
+                for i in range(2)
+            ]
+        },
+    ),
+    "create": (
+        models.V1FaceSwapCreateResponse,
+        {"credits_charged": 450, "estimated_frame_cost": 450, "id": "cuid-example"},
+    ),
+}
+
+_WITH_DOWNLOADS: typing.Dict[str, typing.Type[typing.Any]] = {
+    "video_project": V1VideoProjectsGetResponseWithDownloads,
+    "image_project": V1ImageProjectsGetResponseWithDownloads,
+    "audio_project": V1AudioProjectsGetResponseWithDownloads,
+}
+
+
+def _per_call_us(
+    fn: typing.Callable[[], typing.Any], number: int, repeat: int
+) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return round(best / number * 1e6, 3)
+
+
+def bench_payload(name: str, number: int, repeat: int) -> typing.Dict[str, float]:
+    model, data = PAYLOADS[name]
+
+    def measure(fn: typing.Callable[[], typing.Any]) -> float:
+        return _per_call_us(fn, number, repeat)
+
+    body = json.dumps(data).encode()
+    adapter = _type_adapter(model)
+    results = {
+        "from_encodable": measure(
+            lambda: from_encodable(data=json.loads(body), load_with=model)
+        ),
+        "loads_validate": measure(lambda: adapter.validate_python(json.loads(body))),
+        "validate_json": measure(lambda: parse_json_model(model, body)),
+        "construct": measure(lambda: model.model_construct(**json.loads(body))),
+    }
+
+    if name in _WITH_DOWNLOADS:
+        rendering = httpx.Response(
+            200, content=json.dumps({**data, "status": "rendering"}).encode()
+        )
+        results["poll_in_progress"] = measure(lambda: decode_poll(rendering, model))
+
+        wrapper = _WITH_DOWNLOADS[name]
+        parsed = parse_json_model(model, body)
+        results["dump_rebuild"] = measure(lambda: wrapper(**parsed.model_dump()))
+        results["copy_with_fields"] = measure(lambda: copy_with_fields(wrapper, parsed))
+
+    return results
+
+
+def run(number: int, repeat: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "benchmark": "parse",
+        "python": sys.version.split()[0],
+        "unit": "us_per_call",
+        "number": number,
+        "repeat": repeat,
+        "responses": {name: bench_payload(name, number, repeat) for name in PAYLOADS},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SDK response parsing benchmark")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds (best is kept)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    rendered = json.dumps(run(args.number, args.repeat), indent=2)
+    print(rendered)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(rendered + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Request construction microbenchmarks.
+
+WHAT IT MEASURES:
+The CPU cost of turning `create()` arguments into an HTTP request, for the create
+bodies with the largest style types (`V1VideoToVideoCreateBodyStyle`,
+`V1AnimationCreateBodyStyle`, `V1AiVoiceGeneratorCreateBodyStyle`):
+- `to_encodable_uncached`: `make_api_request.to_encodable`, which builds a new
+  `TypeAdapter` for the `_Serializer*` class on every request
+- `to_encodable_cached`: the SDK's `to_encodable`, adapter compiled once
+- `encode_<codec>`: encoding the serialized body to JSON bytes with each available
+  `JsonCodec` (`json` always, `orjson` if installed)
+- `build_request_<codec>`: the full `create()` request construction (serializer +
+  `build_request` + `httpx.Request`), without sending it
+
+It also reports the one-off cost of `precompile()` in a fresh interpreter.
+
+All numbers are microseconds per call (best of `--repeat` rounds of `--number` calls).
+
+USAGE:
+    python benchmarks/bench_serialize.py
+    python benchmarks/bench_serialize.py --number 5000 --output bench_serialize.json
+"""
+
+import argparse
+import httpx
+import json
+import os
+import subprocess
+import sys
+import timeit
+import typing
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from magic_hour import Client
+from magic_hour.helpers.json_codec import JsonCodec, OrjsonCodec
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.types import params
+from make_api_request import to_encodable as to_encodable_uncached
+
+
+BODIES: typing.Dict[
+    str, typing.Tuple[str, typing.Any, typing.Dict[str, typing.Any]]
+] = {
+    "video_to_video": (
+        "/v1/video-to-video",
+        params._SerializerV1VideoToVideoCreateBody,
+        {
+            "name": "Video To Video video",
+            "assets": {
+                "video_source": "file",
+                "video_file_path": "api-assets/id/1234.mp4",
+            },
+            "end_seconds": 15.0,
+            "start_seconds": 0.0,
+            "fps_resolution": "HALF",
+            "height": 960,
+            "width": 512,
+            "style": {
+                "art_style": "3D Render",
+                "model": "default",
+                "prompt": "a cinematic portrait, golden hour",
+                "prompt_type": "append_default",
+                "version": "default",
+            },
+        },
+    ),
+    "animation": (
+        "/v1/animation",
+        params._SerializerV1AnimationCreateBody,
+        {
+            "name": "Animation video",
+            "assets": {
+                "audio_source": "file",
+                "audio_file_path": "api-assets/id/1234.mp3",
+                "image_file_path": "api-assets/id/1234.png",
+            },
+            "end_seconds": 15.0,
+            "fps": 12.0,
+            "height": 960,
+            "width": 512,
+            "style": {
+                "art_style": "Painterly Illustration",
+                "camera_effect": "Accelerate",
+                "prompt": "Cyberpunk city",
+                "prompt_type": "custom",
+                "transition_speed": 5,
+            },
+        },
+    ),
+    "ai_voice_generator": (
+        "/v1/ai-voice-generator",
+        params._SerializerV1AiVoiceGeneratorCreateBody,
+        {
+            "name": "Voice Generator audio",
+            "style": {"prompt": "Hello, how are you?", "voice_name": "Elon Musk"},
+        },
+    ),
+}
+
+
+def _codecs() -> typing.Dict[str, JsonCodec]:
+    codecs: typing.Dict[str, JsonCodec] = {"json": JsonCodec()}
+    try:
+        codecs["orjson"] = OrjsonCodec()
+    except ImportError:
+        pass
+    return codecs
+
+
+def _per_call_us(
+    fn: typing.Callable[[], typing.Any], number: int, repeat: int
+) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return round(best / number * 1e6, 3)
+
+
+def bench_body(name: str, number: int, repeat: int) -> typing.Dict[str, float]:
+    path, serializer, item = BODIES[name]
+
+    def measure(fn: typing.Callable[[], typing.Any]) -> float:
+        return _per_call_us(fn, number, repeat)
+
+    results = {
+        "to_encodable_uncached": measure(
+            lambda: to_encodable_uncached(item=item, dump_with=serializer)
+        ),
+        "to_encodable_cached": measure(
+            lambda: to_encodable(item=item, dump_with=serializer)
+        ),
+    }
+
+    encoded = to_encodable(item=item, dump_with=serializer)
+    for codec_name, codec in _codecs().items():
+        results[f"encode_{codec_name}"] = measure(lambda: codec.dumps(encoded))
+
+        base_client = Client(token="bench", json_codec=codec)._base_client
+
+        def build() -> httpx.Request:
+            cfg = base_client.build_request(
+                method="POST",
+                path=path,
+                auth_names=["bearerAuth"],
+                json=to_encodable(item=item, dump_with=serializer),
+            )
+            return base_client.httpx_client.build_request(**cfg)
+
+        results[f"build_request_{codec_name}"] = measure(build)
+
+    return results
+
+
+def bench_precompile() -> typing.Dict[str, float]:
+    script = (
+        "import json, time\n"
+        "start = time.perf_counter()\n"
+        "from magic_hour.helpers import precompile\n"
+        "count = precompile()\n"
+        "print(json.dumps({'types': count, 'ms': (time.perf_counter() - start) * 1000}))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    return {"types": result["types"], "ms": round(result["ms"], 2)}
+
+
+def run(number: int, repeat: int) -> typing.Dict[str, typing.Any]:
+    return {
+        "benchmark": "serialize",
+        "python": sys.version.split()[0],
+        "unit": "us_per_call",
+        "number": number,
+        "repeat": repeat,
+        "codecs": list(_codecs()),
+        "bodies": {name: bench_body(name, number, repeat) for name in BODIES},
+        "precompile": bench_precompile(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SDK request construction benchmark")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds (best is kept)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    rendered = json.dumps(run(args.number, args.repeat), indent=2)
+    print(rendered)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(rendered + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
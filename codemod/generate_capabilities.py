@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Script to generate magic_hour/types/capabilities.py, the per-model capability table
+the SDK checks requests against before sending them.
+
+WHAT IT DOES:
+- Reads the create() docstring of every resource client
+- Picks out the per-model rules the API documents there:
+  - "Supported resolutions: ..." / "Supports ..." lists of `resolution` values
+  - "Image count allowed: ..." lists of `image_count` values
+  - "Max additional input images: N" limits on `assets.image_file_paths`
+  - per-model `end_seconds` duration lists
+  - "Not supported" `audio`
+- Writes them to magic_hour/types/capabilities.py as plain literals
+
+WHEN TO RUN:
+- After SDK regeneration, so new models and changed limits are picked up
+- In CI/CD pipeline with --check to catch a stale table
+
+USAGE:
+    python codemod/generate_capabilities.py            # Regenerate the table
+    python codemod/generate_capabilities.py --check    # Fail if it is out of date
+
+EXIT CODES:
+    0 - The table was written, or is up to date
+    1 - The table is out of date (--check)
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+OUTPUT_PATH = os.path.join("magic_hour", "types", "capabilities.py")
+
+HEADER = '''"""
+Per-model capabilities of each resource, as documented by the API.
+
+Generated by codemod/generate_capabilities.py from the create() docstrings; do not
+edit by hand. Keyed by resource, then by the checked argument, then by model:
+
+- `resolution`, `image_count`, `end_seconds`: the values the model accepts
+- `additional_images`: most `assets.image_file_paths` beyond the first
+- `audio`: False where the model can't include audio
+"""
+
+import typing
+
+
+'''
+
+# "- `model` - from N credits/image", followed by more indented "- Key: values" lines
+MODEL_LINE = re.compile(r"^(\s*)- `([\w.\-]+)` - ")
+MODEL_RULE = re.compile(r"^(\s*)- ([^:`]+): (.+)$")
+# "* **`model`**: values"
+MODEL_BULLET = re.compile(r"^\s*\* \*\*`([\w.\-]+)`\*\*: ([^\n]+)$", re.M)
+ARG = re.compile(r"^ {12}(\w+): ", re.M)
+
+BLOCK_RULES = {
+    "Supported resolutions": "resolution",
+    "Image count allowed": "image_count",
+    "Max additional input images": "additional_images",
+}
+
+
+def get_resource_name(file_path: str) -> str:
+    return os.path.basename(os.path.dirname(file_path))
+
+
+def create_docstring(content: str) -> Optional[str]:
+    """The docstring of the first (sync) create() in a client file"""
+    match = re.search(
+        r"\n    def create\(.*?\).*?:\n\s+\"\"\"(.*?)\"\"\"", content, re.DOTALL
+    )
+    return match.group(1) if match else None
+
+
+def split_args(docstring: str) -> Dict[str, str]:
+    """Documentation of each argument in the Args section"""
+    args = docstring.split("Args:", 1)[-1].split("Returns:", 1)[0]
+    matches = list(ARG.finditer(args))
+    return {
+        m.group(1): args[
+            m.end() : matches[i + 1].start() if i + 1 < len(matches) else None
+        ]
+        for i, m in enumerate(matches)
+    }
+
+
+def parse_values(text: str) -> Tuple[object, ...]:
+    values: List[object] = []
+    for value in re.split(r",\s*", text.strip().rstrip(".")):
+        value = value.strip()
+        values.append(int(value) if value.isdigit() else value)
+    return tuple(values)
+
+
+def parse_capabilities(docstring: str) -> Dict[str, Dict[str, object]]:
+    rules: Dict[str, Dict[str, object]] = {}
+    args = split_args(docstring)
+
+    model, indent = None, 0
+    for line in args.get("model", "").splitlines():
+        model_match = MODEL_LINE.match(line)
+        rule_match = MODEL_RULE.match(line)
+        if model_match:
+            model, indent = model_match.group(2), len(model_match.group(1))
+        elif rule_match and model and len(rule_match.group(1)) > indent:
+            field = BLOCK_RULES.get(rule_match.group(2).strip())
+            value = rule_match.group(3)
+            if field == "additional_images":
+                rules.setdefault(field, {})[model] = int(value.strip())
+            elif field is not None:
+                rules.setdefault(field, {})[model] = parse_values(value)
+        elif line.strip():
+            model = None
+
+    for model, value in MODEL_BULLET.findall(args.get("resolution", "")):
+        if value.startswith("Supports "):
+            rules.setdefault("resolution", {})[model] = parse_values(value[9:])
+    for model, value in MODEL_BULLET.findall(args.get("end_seconds", "")):
+        rules.setdefault("end_seconds", {})[model] = parse_values(value)
+    for model, value in MODEL_BULLET.findall(args.get("audio", "")):
+        if value.strip().rstrip(".") == "Not supported":
+            rules.setdefault("audio", {})[model] = False
+    return rules
+
+
+def build_table(base_dir: str) -> Dict[str, Dict[str, Dict[str, object]]]:
+    table: Dict[str, Dict[str, Dict[str, object]]] = {}
+    pattern = os.path.join(base_dir, "magic_hour", "resources", "v1", "*", "client.py")
+    for file_path in sorted(glob.glob(pattern)):
+        with open(file_path, encoding="utf-8") as f:
+            docstring = create_docstring(f.read())
+        if docstring is None:
+            continue
+        rules = parse_capabilities(docstring)
+        if rules:
+            table[get_resource_name(file_path)] = rules
+    return table
+
+
+def render_value(value: object) -> str:
+    if isinstance(value, tuple):
+        items = ", ".join(render_value(v) for v in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def render(table: Dict[str, Dict[str, Dict[str, object]]]) -> str:
+    lines = [
+        "CAPABILITIES: typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]] = {"
+    ]
+    for resource, rules in sorted(table.items()):
+        lines.append(f"    {json.dumps(resource)}: {{")
+        for field, models in sorted(rules.items()):
+            lines.append(f"        {json.dumps(field)}: {{")
+            for model, value in sorted(models.items()):
+                lines.append(f"            {json.dumps(model)}: {render_value(value)},")
+            lines.append("        },")
+        lines.append("    },")
+    lines.append("}")
+    return HEADER + "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the per-model capability table from create() docstrings"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the table is up to date",
+    )
+    args = parser.parse_args()
+
+    base_dir = "."
+    if not os.path.exists(os.path.join(base_dir, "magic_hour")):
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output_path = os.path.join(base_dir, OUTPUT_PATH)
+
+    content = render(build_table(base_dir))
+    if args.check:
+        with open(output_path, encoding="utf-8") as f:
+            if f.read() != content:
+                print(
+                    f"{OUTPUT_PATH} is out of date; run codemod/generate_capabilities.py"
+                )
+                return 1
+        print(f"{OUTPUT_PATH} is up to date")
+        return 0
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    print(f"Wrote {OUTPUT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Script to rewrite the types package __init__ files so their exports are loaded lazily.
+
+WHAT IT DOES:
+- Reads magic_hour/types/models/__init__.py and magic_hour/types/params/__init__.py
+- Collects every `from .module import Name` re-export (including _Serializer* classes)
+- Rewrites each __init__.py so that:
+  1. The imports only run under `typing.TYPE_CHECKING` (type checkers and IDE
+     autocomplete keep seeing every name)
+  2. A module level `__getattr__` (PEP 562) imports the defining submodule the
+     first time a name is accessed and caches it in the package namespace
+- Keeps `__all__` unchanged
+
+WHY:
+- `import magic_hour` used to import ~130 pydantic model and param modules up
+  front. With lazy exports only the modules an endpoint actually touches are
+  imported, which keeps cold starts fast for serverless users.
+
+WHEN TO RUN:
+- After SDK regeneration (the generator emits eager re-exports)
+- After adding new model or param modules
+
+USAGE:
+    python codemod/lazy_type_exports.py            # Rewrite both __init__ files
+    python codemod/lazy_type_exports.py --check    # Exit 1 if a rewrite is needed
+"""
+
+import argparse
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+TYPES_DIR = Path(__file__).resolve().parent.parent / "magic_hour" / "types"
+PACKAGES = ["models", "params"]
+LINE_LENGTH = 88
+
+
+def collect_exports(source: str) -> Tuple[Dict[str, str], List[str]]:
+    """Return ({name: relative_module}, __all__) for an __init__ module."""
+    tree = ast.parse(source)
+    exports: Dict[str, str] = {}
+    all_names: List[str] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            for alias in node.names:
+                exports[alias.asname or alias.name] = f".{node.module}"
+        elif isinstance(node, ast.Assign):
+            targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+            if "__all__" in targets and isinstance(node.value, ast.List):
+                all_names = [
+                    elt.value
+                    for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                ]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            if node.target.id == "_LAZY_EXPORTS" and isinstance(node.value, ast.Dict):
+                for key, value in zip(node.value.keys, node.value.values):
+                    if isinstance(key, ast.Constant) and isinstance(
+                        value, ast.Constant
+                    ):
+                        exports[key.value] = value.value
+
+    return exports, all_names
+
+
+def _format_import(module: str, names: List[str], indent: str) -> str:
+    line = f"{indent}from {module} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return line
+    inner = "".join(f"{indent}    {name},\n" for name in names)
+    return f"{indent}from {module} import (\n{inner}{indent})"
+
+
+def render(exports: Dict[str, str], all_names: List[str]) -> str:
+    by_module: Dict[str, List[str]] = {}
+    for name, module in exports.items():
+        by_module.setdefault(module, []).append(name)
+
+    imports = "\n".join(
+        _format_import(module, sorted(names), "    ")
+        for module, names in sorted(by_module.items())
+    )
+    lazy_map = "".join(
+        f'    "{name}": "{exports[name]}",\n'
+        for name in sorted(exports, key=lambda n: (n.startswith("_"), n))
+    )
+    all_list = "".join(f'    "{name}",\n' for name in all_names)
+
+    return f"""import importlib
+import typing
+
+
+if typing.TYPE_CHECKING:
+{imports}
+
+
+# Exported names are resolved on first access so that importing the SDK does not
+# import (and build pydantic schemas for) every model up front.
+_LAZY_EXPORTS: typing.Dict[str, str] = {{
+{lazy_map}}}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+__all__ = [
+{all_list}]
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--check", action="store_true", help="Only report whether a rewrite is needed"
+    )
+    args = parser.parse_args()
+
+    needs_update = False
+    for package in PACKAGES:
+        init_path = TYPES_DIR / package / "__init__.py"
+        source = init_path.read_text()
+        exports, all_names = collect_exports(source)
+        rendered = render(exports, all_names)
+        if rendered == source:
+            print(f"✓ {init_path.relative_to(TYPES_DIR.parent.parent)} is up to date")
+            continue
+
+        needs_update = True
+        if args.check:
+            print(f"✗ {init_path.relative_to(TYPES_DIR.parent.parent)} needs rewrite")
+        else:
+            init_path.write_text(rendered)
+            print(f"✓ rewrote {init_path.relative_to(TYPES_DIR.parent.parent)}")
+
+    return 1 if args.check and needs_update else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import sys
+
+from magic_hour.cli import main
+
+
+sys.exit(main())
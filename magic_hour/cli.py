@@ -0,0 +1,379 @@
+"""
+`magic-hour` command line tool.
+
+```sh
+magic-hour batch jobs.jsonl --output results.jsonl --concurrency 16 --rps 5
+```
+
+A manifest is JSONL (one object per line) or CSV (one row per job). Each job names
+its `resource` (e.g. `face_swap_photo`) and gives that resource's `generate()`
+arguments; CSV columns may be dotted (`assets.source_file_path`) to set nested
+arguments, and cells holding JSON (numbers, `true`, objects) are decoded. An
+optional `id` column names the job in the results, otherwise its line number does.
+"""
+
+import argparse
+import csv
+import httpx
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+import typing
+
+from magic_hour.client import Client
+from magic_hour.helpers.batch import run_batch
+from magic_hour.helpers.ledger import SqliteLedger, ledger_scope
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.sweep import apply_overrides
+from magic_hour.helpers.token_pool import TokenPool, TokenPoolEntry
+from make_api_request import ApiError
+
+
+logger = get_sdk_logger(__name__)
+
+TOKEN_ENV_VAR = "MAGIC_HOUR_API_KEY"
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+_MAX_BACKOFF_SECONDS = 60.0
+_PROGRESS_INTERVAL_SECONDS = 0.5
+
+
+class ManifestJob(typing.NamedTuple):
+    key: str
+    """The job's `id`, or its line number in the manifest"""
+
+    resource: str
+    arguments: typing.Dict[str, typing.Any]
+
+
+def _cell(value: str) -> typing.Any:
+    if value == "":
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _job(key: str, fields: typing.Mapping[str, typing.Any]) -> ManifestJob:
+    fields = dict(fields)
+    resource = fields.pop("resource", None)
+    if not isinstance(resource, str) or not resource:
+        raise ValueError(f"Job {key} has no resource")
+    job_id = fields.pop("id", None)
+    arguments = fields.pop("arguments", None)
+    if arguments is None:
+        arguments = apply_overrides({}, fields)
+    elif fields:
+        raise ValueError(f"Job {key} has both arguments and {sorted(fields)}")
+    return ManifestJob(str(job_id) if job_id is not None else key, resource, arguments)
+
+
+def read_manifest(stream: typing.TextIO, format: str) -> typing.Iterator[ManifestJob]:
+    """
+    Jobs of a `"jsonl"` or `"csv"` manifest, read one line at a time. JSONL jobs
+    are `{"resource": ..., ...generate() arguments}` or
+    `{"resource": ..., "arguments": {...}}`.
+    """
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            fields = {k: _cell(v) for k, v in row.items() if k and v is not None}
+            yield _job(
+                str(reader.line_num), {k: v for k, v in fields.items() if v is not None}
+            )
+    elif format == "jsonl":
+        for number, line in enumerate(stream, start=1):
+            if line.strip():
+                fields = json.loads(line)
+                if not isinstance(fields, dict):
+                    raise ValueError(f"Line {number} is not a JSON object")
+                yield _job(str(number), fields)
+    else:
+        raise ValueError(f"Unknown manifest format {format!r}")
+
+
+def completed_keys(output_path: str) -> typing.Set[str]:
+    """Keys of the jobs an earlier run recorded as complete in `output_path`"""
+    keys: typing.Set[str] = set()
+    if not os.path.exists(output_path):
+        return keys
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a line cut short when the run was killed
+            if isinstance(record, dict) and record.get("status") == "complete":
+                keys.add(str(record.get("key")))
+    return keys
+
+
+def _retryable(error: BaseException) -> bool:
+    if isinstance(error, ApiError):
+        return error.status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+class _Progress:
+    """A live status line: jobs finished, failed and skipped, and throughput"""
+
+    def __init__(self, stream: typing.Optional[typing.TextIO]):
+        self.stream = stream
+        self.started = time.monotonic()
+        self.complete = 0
+        self.failed = 0
+        self.skipped = 0
+        self.credits = 0
+        self._lock = threading.Lock()
+        self._shown_at = 0.0
+
+    def update(self, record: typing.Dict[str, typing.Any]) -> None:
+        with self._lock:
+            if record["status"] == "complete":
+                self.complete += 1
+            else:
+                self.failed += 1
+            self.credits += record.get("credits_charged") or 0
+        self.show()
+
+    def line(self) -> str:
+        elapsed = time.monotonic() - self.started
+        finished = self.complete + self.failed
+        rate = finished / elapsed * 60 if elapsed > 0 else 0.0
+        return (
+            f"{self.complete} complete, {self.failed} failed, {self.skipped} skipped"
+            f" | {rate:.1f} jobs/min | {self.credits} credits | {elapsed:.0f}s"
+        )
+
+    def show(self, final: bool = False) -> None:
+        if self.stream is None:
+            return
+        now = time.monotonic()
+        if not final and now - self._shown_at < _PROGRESS_INTERVAL_SECONDS:
+            return
+        self._shown_at = now
+        interactive = self.stream.isatty()
+        end = "\n" if final or not interactive else ""
+        self.stream.write(("\r" if interactive else "") + self.line() + end)
+        self.stream.flush()
+
+
+def run_manifest(
+    client: Client,
+    jobs: typing.Iterable[ManifestJob],
+    output: typing.TextIO,
+    *,
+    concurrency: int = 8,
+    retries: int = 3,
+    retry_backoff: float = 1.0,
+    skip: typing.Collection[str] = (),
+    download_directory: typing.Optional[str] = None,
+    progress: typing.Optional[typing.TextIO] = None,
+) -> typing.Tuple[int, int]:
+    """
+    Run every job not in `skip`, up to `concurrency` at a time, writing a JSONL
+    record to `output` as each one finishes. Requests failing with a transport
+    error, 429 or 5xx are retried up to `retries` times with exponential backoff.
+
+    Returns:
+        The number of jobs that completed and that failed
+    """
+    status = _Progress(progress)
+    write_lock = threading.Lock()
+
+    def pending() -> typing.Iterator[ManifestJob]:
+        for job in jobs:
+            if job.key in skip:
+                status.skipped += 1
+                status.show()
+            else:
+                yield job
+
+    def run(job: ManifestJob) -> typing.Dict[str, typing.Any]:
+        started = time.monotonic()
+        record: typing.Dict[str, typing.Any] = {
+            "key": job.key,
+            "resource": job.resource,
+        }
+        arguments = dict(job.arguments)
+        if download_directory is not None:
+            arguments.setdefault("download_directory", download_directory)
+        for attempt in range(retries + 1):
+            try:
+                resource = getattr(client.v1, job.resource, None)
+                if resource is None or not hasattr(resource, "generate"):
+                    raise ValueError(f"Unknown resource {job.resource!r}")
+                # generate() may fill in uploaded paths, so each attempt gets a copy;
+                # the scope keeps identical jobs under different keys apart
+                with ledger_scope(job.key):
+                    result = resource.generate(**apply_overrides(arguments, {}))
+            except Exception as e:
+                if attempt < retries and _retryable(e):
+                    delay = min(_MAX_BACKOFF_SECONDS, retry_backoff * 2**attempt)
+                    logger.info("Retrying job %s in %.1fs: %r", job.key, delay, e)
+                    time.sleep(delay * random.uniform(0.5, 1.0))
+                    continue
+                record.update(status="failed", error=repr(e), attempts=attempt + 1)
+                break
+            record.update(
+                status=result.status,
+                project_id=result.id,
+                credits_charged=result.credits_charged,
+                downloaded_paths=getattr(result, "downloaded_paths", None),
+                attempts=attempt + 1,
+            )
+            break
+        record["seconds"] = round(time.monotonic() - started, 3)
+        with write_lock:
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+        status.update(record)
+        return record
+
+    for outcome in run_batch(
+        run, pending(), max_concurrency=concurrency, ordered=False
+    ):
+        outcome.unwrap()
+    status.show(final=True)
+    return status.complete, status.failed
+
+
+def _tokens(arguments: argparse.Namespace) -> typing.List[str]:
+    tokens = arguments.token or []
+    if not tokens and os.getenv(TOKEN_ENV_VAR):
+        tokens = [os.environ[TOKEN_ENV_VAR]]
+    if not tokens:
+        raise SystemExit(f"Pass --token or set {TOKEN_ENV_VAR}")
+    return tokens
+
+
+def _client(arguments: argparse.Namespace) -> Client:
+    tokens = _tokens(arguments)
+    ledger = (
+        None
+        if arguments.no_ledger
+        else SqliteLedger(arguments.ledger or arguments.output + ".ledger.db")
+    )
+    if len(tokens) == 1 and arguments.rps is None:
+        return Client(token=tokens[0], base_url=arguments.base_url, ledger=ledger)
+    entries: typing.List[TokenPoolEntry] = []
+    for token in tokens:
+        entry: TokenPoolEntry = {"token": token}
+        if arguments.rps is not None:
+            entry["requests_per_second"] = arguments.rps / len(tokens)
+        entries.append(entry)
+    return Client(
+        token_pool=TokenPool(entries), base_url=arguments.base_url, ledger=ledger
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="magic-hour", description="Magic Hour API tools"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    batch = commands.add_parser(
+        "batch",
+        help="run the jobs of a JSONL or CSV manifest",
+        description=__doc__.split("```")[-1].strip() if __doc__ else None,
+    )
+    batch.add_argument("manifest", help="JSONL or CSV manifest, or - for stdin")
+    batch.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="JSONL file results are appended to; jobs it records as complete are skipped",
+    )
+    batch.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        help="manifest format (default: from the file extension)",
+    )
+    batch.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=8,
+        help="jobs in progress at once (default: 8)",
+    )
+    batch.add_argument(
+        "--rps", type=float, help="most API requests per second, across all tokens"
+    )
+    batch.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="retries of a job failing with a transport error, 429 or 5xx (default: 3)",
+    )
+    batch.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=1.0,
+        help="seconds before the first retry, doubled each time (default: 1)",
+    )
+    batch.add_argument(
+        "--download-directory",
+        help="where outputs are downloaded, unless a job says otherwise",
+    )
+    batch.add_argument(
+        "--token",
+        action="append",
+        help=f"API token; repeat to spread jobs over several (default: ${TOKEN_ENV_VAR})",
+    )
+    batch.add_argument(
+        "--ledger",
+        help="job ledger, so jobs rendering when a run is killed are resumed (default: OUTPUT.ledger.db)",
+    )
+    batch.add_argument(
+        "--no-ledger", action="store_true", help="don't keep a job ledger"
+    )
+    batch.add_argument("--base-url", help=argparse.SUPPRESS)
+    batch.add_argument("-q", "--quiet", action="store_true", help="don't show progress")
+    return parser
+
+
+def batch_command(arguments: argparse.Namespace) -> int:
+    format = arguments.format or (
+        "csv" if arguments.manifest.lower().endswith(".csv") else "jsonl"
+    )
+    skip = completed_keys(arguments.output)
+    client = _client(arguments)
+    manifest: typing.TextIO = (
+        io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+        if arguments.manifest == "-"
+        else open(arguments.manifest, encoding="utf-8", newline="")
+    )
+    with manifest, open(arguments.output, "a", encoding="utf-8") as output:
+        _, failed = run_manifest(
+            client,
+            read_manifest(manifest, format),
+            output,
+            concurrency=arguments.concurrency,
+            retries=arguments.retries,
+            retry_backoff=arguments.retry_backoff,
+            skip=skip,
+            download_directory=arguments.download_directory,
+            progress=None if arguments.quiet else sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    arguments = _parser().parse_args(argv)
+    try:
+        return batch_command(arguments)
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted; run again with the same --output to resume\n")
+        sys.stderr.flush()
+        # jobs still rendering are in the ledger and resumed by the next run, so
+        # exit now instead of letting their threads keep the process alive
+        os._exit(130)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
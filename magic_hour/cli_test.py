@@ -0,0 +1,120 @@
+import io
+import json
+import pathlib
+import pytest
+
+from magic_hour.cli import completed_keys, read_manifest, run_manifest
+from magic_hour.helpers.ledger import MemoryLedger
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def test_csv_and_jsonl_manifests_read_the_same_jobs() -> None:
+    csv_jobs = list(
+        read_manifest(
+            io.StringIO(
+                "id,resource,assets.source_file_path,assets.target_file_path,name\n"
+                "a,face_swap_photo,api-assets/face.png,api-assets/t.png,\n"
+            ),
+            "csv",
+        )
+    )
+    jsonl_jobs = list(
+        read_manifest(
+            io.StringIO(
+                '\n{"id": "a", "resource": "face_swap_photo", "assets": '
+                '{"source_file_path": "api-assets/face.png", '
+                '"target_file_path": "api-assets/t.png"}}\n'
+            ),
+            "jsonl",
+        )
+    )
+
+    assert csv_jobs == jsonl_jobs
+    assert csv_jobs[0].key == "a"
+    assert csv_jobs[0].arguments == {
+        "assets": {
+            "source_file_path": "api-assets/face.png",
+            "target_file_path": "api-assets/t.png",
+        }
+    }
+
+
+def test_jobs_are_retried_recorded_and_skipped_on_rerun(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+    manifest = "".join(
+        json.dumps(
+            {
+                "resource": "face_swap_photo",
+                "assets": {
+                    "source_file_path": "api-assets/face.png",
+                    "target_file_path": f"api-assets/t{i}.png",
+                },
+                "download_outputs": False,
+            }
+        )
+        + "\n"
+        for i in range(4)
+    )
+    manifest += '{"resource": "no_such_resource"}\n'
+    output = tmp_path / "results.jsonl"
+    mock.inject(503, count=1, path="/v1/face-swap-photo")
+
+    with open(output, "a") as f:
+        complete, failed = run_manifest(
+            client,
+            read_manifest(io.StringIO(manifest), "jsonl"),
+            f,
+            concurrency=2,
+            retry_backoff=0.0,
+        )
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert (complete, failed) == (4, 1)
+    assert sorted(r["key"] for r in records) == ["1", "2", "3", "4", "5"]
+    assert sum(r["attempts"] for r in records) == 6
+    assert {r["key"]: r["status"] for r in records}["5"] == "failed"
+    assert completed_keys(str(output)) == {"1", "2", "3", "4"}
+
+    with open(output, "a") as f:
+        complete, failed = run_manifest(
+            client,
+            read_manifest(io.StringIO(manifest), "jsonl"),
+            f,
+            skip=completed_keys(str(output)),
+        )
+    assert (complete, failed) == (0, 1)
+    assert len([r for r in mock.requests if r.method == "POST"]) == 5
+
+
+def test_identical_jobs_with_different_ids_are_separate_projects(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour(render_seconds=0.1)
+    row = {
+        "resource": "ai_image_generator",
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "x"},
+        "download_outputs": False,
+    }
+    manifest = "".join(json.dumps({"id": key, **row}) + "\n" for key in "ab")
+
+    with open(tmp_path / "results.jsonl", "a") as f:
+        complete, _ = run_manifest(
+            mock.client(ledger=MemoryLedger()),
+            read_manifest(io.StringIO(manifest), "jsonl"),
+            f,
+            concurrency=2,
+        )
+
+    records = [json.loads(line) for line in open(tmp_path / "results.jsonl")]
+    assert complete == 2
+    assert len({r["project_id"] for r in records}) == 2
@@ -1,9 +1,32 @@
+import copy
 import httpx
+import importlib
 import typing
 
 from magic_hour.environment import Environment, _get_base_url
+from magic_hour.helpers.base_client import (
+    MagicHourAsyncBaseClient,
+    MagicHourSyncBaseClient,
+)
+from magic_hour.helpers.batch import DEFAULT_MAX_CONCURRENCY, BatchItemResult, run_batch
+from magic_hour.helpers.tracing import SpanListener, Tracer
 from magic_hour.resources.v1 import AsyncV1Client, V1Client
-from make_api_request import AsyncBaseClient, AuthBearer, SyncBaseClient
+from make_api_request import AuthBearer
+
+
+if typing.TYPE_CHECKING:
+    from magic_hour.helpers.budget import CreditBudget
+    from magic_hour.helpers.chrome_trace import TraceRecorder
+    from magic_hour.helpers.dedupe import RequestDeduplicator
+    from magic_hour.helpers.face_cache import FaceDetectionCache
+    from magic_hour.helpers.json_codec import JsonCodec
+    from magic_hour.helpers.ledger import JobLedger, LedgerEntry
+    from magic_hour.helpers.pipeline import JobSpec, PipelineItemResult
+    from magic_hour.helpers.token_pool import TokenPool
+
+
+_T = typing.TypeVar("_T")
+_R = typing.TypeVar("_R")
 
 
 class Client:
@@ -15,18 +38,172 @@ class Client:
         base_url: typing.Optional[str] = None,
         environment: Environment = Environment.ENVIRONMENT,
         token: typing.Optional[str] = None,
+        token_pool: typing.Optional["TokenPool"] = None,
+        json_codec: typing.Optional["JsonCodec"] = None,
+        span_listeners: typing.Optional[typing.Sequence[SpanListener]] = None,
+        transfer_client: typing.Optional[httpx.Client] = None,
+        ledger: typing.Optional["JobLedger"] = None,
+        deduplicator: typing.Optional["RequestDeduplicator"] = None,
+        credit_budget: typing.Optional["CreditBudget"] = None,
+        face_detection_cache: typing.Optional["FaceDetectionCache"] = None,
     ):
-        """Initialize root client"""
-        self._base_client = SyncBaseClient(
+        """Initialize root client
+
+        Args:
+            token_pool: Spread requests over several API tokens instead of using a
+                single `token`. See `magic_hour.helpers.TokenPool`.
+            json_codec: Encoder for JSON request bodies, e.g.
+                `magic_hour.helpers.OrjsonCodec()`. Defaults to httpx's `json.dumps`.
+            span_listeners: Receive a span for every request, upload, download and
+                `generate()` phase. See `magic_hour.helpers.SpanListener`; more can be
+                added later with `client.tracer.add_listener()`.
+            transfer_client: Client used for presigned uploads and output downloads.
+                Defaults to a new client per file.
+            ledger: Durable record of submitted jobs, e.g.
+                `magic_hour.helpers.SqliteLedger("jobs.db")`. `generate()` calls
+                matching a recorded job resume it instead of submitting it again.
+            deduplicator: Share one project between identical create requests made
+                concurrently or within a window. See
+                `magic_hour.helpers.RequestDeduplicator`.
+            credit_budget: Hold back or reject submissions once a credit cap or
+                spend rate is reached. See `magic_hour.helpers.CreditBudget`.
+            face_detection_cache: Reuse face detection results for targets seen
+                before. See `magic_hour.helpers.FaceDetectionCache`.
+        """
+        if token is not None and token_pool is not None:
+            raise ValueError("Pass either `token` or `token_pool`, not both")
+
+        self._base_client = MagicHourSyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
             httpx_client=httpx.Client(timeout=timeout)
             if httpx_client is None
             else httpx_client,
             auths={"bearerAuth": AuthBearer(token=token)},
+            token_pool=token_pool,
+            json_codec=json_codec,
+            tracer=Tracer(span_listeners),
+            transfer_client=transfer_client,
+            ledger=ledger,
+            deduplicator=deduplicator,
+            credit_budget=credit_budget,
+            face_detection_cache=face_detection_cache,
         )
 
         self.v1 = V1Client(base_client=self._base_client)
 
+    @property
+    def tracer(self) -> Tracer:
+        """The tracer spans are reported through, shared with `with_token()` views"""
+        return self._base_client.tracer
+
+    def record_trace(self, max_events: int = 100_000) -> "TraceRecorder":
+        """
+        Start recording a timeline of this client's uploads, requests, renders and
+        downloads, exportable as Chrome trace-event JSON for Perfetto:
+
+        ```py
+        recorder = client.record_trace()
+        ...
+        recorder.save("run.trace.json")
+        client.tracer.remove_listener(recorder)  # stop recording
+        ```
+
+        Args:
+            max_events: Size of the ring buffer; older events are dropped first
+        """
+        chrome_trace = importlib.import_module("magic_hour.helpers.chrome_trace")
+        recorder: "TraceRecorder" = chrome_trace.TraceRecorder(max_events=max_events)
+        self.tracer.add_listener(recorder)
+        return recorder
+
+    def batch(
+        self,
+        fn: typing.Callable[[_T], _R],
+        items: typing.Iterable[_T],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+    ) -> typing.Generator[BatchItemResult[_T, _R], None, None]:
+        """
+        Call `fn(item)` for every item on up to `max_concurrency` threads, for
+        batches that mix resources or need more than one call per item. Every thread
+        shares this client's connection pool. For a single resource,
+        `client.v1.<resource>.generate_many()` is simpler.
+
+        ```py
+        def swap(row):
+            image = client.v1.files.upload_file(row["photo"])
+            return client.v1.face_swap_photo.generate(
+                assets={"source_file_path": row["face"], "target_file_path": image}
+            )
+
+        for outcome in client.batch(swap, rows, max_concurrency=16, ordered=False):
+            print(outcome.index, outcome.result if outcome.ok else outcome.error)
+        ```
+
+        Results are `BatchItemResult`s, yielded in input order (or as they complete
+        with `ordered=False`); an item that raises carries the exception in `.error`.
+        The threads are released once the results are exhausted, or when the loop is
+        left early, in which case items not yet started are skipped.
+        """
+        return run_batch(fn, items, max_concurrency=max_concurrency, ordered=ordered)
+
+    def resume_pending(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        download_outputs: bool = True,
+    ) -> typing.Generator[BatchItemResult["LedgerEntry", typing.Any], None, None]:
+        """
+        Wait on, and download the outputs of, every job the ledger recorded as
+        submitted but not finished, e.g. when a worker starts after a crash:
+
+        ```py
+        client = Client(ledger=SqliteLedger("jobs.db"))
+        for outcome in client.resume_pending():
+            print(outcome.item.project_id, outcome.result.downloaded_paths)
+        ```
+
+        Outputs go to the `download_directory` the job was submitted with. Results
+        are `BatchItemResult`s whose `item` is the `LedgerEntry`, yielded as each job
+        finishes.
+        """
+        ledger = importlib.import_module("magic_hour.helpers.ledger")
+        return ledger.resume_pending(
+            self._base_client,
+            self._require_ledger(),
+            max_concurrency=max_concurrency,
+            download_outputs=download_outputs,
+        )
+
+    def _require_ledger(self) -> "JobLedger":
+        if self._base_client.ledger is None:
+            raise ValueError("This client has no ledger; pass `ledger=` to the client")
+        return self._base_client.ledger
+
+    def with_token(self, token: typing.Optional[str]) -> "Client":
+        """
+        Return a lightweight view of this client that authenticates with `token`.
+
+        The view shares this client's `httpx.Client`, so connection reuse and pool
+        limits are shared across every token. Views are cheap to create (resource
+        clients are built lazily), which makes it practical to serve many tenants from
+        one client. A view never uses the parent's `token_pool`:
+
+        ```py
+        client = Client()  # shared transport, no default token
+        tenant = client.with_token(customer_token)
+        tenant.v1.face_swap_photo.generate(...)
+        ```
+
+        For a single call, the token can also be given per request with
+        `request_options={"additional_headers": {"Authorization": f"Bearer {token}"}}`.
+        """
+        view = copy.copy(self)
+        view._base_client = self._base_client.with_token(token)
+        view.v1 = V1Client(base_client=view._base_client)
+        return view
+
 
 class AsyncClient:
     def __init__(
@@ -37,14 +214,195 @@ class AsyncClient:
         base_url: typing.Optional[str] = None,
         environment: Environment = Environment.ENVIRONMENT,
         token: typing.Optional[str] = None,
+        token_pool: typing.Optional["TokenPool"] = None,
+        json_codec: typing.Optional["JsonCodec"] = None,
+        span_listeners: typing.Optional[typing.Sequence[SpanListener]] = None,
+        transfer_client: typing.Optional[httpx.AsyncClient] = None,
+        ledger: typing.Optional["JobLedger"] = None,
+        deduplicator: typing.Optional["RequestDeduplicator"] = None,
+        credit_budget: typing.Optional["CreditBudget"] = None,
+        face_detection_cache: typing.Optional["FaceDetectionCache"] = None,
     ):
-        """Initialize root client"""
-        self._base_client = AsyncBaseClient(
+        """Initialize root client
+
+        Args:
+            token_pool: Spread requests over several API tokens instead of using a
+                single `token`. See `magic_hour.helpers.TokenPool`.
+            json_codec: Encoder for JSON request bodies, e.g.
+                `magic_hour.helpers.OrjsonCodec()`. Defaults to httpx's `json.dumps`.
+            span_listeners: Receive a span for every request, upload, download and
+                `generate()` phase. See `magic_hour.helpers.SpanListener`; more can be
+                added later with `client.tracer.add_listener()`.
+            transfer_client: Client used for presigned uploads and output downloads.
+                Defaults to a new client per file.
+            ledger: Durable record of submitted jobs, e.g.
+                `magic_hour.helpers.SqliteLedger("jobs.db")`. `generate()` calls
+                matching a recorded job resume it instead of submitting it again.
+            deduplicator: Share one project between identical create requests made
+                concurrently or within a window. See
+                `magic_hour.helpers.RequestDeduplicator`.
+            credit_budget: Hold back or reject submissions once a credit cap or
+                spend rate is reached. See `magic_hour.helpers.CreditBudget`.
+            face_detection_cache: Reuse face detection results for targets seen
+                before. See `magic_hour.helpers.FaceDetectionCache`.
+        """
+        if token is not None and token_pool is not None:
+            raise ValueError("Pass either `token` or `token_pool`, not both")
+
+        self._base_client = MagicHourAsyncBaseClient(
             base_url=_get_base_url(base_url=base_url, environment=environment),
             httpx_client=httpx.AsyncClient(timeout=timeout)
             if httpx_client is None
             else httpx_client,
             auths={"bearerAuth": AuthBearer(token=token)},
+            token_pool=token_pool,
+            json_codec=json_codec,
+            tracer=Tracer(span_listeners),
+            transfer_client=transfer_client,
+            ledger=ledger,
+            deduplicator=deduplicator,
+            credit_budget=credit_budget,
+            face_detection_cache=face_detection_cache,
         )
 
         self.v1 = AsyncV1Client(base_client=self._base_client)
+
+    @property
+    def tracer(self) -> Tracer:
+        """The tracer spans are reported through, shared with `with_token()` views"""
+        return self._base_client.tracer
+
+    def record_trace(self, max_events: int = 100_000) -> "TraceRecorder":
+        """
+        Start recording a timeline of this client's uploads, requests, renders and
+        downloads, exportable as Chrome trace-event JSON for Perfetto:
+
+        ```py
+        recorder = client.record_trace()
+        ...
+        recorder.save("run.trace.json")
+        client.tracer.remove_listener(recorder)  # stop recording
+        ```
+
+        Args:
+            max_events: Size of the ring buffer; older events are dropped first
+        """
+        chrome_trace = importlib.import_module("magic_hour.helpers.chrome_trace")
+        recorder: "TraceRecorder" = chrome_trace.TraceRecorder(max_events=max_events)
+        self.tracer.add_listener(recorder)
+        return recorder
+
+    def pipeline(
+        self,
+        jobs: typing.Union[typing.AsyncIterable["JobSpec"], typing.Iterable["JobSpec"]],
+        *,
+        resource: typing.Optional[str] = None,
+        upload_concurrency: int = 4,
+        submit_concurrency: int = 4,
+        wait_concurrency: int = 256,
+        download_concurrency: int = 4,
+        queue_size: int = 16,
+        download_outputs: bool = True,
+        download_directory: typing.Optional[str] = None,
+    ) -> typing.AsyncGenerator["PipelineItemResult", None]:
+        """
+        Run a stream of jobs through separate upload, submit, wait and download
+        stages, each with its own concurrency, and yield results as jobs finish.
+
+        Unlike `await generate()` per job, stages are limited independently (uploads
+        and downloads by bandwidth, submissions by rate limits, while waiting costs
+        almost nothing) and later jobs upload while earlier ones render. Jobs are
+        read from `jobs` only as the bounded queues between stages have room, so an
+        endless async iterator is fine.
+
+        ```py
+        async def specs():
+            async for photo in incoming_photos():
+                yield {"assets": {"source_file_path": face, "target_file_path": photo}}
+
+        async for outcome in client.pipeline(specs(), resource="face_swap_photo"):
+            if outcome.ok:
+                print(outcome.result.downloaded_paths)
+            else:
+                print(f"job {outcome.index} failed to {outcome.stage}: {outcome.error}")
+        ```
+
+        Args:
+            jobs: `generate()` arguments per job; a job may set `"resource"`
+            resource: Resource used by jobs that don't set one, e.g. `"face_swap"`
+            upload_concurrency: Jobs uploading their input files at once
+            submit_concurrency: Create requests in flight at once
+            wait_concurrency: Renders being waited on at once
+            download_concurrency: Jobs downloading their outputs at once
+            queue_size: Capacity of the queue in front of each stage
+            download_outputs: Default for jobs that don't set `download_outputs`
+            download_directory: Default for jobs that don't set `download_directory`
+        """
+        pipeline = importlib.import_module("magic_hour.helpers.pipeline")
+        return pipeline.AsyncPipeline(
+            self,
+            resource=resource,
+            upload_concurrency=upload_concurrency,
+            submit_concurrency=submit_concurrency,
+            wait_concurrency=wait_concurrency,
+            download_concurrency=download_concurrency,
+            queue_size=queue_size,
+            download_outputs=download_outputs,
+            download_directory=download_directory,
+        ).run(jobs)
+
+    def resume_pending(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        download_outputs: bool = True,
+    ) -> typing.AsyncGenerator[BatchItemResult["LedgerEntry", typing.Any], None]:
+        """
+        Wait on, and download the outputs of, every job the ledger recorded as
+        submitted but not finished, e.g. when a worker starts after a crash:
+
+        ```py
+        client = AsyncClient(ledger=SqliteLedger("jobs.db"))
+        async for outcome in client.resume_pending():
+            print(outcome.item.project_id, outcome.result.downloaded_paths)
+        ```
+
+        Outputs go to the `download_directory` the job was submitted with. Results
+        are `BatchItemResult`s whose `item` is the `LedgerEntry`, yielded as each job
+        finishes.
+        """
+        ledger = importlib.import_module("magic_hour.helpers.ledger")
+        return ledger.resume_pending_async(
+            self._base_client,
+            self._require_ledger(),
+            max_concurrency=max_concurrency,
+            download_outputs=download_outputs,
+        )
+
+    def _require_ledger(self) -> "JobLedger":
+        if self._base_client.ledger is None:
+            raise ValueError("This client has no ledger; pass `ledger=` to the client")
+        return self._base_client.ledger
+
+    def with_token(self, token: typing.Optional[str]) -> "AsyncClient":
+        """
+        Return a lightweight view of this client that authenticates with `token`.
+
+        The view shares this client's `httpx.AsyncClient`, so connection reuse and pool
+        limits are shared across every token. Views are cheap to create (resource
+        clients are built lazily), which makes it practical to serve many tenants from
+        one client. A view never uses the parent's `token_pool`:
+
+        ```py
+        client = AsyncClient()  # shared transport, no default token
+        tenant = client.with_token(customer_token)
+        await tenant.v1.face_swap_photo.generate(...)
+        ```
+
+        For a single call, the token can also be given per request with
+        `request_options={"additional_headers": {"Authorization": f"Bearer {token}"}}`.
+        """
+        view = copy.copy(self)
+        view._base_client = self._base_client.with_token(token)
+        view.v1 = AsyncV1Client(base_client=view._base_client)
+        return view
@@ -0,0 +1,131 @@
+import httpx
+import json
+import pytest
+import subprocess
+import sys
+import typing
+
+from magic_hour import AsyncClient, Client
+from magic_hour.resources.v1.face_swap import AsyncFaceSwapClient, FaceSwapClient
+from magic_hour.types import models, params
+
+
+def _loaded_sdk_modules(code: str) -> typing.List[str]:
+    """Run `code` in a fresh interpreter and return the magic_hour modules it imported"""
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('magic_hour'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return typing.cast(typing.List[str], json.loads(out.stdout.strip()))
+
+
+def test_client_construction_does_not_import_resources() -> None:
+    loaded = _loaded_sdk_modules(
+        "import magic_hour\nmagic_hour.Client(token='t')\nmagic_hour.AsyncClient(token='t')"
+    )
+
+    assert not [m for m in loaded if m.startswith("magic_hour.types.")]
+    assert not [m for m in loaded if m.endswith(".face_swap.client")]
+    # optional helpers load when they're configured or used
+    for helper in ("budget", "face_cache", "ledger", "pipeline", "chrome_trace"):
+        assert f"magic_hour.helpers.{helper}" not in loaded
+
+
+def test_resource_access_imports_only_what_it_needs() -> None:
+    loaded = _loaded_sdk_modules(
+        "import magic_hour\nmagic_hour.Client(token='t').v1.face_swap"
+    )
+
+    assert "magic_hour.resources.v1.face_swap.client" in loaded
+    assert "magic_hour.resources.v1.lip_sync.client" not in loaded
+    assert "magic_hour.types.params.v1_lip_sync_create_body" not in loaded
+
+
+def test_resource_clients_are_cached_and_typed() -> None:
+    client = Client(token="API_TOKEN")
+    async_client = AsyncClient(token="API_TOKEN")
+
+    assert isinstance(client.v1.face_swap, FaceSwapClient)
+    assert client.v1.face_swap is client.v1.face_swap
+    assert client.v1.face_swap._base_client is client._base_client
+    assert isinstance(async_client.v1.face_swap, AsyncFaceSwapClient)
+    assert async_client.v1.face_swap is async_client.v1.face_swap
+
+
+def test_lazy_type_exports() -> None:
+    assert models.V1FaceSwapCreateResponse.__name__ == "V1FaceSwapCreateResponse"
+    assert params._SerializerV1FaceSwapCreateBody.__name__ == (
+        "_SerializerV1FaceSwapCreateBody"
+    )
+    assert set(models.__all__) <= set(dir(models))
+    assert set(params.__all__) <= set(dir(params))
+
+    with pytest.raises(AttributeError):
+        models.DoesNotExist  # type: ignore[attr-defined]
+
+
+def _project_response(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "created_at": "2024-01-01T00:00:00Z",
+            "credits_charged": 0,
+            "download": None,
+            "downloads": [],
+            "enabled": True,
+            "end_seconds": 1.0,
+            "error": None,
+            "fps": 30.0,
+            "height": 1,
+            "id": request.url.path.rsplit("/", 1)[-1],
+            "name": None,
+            "start_seconds": 0.0,
+            "status": "complete",
+            "total_frame_cost": 0,
+            "type": "FACE_SWAP",
+            "width": 1,
+        },
+    )
+
+
+def test_with_token_shares_transport() -> None:
+    seen: typing.List[typing.Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization"))
+        return _project_response(request)
+
+    client = Client(httpx_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    tenant_a = client.with_token("token-a")
+    tenant_b = client.with_token("token-b")
+
+    tenant_a.v1.video_projects.get(id="a")
+    tenant_b.v1.video_projects.get(id="b")
+    client.v1.video_projects.get(
+        id="c",
+        request_options={"additional_headers": {"Authorization": "Bearer token-c"}},
+    )
+
+    assert seen == ["Bearer token-a", "Bearer token-b", "Bearer token-c"]
+    assert tenant_a._base_client.httpx_client is client._base_client.httpx_client
+    assert tenant_a.v1 is not client.v1
+
+
+@pytest.mark.asyncio
+async def test_async_with_token_shares_transport() -> None:
+    seen: typing.List[typing.Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Authorization"))
+        return _project_response(request)
+
+    client = AsyncClient(
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    await client.with_token("token-a").v1.video_projects.get(id="a")
+
+    assert seen == ["Bearer token-a"]
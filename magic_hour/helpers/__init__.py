@@ -1,4 +1,138 @@
+import importlib
+import typing
+
 from .download import download_files_sync, download_files_async
 from .logger import get_sdk_logger
 
-__all__ = ["download_files_sync", "download_files_async", "get_sdk_logger"]
+
+if typing.TYPE_CHECKING:
+    from .batch import BatchItemResult, run_batch
+    from .budget import CreditBudget, CreditBudgetExceeded, CreditUsage
+    from .chain import OutputRef
+    from .chrome_trace import TraceRecorder
+    from .dedupe import RequestDeduplicator
+    from .face_cache import FaceDetectionCache, build_face_mappings
+    from .json_codec import JsonCodec, OrjsonCodec, fastest_json_codec
+    from .ledger import JobLedger, LedgerEntry, MemoryLedger, SqliteLedger, ledger_scope
+    from .long_form import LongFormError, LongFormResult, LongFormShard
+    from .media_probe import MediaInfo, MediaRangeError, probe_media
+    from .metrics import MetricsRegistry
+    from .pipeline import AsyncPipeline, PipelineItemResult
+    from .rate_limit import RateLimiter
+    from .segments import (
+        SegmentError,
+        SegmentedVideoResult,
+        VideoSegment,
+        ffmpeg_stitcher,
+    )
+    from .serialization import precompile
+    from .timing import AssetUploadTiming, JobTimings
+    from .token_pool import TokenPool, TokenPoolEntry, TokenUtilization
+    from .tracing import OpenTelemetryListener, Span, SpanListener, Tracer
+    from .validation import UnsupportedRequestError, check_capabilities
+
+# the rest are imported on first use, so `import magic_hour` stays fast
+_LAZY_IMPORTS = {
+    "BatchItemResult": "batch",
+    "run_batch": "batch",
+    "CreditBudget": "budget",
+    "CreditBudgetExceeded": "budget",
+    "CreditUsage": "budget",
+    "OutputRef": "chain",
+    "TraceRecorder": "chrome_trace",
+    "RequestDeduplicator": "dedupe",
+    "FaceDetectionCache": "face_cache",
+    "build_face_mappings": "face_cache",
+    "JsonCodec": "json_codec",
+    "OrjsonCodec": "json_codec",
+    "fastest_json_codec": "json_codec",
+    "JobLedger": "ledger",
+    "LedgerEntry": "ledger",
+    "MemoryLedger": "ledger",
+    "SqliteLedger": "ledger",
+    "ledger_scope": "ledger",
+    "LongFormError": "long_form",
+    "LongFormResult": "long_form",
+    "LongFormShard": "long_form",
+    "MediaInfo": "media_probe",
+    "MediaRangeError": "media_probe",
+    "probe_media": "media_probe",
+    "MetricsRegistry": "metrics",
+    "AsyncPipeline": "pipeline",
+    "PipelineItemResult": "pipeline",
+    "RateLimiter": "rate_limit",
+    "SegmentError": "segments",
+    "SegmentedVideoResult": "segments",
+    "VideoSegment": "segments",
+    "ffmpeg_stitcher": "segments",
+    "precompile": "serialization",
+    "AssetUploadTiming": "timing",
+    "JobTimings": "timing",
+    "TokenPool": "token_pool",
+    "TokenPoolEntry": "token_pool",
+    "TokenUtilization": "token_pool",
+    "OpenTelemetryListener": "tracing",
+    "Span": "tracing",
+    "SpanListener": "tracing",
+    "Tracer": "tracing",
+    "UnsupportedRequestError": "validation",
+    "check_capabilities": "validation",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
+
+__all__ = [
+    "BatchItemResult",
+    "run_batch",
+    "CreditBudget",
+    "CreditBudgetExceeded",
+    "CreditUsage",
+    "OutputRef",
+    "RequestDeduplicator",
+    "download_files_sync",
+    "download_files_async",
+    "FaceDetectionCache",
+    "build_face_mappings",
+    "get_sdk_logger",
+    "LongFormError",
+    "LongFormResult",
+    "LongFormShard",
+    "MediaInfo",
+    "MediaRangeError",
+    "probe_media",
+    "JobLedger",
+    "LedgerEntry",
+    "MemoryLedger",
+    "SqliteLedger",
+    "ledger_scope",
+    "MetricsRegistry",
+    "AsyncPipeline",
+    "PipelineItemResult",
+    "JsonCodec",
+    "OrjsonCodec",
+    "fastest_json_codec",
+    "precompile",
+    "SegmentError",
+    "SegmentedVideoResult",
+    "VideoSegment",
+    "ffmpeg_stitcher",
+    "AssetUploadTiming",
+    "JobTimings",
+    "RateLimiter",
+    "TokenPool",
+    "TokenPoolEntry",
+    "TokenUtilization",
+    "OpenTelemetryListener",
+    "Span",
+    "SpanListener",
+    "Tracer",
+    "TraceRecorder",
+    "UnsupportedRequestError",
+    "check_capabilities",
+]
@@ -0,0 +1,480 @@
+import copy
+import functools
+import hashlib
+import httpx
+import importlib
+import pydantic
+import time
+import typing
+
+from magic_hour.helpers.response_parsing import parse_json_model
+from magic_hour.helpers.timing import current_job
+from magic_hour.helpers.tracing import REQUEST, SpanLike, Tracer, endpoint_template
+from make_api_request import (
+    ApiError,
+    AsyncBaseClient,
+    AuthBearer,
+    AuthProvider,
+    BaseClient,
+    QueryParams,
+    RequestOptions,
+    SyncBaseClient,
+)
+from make_api_request.request import RequestConfig
+from make_api_request.utils import get_response_type
+
+
+if typing.TYPE_CHECKING:
+    from magic_hour.helpers.budget import CreditBudget
+    from magic_hour.helpers.dedupe import RequestDeduplicator
+    from magic_hour.helpers.face_cache import FaceDetectionCache
+    from magic_hour.helpers.json_codec import JsonCodec
+    from magic_hour.helpers.ledger import JobLedger
+    from magic_hour.helpers.token_pool import TokenPool
+
+
+T = typing.TypeVar("T")
+
+
+def _ledger_module() -> typing.Any:
+    # only needed once a ledger is configured, and it pulls in sqlite3
+    return importlib.import_module("magic_hour.helpers.ledger")
+
+
+def _with_bearer(
+    request_options: typing.Optional[RequestOptions], token: str
+) -> RequestOptions:
+    """Copy of `request_options` that authenticates with `token`.
+
+    Headers the caller passed explicitly still take precedence.
+    """
+    opts: RequestOptions = dict(request_options or {})  # type: ignore[assignment]
+    opts["additional_headers"] = {
+        "Authorization": f"Bearer {token}",
+        **(opts.get("additional_headers") or {}),
+    }
+    return opts
+
+
+class _MagicHourClientMixin(BaseClient):
+    """Request building and response parsing shared by the sync and async clients"""
+
+    token_pool: typing.Optional["TokenPool"]
+    json_codec: typing.Optional["JsonCodec"]
+    tracer: Tracer
+    deduplicator: typing.Optional["RequestDeduplicator"]
+    credit_budget: typing.Optional["CreditBudget"]
+    face_detection_cache: typing.Optional["FaceDetectionCache"]
+
+    def _dedupe_scope(self, request_options: typing.Optional[RequestOptions]) -> str:
+        """Who a request is made for, so tenants never share projects"""
+        headers = (request_options or {}).get("additional_headers") or {}
+        authorization = headers.get("Authorization")
+        if authorization is None:
+            if self.token_pool is not None:
+                return f"token-pool:{id(self.token_pool)}"
+            bearer = self._auths.get("bearerAuth")
+            authorization = str(getattr(bearer, "token", None))
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+    def _request_span(self, method: str, path: str) -> typing.ContextManager[SpanLike]:
+        if not self.tracer.enabled:
+            return self.tracer.span(REQUEST)
+        endpoint = endpoint_template(path)
+        return self.tracer.span(
+            REQUEST,
+            {
+                "http.request.method": method,
+                "url.path": endpoint,
+                "magic_hour.endpoint": f"{method} {endpoint}",
+            },
+        )
+
+    def _handle_response(
+        self,
+        *,
+        response: httpx.Response,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+        span: SpanLike,
+    ) -> T:
+        if span.is_recording:
+            span.set_attributes(
+                {
+                    "http.response.status_code": response.status_code,
+                    "http.request.body.size": int(
+                        response.request.headers.get("content-length", 0)
+                    ),
+                    "http.response.body.size": len(response.content),
+                }
+            )
+
+        if not response.is_success:
+            raise ApiError(response=response)
+
+        if self._cast_to_raw_response(res=response, cast_to=cast_to):
+            return typing.cast(T, response)
+
+        return self.process_response(response=response, cast_to=cast_to)
+
+    def build_request(
+        self,
+        *,
+        method: str,
+        path: str,
+        service_name: typing.Optional[str] = None,
+        auth_names: typing.Optional[typing.List[str]] = None,
+        query_params: typing.Optional[QueryParams] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        data: typing.Optional[httpx._types.RequestData] = None,
+        files: typing.Optional[httpx._types.RequestFiles] = None,
+        json: typing.Optional[typing.Any] = None,
+        content_type: typing.Optional[str] = None,
+        content: typing.Optional[httpx._types.RequestContent] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> RequestConfig:
+        if self.json_codec is not None and json is not None and content is None:
+            # send the body pre-encoded instead of letting httpx json.dumps it
+            content = self.json_codec.dumps(json)
+            content_type = content_type or "application/json"
+            json = None
+        return super().build_request(
+            method=method,
+            path=path,
+            service_name=service_name,
+            auth_names=auth_names,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+
+    def process_response(
+        self,
+        *,
+        response: httpx.Response,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+    ) -> T:
+        if (
+            response.status_code != 204
+            and get_response_type(response.headers) == "json"
+        ):
+            if isinstance(cast_to, type) and issubclass(cast_to, pydantic.BaseModel):
+                # decoded and validated in one pass by pydantic-core
+                return typing.cast(T, parse_json_model(cast_to, response.content))
+            if self.json_codec is not None and cast_to is type(typing.Any):
+                return typing.cast(T, self.json_codec.loads(response.content))
+        return super().process_response(response=response, cast_to=cast_to)
+
+
+class MagicHourSyncBaseClient(_MagicHourClientMixin, SyncBaseClient):
+    """
+    `SyncBaseClient` with the SDK level request features configured on `Client`
+    (e.g. routing requests across a `TokenPool`, a custom `JsonCodec`, spans
+    for the client's `Tracer`).
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: typing.Union[str, typing.Dict[str, str]],
+        httpx_client: httpx.Client,
+        auths: typing.Optional[typing.Dict[str, AuthProvider]] = None,
+        token_pool: typing.Optional["TokenPool"] = None,
+        json_codec: typing.Optional["JsonCodec"] = None,
+        tracer: typing.Optional[Tracer] = None,
+        transfer_client: typing.Optional[httpx.Client] = None,
+        ledger: typing.Optional["JobLedger"] = None,
+        deduplicator: typing.Optional["RequestDeduplicator"] = None,
+        credit_budget: typing.Optional["CreditBudget"] = None,
+        face_detection_cache: typing.Optional["FaceDetectionCache"] = None,
+    ):
+        super().__init__(base_url=base_url, httpx_client=httpx_client, auths=auths)
+        self.token_pool = token_pool
+        self.json_codec = json_codec
+        self.tracer = tracer if tracer is not None else Tracer()
+        self.transfer_client = transfer_client
+        self.ledger = ledger
+        self.deduplicator = deduplicator
+        self.credit_budget = credit_budget
+        self.face_detection_cache = face_detection_cache
+
+    def with_token(self, token: typing.Optional[str]) -> "MagicHourSyncBaseClient":
+        """Copy of this client sharing its transport but authenticating as `token`"""
+        view = copy.copy(self)
+        view._auths = {"bearerAuth": AuthBearer(token=token)}
+        view.token_pool = None
+        return view
+
+    def request(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+        service_name: typing.Optional[str] = None,
+        auth_names: typing.Optional[typing.List[str]] = None,
+        query_params: typing.Optional[QueryParams] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        data: typing.Optional[httpx._types.RequestData] = None,
+        files: typing.Optional[httpx._types.RequestFiles] = None,
+        json: typing.Optional[typing.Any] = None,
+        content_type: typing.Optional[str] = None,
+        content: typing.Optional[httpx._types.RequestContent] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> T:
+        send = functools.partial(
+            self._send,
+            method=method,
+            path=path,
+            cast_to=cast_to,
+            service_name=service_name,
+            auth_names=auth_names,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+        budget = self.credit_budget
+        if budget is not None and budget.applies(method, path, json):
+            send = functools.partial(budget.run, path, send)
+        dedupe = self.deduplicator
+        if dedupe is not None and dedupe.applies(method, path, json):
+            scope = self._dedupe_scope(request_options)
+            result: T = dedupe.run(dedupe.fingerprint(scope, path, json), send)
+        else:
+            result = send()
+        if self.ledger is not None:
+            _ledger_module().record_created(method, path, result)
+        if budget is not None and method.upper() == "GET":
+            budget.observe(result)
+        if dedupe is not None and method.upper() == "GET":
+            dedupe.observe(result)
+        return result
+
+    def _send(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+        service_name: typing.Optional[str] = None,
+        auth_names: typing.Optional[typing.List[str]] = None,
+        query_params: typing.Optional[QueryParams] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        data: typing.Optional[httpx._types.RequestData] = None,
+        files: typing.Optional[httpx._types.RequestFiles] = None,
+        json: typing.Optional[typing.Any] = None,
+        content_type: typing.Optional[str] = None,
+        content: typing.Optional[httpx._types.RequestContent] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> T:
+        pool = self.token_pool
+        lease = None
+        if pool is not None:
+            lease = pool.acquire(method=method, path=path, json=json)
+            request_options = _with_bearer(request_options, lease.token)
+
+        try:
+            with self._request_span(method, path) as span:
+                if lease is not None and span.is_recording:
+                    span.set_attributes(
+                        {
+                            "magic_hour.token": lease.label,
+                            "magic_hour.token_pool.wait_seconds": lease.wait_seconds,
+                            "magic_hour.rate_limit.wait_seconds": lease.rate_limit_wait_seconds,
+                        }
+                    )
+                req_cfg = self.build_request(
+                    method=method,
+                    path=path,
+                    service_name=service_name,
+                    auth_names=auth_names,
+                    query_params=query_params,
+                    headers=headers,
+                    data=data,
+                    files=files,
+                    json=json,
+                    content_type=content_type,
+                    content=content,
+                    request_options=request_options,
+                )
+                started = time.perf_counter()
+                response = self.httpx_client.request(**req_cfg)
+                job = current_job()
+                if job is not None:
+                    job.record_request(method, path, started, time.perf_counter())
+                result: T = self._handle_response(
+                    response=response, cast_to=cast_to, span=span
+                )
+        except BaseException as e:
+            if pool is not None and lease is not None:
+                pool.release(lease, method=method, path=path, error=e)
+            raise
+
+        if pool is not None and lease is not None:
+            pool.release(lease, method=method, path=path, result=result)
+        return result
+
+
+class MagicHourAsyncBaseClient(_MagicHourClientMixin, AsyncBaseClient):
+    """
+    `AsyncBaseClient` with the SDK level request features configured on
+    `AsyncClient` (e.g. routing requests across a `TokenPool`, a custom
+    `JsonCodec`, spans for the client's `Tracer`).
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: typing.Union[str, typing.Dict[str, str]],
+        httpx_client: httpx.AsyncClient,
+        auths: typing.Optional[typing.Dict[str, AuthProvider]] = None,
+        token_pool: typing.Optional["TokenPool"] = None,
+        json_codec: typing.Optional["JsonCodec"] = None,
+        tracer: typing.Optional[Tracer] = None,
+        transfer_client: typing.Optional[httpx.AsyncClient] = None,
+        ledger: typing.Optional["JobLedger"] = None,
+        deduplicator: typing.Optional["RequestDeduplicator"] = None,
+        credit_budget: typing.Optional["CreditBudget"] = None,
+        face_detection_cache: typing.Optional["FaceDetectionCache"] = None,
+    ):
+        super().__init__(base_url=base_url, httpx_client=httpx_client, auths=auths)
+        self.token_pool = token_pool
+        self.json_codec = json_codec
+        self.tracer = tracer if tracer is not None else Tracer()
+        self.transfer_client = transfer_client
+        self.ledger = ledger
+        self.deduplicator = deduplicator
+        self.credit_budget = credit_budget
+        self.face_detection_cache = face_detection_cache
+
+    def with_token(self, token: typing.Optional[str]) -> "MagicHourAsyncBaseClient":
+        """Copy of this client sharing its transport but authenticating as `token`"""
+        view = copy.copy(self)
+        view._auths = {"bearerAuth": AuthBearer(token=token)}
+        view.token_pool = None
+        return view
+
+    async def request(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+        service_name: typing.Optional[str] = None,
+        auth_names: typing.Optional[typing.List[str]] = None,
+        query_params: typing.Optional[QueryParams] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        data: typing.Optional[httpx._types.RequestData] = None,
+        files: typing.Optional[httpx._types.RequestFiles] = None,
+        json: typing.Optional[typing.Any] = None,
+        content_type: typing.Optional[str] = None,
+        content: typing.Optional[httpx._types.RequestContent] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> T:
+        send = functools.partial(
+            self._send,
+            method=method,
+            path=path,
+            cast_to=cast_to,
+            service_name=service_name,
+            auth_names=auth_names,
+            query_params=query_params,
+            headers=headers,
+            data=data,
+            files=files,
+            json=json,
+            content_type=content_type,
+            content=content,
+            request_options=request_options,
+        )
+        budget = self.credit_budget
+        if budget is not None and budget.applies(method, path, json):
+            send = functools.partial(budget.run_async, path, send)
+        dedupe = self.deduplicator
+        if dedupe is not None and dedupe.applies(method, path, json):
+            scope = self._dedupe_scope(request_options)
+            result: T = await dedupe.run_async(
+                dedupe.fingerprint(scope, path, json), send
+            )
+        else:
+            result = await send()
+        if self.ledger is not None:
+            await _ledger_module().record_created_async(method, path, result)
+        if budget is not None and method.upper() == "GET":
+            budget.observe(result)
+        if dedupe is not None and method.upper() == "GET":
+            dedupe.observe(result)
+        return result
+
+    async def _send(
+        self,
+        *,
+        method: str,
+        path: str,
+        cast_to: typing.Union[typing.Type[T], typing.Any],
+        service_name: typing.Optional[str] = None,
+        auth_names: typing.Optional[typing.List[str]] = None,
+        query_params: typing.Optional[QueryParams] = None,
+        headers: typing.Optional[typing.Dict[str, str]] = None,
+        data: typing.Optional[httpx._types.RequestData] = None,
+        files: typing.Optional[httpx._types.RequestFiles] = None,
+        json: typing.Optional[typing.Any] = None,
+        content_type: typing.Optional[str] = None,
+        content: typing.Optional[httpx._types.RequestContent] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> T:
+        pool = self.token_pool
+        lease = None
+        if pool is not None:
+            lease = await pool.acquire_async(method=method, path=path, json=json)
+            request_options = _with_bearer(request_options, lease.token)
+
+        try:
+            with self._request_span(method, path) as span:
+                if lease is not None and span.is_recording:
+                    span.set_attributes(
+                        {
+                            "magic_hour.token": lease.label,
+                            "magic_hour.token_pool.wait_seconds": lease.wait_seconds,
+                            "magic_hour.rate_limit.wait_seconds": lease.rate_limit_wait_seconds,
+                        }
+                    )
+                req_cfg = self.build_request(
+                    method=method,
+                    path=path,
+                    service_name=service_name,
+                    auth_names=auth_names,
+                    query_params=query_params,
+                    headers=headers,
+                    data=data,
+                    files=files,
+                    json=json,
+                    content_type=content_type,
+                    content=content,
+                    request_options=request_options,
+                )
+                started = time.perf_counter()
+                response = await self.httpx_client.request(**req_cfg)
+                job = current_job()
+                if job is not None:
+                    job.record_request(method, path, started, time.perf_counter())
+                result: T = self._handle_response(
+                    response=response, cast_to=cast_to, span=span
+                )
+        except BaseException as e:
+            if pool is not None and lease is not None:
+                pool.release(lease, method=method, path=path, error=e)
+            raise
+
+        if pool is not None and lease is not None:
+            pool.release(lease, method=method, path=path, result=result)
+        return result
@@ -0,0 +1,209 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import time
+import typing
+
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class BatchItemResult(typing.Generic[T, R]):
+    """
+    The outcome of one item of a batch: either `result` or the `error` it raised.
+
+    Attributes:
+        index: Position of the item in the input
+        item: The input item
+        result: What the call returned, or None if it raised
+        error: The exception the call raised, or None if it succeeded
+        seconds: How long the call took, not counting time spent waiting for a slot
+    """
+
+    __slots__ = ("index", "item", "result", "error", "seconds")
+
+    def __init__(
+        self,
+        index: int,
+        item: T,
+        result: typing.Optional[R] = None,
+        error: typing.Optional[BaseException] = None,
+        seconds: float = 0.0,
+    ):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> R:
+        """The result, or raise the item's error"""
+        if self.error is not None:
+            raise self.error
+        return typing.cast(R, self.result)
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else f"result={self.result!r}"
+        return f"BatchItemResult(index={self.index}, {outcome})"
+
+
+async def run_in_thread(fn: typing.Callable[..., R], *args: typing.Any) -> R:
+    """
+    Run a blocking `fn(*args)` on the event loop's default executor, with the
+    caller's context variables, so it doesn't stall other tasks meanwhile (what
+    `asyncio.to_thread()` does on Python 3.9+)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(context.run, fn, *args))
+
+
+def _call(fn: typing.Callable[[T], R], index: int, item: T) -> "BatchItemResult[T, R]":
+    started = time.perf_counter()
+    try:
+        result = fn(item)
+    except Exception as e:
+        logger.warning("Batch item %s failed: %r", index, e)
+        return BatchItemResult(
+            index, item, error=e, seconds=time.perf_counter() - started
+        )
+    return BatchItemResult(
+        index, item, result=result, seconds=time.perf_counter() - started
+    )
+
+
+def run_batch(
+    fn: typing.Callable[[T], R],
+    items: typing.Iterable[T],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> typing.Generator["BatchItemResult[T, R]", None, None]:
+    """
+    Call `fn` on every item on a pool of `max_concurrency` threads, yielding a
+    `BatchItemResult` per item: in input order when `ordered`, otherwise as soon as
+    each one finishes. An item that raises doesn't stop the others.
+
+    Items are pulled from `items` lazily, only as threads free up, so large or
+    generated inputs are fine. In order, at most `max_concurrency` finished
+    results wait behind a slow item before pulling pauses. The threads are shut down when the iterator is
+    exhausted or closed; stopping early cancels the items not yet started.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return _run_batch(fn, items, max_concurrency, ordered)
+
+
+def _run_batch(
+    fn: typing.Callable[[T], R],
+    items: typing.Iterable[T],
+    max_concurrency: int,
+    ordered: bool,
+) -> typing.Generator["BatchItemResult[T, R]", None, None]:
+    source = enumerate(items)
+    pending: typing.Set["concurrent.futures.Future[BatchItemResult[T, R]]"] = set()
+    finished: typing.Dict[int, BatchItemResult[T, R]] = {}
+    next_index = 0
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="magic-hour-batch"
+    )
+
+    def fill() -> None:
+        # in order, items finished behind a slow one wait here: stop reading
+        # more once as many are buffered as run at once
+        while len(pending) < max_concurrency and len(finished) < max_concurrency:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending.add(executor.submit(_call, fn, index, item))
+
+    wait_for_running = True
+    try:
+        fill()
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                pending.discard(future)
+                outcome = future.result()
+                if not ordered:
+                    yield outcome
+                else:
+                    finished[outcome.index] = outcome
+            fill()
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+                fill()
+    except GeneratorExit:  # the caller stopped early: let running items finish
+        raise
+    except BaseException:  # e.g. Ctrl-C: don't wait on renders still in progress
+        wait_for_running = False
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=wait_for_running)
+
+
+class GenerateManyMixin:
+    """Adds `generate_many()` to a sync resource client with a `generate()` method"""
+
+    def generate_many(
+        self,
+        items: typing.Iterable[typing.Mapping[str, typing.Any]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+        **kwargs: typing.Any,
+    ) -> typing.Generator[
+        BatchItemResult[typing.Mapping[str, typing.Any], typing.Any], None, None
+    ]:
+        """
+        Run `generate()` once per item, up to `max_concurrency` at a time, so
+        uploads, renders and downloads of different items overlap.
+
+        Each item is a dict of `generate()` arguments; keyword arguments given here
+        apply to every item (an item's own values win). Results are yielded in input
+        order, or as they complete with `ordered=False`; a failed item carries its
+        exception in `.error` instead of stopping the batch.
+
+        ```py
+        for outcome in client.v1.face_swap_photo.generate_many(
+            [{"assets": {...}}, {"assets": {...}}],
+            max_concurrency=16,
+            download_directory="outputs",
+        ):
+            if outcome.ok:
+                print(outcome.result.downloaded_paths)
+            else:
+                print(f"item {outcome.index} failed: {outcome.error}")
+        ```
+
+        Args:
+            items: `generate()` arguments for each job
+            max_concurrency: Maximum number of jobs in progress at once
+            ordered: Yield results in input order rather than as they complete
+            **kwargs: `generate()` arguments shared by every item
+        """
+        generate = getattr(self, "generate")
+        return run_batch(
+            lambda item: generate(**{**kwargs, **item}),
+            items,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
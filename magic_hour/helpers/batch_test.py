@@ -0,0 +1,151 @@
+import pathlib
+import pytest
+import threading
+import time
+import typing
+
+from magic_hour import ApiError
+from magic_hour.helpers.batch import run_batch
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def test_generate_many_overlaps_jobs(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.2)
+    client = mock.client()
+    items = [{"style": {"prompt": f"image {i}"}} for i in range(8)]
+
+    started = time.perf_counter()
+    outcomes = list(
+        client.v1.ai_image_generator.generate_many(
+            items,
+            max_concurrency=8,
+            image_count=1,
+            orientation="square",
+            download_directory=str(tmp_path),
+        )
+    )
+
+    assert time.perf_counter() - started < 0.2 * 4  # sequential would take 1.6s+
+    assert [o.index for o in outcomes] == list(range(8))
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert len(list(tmp_path.iterdir())) == 8
+
+
+def test_per_item_errors() -> None:
+    mock = MockMagicHour()
+    mock.inject(503, count=1, path="/v1/ai-image-generator")
+    client = mock.client()
+
+    outcomes = list(
+        client.v1.ai_image_generator.generate_many(
+            [{"image_count": 1}, {"image_count": 2}],
+            max_concurrency=1,
+            orientation="square",
+            style={"prompt": "a cat"},
+            download_outputs=False,
+        )
+    )
+
+    assert not outcomes[0].ok and isinstance(outcomes[0].error, ApiError)
+    with pytest.raises(ApiError):
+        outcomes[0].unwrap()
+    assert outcomes[1].ok and outcomes[1].unwrap().credits_charged == 10
+
+
+def test_unordered_results_and_bounded_concurrency() -> None:
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work(delay: float) -> float:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(delay)
+        with lock:
+            running -= 1
+        return delay
+
+    outcomes = list(run_batch(work, [0.2, 0.0, 0.1], max_concurrency=2, ordered=False))
+
+    assert [o.result for o in outcomes] == [0.0, 0.1, 0.2]
+    assert peak == 2
+
+
+def test_client_batch_stops_early() -> None:
+    client = MockMagicHour().client()
+    pulled: typing.List[int] = []
+
+    def items() -> typing.Iterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    batch = client.batch(lambda i: i * 2, items(), max_concurrency=2)
+    first = next(batch)
+    batch.close()
+
+    assert first.result == 0
+    assert len(pulled) < 10
+    assert not any(t.name.startswith("magic-hour-batch") for t in threading.enumerate())
+
+    with pytest.raises(ValueError):
+        client.batch(lambda i: i, [], max_concurrency=0)
+
+
+def test_interrupted_batch_does_not_wait_for_running_items() -> None:
+    release = threading.Event()
+    pulled: typing.List[int] = []
+
+    def items() -> typing.Iterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    batch = run_batch(
+        lambda i: i if i == 0 else release.wait(5), items(), max_concurrency=2
+    )
+    assert next(batch).result == 0
+    started = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        batch.throw(KeyboardInterrupt())
+
+    assert time.monotonic() - started < 1.0
+    assert len(pulled) == 3
+    release.set()
+
+
+def test_ordered_batch_buffers_a_bounded_number_behind_a_slow_item() -> None:
+    release = threading.Event()
+    pulled: typing.List[int] = []
+    read_while_blocked: typing.List[int] = []
+
+    def items() -> typing.Iterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    def work(i: int) -> int:
+        if i == 0:
+            release.wait(5)
+        return i
+
+    def release_later() -> None:
+        time.sleep(0.2)
+        read_while_blocked.append(len(pulled))
+        release.set()
+
+    threading.Thread(target=release_later).start()
+    results = [
+        outcome.result for outcome in run_batch(work, items(), max_concurrency=2)
+    ]
+
+    assert results == list(range(100))
+    # the slow head item and the two finished ones waiting behind it
+    assert read_while_blocked == [3]
@@ -0,0 +1,333 @@
+import asyncio
+import collections
+import math
+import pydantic
+import threading
+import time
+import typing
+
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+T = typing.TypeVar("T")
+
+_UPLOAD_URLS_PATH = "/v1/files/upload-urls"
+_RATE_WINDOW_SECONDS = 60.0
+_FINISHED_STATUSES = frozenset({"complete", "error", "canceled"})
+# how often a submission held back by the cap re-checks whether credits were freed
+_CAP_RECHECK_SECONDS = 1.0
+# how often an async submission waiting for an endpoint's first cost re-checks
+_PROBE_RECHECK_SECONDS = 0.05
+
+
+class CreditBudgetExceeded(Exception):
+    """Raised instead of submitting a job that a `CreditBudget` doesn't allow"""
+
+
+class CreditUsage(pydantic.BaseModel):
+    """
+    Point-in-time credit totals of a `CreditBudget`. Credits of unfinished jobs are
+    the latest `credits_charged` seen, which the API may still adjust.
+    """
+
+    in_flight_credits: float
+    """Submitted jobs that haven't finished, plus create requests awaiting a reply"""
+
+    completed_credits: float
+    """Jobs that finished (`complete`, `error` or `canceled`)"""
+
+    last_minute_credits: float
+    """Jobs submitted in the last 60 seconds"""
+
+    jobs: int
+    held_seconds: float
+    """Total time submissions waited for budget"""
+
+    rejected: int
+    """Submissions refused with `CreditBudgetExceeded`"""
+
+    @property
+    def committed_credits(self) -> float:
+        return self.in_flight_credits + self.completed_credits
+
+
+class _Charge:
+    __slots__ = ("credits", "submitted_at")
+
+    def __init__(self, credits: float, submitted_at: float):
+        self.credits = credits
+        self.submitted_at = submitted_at
+
+
+class CreditBudget:
+    """
+    Keeps a running total of the credits of submitted jobs and holds back new
+    submissions once a cap or spend rate is reached, so a runaway batch can't burn
+    through a month of credits. Share one budget between clients, threads and
+    tasks to govern all of them together:
+
+    ```py
+    budget = CreditBudget(max_credits=50_000, max_credits_per_minute=2_000)
+    client = Client(credit_budget=budget)
+    ...
+    print(budget.usage())
+    ```
+
+    Each job counts the `credits_charged` of its create response, updated from the
+    project whenever a status check returns it. Before a job is submitted, its cost
+    is estimated from the last job created through the same endpoint, and counted
+    while the create request is in flight so concurrent submissions can't overshoot.
+    Until an endpoint's cost is known (from `estimates`, `default_estimate` or a
+    create response), its submissions go one at a time, the others waiting for the
+    first reply. Endpoints in `exempt_paths` (face detection by default) are
+    counted but never held back.
+
+    Args:
+        max_credits: Most credits all jobs together may commit
+        max_credits_per_minute: Most credits of jobs submitted in any 60 seconds.
+            A single job costing more is still let through once the window is empty.
+        block: Wait until the submission fits instead of raising
+            `CreditBudgetExceeded`. Submissions that only a failed job's refund
+            could make room for are rejected when nothing is in flight.
+        timeout: With `block`, the longest a submission waits before raising
+        exempt_paths: Endpoints never held back
+        estimates: Credits a job is expected to cost per endpoint, e.g.
+            `{"/v1/ai-image-generator": 5}`, until a create response says otherwise
+        default_estimate: Expected cost of jobs on endpoints without an estimate,
+            so their first submissions needn't go one at a time
+    """
+
+    def __init__(
+        self,
+        *,
+        max_credits: typing.Optional[float] = None,
+        max_credits_per_minute: typing.Optional[float] = None,
+        block: bool = True,
+        timeout: typing.Optional[float] = None,
+        exempt_paths: typing.Iterable[str] = ("/v1/face-detection",),
+        estimates: typing.Optional[typing.Mapping[str, float]] = None,
+        default_estimate: typing.Optional[float] = None,
+    ):
+        for name, value in (
+            ("max_credits", max_credits),
+            ("max_credits_per_minute", max_credits_per_minute),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be greater than 0")
+        self.max_credits = max_credits
+        self.max_credits_per_minute = max_credits_per_minute
+        self.block = block
+        self.timeout = timeout
+        self.exempt_paths = frozenset(p.rstrip("/") for p in exempt_paths)
+        self._condition = threading.Condition()
+        # unfinished jobs by project id; finished ones are folded into the totals
+        self._charges: typing.Dict[str, _Charge] = {}
+        self._completed_credits = 0.0
+        self._jobs = 0
+        # charges submitted within the rate window, oldest first
+        self._recent: typing.Deque[_Charge] = collections.deque()
+        # estimated credits of create requests awaiting a reply: (submitted at, credits)
+        self._pending: typing.List[typing.Tuple[float, float]] = []
+        self.default_estimate = default_estimate
+        self._estimates: typing.Dict[str, float] = {
+            path.rstrip("/"): float(credits)
+            for path, credits in (estimates or {}).items()
+        }
+        # endpoints with no estimate yet whose first create request is in flight
+        self._probing: typing.Set[str] = set()
+        self._held_seconds = 0.0
+        self._rejected = 0
+
+    def applies(self, method: str, path: str, body: typing.Any) -> bool:
+        """Whether a request submits a job, so is counted"""
+        return (
+            body is not None
+            and method.upper() == "POST"
+            and path.rstrip("/") != _UPLOAD_URLS_PATH
+        )
+
+    def usage(self) -> CreditUsage:
+        with self._condition:
+            now = time.monotonic()
+            return CreditUsage(
+                in_flight_credits=self._in_flight_credits(),
+                completed_credits=self._completed_credits,
+                last_minute_credits=self._window_credits(now)[0],
+                jobs=self._jobs,
+                held_seconds=self._held_seconds,
+                rejected=self._rejected,
+            )
+
+    def _in_flight_credits(self) -> float:
+        return sum(c.credits for c in self._charges.values()) + sum(
+            credits for _, credits in self._pending
+        )
+
+    def _window_credits(self, now: float) -> typing.Tuple[float, float]:
+        """Credits submitted within the rate window, and when the oldest leaves it"""
+        start = now - _RATE_WINDOW_SECONDS
+        while self._recent and self._recent[0].submitted_at <= start:
+            self._recent.popleft()
+        submitted = [(c.submitted_at, c.credits) for c in self._recent]
+        in_window = [(t, c) for t, c in submitted + self._pending if t > start]
+        if not in_window:
+            return 0.0, now
+        oldest = min(t for t, _ in in_window)
+        return sum(c for _, c in in_window), oldest + _RATE_WINDOW_SECONDS
+
+    def _hold_for(self, path: str, estimate: float, now: float) -> float:
+        """0 if a job costing `estimate` may be submitted now, else seconds to wait"""
+        if path in self.exempt_paths:
+            return 0.0
+        wait = 0.0
+        if self.max_credits is not None:
+            committed = self._completed_credits + self._in_flight_credits()
+            if committed >= self.max_credits or committed + estimate > self.max_credits:
+                in_flight = self._pending or self._charges
+                # only a refund for a job still in flight could make room
+                wait = _CAP_RECHECK_SECONDS if in_flight else math.inf
+        if self.max_credits_per_minute is not None:
+            spent, frees_at = self._window_credits(now)
+            limit = self.max_credits_per_minute
+            if spent > 0 and (spent >= limit or spent + estimate > limit):
+                wait = max(wait, frees_at - now)
+        return wait
+
+    def _admit(
+        self, path: str, started: float, deadline: typing.Optional[float]
+    ) -> typing.Tuple[typing.Optional[typing.Tuple[float, float]], float]:
+        """
+        Count a submission as pending if it fits, returning its pending record, or
+        return how long to wait (raising if it may not wait)
+        """
+        # must hold the condition's lock
+        now = time.monotonic()
+        known = self._estimates.get(path, self.default_estimate)
+        estimate = known if known is not None else 0.0
+        # wait for the reply that tells the cost, rather than guessing it's free
+        probing = known is None and path in self._probing
+        wait = (
+            _PROBE_RECHECK_SECONDS if probing else self._hold_for(path, estimate, now)
+        )
+        if wait <= 0:
+            if known is None and self._capped(path):
+                self._probing.add(path)
+            pending = (now, estimate)
+            self._pending.append(pending)
+            self._held_seconds += now - started
+            return pending, 0.0
+        if (
+            (not self.block and not probing)
+            or wait == math.inf
+            or (deadline is not None and now >= deadline)
+        ):
+            self._rejected += 1
+            self._held_seconds += now - started
+            raise CreditBudgetExceeded(
+                f"Submitting to {path} would exceed the credit budget "
+                f"(estimated {estimate:g} credits; {self._summary()})"
+            )
+        if deadline is not None:
+            wait = min(wait, deadline - now)
+        return None, wait
+
+    def _capped(self, path: str) -> bool:
+        return path not in self.exempt_paths and (
+            self.max_credits is not None or self.max_credits_per_minute is not None
+        )
+
+    def _summary(self) -> str:
+        usage = self.usage()
+        return (
+            f"{usage.committed_credits:g} committed of "
+            f"{self.max_credits if self.max_credits is not None else 'unlimited'}, "
+            f"{usage.last_minute_credits:g} in the last minute of "
+            f"{self.max_credits_per_minute if self.max_credits_per_minute is not None else 'unlimited'}"
+        )
+
+    def _settle(
+        self, path: str, pending: typing.Tuple[float, float], response: typing.Any
+    ) -> None:
+        with self._condition:
+            self._pending.remove(pending)
+            self._probing.discard(path)  # the only submission admitted while probing
+            project_id = getattr(response, "id", None)
+            credits = getattr(response, "credits_charged", None)
+            if isinstance(project_id, str) and isinstance(credits, (int, float)):
+                self._estimates[path] = float(credits)
+                charge = _Charge(float(credits), pending[0])
+                self._charges[project_id] = charge
+                self._recent.append(charge)
+                self._jobs += 1
+            self._condition.notify_all()
+
+    def observe(self, project: typing.Any) -> None:
+        """Update a job's credits from a project returned by a status check"""
+        project_id = getattr(project, "id", None)
+        credits = getattr(project, "credits_charged", None)
+        if not isinstance(project_id, str) or not isinstance(credits, (int, float)):
+            return
+        with self._condition:
+            charge = self._charges.get(project_id)
+            if charge is None:
+                return
+            charge.credits = float(credits)
+            if getattr(project, "status", None) in _FINISHED_STATUSES:
+                del self._charges[project_id]
+                self._completed_credits += charge.credits
+            self._condition.notify_all()
+
+    def run(self, path: str, send: typing.Callable[[], T]) -> T:
+        """Call `send()` (which submits a job to `path`) once the budget allows it"""
+        path = path.rstrip("/")
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        with self._condition:
+            started = time.monotonic()
+            pending, wait = self._admit(path, started, deadline)
+            while pending is None:
+                self._condition.wait(wait)
+                pending, wait = self._admit(path, started, deadline)
+        try:
+            response = send()
+        except BaseException:
+            self._settle(path, pending, None)
+            raise
+        self._settle(path, pending, response)
+        return response
+
+    async def run_async(
+        self, path: str, send: typing.Callable[[], typing.Awaitable[T]]
+    ) -> T:
+        """Async version of `run()`"""
+        path = path.rstrip("/")
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        started = time.monotonic()
+        with self._condition:
+            pending, wait = self._admit(path, started, deadline)
+        while pending is None:
+            # re-checked at least every second, since releases can't wake this task
+            await asyncio.sleep(min(wait, _CAP_RECHECK_SECONDS))
+            with self._condition:
+                pending, wait = self._admit(path, started, deadline)
+        try:
+            response = await send()
+        except BaseException:
+            self._settle(path, pending, None)
+            raise
+        self._settle(path, pending, response)
+        return response
+
+
+def get_credit_budget(base_client: typing.Any) -> typing.Optional[CreditBudget]:
+    """The credit budget configured on a base client, if any"""
+    budget = getattr(base_client, "credit_budget", None)
+    return budget if isinstance(budget, CreditBudget) else None
+
+
+def observe_credits(base_client: typing.Any, project: typing.Any) -> None:
+    """Report a project returned by a status check to the client's credit budget"""
+    budget = get_credit_budget(base_client)
+    if budget is not None:
+        budget.observe(project)
@@ -0,0 +1,162 @@
+import asyncio
+import pytest
+import threading
+import time
+import types
+import typing
+
+from magic_hour.helpers import budget as budget_module
+from magic_hour.helpers.budget import CreditBudget, CreditBudgetExceeded
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+IMAGE: typing.Dict[str, typing.Any] = {
+    "image_count": 1,  # 5 credits on the mock server
+    "orientation": "square",
+    "style": {"prompt": "x"},
+}
+
+
+def test_cap_rejects_submissions_but_not_exempt_calls() -> None:
+    budget = CreditBudget(max_credits=10, block=False)
+    client = MockMagicHour().client(credit_budget=budget)
+
+    client.v1.ai_image_generator.generate(**IMAGE, download_outputs=False)
+    client.v1.ai_image_generator.create(**IMAGE)
+    with pytest.raises(CreditBudgetExceeded):
+        client.v1.ai_image_generator.create(**IMAGE)
+    client.v1.face_detection.create(assets={"target_file_path": "api-assets/a.png"})
+
+    usage = budget.usage()
+    assert usage.completed_credits == 5 and usage.in_flight_credits == 5
+    assert usage.jobs == 3 and usage.rejected == 1
+
+
+def test_concurrent_submissions_do_not_overshoot_the_cap() -> None:
+    mock = MockMagicHour(latency_seconds=0.05)
+    budget = CreditBudget(max_credits=20, block=False)
+    client = mock.client(credit_budget=budget)
+    client.v1.ai_image_generator.create(**IMAGE)  # teaches the budget the cost
+    outcomes: typing.List[bool] = []
+
+    def submit() -> None:
+        try:
+            client.v1.ai_image_generator.create(**IMAGE)
+            outcomes.append(True)
+        except CreditBudgetExceeded:
+            outcomes.append(False)
+
+    threads = [threading.Thread(target=submit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes.count(True) == 3
+    assert budget.usage().committed_credits == 20
+
+
+def test_first_concurrent_submissions_wait_for_the_cost() -> None:
+    mock = MockMagicHour(latency_seconds=0.2)
+    budget = CreditBudget(max_credits=10, block=False)
+    client = mock.client(credit_budget=budget)
+    outcomes: typing.List[bool] = []
+
+    def submit() -> None:
+        try:
+            client.v1.ai_image_generator.create(**IMAGE)
+            outcomes.append(True)
+        except CreditBudgetExceeded:
+            outcomes.append(False)
+
+    threads = [threading.Thread(target=submit) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes.count(True) == 2
+    assert budget.usage().committed_credits == 10
+
+
+@pytest.mark.asyncio
+async def test_async_first_submissions_wait_for_the_cost() -> None:
+    budget = CreditBudget(max_credits=10, block=False)
+    client = MockMagicHour(latency_seconds=0.1).async_client(credit_budget=budget)
+
+    outcomes = await asyncio.gather(
+        *(client.v1.ai_image_generator.create(**IMAGE) for _ in range(6)),
+        return_exceptions=True,
+    )
+
+    assert sum(not isinstance(o, BaseException) for o in outcomes) == 2
+    assert all(
+        isinstance(o, CreditBudgetExceeded)
+        for o in outcomes
+        if isinstance(o, BaseException)
+    )
+    assert budget.usage().committed_credits == 10
+
+
+def test_spend_rate_holds_submissions_back() -> None:
+    budget = CreditBudget(max_credits_per_minute=10, timeout=0.2)
+    client = MockMagicHour().client(credit_budget=budget)
+
+    client.v1.ai_image_generator.create(**IMAGE)
+    client.v1.ai_image_generator.create(**IMAGE)
+    started = time.monotonic()
+    with pytest.raises(CreditBudgetExceeded):
+        client.v1.ai_image_generator.create(**IMAGE)
+
+    assert time.monotonic() - started >= 0.2
+    assert budget.usage().last_minute_credits == 10
+    assert budget.usage().held_seconds >= 0.2
+
+
+def test_finished_jobs_are_folded_into_totals(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(
+        budget_module, "time", types.SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    budget = CreditBudget(max_credits=10_000, max_credits_per_minute=1_000)
+
+    for i in range(500):
+        clock.now = i * 0.5
+        project = types.SimpleNamespace(id=f"p{i}", credits_charged=2, status="queued")
+        budget.run("/v1/ai-image-generator", lambda: project)
+        if i % 5:
+            budget.observe(
+                types.SimpleNamespace(**{**vars(project), "status": "complete"})
+            )
+
+    usage = budget.usage()
+    assert usage.jobs == 500 and usage.completed_credits == 400 * 2
+    assert usage.in_flight_credits == 100 * 2
+    assert usage.last_minute_credits == 120 * 2  # submitted at 190s..249.5s
+    # only unfinished jobs and the last minute's submissions are kept
+    assert len(budget._charges) == 100 and len(budget._recent) == 120
+
+
+@pytest.mark.asyncio
+async def test_async_budget_tracks_final_credits() -> None:
+    budget = CreditBudget(max_credits=500)
+    client = MockMagicHour(render_seconds=0.05).async_client(credit_budget=budget)
+
+    result = await client.v1.text_to_video.generate(
+        end_seconds=5.0,
+        orientation="landscape",
+        style={"prompt": "x"},
+        download_outputs=False,
+    )
+
+    assert result.status == "complete"
+    usage = budget.usage()
+    assert usage.completed_credits == result.credits_charged == 150
+    assert usage.in_flight_credits == 0
+    with pytest.raises(ValueError):
+        CreditBudget(max_credits=0)
@@ -0,0 +1,198 @@
+import datetime
+import io
+import pathlib
+import time
+import typing
+import urllib.parse
+
+from magic_hour.helpers.ledger import projects_client
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.transfer import (
+    async_transfer_client,
+    get_transfer_client,
+    sync_transfer_client,
+)
+
+
+logger = get_sdk_logger(__name__)
+
+DEFAULT_MIN_VALIDITY_SECONDS = 600.0
+"""How long an output URL must stay valid to be handed to the next job as-is"""
+
+
+def _parse_expiry(value: typing.Optional[str]) -> typing.Optional[float]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+class OutputRef(str):
+    """
+    An output of a finished project, usable anywhere an input file is: it is the
+    output's download URL, which the API fetches itself, so chaining jobs needs no
+    local download and no re-upload. Get one with `result.output()`:
+
+    ```py
+    image = client.v1.ai_image_generator.generate(..., download_outputs=False)
+    video = client.v1.image_to_video.generate(
+        assets={"image_file_path": image.output()}, ...
+    )
+    ```
+
+    Download URLs expire. When a job's files are uploaded, a reference valid for
+    less than `min_validity_seconds` is refreshed by fetching the project again,
+    and only if that doesn't produce a usable URL is the output copied through
+    memory and uploaded.
+    """
+
+    project_id: str
+    kind: str
+    """`"video"`, `"image"` or `"audio"`: the kind of project the output belongs to"""
+
+    output_index: int
+    """Position of the output in the project's `downloads`"""
+
+    expires_at: typing.Optional[str]
+    min_validity_seconds: float
+
+    def __new__(
+        cls,
+        url: str,
+        project_id: str,
+        kind: str,
+        output_index: int = 0,
+        expires_at: typing.Optional[str] = None,
+        min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS,
+    ) -> "OutputRef":
+        ref = super().__new__(cls, url)
+        ref.project_id = project_id
+        ref.kind = kind
+        ref.output_index = output_index
+        ref.expires_at = expires_at
+        ref.min_validity_seconds = min_validity_seconds
+        return ref
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (
+            OutputRef,
+            (
+                str(self),
+                self.project_id,
+                self.kind,
+                self.output_index,
+                self.expires_at,
+                self.min_validity_seconds,
+            ),
+        )
+
+    def expires_in(self) -> typing.Optional[float]:
+        """Seconds until the URL expires (negative once expired), None if unknown"""
+        expiry = _parse_expiry(self.expires_at)
+        return expiry - time.time() if expiry is not None else None
+
+    @property
+    def usable(self) -> bool:
+        remaining = self.expires_in()
+        return remaining is None or remaining >= self.min_validity_seconds
+
+    def _refreshed(self, project: typing.Any) -> typing.Optional["OutputRef"]:
+        downloads = getattr(project, "downloads", None) or []
+        if self.output_index >= len(downloads):
+            return None
+        download = downloads[self.output_index]
+        return OutputRef(
+            download.url,
+            self.project_id,
+            self.kind,
+            self.output_index,
+            download.expires_at,
+            self.min_validity_seconds,
+        )
+
+    def _file_name(self) -> str:
+        return pathlib.PurePosixPath(urllib.parse.urlparse(self).path).name
+
+
+def output_ref(
+    project: typing.Any,
+    kind: str,
+    index: int = 0,
+    min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS,
+) -> OutputRef:
+    """The `index`-th output of a `kind` project response, as an `OutputRef`"""
+    if project.status != "complete":
+        raise ValueError(
+            f"Project {project.id} has status {project.status}; only outputs of "
+            "complete projects can be passed on"
+        )
+    downloads = project.downloads or []
+    if index >= len(downloads):
+        raise IndexError(f"Project {project.id} has {len(downloads)} output(s)")
+    download = downloads[index]
+    return OutputRef(
+        download.url,
+        project.id,
+        kind,
+        index,
+        download.expires_at,
+        min_validity_seconds,
+    )
+
+
+def resolve_output(file_client: typing.Any, ref: OutputRef) -> str:
+    """
+    What to put in an asset field for `ref`: its URL if still valid long enough,
+    else a refreshed URL, else the path of a copy uploaded through memory
+    """
+    if ref.usable:
+        return str(ref)
+    base_client = file_client._base_client
+    source = ref
+    try:
+        project = projects_client(ref.kind, base_client, asynchronous=False).get(
+            id=ref.project_id
+        )
+        source = ref._refreshed(project) or ref
+    except Exception as e:
+        logger.warning("Could not refresh output of project %s: %r", ref.project_id, e)
+    if source.usable and source is not ref:
+        return str(source)
+
+    logger.info("Copying output of project %s through memory", ref.project_id)
+    with sync_transfer_client(get_transfer_client(base_client)) as client:
+        response = client.get(str(source))
+        response.raise_for_status()
+    buffer = io.BytesIO(response.content)
+    buffer.name = ref._file_name()
+    return typing.cast(str, file_client.upload_file(buffer))
+
+
+async def resolve_output_async(file_client: typing.Any, ref: OutputRef) -> str:
+    """Async version of `resolve_output()`"""
+    if ref.usable:
+        return str(ref)
+    base_client = file_client._base_client
+    source = ref
+    try:
+        project = await projects_client(ref.kind, base_client, asynchronous=True).get(
+            id=ref.project_id
+        )
+        source = ref._refreshed(project) or ref
+    except Exception as e:
+        logger.warning("Could not refresh output of project %s: %r", ref.project_id, e)
+    if source.usable and source is not ref:
+        return str(source)
+
+    logger.info("Copying output of project %s through memory", ref.project_id)
+    async with async_transfer_client(get_transfer_client(base_client)) as client:
+        response = await client.get(str(source))
+        response.raise_for_status()
+    buffer = io.BytesIO(response.content)
+    buffer.name = ref._file_name()
+    return typing.cast(str, await file_client.upload_file(buffer))
@@ -0,0 +1,103 @@
+import copy
+import pickle
+import pytest
+import typing
+
+from magic_hour.helpers.chain import OutputRef
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+IMAGE: typing.Dict[str, typing.Any] = {
+    "image_count": 1,
+    "orientation": "square",
+    "style": {"prompt": "x"},
+    "download_outputs": False,
+}
+
+
+def _transfers(mock: MockMagicHour) -> typing.List[str]:
+    return [r.path for r in mock.requests if r.path.startswith(("/cdn/", "/upload/"))]
+
+
+def _animate(client: typing.Any, image: typing.Any) -> typing.Any:
+    return client.v1.image_to_video.generate(
+        assets={"image_file_path": image},
+        end_seconds=2.0,
+        style={"prompt": "y"},
+        download_outputs=False,
+    )
+
+
+def _expired(ref: OutputRef) -> OutputRef:
+    return OutputRef(ref, ref.project_id, ref.kind, expires_at="2020-01-01T00:00:00Z")
+
+
+def test_outputs_are_passed_on_by_url() -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+
+    image = client.v1.ai_image_generator.generate(**IMAGE)
+    ref = image.output()
+    video = _animate(client, ref)
+
+    assert ref == image.downloads[0].url and ref.usable
+    assert video.status == "complete"
+    assert mock._jobs[video.id].body["assets"]["image_file_path"] == ref
+    assert _transfers(mock) == []
+
+
+def test_expiring_outputs_are_refreshed() -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+    image = client.v1.ai_image_generator.generate(**IMAGE)
+
+    video = _animate(client, _expired(image.output()))
+
+    refreshed = mock._jobs[video.id].body["assets"]["image_file_path"]
+    assert refreshed.endswith(f"/cdn/{image.id}/{image.id}-0.png")
+    assert ("GET", f"/v1/image-projects/{image.id}") in [
+        (r.method, r.path) for r in mock.requests
+    ]
+    assert _transfers(mock) == []
+
+
+@pytest.mark.asyncio
+async def test_outputs_that_cannot_be_refreshed_are_copied_through_memory() -> None:
+    mock = MockMagicHour()
+    client = mock.async_client()
+    image = await client.v1.ai_image_generator.generate(**IMAGE)
+    mock.inject(404, count=1, path="/v1/image-projects/")
+
+    video = await client.v1.image_to_video.generate(
+        assets={"image_file_path": _expired(image.output())},
+        end_seconds=2.0,
+        style={"prompt": "y"},
+        download_outputs=False,
+    )
+
+    uploaded = mock._jobs[video.id].body["assets"]["image_file_path"]
+    assert uploaded in mock.uploads
+    assert [p.split("/")[1] for p in _transfers(mock)] == ["cdn", "upload"]
+
+
+def test_refs_round_trip_and_require_complete_projects() -> None:
+    client = MockMagicHour(job_failure_rate=1.0).client()
+    ref = OutputRef("https://cdn.test/a.png", "p1", "image", 2, None, 60.0)
+
+    for copied in (pickle.loads(pickle.dumps(ref)), copy.deepcopy(ref)):
+        assert copied == ref and isinstance(copied, OutputRef)
+        assert (copied.project_id, copied.kind, copied.output_index) == (
+            "p1",
+            "image",
+            2,
+        )
+        assert copied.min_validity_seconds == 60.0
+
+    failed = client.v1.ai_image_generator.generate(**IMAGE)
+    with pytest.raises(ValueError):
+        failed.output()
@@ -0,0 +1,162 @@
+import collections
+import heapq
+import json
+import os
+import threading
+import typing
+
+from magic_hour.helpers.tracing import WAIT, Span, SpanListener
+
+
+class TraceRecorder(SpanListener):
+    """
+    Records SDK spans as a timeline in the Chrome trace-event format, which can be
+    opened in [Perfetto](https://ui.perfetto.dev) or `chrome://tracing`.
+
+    Every top-level operation (a `generate()` call, or a request made outside of
+    one) is drawn on a "worker" row, reusing the lowest free row, so the number of
+    rows is the peak concurrency and gaps show idle time. Its uploads, create
+    request, status polls (split into queued / rendering) and downloads are nested
+    underneath.
+
+    Events are kept in a ring buffer of `max_events`, so long runs keep the most
+    recent part of the timeline in bounded memory.
+
+    ```py
+    recorder = client.record_trace(max_events=200_000)
+    ...  # run jobs
+    recorder.save("run.trace.json")
+    ```
+
+    Args:
+        max_events: Maximum number of trace events kept; older ones are dropped
+    """
+
+    def __init__(self, max_events: int = 100_000):
+        if max_events <= 0:
+            raise ValueError("max_events must be greater than 0")
+        self.max_events = max_events
+        self._events: typing.Deque[typing.Dict[str, typing.Any]] = collections.deque(
+            maxlen=max_events
+        )
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._lanes: typing.Dict[int, int] = {}
+        self._free_lanes: typing.List[int] = []
+        self._lane_count = 0
+        self._recorded = 0
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded because the ring buffer was full"""
+        with self._lock:
+            return self._recorded - len(self._events)
+
+    def on_start(self, span: Span) -> None:
+        if span.parent is not None:
+            return
+        with self._lock:
+            if self._free_lanes:
+                lane = heapq.heappop(self._free_lanes)
+            else:
+                self._lane_count += 1
+                lane = self._lane_count
+            self._lanes[span.trace_id] = lane
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            lane = self._lanes.get(span.trace_id, 0)
+            if span.parent is None and self._lanes.pop(span.trace_id, None) is not None:
+                heapq.heappush(self._free_lanes, lane)
+        events = [self._complete_event(span, lane)]
+        if span.name == WAIT:
+            events.extend(self._status_events(span, lane))
+        with self._lock:
+            self._events.extend(events)
+            self._recorded += len(events)
+
+    def _complete_event(self, span: Span, lane: int) -> typing.Dict[str, typing.Any]:
+        args: typing.Dict[str, typing.Any] = {
+            k: v for k, v in span.attributes.items() if v is not None
+        }
+        args["status"] = span.status
+        if span.exception is not None:
+            args["exception"] = repr(span.exception)
+        end = span.end_time_ns if span.end_time_ns is not None else span.start_time_ns
+        return {
+            "name": span.name.replace("magic_hour.", "", 1),
+            "cat": "magic_hour",
+            "ph": "X",
+            "ts": span.start_time_ns / 1000,
+            "dur": (end - span.start_time_ns) / 1000,
+            "pid": self._pid,
+            "tid": lane,
+            "args": args,
+        }
+
+    def _status_events(
+        self, span: Span, lane: int
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        end = span.end_time_ns if span.end_time_ns is not None else span.start_time_ns
+        changes = [(ts, attrs.get("status")) for name, ts, attrs in span.events]
+        events = []
+        for i, (ts, status) in enumerate(changes):
+            until = changes[i + 1][0] if i + 1 < len(changes) else end
+            if until <= ts:
+                continue
+            events.append(
+                {
+                    "name": str(status),
+                    "cat": "magic_hour.status",
+                    "ph": "X",
+                    "ts": ts / 1000,
+                    "dur": (until - ts) / 1000,
+                    "pid": self._pid,
+                    "tid": lane,
+                    "args": {
+                        "project_id": span.attributes.get("magic_hour.project_id")
+                    },
+                }
+            )
+        return events
+
+    def clear(self) -> None:
+        """Drop every recorded event"""
+        with self._lock:
+            self._events.clear()
+            self._recorded = 0
+
+    def to_chrome_trace(self) -> typing.Dict[str, typing.Any]:
+        """The recorded timeline as a Chrome trace-event JSON object"""
+        with self._lock:
+            events = list(self._events)
+            lane_count = self._lane_count
+            dropped = self._recorded - len(events)
+        metadata: typing.List[typing.Dict[str, typing.Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "args": {"name": "magic_hour"},
+            }
+        ]
+        for lane in range(lane_count + 1):
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": lane,
+                    "args": {"name": f"worker {lane}" if lane else "other"},
+                }
+            )
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": dropped},
+        }
+
+    def save(self, path: typing.Union[str, "os.PathLike[str]"]) -> None:
+        """Write the timeline to `path` as Chrome trace-event JSON"""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -0,0 +1,121 @@
+import asyncio
+import httpx
+import itertools
+import json
+import pathlib
+import pytest
+import typing
+
+from magic_hour import AsyncClient, Client
+from magic_hour.helpers import TraceRecorder
+
+
+def _video_project(status: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "created_at": "2024-10-18T05:16:19.027Z",
+        "credits_charged": 450,
+        "download": None,
+        "downloads": [],
+        "enabled": True,
+        "end_seconds": 5.0,
+        "error": None,
+        "fps": 30.0,
+        "height": 960,
+        "id": "cuid-example",
+        "name": "Example Name",
+        "start_seconds": 0.0,
+        "status": status,
+        "total_frame_cost": 450,
+        "type": "TEXT_TO_VIDEO",
+        "width": 512,
+    }
+
+
+def _handler() -> typing.Callable[[httpx.Request], httpx.Response]:
+    statuses = itertools.cycle(["queued", "rendering", "complete"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={
+                    "credits_charged": 450,
+                    "estimated_frame_cost": 450,
+                    "id": "cuid-example",
+                },
+            )
+        return httpx.Response(200, json=_video_project(next(statuses)))
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jobs_get_their_own_rows(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    handler = _handler()
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.001)
+        return handler(request)
+
+    client = AsyncClient(
+        token="API_TOKEN",
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(slow_handler)),
+    )
+    recorder = client.record_trace()
+
+    await asyncio.gather(
+        *(
+            client.v1.text_to_video.generate(
+                end_seconds=5.0,
+                style={"prompt": "a dog running"},
+                orientation="landscape",
+                download_outputs=False,
+            )
+            for _ in range(3)
+        )
+    )
+    recorder.save(tmp_path / "run.trace.json")
+
+    trace = json.loads((tmp_path / "run.trace.json").read_text())
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    generates = [e for e in events if e["name"] == "generate"]
+    assert sorted(e["tid"] for e in generates) == [1, 2, 3]
+    for generate in generates:
+        children = [
+            e for e in events if e["tid"] == generate["tid"] and e is not generate
+        ]
+        assert {"request", "wait"} <= {e["name"] for e in children}
+        assert all(
+            generate["ts"] <= e["ts"]
+            and e["ts"] + e["dur"] <= generate["ts"] + generate["dur"] + 1
+            for e in children
+        )
+    assert any(e["cat"] == "magic_hour.status" for e in events)
+    assert trace["otherData"] == {"dropped_events": 0}
+
+
+def test_ring_buffer_keeps_latest_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    recorder = TraceRecorder(max_events=4)
+    client = Client(
+        token="API_TOKEN",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler())),
+        span_listeners=[recorder],
+    )
+
+    client.v1.text_to_video.generate(
+        end_seconds=5.0, style={"prompt": "a dog running"}, download_outputs=False
+    )
+
+    events = [e for e in recorder.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+    assert len(events) == 4
+    assert recorder.dropped > 0
+    assert "generate" in {e["name"] for e in events}  # the last span to end
+
+    client.tracer.remove_listener(recorder)
+    recorder.clear()
+    client.v1.video_projects.get(id="cuid-example")
+    assert recorder.to_chrome_trace()["otherData"] == {"dropped_events": 0}
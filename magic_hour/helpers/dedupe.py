@@ -0,0 +1,239 @@
+import asyncio
+import collections
+import copy
+import hashlib
+import json
+import threading
+import time
+import typing
+
+from magic_hour.helpers.batch import run_in_thread
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+T = typing.TypeVar("T")
+
+_UPLOAD_URLS_PATH = "/v1/files/upload-urls"
+_ASSET_PREFIX = "api-assets/"
+_FAILED_STATUSES = frozenset({"error", "canceled"})
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: typing.Any = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class RequestDeduplicator:
+    """
+    Collapses identical create requests into one project. Retry storms and
+    duplicate upstream events then cost one render instead of many:
+
+    - concurrent identical requests share the request already in flight
+    - an identical request within `window_seconds` of a successful one reuses its
+      project
+
+    Requests are identical when they go to the same endpoint for the same API
+    token with the same body, where uploaded assets are compared by their content
+    (a SHA-256 computed while uploading) rather than by their `api-assets/` path.
+    Projects a status check sees end in `error` or `canceled` are not reused.
+
+    ```py
+    dedupe = RequestDeduplicator(window_seconds=600)
+    client = Client(deduplicator=dedupe)
+    metrics.track_cache("dedupe", dedupe.stats)  # optional
+    ```
+
+    Args:
+        window_seconds: How long a created project is reused for identical requests
+        max_entries: Most recent projects (and asset hashes) remembered
+    """
+
+    def __init__(self, *, window_seconds: float = 300.0, max_entries: int = 10_000):
+        if window_seconds < 0:
+            raise ValueError("window_seconds must not be negative")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._flights: typing.Dict[str, _Flight] = {}
+        self._async_flights: typing.Dict[str, "asyncio.Future[typing.Any]"] = {}
+        # fingerprint -> (created at, response), oldest first
+        self._completed: "collections.OrderedDict[str, typing.Tuple[float, typing.Any]]" = collections.OrderedDict()
+        self._assets: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> typing.Tuple[int, int]:
+        """`(hits, misses)`: requests answered without / with a new project"""
+        return self.hits, self.misses
+
+    def applies(self, method: str, path: str, body: typing.Any) -> bool:
+        """Whether a request creates a project, so is deduplicated"""
+        return (
+            body is not None
+            and method.upper() == "POST"
+            and path.rstrip("/") != _UPLOAD_URLS_PATH
+        )
+
+    def register_asset(self, file_path: str, content: bytes) -> None:
+        """Remember the content hash of a file uploaded to `file_path`"""
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._assets[file_path] = digest
+            while len(self._assets) > self.max_entries:
+                self._assets.popitem(last=False)
+
+    async def register_asset_async(self, file_path: str, content: bytes) -> None:
+        """Async version of `register_asset()`, hashing on a worker thread"""
+        await run_in_thread(self.register_asset, file_path, content)
+
+    def asset_digest(self, file_path: str) -> typing.Optional[str]:
+        """SHA-256 of the content uploaded to `file_path`, if it was registered"""
+        with self._lock:
+            return self._assets.get(file_path)
+
+    def _canonical(self, value: typing.Any) -> typing.Any:
+        if isinstance(value, dict):
+            return {k: self._canonical(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._canonical(v) for v in value]
+        if isinstance(value, str) and value.startswith(_ASSET_PREFIX):
+            digest = self._assets.get(value)
+            return f"sha256:{digest}" if digest is not None else value
+        return value
+
+    def fingerprint(self, scope: str, path: str, body: typing.Any) -> str:
+        """
+        Hash of a create request: `scope` (who is asking, e.g. the API token), the
+        endpoint, and the body with uploaded assets replaced by their content hash
+        """
+        with self._lock:
+            canonical = self._canonical(body)
+        encoded = json.dumps(
+            [scope, path.rstrip("/"), canonical],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def forget(self, project_id: str) -> None:
+        """Stop reusing the project `project_id`, e.g. because it failed"""
+        with self._lock:
+            for fingerprint, (_, response) in list(self._completed.items()):
+                if getattr(response, "id", None) == project_id:
+                    del self._completed[fingerprint]
+
+    def observe(self, project: typing.Any) -> None:
+        """Stop reusing a project a status check saw end in `error` or `canceled`"""
+        if getattr(project, "status", None) in _FAILED_STATUSES:
+            self.forget(project.id)
+
+    def _reuse(self, fingerprint: str) -> typing.Tuple[bool, typing.Any]:
+        # must hold the lock
+        entry = self._completed.get(fingerprint)
+        if entry is None:
+            return False, None
+        created_at, response = entry
+        if time.monotonic() - created_at > self.window_seconds:
+            del self._completed[fingerprint]
+            return False, None
+        self.hits += 1
+        logger.info(
+            "Reusing project %s for an identical request", getattr(response, "id", None)
+        )
+        return True, copy.copy(response)
+
+    def _complete(self, fingerprint: str, response: typing.Any) -> None:
+        # must hold the lock
+        self._completed[fingerprint] = (time.monotonic(), response)
+        self._completed.move_to_end(fingerprint)
+        while len(self._completed) > self.max_entries:
+            self._completed.popitem(last=False)
+
+    def run(self, fingerprint: str, send: typing.Callable[[], T]) -> T:
+        """Call `send()` unless an identical request is in flight or recent"""
+        with self._lock:
+            reused, response = self._reuse(fingerprint)
+            if reused:
+                return typing.cast(T, response)
+            flight = self._flights.get(fingerprint)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[fingerprint] = _Flight()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return typing.cast(T, copy.copy(flight.result))
+
+        try:
+            flight.result = send()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[fingerprint]
+                if flight.error is None:
+                    self._complete(fingerprint, flight.result)
+            flight.event.set()
+        return typing.cast(T, flight.result)
+
+    async def run_async(
+        self, fingerprint: str, send: typing.Callable[[], typing.Awaitable[T]]
+    ) -> T:
+        """Async version of `run()`"""
+        with self._lock:
+            reused, response = self._reuse(fingerprint)
+            if reused:
+                return typing.cast(T, response)
+            flight = self._async_flights.get(fingerprint)
+            leader = flight is None
+            if flight is None:
+                flight = asyncio.get_running_loop().create_future()
+                self._async_flights[fingerprint] = flight
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            return typing.cast(T, copy.copy(await asyncio.shield(flight)))
+
+        try:
+            result = await send()
+        except BaseException as e:
+            with self._lock:
+                del self._async_flights[fingerprint]
+            flight.set_exception(e)
+            flight.exception()  # retrieved here, so no waiter is fine too
+            raise
+        with self._lock:
+            del self._async_flights[fingerprint]
+            self._complete(fingerprint, result)
+        flight.set_result(result)
+        return result
+
+
+def get_deduplicator(base_client: typing.Any) -> typing.Optional[RequestDeduplicator]:
+    """The deduplicator configured on a base client, if any"""
+    dedupe = getattr(base_client, "deduplicator", None)
+    return dedupe if isinstance(dedupe, RequestDeduplicator) else None
+
+
+def observe_status(base_client: typing.Any, project: typing.Any) -> None:
+    """Report a project returned by a status check to the client's deduplicator"""
+    dedupe = get_deduplicator(base_client)
+    if dedupe is not None:
+        dedupe.observe(project)
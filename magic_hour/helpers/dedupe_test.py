@@ -0,0 +1,157 @@
+import asyncio
+import pathlib
+import pytest
+import threading
+import typing
+
+from magic_hour.helpers.dedupe import RequestDeduplicator
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _creates(mock: MockMagicHour, path: str) -> int:
+    return sum(1 for r in mock.requests if r.method == "POST" and r.path == path)
+
+
+def _image(path: pathlib.Path, content: bytes) -> str:
+    path.write_bytes(b"\x89PNG" + content)
+    return str(path)
+
+
+def test_concurrent_identical_requests_share_a_project() -> None:
+    mock = MockMagicHour(latency_seconds=0.1)
+    client = mock.client(deduplicator=RequestDeduplicator())
+    ids: typing.List[str] = []
+
+    def create() -> None:
+        ids.append(
+            client.v1.ai_image_generator.create(
+                image_count=1, orientation="square", style={"prompt": "a fox"}
+            ).id
+        )
+
+    threads = [threading.Thread(target=create) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _creates(mock, "/v1/ai-image-generator") == 1
+    assert len(set(ids)) == 1 and len(ids) == 6
+
+
+def test_uploaded_assets_compare_by_content(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour()
+    dedupe = RequestDeduplicator()
+    client = mock.client(deduplicator=dedupe)
+
+    def upscale(path: str) -> str:
+        return client.v1.ai_image_upscaler.generate(
+            assets={"image_file_path": path},
+            scale_factor=2,
+            style={"enhancement": "Balanced"},
+            download_outputs=False,
+        ).id
+
+    first = upscale(_image(tmp_path / "a.png", b"same"))
+    assert upscale(_image(tmp_path / "copy-of-a.png", b"same")) == first
+    assert upscale(_image(tmp_path / "b.png", b"different")) != first
+
+    assert _creates(mock, "/v1/ai-image-upscaler") == 2
+    assert dedupe.stats() == (1, 2)
+
+
+def test_projects_are_not_shared_across_tokens_or_reused_after_the_window() -> None:
+    mock = MockMagicHour()
+    client = mock.client(deduplicator=RequestDeduplicator(window_seconds=0))
+    arguments: typing.Dict[str, typing.Any] = {
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "x"},
+    }
+
+    client.v1.ai_image_generator.create(**arguments)
+    client.with_token("another-tenant").v1.ai_image_generator.create(**arguments)
+    client.v1.ai_image_generator.create(**arguments)
+
+    assert _creates(mock, "/v1/ai-image-generator") == 3
+
+
+def test_failed_projects_are_not_reused() -> None:
+    mock = MockMagicHour(job_failure_rate=1.0)
+    client = mock.client(deduplicator=RequestDeduplicator())
+
+    for _ in range(2):
+        result = client.v1.ai_image_generator.generate(
+            image_count=1,
+            orientation="square",
+            style={"prompt": "x"},
+            download_outputs=False,
+        )
+        assert result.status == "error"
+
+    assert _creates(mock, "/v1/ai-image-generator") == 2
+
+    # create() callers: a status check seeing the failure is enough
+    arguments: typing.Dict[str, typing.Any] = {
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "y"},
+    }
+    first = client.v1.ai_image_generator.create(**arguments)
+    client.v1.image_projects.check_result(
+        id=first.id, wait_for_completion=True, download_outputs=False
+    )
+    again = client.v1.ai_image_generator.create(**arguments)
+    assert again.id != first.id
+
+
+@pytest.mark.asyncio
+async def test_projects_failing_while_generate_polls_are_not_reused() -> None:
+    # the failure is only seen by generate()'s polling, not the first status check
+    mock = MockMagicHour(job_failure_rate=1.0, render_seconds=0.05)
+    arguments: typing.Dict[str, typing.Any] = {
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "x"},
+        "download_outputs": False,
+    }
+
+    client = mock.client(deduplicator=RequestDeduplicator(window_seconds=600))
+    first = client.v1.ai_image_generator.generate(**arguments)
+    again = client.v1.ai_image_generator.generate(**arguments)
+    assert first.status == again.status == "error" and again.id != first.id
+
+    async_client = mock.async_client(
+        deduplicator=RequestDeduplicator(window_seconds=600)
+    )
+    first = await async_client.v1.ai_image_generator.generate(**arguments)
+    again = await async_client.v1.ai_image_generator.generate(**arguments)
+    assert again.id != first.id
+
+    assert _creates(mock, "/v1/ai-image-generator") == 4
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_identical_requests() -> None:
+    mock = MockMagicHour(latency_seconds=0.05)
+    mock.inject(500, count=1, path="/v1/ai-image-generator")
+    client = mock.async_client(deduplicator=RequestDeduplicator())
+
+    async def create() -> str:
+        project = await client.v1.ai_image_generator.create(
+            image_count=1, orientation="square", style={"prompt": "x"}
+        )
+        return project.id
+
+    # the first flight fails for everyone waiting on it; the next one is shared
+    failed = await asyncio.gather(*(create() for _ in range(3)), return_exceptions=True)
+    ids = await asyncio.gather(*(create() for _ in range(3)))
+
+    assert all(isinstance(e, Exception) for e in failed)
+    assert len(set(ids)) == 1
+    assert _creates(mock, "/v1/ai-image-generator") == 2
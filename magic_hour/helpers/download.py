@@ -1,11 +1,18 @@
 import os
+import time
 from pathlib import Path
-from typing import Union, List
+from typing import TYPE_CHECKING, Union, List, Optional
 from urllib.parse import urlparse
 import httpx
-from magic_hour.types import models
 import logging
 
+from magic_hour.helpers.timing import current_job
+from magic_hour.helpers.tracing import DOWNLOAD, NOOP_TRACER, Tracer
+from magic_hour.helpers.transfer import async_transfer_client, sync_transfer_client
+
+if TYPE_CHECKING:
+    from magic_hour.types import models
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,57 +28,101 @@ def _compute_download_path(
 
 def download_files_sync(
     downloads: Union[
-        List[models.V1ImageProjectsGetResponseDownloadsItem],
-        List[models.V1VideoProjectsGetResponseDownloadsItem],
-        List[models.V1AudioProjectsGetResponseDownloadsItem],
+        List["models.V1ImageProjectsGetResponseDownloadsItem"],
+        List["models.V1VideoProjectsGetResponseDownloadsItem"],
+        List["models.V1AudioProjectsGetResponseDownloadsItem"],
     ],
     download_directory: Union[str, None] = None,
+    tracer: Optional[Tracer] = None,
+    transfer_client: Optional[httpx.Client] = None,
 ) -> List[str]:
     downloaded_paths: List[str] = []
+    tracer = tracer or NOOP_TRACER
 
     for download in downloads:
-        with httpx.Client() as http_client:
-            download_response = http_client.get(download.url)
-            download_response.raise_for_status()
-
-            download_path = _compute_download_path(
-                download.url, download_directory=download_directory
-            )
-
-            with open(download_path, "wb") as f:
-                f.write(download_response.content)
+        download_path = _compute_download_path(
+            download.url, download_directory=download_directory
+        )
+        with tracer.span(
+            DOWNLOAD,
+            {
+                "url.path": urlparse(download.url).path,
+                "magic_hour.download.path": download_path,
+            },
+        ) as span:
+            started = time.perf_counter()
+            with sync_transfer_client(transfer_client) as http_client:
+                download_response = http_client.get(download.url)
+                span.set_attribute(
+                    "http.response.status_code", download_response.status_code
+                )
+                download_response.raise_for_status()
+
+                with open(download_path, "wb") as f:
+                    f.write(download_response.content)
+                span.set_attribute(
+                    "http.response.body.size", len(download_response.content)
+                )
+
+            job = current_job()
+            if job is not None:
+                job.record_download(
+                    time.perf_counter() - started, len(download_response.content)
+                )
 
             downloaded_paths.append(download_path)
 
-            logger.info(f"Downloaded file saved as: {download_path}")
+            logger.info("Downloaded file saved as: %s", download_path)
 
     return downloaded_paths
 
 
 async def download_files_async(
     downloads: Union[
-        List[models.V1ImageProjectsGetResponseDownloadsItem],
-        List[models.V1VideoProjectsGetResponseDownloadsItem],
-        List[models.V1AudioProjectsGetResponseDownloadsItem],
+        List["models.V1ImageProjectsGetResponseDownloadsItem"],
+        List["models.V1VideoProjectsGetResponseDownloadsItem"],
+        List["models.V1AudioProjectsGetResponseDownloadsItem"],
     ],
     download_directory: Union[str, None] = None,
+    tracer: Optional[Tracer] = None,
+    transfer_client: Optional[httpx.AsyncClient] = None,
 ) -> List[str]:
     downloaded_paths: List[str] = []
+    tracer = tracer or NOOP_TRACER
 
     for download in downloads:
-        async with httpx.AsyncClient() as http_client:
-            download_response = await http_client.get(download.url)
-            download_response.raise_for_status()
-
-            download_path = _compute_download_path(
-                download.url, download_directory=download_directory
-            )
-
-            with open(download_path, "wb") as f:
-                f.write(download_response.content)
+        download_path = _compute_download_path(
+            download.url, download_directory=download_directory
+        )
+        with tracer.span(
+            DOWNLOAD,
+            {
+                "url.path": urlparse(download.url).path,
+                "magic_hour.download.path": download_path,
+            },
+        ) as span:
+            started = time.perf_counter()
+            async with async_transfer_client(transfer_client) as http_client:
+                download_response = await http_client.get(download.url)
+                span.set_attribute(
+                    "http.response.status_code", download_response.status_code
+                )
+                download_response.raise_for_status()
+
+                with open(download_path, "wb") as f:
+                    f.write(download_response.content)
+                span.set_attribute(
+                    "http.response.body.size", len(download_response.content)
+                )
+
+            job = current_job()
+            if job is not None:
+                job.record_download(
+                    time.perf_counter() - started, len(download_response.content)
+                )
 
             downloaded_paths.append(download_path)
 
-            logger.info(f"Downloaded file saved as: {download_path}")
+            logger.info("Downloaded file saved as: %s", download_path)
 
     return downloaded_paths
@@ -0,0 +1,252 @@
+import collections
+import hashlib
+import os
+import pathlib
+import threading
+import time
+import typing
+
+from magic_hour.helpers.batch import run_in_thread
+from magic_hour.helpers.dedupe import get_deduplicator
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+_ASSET_PREFIX = "api-assets/"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class _Entry:
+    __slots__ = ("response", "stored_at", "downloaded_paths")
+
+    def __init__(self, response: typing.Any):
+        self.response = response
+        self.stored_at = time.monotonic()
+        # download directory -> paths the face crops were downloaded to
+        self.downloaded_paths: typing.Dict[str, typing.List[str]] = {}
+
+
+def _file_digest(path: typing.Union[str, "os.PathLike[str]"]) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def target_fingerprint(
+    target: typing.Any, base_client: typing.Any = None
+) -> typing.Optional[str]:
+    """
+    What identifies the content of a face detection target, or None if it can't be
+    identified without consuming it (a file-like object):
+
+    - local files: the SHA-256 of their content, so copies share results
+    - `api-assets/` paths: the content hash recorded while uploading them through a
+      client with a `RequestDeduplicator`, else the path
+    - project outputs (`result.output()`): the project and output index
+    - URLs: the URL
+    """
+    project_id = getattr(target, "project_id", None)
+    if isinstance(project_id, str):
+        return f"output:{project_id}:{getattr(target, 'output_index', 0)}"
+    if isinstance(target, pathlib.Path) or (
+        isinstance(target, str) and os.path.isfile(target)
+    ):
+        return _file_digest(target)
+    if not isinstance(target, str):
+        return None
+    if target.startswith(_ASSET_PREFIX):
+        dedupe = get_deduplicator(base_client)
+        digest = dedupe.asset_digest(target) if dedupe is not None else None
+        return f"sha256:{digest}" if digest is not None else target
+    return target
+
+
+class FaceDetectionCache:
+    """
+    Remembers face detection results by the content of the target and the
+    `confidence_score`, so detecting faces in a target seen before makes no API
+    calls and downloads no face crops again:
+
+    ```py
+    client = Client(face_detection_cache=FaceDetectionCache())
+    for face in new_faces:
+        mappings = client.v1.face_detection.face_mappings(
+            target_file_path="team.mp4", new_faces=[face, face]
+        )  # detects once, then answers from the cache
+        client.v1.face_swap.generate(
+            assets={"video_file_path": "team.mp4", "face_mappings": mappings, ...}, ...
+        )
+    ```
+
+    Results are only shared between requests made with the same API token, since
+    detected faces are assets of the account that detected them. Only complete
+    detections are cached. The face crop URLs of a result are signed and expire, so
+    results are detected again after `ttl_seconds`, or sooner when downloading a
+    cached result's crops fails.
+
+    Args:
+        max_entries: Most results remembered; the least recently used go first
+        ttl_seconds: How long a result is reused, or None to keep it until evicted
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1_000,
+        ttl_seconds: typing.Optional[float] = 3600.0,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[str, _Entry]" = (
+            collections.OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> typing.Tuple[int, int]:
+        """`(hits, misses)`: detections answered from / not found in the cache"""
+        return self.hits, self.misses
+
+    def get(self, key: str) -> typing.Any:
+        """The cached detection for `key`, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        logger.info("Reusing face detection %s", getattr(entry.response, "id", None))
+        return entry.response
+
+    def _expired(self, entry: _Entry) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - entry.stored_at >= self.ttl_seconds
+        )
+
+    def discard(self, key: str) -> None:
+        """Forget a detection, e.g. one whose face crops can't be downloaded anymore"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def put(self, key: str, response: typing.Any) -> None:
+        """Cache a complete detection"""
+        with self._lock:
+            self._entries[key] = _Entry(response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def downloaded_paths(
+        self, key: str, download_directory: typing.Optional[str]
+    ) -> typing.Optional[typing.List[str]]:
+        """Face crops of `key` downloaded to `download_directory` that still exist"""
+        with self._lock:
+            entry = self._entries.get(key)
+            paths = (
+                entry.downloaded_paths.get(download_directory or "") if entry else None
+            )
+        if paths and all(os.path.isfile(p) for p in paths):
+            return list(paths)
+        return None
+
+    def record_downloads(
+        self,
+        key: str,
+        download_directory: typing.Optional[str],
+        paths: typing.List[str],
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.downloaded_paths[download_directory or ""] = list(paths)
+
+
+def get_face_detection_cache(
+    base_client: typing.Any,
+) -> typing.Optional[FaceDetectionCache]:
+    """The face detection cache configured on a base client, if any"""
+    cache = getattr(base_client, "face_detection_cache", None)
+    return cache if isinstance(cache, FaceDetectionCache) else None
+
+
+def detection_cache_key(
+    base_client: typing.Any,
+    target: typing.Any,
+    confidence_score: typing.Any,
+    request_options: typing.Any,
+) -> typing.Tuple[typing.Optional[FaceDetectionCache], typing.Optional[str]]:
+    """The client's cache and the key of a detection in it, if both exist"""
+    cache = get_face_detection_cache(base_client)
+    if cache is None:
+        return None, None
+    scope = base_client._dedupe_scope(request_options)
+    fingerprint = target_fingerprint(target, base_client)
+    if fingerprint is None:
+        return cache, None
+    score = confidence_score if isinstance(confidence_score, (int, float)) else None
+    return cache, f"{scope}|{fingerprint}|{score!r}"
+
+
+async def detection_cache_key_async(
+    base_client: typing.Any,
+    target: typing.Any,
+    confidence_score: typing.Any,
+    request_options: typing.Any,
+) -> typing.Tuple[typing.Optional[FaceDetectionCache], typing.Optional[str]]:
+    """Async version of `detection_cache_key()`, hashing local files on a thread"""
+    if get_face_detection_cache(base_client) is None:
+        return None, None
+    return await run_in_thread(
+        detection_cache_key, base_client, target, confidence_score, request_options
+    )
+
+
+def build_face_mappings(
+    faces: typing.Any,
+    new_faces: typing.Union[
+        typing.Sequence[typing.Optional[str]],
+        typing.Mapping[typing.Union[int, str], str],
+    ],
+) -> typing.List[typing.Dict[str, str]]:
+    """
+    `face_mappings` for face_swap and face_swap_photo from detected faces.
+
+    Args:
+        faces: A face detection result, or its `faces`
+        new_faces: The face to put in place of each detected one: a list in the
+            order of `faces` (None leaves a face as is), or a dict keyed by the
+            face's index or `path`. Local files are uploaded by `generate()`.
+    """
+    faces = getattr(faces, "faces", faces)
+    if isinstance(new_faces, typing.Mapping):
+        by_index = {
+            i: new_faces.get(i, new_faces.get(f.path)) for i, f in enumerate(faces)
+        }
+        unknown = set(new_faces) - set(range(len(faces))) - {f.path for f in faces}
+        if unknown:
+            raise ValueError(f"No detected face matches {sorted(map(str, unknown))}")
+    else:
+        if len(new_faces) > len(faces):
+            raise ValueError(
+                f"{len(new_faces)} new faces given for {len(faces)} detected face(s)"
+            )
+        by_index = dict(enumerate(new_faces))
+    mappings: typing.List[typing.Dict[str, str]] = []
+    for i, face in enumerate(faces):
+        new_face = by_index.get(i)
+        if new_face is not None:
+            mappings.append({"original_face": face.path, "new_face": new_face})
+    return mappings
@@ -0,0 +1,113 @@
+import pathlib
+import pytest
+import time
+import types
+import typing
+
+from magic_hour.helpers.face_cache import FaceDetectionCache, build_face_mappings
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _detections(mock: MockMagicHour) -> int:
+    return sum(
+        1
+        for r in mock.requests
+        if r.method == "POST" and r.path == "/v1/face-detection"
+    )
+
+
+def _downloads(mock: MockMagicHour) -> int:
+    return sum(1 for r in mock.requests if r.path.startswith("/cdn/"))
+
+
+def test_targets_with_the_same_content_are_detected_once(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour()
+    cache = FaceDetectionCache()
+    client = mock.client(face_detection_cache=cache)
+    for name in ("team.png", "copy-of-team.png"):
+        (tmp_path / name).write_bytes(b"\x89PNG team")
+
+    def detect(name: str, **kwargs: typing.Any) -> typing.Any:
+        return client.v1.face_detection.generate(
+            assets={"target_file_path": str(tmp_path / name)},
+            download_directory=str(tmp_path),
+            **kwargs,
+        )
+
+    first = detect("team.png")
+    again = detect("copy-of-team.png")
+
+    assert (again.id, again.faces) == (first.id, first.faces)
+    assert again.downloaded_paths == first.downloaded_paths
+    assert _detections(mock) == 1 and len(mock.uploads) == 1 and _downloads(mock) == 1
+    assert cache.stats() == (1, 1)
+
+    detect("team.png", confidence_score=0.9)
+    client.with_token("another-tenant").v1.face_detection.generate(
+        assets={"target_file_path": str(tmp_path / "team.png")},
+        download_outputs=False,
+    )
+    assert _detections(mock) == 3
+
+
+def test_expired_or_undownloadable_results_are_detected_again(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour()
+    cache = FaceDetectionCache(ttl_seconds=0.2)
+    client = mock.client(face_detection_cache=cache)
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+
+    def detect(directory: str) -> typing.Any:
+        return client.v1.face_detection.generate(
+            assets={"target_file_path": "api-assets/team.png"},
+            download_directory=str(tmp_path / directory),
+        )
+
+    first = detect("a")
+    mock.inject(403, path="/cdn/")  # the cached crop URL has expired
+    again = detect("b")
+    assert again.id != first.id and again.downloaded_paths
+    assert _detections(mock) == 2
+
+    time.sleep(0.2)
+    detect("b")
+    assert _detections(mock) == 3
+
+
+def test_face_mappings_from_detected_faces() -> None:
+    faces = [types.SimpleNamespace(path=f"api-assets/d/{i}.png") for i in range(3)]
+
+    assert build_face_mappings(faces, ["a.png", None, "c.png"]) == [
+        {"original_face": "api-assets/d/0.png", "new_face": "a.png"},
+        {"original_face": "api-assets/d/2.png", "new_face": "c.png"},
+    ]
+    assert build_face_mappings(faces, {1: "b.png", "api-assets/d/2.png": "c.png"}) == [
+        {"original_face": "api-assets/d/1.png", "new_face": "b.png"},
+        {"original_face": "api-assets/d/2.png", "new_face": "c.png"},
+    ]
+    with pytest.raises(ValueError):
+        build_face_mappings(faces, {"api-assets/other.png": "x.png"})
+
+
+@pytest.mark.asyncio
+async def test_async_face_mappings_reuse_the_detection() -> None:
+    mock = MockMagicHour()
+    client = mock.async_client(face_detection_cache=FaceDetectionCache())
+
+    for face in ("alice.png", "bob.png"):
+        mappings = await client.v1.face_detection.face_mappings(
+            target_file_path="api-assets/team.mp4", new_faces=[face]
+        )
+        assert mappings[0]["new_face"] == face
+        assert mappings[0]["original_face"].startswith("api-assets/mock/")
+
+    assert _detections(mock) == 1 and _downloads(mock) == 0
@@ -0,0 +1,64 @@
+import json
+import typing
+
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes JSON responses for a client.
+
+    `JsonCodec()` itself uses the standard library `json` module. Subclass it to plug
+    in another implementation:
+
+    ```py
+    class MyCodec(JsonCodec):
+        def dumps(self, obj: typing.Any) -> bytes:
+            return my_json.encode(obj)
+
+        def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+            return my_json.decode(data)
+
+    client = Client(json_codec=MyCodec())
+    ```
+    """
+
+    name = "json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    `JsonCodec` backed by [orjson](https://github.com/ijl/orjson), installed with
+    `pip install "magic_hour[fast-json]"`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                'OrjsonCodec requires orjson: pip install "magic_hour[fast-json]"'
+            ) from e
+        self._orjson = orjson
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        return typing.cast(bytes, self._orjson.dumps(obj))
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return self._orjson.loads(data)
+
+
+def fastest_json_codec() -> JsonCodec:
+    """`OrjsonCodec` if orjson is installed, otherwise the standard library codec"""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
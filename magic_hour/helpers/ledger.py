@@ -0,0 +1,612 @@
+import abc
+import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
+import importlib
+import json
+import os
+import pydantic
+import sqlite3
+import threading
+import time
+import typing
+
+from magic_hour.helpers.batch import BatchItemResult, run_batch, run_in_thread
+from magic_hour.helpers.logger import get_sdk_logger
+from make_api_request import type_utils
+
+
+logger = get_sdk_logger(__name__)
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+SUBMITTED = "submitted"
+"""Status of a job whose project was created but not yet seen by a status check"""
+
+_UPLOAD_URLS_PATH = "/v1/files/upload-urls"
+_FINISHED_STATUSES = frozenset({"complete", "error", "canceled"})
+# generate() arguments that don't change what is rendered
+_NOT_FINGERPRINTED = frozenset(
+    {"wait_for_completion", "download_outputs", "download_directory", "request_options"}
+)
+
+# the kind of project each resource's renders are tracked as (image otherwise)
+_PROJECT_KINDS = {
+    "ai_talking_photo": "video",
+    "ai_voice_cloner": "audio",
+    "ai_voice_generator": "audio",
+    "animation": "video",
+    "auto_subtitle_generator": "video",
+    "face_swap": "video",
+    "image_to_video": "video",
+    "lip_sync": "video",
+    "text_to_video": "video",
+    "video_to_video": "video",
+}
+_NOT_PROJECTS = frozenset({"face_detection"})
+
+
+def project_kind(resource: str) -> str:
+    """`"video"`, `"audio"` or `"image"`: which `*_projects` client tracks `resource`"""
+    return _PROJECT_KINDS.get(resource, "image")
+
+
+def _canonical(value: typing.Any) -> typing.Any:
+    if isinstance(value, typing.Mapping):
+        return {
+            str(k): _canonical(v)
+            for k, v in value.items()
+            if not isinstance(v, type_utils.NotGiven)
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, str) and os.path.isfile(value):
+        # a local input file: a new version of it is a new request
+        stat = os.stat(value)
+        return {"file": value, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return value
+
+
+_ledger_scope: "contextvars.ContextVar[typing.Optional[str]]" = contextvars.ContextVar(
+    "magic_hour_ledger_scope", default=None
+)
+
+
+@contextlib.contextmanager
+def ledger_scope(key: str) -> typing.Iterator[None]:
+    """
+    Tell apart the jobs of `generate()` calls made inside the block from identical
+    calls made under another key, e.g. two rows of a batch manifest asking for the
+    same render, so each gets its own project instead of resuming the other's
+
+    ```py
+    with ledger_scope(row_id):
+        client.v1.face_swap_photo.generate(...)
+    ```
+    """
+    token = _ledger_scope.set(key)
+    try:
+        yield
+    finally:
+        _ledger_scope.reset(token)
+
+
+def request_fingerprint(
+    resource: str, arguments: typing.Mapping[str, typing.Any]
+) -> str:
+    """
+    A stable hash identifying the render a `generate()` call asks for: the resource
+    and its arguments, minus the ones that only affect waiting and downloading, and
+    the enclosing `ledger_scope()` if any. Local input files are identified by path,
+    size and modification time.
+    """
+    payload = {k: v for k, v in arguments.items() if k not in _NOT_FINGERPRINTED}
+    key: typing.List[typing.Any] = [resource, _canonical(payload)]
+    scope = _ledger_scope.get()
+    if scope is not None:
+        key.append(scope)
+    encoded = json.dumps(
+        key,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LedgerEntry(pydantic.BaseModel):
+    """One submitted job, as recorded in a `JobLedger`"""
+
+    fingerprint: str
+    """`request_fingerprint()` of the job's `generate()` arguments"""
+
+    resource: str
+    project_id: str
+    status: str
+    """`"submitted"` until a status check has seen the project, then the API status"""
+
+    download_directory: typing.Optional[str] = None
+    downloaded_paths: typing.Optional[typing.List[str]] = None
+    updated_at: float = pydantic.Field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in _FINISHED_STATUSES
+
+    @property
+    def resumable(self) -> bool:
+        """
+        Whether the project is still in progress, so is waited on instead of being
+        resubmitted. A finished project isn't: asking for the same render again
+        after it completed, failed or was canceled creates a new one.
+        """
+        return not self.finished
+
+
+class JobLedger(abc.ABC):
+    """
+    Durable record of submitted jobs, so a restarted worker resumes waiting on (and
+    downloading) the projects it had already created instead of paying for them
+    again. With a ledger configured, `generate()` looks up its arguments first and
+    picks up the recorded project when there is one.
+
+    `SqliteLedger` is the built-in implementation; subclass `JobLedger` to keep the
+    ledger elsewhere (every method may be called from several threads at once):
+
+    ```py
+    class RedisLedger(JobLedger):
+        def get(self, fingerprint: str) -> typing.Optional[LedgerEntry]:
+            data = redis.get(f"magic-hour:{fingerprint}")
+            return LedgerEntry.model_validate_json(data) if data else None
+
+        def put(self, entry: LedgerEntry) -> None:
+            redis.set(f"magic-hour:{entry.fingerprint}", entry.model_dump_json())
+            ...
+
+        def pending(self) -> typing.List[LedgerEntry]:
+            ...
+
+    client = Client(ledger=RedisLedger())
+    ```
+    """
+
+    @abc.abstractmethod
+    def get(self, fingerprint: str) -> typing.Optional[LedgerEntry]:
+        """The entry recorded for `fingerprint`, if any"""
+
+    @abc.abstractmethod
+    def put(self, entry: LedgerEntry) -> None:
+        """Insert or replace the entry with `entry.fingerprint`"""
+
+    @abc.abstractmethod
+    def pending(self) -> typing.List[LedgerEntry]:
+        """Entries whose project hasn't been seen finishing yet"""
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryLedger(JobLedger):
+    """A `JobLedger` kept in memory, e.g. for tests. It doesn't survive a restart."""
+
+    def __init__(self) -> None:
+        self._entries: typing.Dict[str, LedgerEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str) -> typing.Optional[LedgerEntry]:
+        with self._lock:
+            return self._entries.get(fingerprint)
+
+    def put(self, entry: LedgerEntry) -> None:
+        with self._lock:
+            self._entries[entry.fingerprint] = entry
+
+    def pending(self) -> typing.List[LedgerEntry]:
+        with self._lock:
+            return [e for e in self._entries.values() if not e.finished]
+
+
+_COLUMNS = (
+    "fingerprint",
+    "resource",
+    "project_id",
+    "status",
+    "download_directory",
+    "downloaded_paths",
+    "updated_at",
+)
+
+
+class SqliteLedger(JobLedger):
+    """
+    A `JobLedger` in a SQLite database file, created if missing.
+
+    The database is in WAL mode and every write commits on its own, so an entry is
+    on disk before `generate()` moves on, and a killed process loses nothing it
+    recorded. Several threads and processes can share one file: the threads of a
+    process share one connection, one statement at a time, and writers wait up to
+    `timeout` seconds for another process's lock.
+
+    ```py
+    client = Client(ledger=SqliteLedger("jobs.db"))
+    ```
+
+    Args:
+        path: Database file
+        timeout: Seconds a write waits for another writer before failing
+    """
+
+    def __init__(self, path: str, *, timeout: float = 30.0):
+        self.path = path
+        self._timeout = timeout
+        self._conn: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "fingerprint TEXT PRIMARY KEY, resource TEXT NOT NULL, "
+            "project_id TEXT NOT NULL, status TEXT NOT NULL, download_directory TEXT, "
+            "downloaded_paths TEXT, updated_at REAL NOT NULL)"
+        )
+        self._execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+
+    def _execute(
+        self, sql: str, parameters: typing.Sequence[typing.Any] = ()
+    ) -> typing.List[typing.Any]:
+        """Run one statement on the shared connection and fetch its rows"""
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=self._timeout,
+                    isolation_level=None,  # autocommit: one transaction per write
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn = conn
+            return self._conn.execute(sql, parameters).fetchall()
+
+    @staticmethod
+    def _entry(row: typing.Sequence[typing.Any]) -> LedgerEntry:
+        values = dict(zip(_COLUMNS, row))
+        if values["downloaded_paths"] is not None:
+            values["downloaded_paths"] = json.loads(values["downloaded_paths"])
+        return LedgerEntry(**values)
+
+    def get(self, fingerprint: str) -> typing.Optional[LedgerEntry]:
+        rows = self._execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE fingerprint = ?",
+            (fingerprint,),
+        )
+        return self._entry(rows[0]) if rows else None
+
+    def put(self, entry: LedgerEntry) -> None:
+        paths = entry.downloaded_paths
+        self._execute(
+            f"INSERT OR REPLACE INTO jobs ({', '.join(_COLUMNS)}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.fingerprint,
+                entry.resource,
+                entry.project_id,
+                entry.status,
+                entry.download_directory,
+                json.dumps(paths) if paths is not None else None,
+                entry.updated_at,
+            ),
+        )
+
+    def pending(self) -> typing.List[LedgerEntry]:
+        rows = self._execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM jobs "
+            "WHERE status NOT IN ('complete', 'error', 'canceled') "
+            "ORDER BY updated_at"
+        )
+        return [self._entry(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the connection; the ledger reconnects if it is used again"""
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+
+def get_ledger(base_client: typing.Any) -> typing.Optional[JobLedger]:
+    """The ledger configured on a base client, if any"""
+    ledger = getattr(base_client, "ledger", None)
+    return ledger if isinstance(ledger, JobLedger) else None
+
+
+class _Submission:
+    """The ledgered `generate()` call running in the current thread / task"""
+
+    __slots__ = ("ledger", "fingerprint", "resource", "download_directory")
+
+    def __init__(
+        self,
+        ledger: JobLedger,
+        fingerprint: str,
+        resource: str,
+        download_directory: typing.Optional[str],
+    ):
+        self.ledger = ledger
+        self.fingerprint = fingerprint
+        self.resource = resource
+        self.download_directory = download_directory
+
+    def record(
+        self,
+        project_id: str,
+        status: str,
+        downloaded_paths: typing.Optional[typing.List[str]] = None,
+    ) -> None:
+        self.ledger.put(
+            LedgerEntry(
+                fingerprint=self.fingerprint,
+                resource=self.resource,
+                project_id=project_id,
+                status=status,
+                download_directory=self.download_directory,
+                downloaded_paths=downloaded_paths,
+            )
+        )
+
+
+_current_submission: "contextvars.ContextVar[typing.Optional[_Submission]]" = (
+    contextvars.ContextVar("magic_hour_current_submission", default=None)
+)
+
+
+def _created(
+    method: str, path: str, result: typing.Any
+) -> typing.Optional[typing.Tuple[_Submission, str]]:
+    submission = _current_submission.get()
+    if (
+        submission is None
+        or method.upper() != "POST"
+        or path.rstrip("/") == _UPLOAD_URLS_PATH
+    ):
+        return None
+    project_id = getattr(result, "id", None)
+    return (submission, project_id) if isinstance(project_id, str) else None
+
+
+def record_created(method: str, path: str, result: typing.Any) -> None:
+    """
+    Called by the base clients for every response: records the project a ledgered
+    `generate()` call just created, before anything else can go wrong.
+    """
+    created = _created(method, path, result)
+    if created is not None:
+        submission, project_id = created
+        submission.record(project_id, SUBMITTED)
+
+
+async def record_created_async(method: str, path: str, result: typing.Any) -> None:
+    """Async version of `record_created()`, writing the ledger on a worker thread"""
+    created = _created(method, path, result)
+    if created is not None:
+        submission, project_id = created
+        await run_in_thread(submission.record, project_id, SUBMITTED)
+
+
+def _record_result(submission: _Submission, result: typing.Any) -> None:
+    project_id = getattr(result, "id", None)
+    if isinstance(project_id, str):
+        submission.record(
+            project_id, result.status, getattr(result, "downloaded_paths", None)
+        )
+
+
+def projects_client(
+    kind: str, base_client: typing.Any, asynchronous: bool
+) -> typing.Any:
+    """The (async) `{kind}_projects` client, e.g. `VideoProjectsClient` for `"video"`"""
+    module = importlib.import_module(f"magic_hour.resources.v1.{kind}_projects.client")
+    name = f"{'Async' if asynchronous else ''}{kind.title()}ProjectsClient"
+    return getattr(module, name)(base_client=base_client)
+
+
+def _outputs_on_disk(entry: LedgerEntry) -> bool:
+    return bool(entry.downloaded_paths) and all(
+        os.path.isfile(p) for p in entry.downloaded_paths or []
+    )
+
+
+def _resume_arguments(
+    entry: LedgerEntry, arguments: typing.Mapping[str, typing.Any]
+) -> typing.Tuple[typing.Dict[str, typing.Any], bool]:
+    download_outputs = arguments.get("download_outputs", True)
+    reuse_outputs = download_outputs and _outputs_on_disk(entry)
+    return (
+        {
+            "id": entry.project_id,
+            "wait_for_completion": arguments.get("wait_for_completion", True),
+            "download_outputs": download_outputs and not reuse_outputs,
+            "download_directory": arguments.get(
+                "download_directory", entry.download_directory
+            ),
+        },
+        reuse_outputs,
+    )
+
+
+def _resumed(
+    submission: _Submission, entry: LedgerEntry, result: typing.Any, reused: bool
+) -> typing.Any:
+    if reused and result.status == "complete":
+        result.downloaded_paths = list(entry.downloaded_paths or [])
+    _record_result(submission, result)
+    return result
+
+
+def resume_job(
+    base_client: typing.Any,
+    ledger: JobLedger,
+    entry: LedgerEntry,
+    arguments: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+) -> typing.Any:
+    """
+    Wait on (and download) the project of a ledger entry instead of submitting the
+    job again; `arguments` are the waiting and downloading `generate()` arguments.
+    Outputs already downloaded by an earlier run are reused if still on disk.
+    """
+    logger.info(
+        "Resuming %s project %s from the ledger", entry.resource, entry.project_id
+    )
+    arguments = arguments or {}
+    submission = _Submission(
+        ledger,
+        entry.fingerprint,
+        entry.resource,
+        arguments.get("download_directory", entry.download_directory),
+    )
+    check_arguments, reuse = _resume_arguments(entry, arguments)
+    projects = projects_client(
+        project_kind(entry.resource), base_client, asynchronous=False
+    )
+    return _resumed(submission, entry, projects.check_result(**check_arguments), reuse)
+
+
+async def resume_job_async(
+    base_client: typing.Any,
+    ledger: JobLedger,
+    entry: LedgerEntry,
+    arguments: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+) -> typing.Any:
+    """Async version of `resume_job()`"""
+    logger.info(
+        "Resuming %s project %s from the ledger", entry.resource, entry.project_id
+    )
+    arguments = arguments or {}
+    submission = _Submission(
+        ledger,
+        entry.fingerprint,
+        entry.resource,
+        arguments.get("download_directory", entry.download_directory),
+    )
+    check_arguments, reuse = _resume_arguments(entry, arguments)
+    projects = projects_client(
+        project_kind(entry.resource), base_client, asynchronous=True
+    )
+    result = await projects.check_result(**check_arguments)
+    return await run_in_thread(_resumed, submission, entry, result, reuse)
+
+
+def ledgered_generate(resource: str, fn: F) -> F:
+    """
+    Wrap a resource client's (sync or async) `generate()` so that, when the client
+    has a ledger, the created project is recorded as soon as it exists and a call
+    whose arguments match a recorded job still in progress resumes it instead.
+    """
+    if resource in _NOT_PROJECTS:
+        return fn
+
+    if asyncio.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(
+            self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            ledger = get_ledger(self._base_client)
+            if ledger is None:
+                return await fn(self, *args, **kwargs)
+            fingerprint = request_fingerprint(resource, kwargs)
+            entry = await run_in_thread(ledger.get, fingerprint)
+            if entry is not None and entry.resumable:
+                return await resume_job_async(self._base_client, ledger, entry, kwargs)
+            submission = _Submission(
+                ledger, fingerprint, resource, kwargs.get("download_directory")
+            )
+            token = _current_submission.set(submission)
+            try:
+                result = await fn(self, *args, **kwargs)
+            finally:
+                _current_submission.reset(token)
+            await run_in_thread(_record_result, submission, result)
+            return result
+
+        return typing.cast(F, async_wrapper)
+
+    @functools.wraps(fn)
+    def wrapper(
+        self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        ledger = get_ledger(self._base_client)
+        if ledger is None:
+            return fn(self, *args, **kwargs)
+        fingerprint = request_fingerprint(resource, kwargs)
+        entry = ledger.get(fingerprint)
+        if entry is not None and entry.resumable:
+            return resume_job(self._base_client, ledger, entry, kwargs)
+        submission = _Submission(
+            ledger, fingerprint, resource, kwargs.get("download_directory")
+        )
+        token = _current_submission.set(submission)
+        try:
+            result = fn(self, *args, **kwargs)
+        finally:
+            _current_submission.reset(token)
+        _record_result(submission, result)
+        return result
+
+    return typing.cast(F, wrapper)
+
+
+def resume_pending(
+    base_client: typing.Any,
+    ledger: JobLedger,
+    *,
+    max_concurrency: int,
+    download_outputs: bool,
+) -> typing.Generator["BatchItemResult[LedgerEntry, typing.Any]", None, None]:
+    """`resume_job()` every pending ledger entry, on a pool of threads"""
+    arguments = {"download_outputs": download_outputs}
+    return run_batch(
+        lambda entry: resume_job(base_client, ledger, entry, arguments),
+        ledger.pending(),
+        max_concurrency=max_concurrency,
+        ordered=False,
+    )
+
+
+async def resume_pending_async(
+    base_client: typing.Any,
+    ledger: JobLedger,
+    *,
+    max_concurrency: int,
+    download_outputs: bool,
+) -> typing.AsyncGenerator["BatchItemResult[LedgerEntry, typing.Any]", None]:
+    """`resume_job_async()` every pending ledger entry, yielding as each finishes"""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    arguments = {"download_outputs": download_outputs}
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def resume(
+        index: int, entry: LedgerEntry
+    ) -> "BatchItemResult[LedgerEntry, typing.Any]":
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await resume_job_async(base_client, ledger, entry, arguments)
+            except Exception as e:
+                logger.warning("Resuming project %s failed: %r", entry.project_id, e)
+                return BatchItemResult(
+                    index, entry, error=e, seconds=time.perf_counter() - started
+                )
+            return BatchItemResult(
+                index, entry, result=result, seconds=time.perf_counter() - started
+            )
+
+    entries = await run_in_thread(ledger.pending)
+    tasks = [asyncio.ensure_future(resume(i, entry)) for i, entry in enumerate(entries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
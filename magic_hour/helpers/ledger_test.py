@@ -0,0 +1,216 @@
+import concurrent.futures
+import os
+import pathlib
+import pytest
+import threading
+import typing
+
+from magic_hour.helpers.ledger import (
+    JobLedger,
+    LedgerEntry,
+    MemoryLedger,
+    SqliteLedger,
+    request_fingerprint,
+)
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _open_count(path: str) -> int:
+    """How many file descriptors of this process are open on `path` (Linux only)"""
+    count = 0
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            count += os.readlink(f"/proc/self/fd/{fd}") == os.path.realpath(path)
+        except OSError:  # e.g. the descriptor listdir() itself used
+            pass
+    return count
+
+
+def _creates(mock: MockMagicHour, path: str) -> int:
+    return sum(1 for r in mock.requests if r.method == "POST" and r.path == path)
+
+
+def test_restarted_worker_resumes_instead_of_resubmitting(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour(render_seconds=0.05, transfer_error_rate=1.0)
+    db = str(tmp_path / "jobs.db")
+    arguments: typing.Dict[str, typing.Any] = {
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "a lighthouse"},
+        "download_directory": str(tmp_path),
+    }
+
+    # the first worker dies while downloading, after the project was created
+    with pytest.raises(Exception):
+        mock.client(ledger=SqliteLedger(db)).v1.ai_image_generator.generate(**arguments)
+    (entry,) = SqliteLedger(db).pending()
+    assert entry.status == "submitted" and entry.resource == "ai_image_generator"
+
+    mock.transfer_error_rate = 0.0
+    client = mock.client(ledger=SqliteLedger(db))
+    result = client.v1.ai_image_generator.generate(**arguments)
+
+    assert _creates(mock, "/v1/ai-image-generator") == 1
+    assert result.id == entry.project_id and result.status == "complete"
+    assert result.downloaded_paths and os.path.isfile(result.downloaded_paths[0])
+    assert SqliteLedger(db).pending() == []
+
+    # finished: the same arguments again ask for a new render
+    again = client.v1.ai_image_generator.generate(**arguments)
+    assert _creates(mock, "/v1/ai-image-generator") == 2
+    assert again.id != entry.project_id and again.status == "complete"
+
+
+@pytest.mark.parametrize("failure_rate", [0.0, 1.0])
+def test_finished_jobs_are_submitted_again(failure_rate: float) -> None:
+    mock = MockMagicHour(job_failure_rate=failure_rate)
+    client = mock.client(ledger=MemoryLedger())
+
+    for _ in range(2):
+        result = client.v1.ai_image_generator.generate(
+            image_count=1,
+            orientation="square",
+            style={"prompt": "x"},
+            download_outputs=False,
+        )
+        assert result.status == ("error" if failure_rate else "complete")
+
+    assert _creates(mock, "/v1/ai-image-generator") == 2
+
+
+def test_resume_pending(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.05)
+    ledger = MemoryLedger()
+    client = mock.client(ledger=ledger)
+    for prompt in ("a", "b", "c"):
+        client.v1.ai_image_generator.generate(
+            image_count=1,
+            orientation="square",
+            style={"prompt": prompt},
+            wait_for_completion=False,
+            download_directory=str(tmp_path),
+        )
+    assert len(ledger.pending()) == 3
+
+    outcomes = list(client.resume_pending())
+
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert len(list(tmp_path.iterdir())) == 3
+    assert ledger.pending() == []
+    with pytest.raises(ValueError):
+        mock.client().resume_pending()
+
+
+@pytest.mark.asyncio
+async def test_async_generate_and_pipeline_use_the_ledger(
+    tmp_path: pathlib.Path,
+) -> None:
+    mock = MockMagicHour(render_seconds=0.05)
+    client = mock.async_client(ledger=MemoryLedger())
+    spec: typing.Dict[str, typing.Any] = {
+        "image_count": 1,
+        "orientation": "square",
+        "style": {"prompt": "x"},
+    }
+
+    created = await client.v1.ai_image_generator.generate(
+        **spec, wait_for_completion=False
+    )
+    outcomes = [
+        o
+        async for o in client.pipeline(
+            [spec, spec], resource="ai_image_generator", download_outputs=False
+        )
+    ]
+
+    assert _creates(mock, "/v1/ai-image-generator") == 1
+    assert all(o.unwrap().id == created.id for o in outcomes)
+
+
+@pytest.mark.asyncio
+async def test_async_resume_pending_reads_the_ledger_off_the_loop() -> None:
+    class ThreadCheckingLedger(MemoryLedger):
+        def pending(self) -> typing.List[LedgerEntry]:
+            assert threading.current_thread() is not loop_thread
+            return super().pending()
+
+    loop_thread = threading.current_thread()
+    mock = MockMagicHour(render_seconds=0.05)
+    client = mock.async_client(ledger=ThreadCheckingLedger())
+    await client.v1.ai_image_generator.generate(
+        image_count=1,
+        orientation="square",
+        style={"prompt": "x"},
+        wait_for_completion=False,
+    )
+
+    outcomes = [o async for o in client.resume_pending(download_outputs=False)]
+
+    assert [o.unwrap().status for o in outcomes] == ["complete"]
+
+
+def test_job_ledger_requires_every_method() -> None:
+    class PartialLedger(JobLedger):
+        def get(self, fingerprint: str) -> typing.Optional[LedgerEntry]:
+            return None
+
+    with pytest.raises(TypeError):
+        PartialLedger()  # type: ignore[abstract]
+
+
+def test_sqlite_ledger_concurrent_writers(tmp_path: pathlib.Path) -> None:
+    db = str(tmp_path / "jobs.db")
+    ledger = SqliteLedger(db)
+
+    def write(worker: int) -> None:
+        for i in range(250):
+            ledger.put(
+                LedgerEntry(
+                    fingerprint=f"{worker}-{i}",
+                    resource="face_swap",
+                    project_id=f"p{worker}-{i}",
+                    status="complete" if i % 5 else "rendering",
+                    downloaded_paths=[f"out/{worker}-{i}.mp4"] if i % 5 else None,
+                )
+            )
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ledger.close()
+
+    reopened = SqliteLedger(db)
+    assert len(reopened.pending()) == 8 * 50
+    # every batch runs on fresh threads; they share the ledger's one connection
+    for _ in range(20):
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            list(pool.map(reopened.get, [f"{w}-0" for w in range(8)]))
+    if os.path.isdir("/proc/self/fd"):
+        assert _open_count(db) == 1
+    entry = reopened.get("3-7")
+    assert entry is not None and entry.downloaded_paths == ["out/3-7.mp4"]
+    assert reopened.get("missing") is None
+
+
+def test_fingerprint(tmp_path: pathlib.Path) -> None:
+    photo = tmp_path / "photo.png"
+    photo.write_bytes(b"one")
+    arguments = {"assets": {"image_file_path": str(photo)}, "name": "x"}
+
+    first = request_fingerprint("photo_colorizer", arguments)
+    assert first == request_fingerprint(
+        "photo_colorizer", {**arguments, "download_directory": "elsewhere"}
+    )
+    assert first != request_fingerprint("ai_image_upscaler", arguments)
+
+    photo.write_bytes(b"changed")
+    assert first != request_fingerprint("photo_colorizer", arguments)
@@ -0,0 +1,378 @@
+import asyncio
+import os
+import pydantic
+import re
+import shutil
+import tempfile
+import time
+import typing
+import wave
+
+from magic_hour.helpers.batch import run_batch
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.timing import JobTimings
+
+
+logger = get_sdk_logger(__name__)
+
+DEFAULT_MAX_SHARD_CHARS = 1000
+"""The API's character limit for one `ai_voice_generator` prompt"""
+
+Concatenator = typing.Callable[[typing.List[str], str], None]
+"""Joins the audio files at the given paths, in order, into the output path"""
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?…。！？])\s+")
+
+
+class LongFormShard(pydantic.BaseModel):
+    index: int
+    text: str
+    project_id: typing.Optional[str] = None
+    status: typing.Optional[str] = None
+    """Final status of the shard's project, None if it wasn't created"""
+
+    credits_charged: typing.Optional[int] = None
+    seconds: typing.Optional[float] = None
+    """Wall-clock time of the shard's `generate()` call"""
+
+    timings: typing.Optional[JobTimings] = None
+    error: typing.Optional[str] = None
+    """Why the shard failed, if it raised"""
+
+
+class LongFormResult(pydantic.BaseModel):
+    """The shard plan and outcome of `generate_long_form()`"""
+
+    shards: typing.List[LongFormShard]
+    output_path: typing.Optional[str] = None
+    """The stitched audio file, None if a shard failed"""
+
+    total_seconds: float = 0.0
+    concatenate_seconds: float = 0.0
+
+    @property
+    def credits_charged(self) -> int:
+        return sum(s.credits_charged or 0 for s in self.shards)
+
+
+class LongFormError(Exception):
+    """
+    Raised by `generate_long_form()` when a shard doesn't complete, or the shards
+    can't be stitched. `result` lists every shard's project, so completed ones can
+    be downloaded again instead of re-rendered.
+    """
+
+    def __init__(self, message: str, result: LongFormResult):
+        super().__init__(message)
+        self.result = result
+
+
+def _split(text: str, pattern: typing.Optional["re.Pattern[str]"]) -> typing.List[str]:
+    parts = pattern.split(text) if pattern is not None else text.split()
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _pieces(text: str, max_chars: int) -> typing.List[typing.Tuple[str, str]]:
+    """Units no longer than `max_chars`, each with the separator that precedes it"""
+    pieces: typing.List[typing.Tuple[str, str]] = []
+    for paragraph in _split(text, _PARAGRAPH_BREAK):
+        separator = "\n\n"
+        for sentence in _split(paragraph, _SENTENCE_END):
+            units = [sentence] if len(sentence) <= max_chars else _split(sentence, None)
+            for unit in units:
+                # a single word over the limit is cut wherever it has to be
+                for start in range(0, len(unit), max_chars):
+                    pieces.append((separator, unit[start : start + max_chars]))
+                    separator = " "
+    return pieces
+
+
+def plan_shards(
+    text: str, max_chars: int = DEFAULT_MAX_SHARD_CHARS
+) -> typing.List[str]:
+    """
+    Split `text` into as few shards of at most `max_chars` characters as possible,
+    breaking between paragraphs or sentences where it can, and between words (or
+    within one, as a last resort) where it must
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+    shards: typing.List[str] = []
+    current = ""
+    for separator, piece in _pieces(text, max_chars):
+        if current and len(current) + len(separator) + len(piece) <= max_chars:
+            current += separator + piece
+        else:
+            if current:
+                shards.append(current)
+            current = piece
+    if current:
+        shards.append(current)
+    return shards
+
+
+def concatenate_wav(paths: typing.List[str], output_path: str) -> None:
+    """Join WAV files with the same channels, sample width and rate"""
+    with wave.open(output_path, "wb") as output:
+        params: typing.Optional[typing.Tuple[int, int, int]] = None
+        for path in paths:
+            with wave.open(path, "rb") as shard:
+                shard_params = (
+                    shard.getnchannels(),
+                    shard.getsampwidth(),
+                    shard.getframerate(),
+                )
+                if params is None:
+                    params = shard_params
+                    output.setnchannels(params[0])
+                    output.setsampwidth(params[1])
+                    output.setframerate(params[2])
+                elif shard_params != params:
+                    raise ValueError(
+                        f"{path} has (channels, sample width, rate) {shard_params}, "
+                        f"expected {params}"
+                    )
+                output.writeframes(shard.readframes(shard.getnframes()))
+
+
+def _id3v2_length(data: bytes) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:  # "syncsafe": 7 bits per byte
+        size = (size << 7) | (byte & 0x7F)
+    has_footer = data[5] & 0x10
+    return 10 + size + (10 if has_footer else 0)
+
+
+def concatenate_mpeg(paths: typing.List[str], output_path: str) -> None:
+    """
+    Join MP3 files. MPEG audio is a sequence of independent frames, so the files
+    are appended, keeping only the first file's ID3v2 tag and the last one's ID3v1
+    tag. Files should share a sample rate and channel layout.
+    """
+    with open(output_path, "wb") as output:
+        for i, path in enumerate(paths):
+            with open(path, "rb") as f:
+                data = f.read()
+            if i > 0:
+                data = data[_id3v2_length(data) :]
+            if i < len(paths) - 1 and len(data) >= 128 and data[-128:-125] == b"TAG":
+                data = data[:-128]
+            output.write(data)
+
+
+_CONCATENATORS: typing.Dict[str, Concatenator] = {
+    ".wav": concatenate_wav,
+    ".mp3": concatenate_mpeg,
+}
+
+
+def _concatenator(
+    extension: str, concatenator: typing.Optional[Concatenator]
+) -> Concatenator:
+    if concatenator is not None:
+        return concatenator
+    try:
+        return _CONCATENATORS[extension.lower()]
+    except KeyError:
+        raise ValueError(
+            f"No built-in concatenation for {extension or 'extensionless'} audio; "
+            "pass concatenator=..."
+        ) from None
+
+
+def _shard_arguments(
+    style: typing.Mapping[str, typing.Any],
+    text: str,
+    index: int,
+    count: int,
+    name: typing.Any,
+    directory: str,
+    request_options: typing.Any,
+) -> typing.Dict[str, typing.Any]:
+    arguments: typing.Dict[str, typing.Any] = {
+        "style": {**style, "prompt": text},
+        "download_directory": directory,
+        "request_options": request_options,
+    }
+    if isinstance(name, str):
+        arguments["name"] = f"{name} ({index + 1}/{count})"
+    return arguments
+
+
+def _record(shard: LongFormShard, result: typing.Any, started: float) -> None:
+    shard.seconds = time.perf_counter() - started
+    shard.project_id = result.id
+    shard.status = result.status
+    shard.credits_charged = result.credits_charged
+    shard.timings = getattr(result, "timings", None)
+
+
+def _create_output_directory(
+    output_path: typing.Optional[str], download_directory: typing.Optional[str]
+) -> None:
+    """Create the stitched file's directory, before any shard is paid for"""
+    directory = (
+        os.path.dirname(output_path) if output_path is not None else download_directory
+    )
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _finish(
+    result: LongFormResult,
+    downloaded: typing.Dict[int, str],
+    output_path: typing.Optional[str],
+    download_directory: typing.Optional[str],
+    concatenator: typing.Optional[Concatenator],
+    started: float,
+) -> LongFormResult:
+    failed = [
+        s for s in result.shards if s.status != "complete" or s.index not in downloaded
+    ]
+    if failed:
+        result.total_seconds = time.perf_counter() - started
+        raise LongFormError(
+            f"{len(failed)} of {len(result.shards)} shard(s) failed, first: "
+            f"shard {failed[0].index} ({failed[0].error or failed[0].status})",
+            result,
+        )
+    paths = [downloaded[s.index] for s in result.shards]
+    extension = os.path.splitext(paths[0])[1]
+    if output_path is None:
+        output_path = os.path.join(
+            download_directory or ".",
+            f"{result.shards[0].project_id}-long-form{extension}",
+        )
+    stitch_started = time.perf_counter()
+    try:
+        if len(paths) == 1:
+            shutil.copyfile(paths[0], output_path)
+        else:
+            _concatenator(extension, concatenator)(paths, output_path)
+    except Exception as e:
+        result.total_seconds = time.perf_counter() - started
+        raise LongFormError(
+            f"Stitching {len(paths)} shard(s) into {output_path} failed: {e!r}", result
+        ) from e
+    result.concatenate_seconds = time.perf_counter() - stitch_started
+    result.output_path = output_path
+    result.total_seconds = time.perf_counter() - started
+    logger.info(
+        "Stitched %s shard(s) into %s in %.3fs",
+        len(paths),
+        output_path,
+        result.concatenate_seconds,
+    )
+    return result
+
+
+def generate_long_form(
+    generate: typing.Callable[..., typing.Any],
+    *,
+    style: typing.Mapping[str, typing.Any],
+    name: typing.Any,
+    max_shard_chars: int,
+    max_concurrency: int,
+    output_path: typing.Optional[str],
+    download_directory: typing.Optional[str],
+    concatenator: typing.Optional[Concatenator],
+    request_options: typing.Any,
+) -> LongFormResult:
+    """Run one `generate()` per shard of `style["prompt"]` on a thread pool, then stitch"""
+    started = time.perf_counter()
+    texts = plan_shards(style["prompt"], max_shard_chars)
+    _create_output_directory(output_path, download_directory)
+    result = LongFormResult(
+        shards=[LongFormShard(index=i, text=t) for i, t in enumerate(texts)]
+    )
+    downloaded: typing.Dict[int, str] = {}
+    logger.info(
+        "Generating %s characters as %s shard(s)", len(style["prompt"]), len(texts)
+    )
+
+    with tempfile.TemporaryDirectory(prefix="magic-hour-long-form-") as directory:
+
+        def run(shard: LongFormShard) -> None:
+            shard_started = time.perf_counter()
+            output = generate(
+                **_shard_arguments(
+                    style,
+                    shard.text,
+                    shard.index,
+                    len(texts),
+                    name,
+                    directory,
+                    request_options,
+                )
+            )
+            _record(shard, output, shard_started)
+            if output.downloaded_paths:
+                downloaded[shard.index] = output.downloaded_paths[0]
+
+        for outcome in run_batch(run, result.shards, max_concurrency=max_concurrency):
+            if outcome.error is not None:
+                outcome.item.error = repr(outcome.error)
+        return _finish(
+            result, downloaded, output_path, download_directory, concatenator, started
+        )
+
+
+async def generate_long_form_async(
+    generate: typing.Callable[..., typing.Awaitable[typing.Any]],
+    *,
+    style: typing.Mapping[str, typing.Any],
+    name: typing.Any,
+    max_shard_chars: int,
+    max_concurrency: int,
+    output_path: typing.Optional[str],
+    download_directory: typing.Optional[str],
+    concatenator: typing.Optional[Concatenator],
+    request_options: typing.Any,
+) -> LongFormResult:
+    """Async version of `generate_long_form()`"""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    started = time.perf_counter()
+    texts = plan_shards(style["prompt"], max_shard_chars)
+    _create_output_directory(output_path, download_directory)
+    result = LongFormResult(
+        shards=[LongFormShard(index=i, text=t) for i, t in enumerate(texts)]
+    )
+    downloaded: typing.Dict[int, str] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    logger.info(
+        "Generating %s characters as %s shard(s)", len(style["prompt"]), len(texts)
+    )
+
+    with tempfile.TemporaryDirectory(prefix="magic-hour-long-form-") as directory:
+
+        async def run(shard: LongFormShard) -> None:
+            async with semaphore:
+                shard_started = time.perf_counter()
+                try:
+                    output = await generate(
+                        **_shard_arguments(
+                            style,
+                            shard.text,
+                            shard.index,
+                            len(texts),
+                            name,
+                            directory,
+                            request_options,
+                        )
+                    )
+                except Exception as e:
+                    logger.warning("Shard %s failed: %r", shard.index, e)
+                    shard.error = repr(e)
+                    return
+            _record(shard, output, shard_started)
+            if output.downloaded_paths:
+                downloaded[shard.index] = output.downloaded_paths[0]
+
+        await asyncio.gather(*(run(shard) for shard in result.shards))
+        return _finish(
+            result, downloaded, output_path, download_directory, concatenator, started
+        )
@@ -0,0 +1,121 @@
+import os
+import pathlib
+import pytest
+import time
+import typing
+import wave
+
+from magic_hour.helpers.long_form import LongFormError, concatenate_wav, plan_shards
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+SCRIPT = (
+    "The tide came in. Gulls circled the pier!\n\n"
+    "Nobody on the boardwalk noticed the lighthouse go dark. "
+    "By morning it was lit again?\n\n"
+    "Supercalifragilisticexpialidocious"
+)
+
+
+def test_shards_break_at_paragraphs_then_sentences_then_words() -> None:
+    assert plan_shards(SCRIPT, max_chars=60) == [
+        "The tide came in. Gulls circled the pier!",
+        "Nobody on the boardwalk noticed the lighthouse go dark.",
+        "By morning it was lit again?",
+        "Supercalifragilisticexpialidocious",
+    ]
+    assert plan_shards(SCRIPT, max_chars=len(SCRIPT)) == [SCRIPT]
+    assert plan_shards("one two three four", max_chars=9) == [
+        "one two",
+        "three",
+        "four",
+    ]
+    assert plan_shards("abcdefgh", max_chars=3) == ["abc", "def", "gh"]
+
+
+def test_wav_shards_are_joined_frame_for_frame(tmp_path: pathlib.Path) -> None:
+    paths = []
+    for i, frames in enumerate([b"\x01\x00" * 100, b"\x02\x00" * 50]):
+        path = str(tmp_path / f"{i}.wav")
+        with wave.open(path, "wb") as shard:
+            shard.setnchannels(1)
+            shard.setsampwidth(2)
+            shard.setframerate(16000)
+            shard.writeframes(frames)
+        paths.append(path)
+
+    concatenate_wav(paths, str(tmp_path / "out.wav"))
+
+    with wave.open(str(tmp_path / "out.wav"), "rb") as output:
+        assert output.getnframes() == 150 and output.getframerate() == 16000
+        assert output.readframes(150) == b"\x01\x00" * 100 + b"\x02\x00" * 50
+
+
+def test_shards_render_concurrently_and_are_stitched(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.2, output_bytes=64)
+    client = mock.client()
+
+    started = time.perf_counter()
+    result = client.v1.ai_voice_generator.generate_long_form(
+        style={"prompt": SCRIPT, "voice_name": "Morgan Freeman"},
+        name="Tide",
+        max_shard_chars=60,
+        download_directory=str(tmp_path),
+    )
+
+    assert time.perf_counter() - started < 0.2 * 3  # sequential would take 0.8s+
+    assert [s.text for s in result.shards] == plan_shards(SCRIPT, max_chars=60)
+    assert all(s.status == "complete" and s.seconds for s in result.shards)
+    assert len({s.project_id for s in result.shards}) == 4
+    assert result.output_path is not None
+    assert os.path.dirname(result.output_path) == str(tmp_path)
+    assert os.path.getsize(result.output_path) == 4 * 64
+    assert os.listdir(tmp_path) == [os.path.basename(result.output_path)]
+
+
+@pytest.mark.asyncio
+async def test_async_failed_shards_raise_with_the_plan(tmp_path: pathlib.Path) -> None:
+    client = MockMagicHour(job_failure_rate=1.0).async_client()
+
+    with pytest.raises(LongFormError) as raised:
+        await client.v1.ai_voice_generator.generate_long_form(
+            style={"prompt": SCRIPT, "voice_name": "Morgan Freeman"},
+            max_shard_chars=60,
+            output_path=str(tmp_path / "out.mp3"),
+        )
+
+    assert [s.status for s in raised.value.result.shards] == ["error"] * 4
+    assert raised.value.result.output_path is None
+    assert not (tmp_path / "out.mp3").exists()
+
+
+def test_output_directory_is_created_and_stitch_failures_keep_the_shards(
+    tmp_path: pathlib.Path,
+) -> None:
+    client = MockMagicHour(output_bytes=64).client()
+    arguments: typing.Dict[str, typing.Any] = {
+        "style": {"prompt": SCRIPT, "voice_name": "Morgan Freeman"},
+        "max_shard_chars": 60,
+    }
+
+    result = client.v1.ai_voice_generator.generate_long_form(
+        **arguments, download_directory=str(tmp_path / "new" / "out")
+    )
+    assert result.output_path is not None and os.path.isfile(result.output_path)
+
+    def fail(paths: typing.List[str], output_path: str) -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(LongFormError) as raised:
+        client.v1.ai_voice_generator.generate_long_form(
+            **arguments, output_path=str(tmp_path / "out.mp3"), concatenator=fail
+        )
+    assert isinstance(raised.value.__cause__, OSError)
+    assert all(
+        s.status == "complete" and s.project_id for s in raised.value.result.shards
+    )
@@ -0,0 +1,462 @@
+import functools
+import os
+import pathlib
+import pydantic
+import struct
+import typing
+
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+# how far past the end of a file `end_seconds` may be before it's rejected, covering
+# container vs. stream duration rounding
+RANGE_TOLERANCE_SECONDS = 0.1
+
+_HEADER_BYTES = 64 * 1024
+# a `moov` box larger than this (hours of video with per-sample tables) isn't read
+_MAX_MOOV_BYTES = 64 * 1024 * 1024
+_MP4_BRANDS = (b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide", b"pnot")
+
+_MPEG_BITRATES = {  # kbit/s by (MPEG version 1?, layer) and bitrate index
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MPEG_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+_JPEG_FRAME_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class MediaInfo(pydantic.BaseModel):
+    """What `probe_media()` read from a file's headers; unknown fields are None"""
+
+    kind: str
+    """`"video"`, `"audio"` or `"image"`"""
+
+    container: str
+    """e.g. `"mp4"`, `"mov"`, `"wav"`, `"mp3"`, `"flac"`, `"png"`"""
+
+    duration_seconds: typing.Optional[float] = None
+    fps: typing.Optional[float] = None
+    width: typing.Optional[int] = None
+    height: typing.Optional[int] = None
+    video_codec: typing.Optional[str] = None
+    """Sample entry code of the video track, e.g. `"avc1"` or `"hvc1"`"""
+
+    audio_codec: typing.Optional[str] = None
+    sample_rate: typing.Optional[int] = None
+    channels: typing.Optional[int] = None
+
+    def estimated_frames(
+        self,
+        start_seconds: float,
+        end_seconds: float,
+        max_fps_limit: typing.Optional[float] = None,
+    ) -> typing.Optional[int]:
+        """
+        Frames a render of `[start_seconds, end_seconds)` would produce at the
+        file's frame rate, capped at `max_fps_limit`: what the API charges once the
+        render completes (the estimate charged at queue time assumes 30 FPS)
+        """
+        if self.fps is None:
+            return None
+        fps = min(self.fps, max_fps_limit) if max_fps_limit else self.fps
+        end = min(end_seconds, self.duration_seconds or end_seconds)
+        return max(0, round((end - start_seconds) * fps))
+
+
+class MediaRangeError(ValueError):
+    """Raised before uploading a file that `start_seconds`/`end_seconds` don't fit"""
+
+    def __init__(self, message: str, path: str, media: MediaInfo):
+        super().__init__(message)
+        self.path = path
+        self.media = media
+
+
+def _box_header(
+    data: bytes, offset: int, end: typing.Optional[int] = None
+) -> typing.Optional[typing.Tuple[int, bytes, int]]:
+    """
+    `(size, type, header length)` of the ISO-BMFF box at `offset`, in data ending
+    at `end` (the end of `data` by default)
+    """
+    if offset + 8 > len(data):
+        return None
+    size, type_ = struct.unpack_from(">I4s", data, offset)
+    if size == 1:
+        if offset + 16 > len(data):
+            return None
+        (size,) = struct.unpack_from(">Q", data, offset + 8)
+        return size, type_, 16
+    if size == 0:  # the box runs to the end
+        size = (len(data) if end is None else end) - offset
+    return (size, type_, 8) if size >= 8 else None
+
+
+def _boxes(data: bytes) -> typing.Iterator[typing.Tuple[bytes, bytes]]:
+    offset = 0
+    while True:
+        header = _box_header(data, offset)
+        if header is None:
+            return
+        size, type_, length = header
+        yield type_, data[offset + length : offset + size]
+        offset += size
+
+
+def _child(data: bytes, type_: bytes) -> typing.Optional[bytes]:
+    return next((body for t, body in _boxes(data) if t == type_), None)
+
+
+def _full_box_times(body: bytes) -> typing.Tuple[int, int]:
+    """`(timescale, duration)` of an `mvhd` or `mdhd` box"""
+    if body[0] == 1:
+        return struct.unpack_from(">IQ", body, 20)
+    return struct.unpack_from(">II", body, 12)
+
+
+def _parse_trak(trak: bytes, info: typing.Dict[str, typing.Any]) -> None:
+    mdia = _child(trak, b"mdia")
+    if mdia is None:
+        return
+    hdlr = _child(mdia, b"hdlr")
+    mdhd = _child(mdia, b"mdhd")
+    stbl = _child(_child(mdia, b"minf") or b"", b"stbl") or b""
+    stsd = _child(stbl, b"stsd")
+    handler = hdlr[8:12] if hdlr is not None and len(hdlr) >= 12 else b""
+    # the first sample entry follows the full box header and entry count
+    entry = stsd[8:] if stsd is not None and len(stsd) > 16 else b""
+    codec = entry[4:8].decode("latin-1").strip() if len(entry) >= 8 else None
+    if handler == b"vide" and "video_codec" not in info:
+        info["video_codec"] = codec
+        if len(entry) >= 36:
+            info["width"], info["height"] = struct.unpack_from(">HH", entry, 32)
+        stts = _child(stbl, b"stts")
+        if mdhd is not None and stts is not None and len(stts) >= 8:
+            timescale, duration = _full_box_times(mdhd)
+            (entries,) = struct.unpack_from(">I", stts, 4)
+            samples = sum(
+                struct.unpack_from(">I", stts, 8 + 8 * i)[0]
+                for i in range(min(entries, (len(stts) - 8) // 8))
+            )
+            if duration and timescale:
+                info["fps"] = round(samples * timescale / duration, 3)
+    elif handler == b"soun" and "audio_codec" not in info:
+        info["audio_codec"] = codec
+        if len(entry) >= 36:
+            channels, _, _, _, rate = struct.unpack_from(">HHHHI", entry, 24)
+            info["channels"], info["sample_rate"] = channels, rate >> 16
+
+
+def _read_moov(f: typing.BinaryIO, file_size: int) -> typing.Optional[bytes]:
+    """The `moov` box, found by seeking from one top-level box header to the next"""
+    offset = 0
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        header = _box_header(f.read(16), 0, file_size - offset)
+        if header is None:
+            return None
+        size, type_, length = header
+        if type_ == b"moov":
+            if size > _MAX_MOOV_BYTES:
+                return None
+            return _read_at(f, offset + length, size - length)
+        offset += size
+    return None
+
+
+def _read_at(f: typing.BinaryIO, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    return f.read(size)
+
+
+def _probe_mp4(
+    f: typing.BinaryIO, head: bytes, file_size: int
+) -> typing.Optional[MediaInfo]:
+    ftyp = _child(head, b"ftyp")
+    container = "mov" if ftyp is not None and ftyp[:4] == b"qt  " else "mp4"
+    moov = _read_moov(f, file_size)
+    if moov is None:
+        return None
+    info: typing.Dict[str, typing.Any] = {}
+    mvhd = _child(moov, b"mvhd")
+    if mvhd is not None:
+        timescale, duration = _full_box_times(mvhd)
+        if timescale and duration:  # fragmented files leave the duration at 0
+            info["duration_seconds"] = duration / timescale
+    for type_, body in _boxes(moov):
+        if type_ == b"trak":
+            _parse_trak(body, info)
+    kind = "video" if "video_codec" in info else "audio"
+    return MediaInfo(kind=kind, container=container, **info)
+
+
+def _probe_wav(head: bytes, file_size: int) -> typing.Optional[MediaInfo]:
+    offset = 12
+    fmt: typing.Optional[typing.Tuple[int, ...]] = None
+    while offset + 8 <= len(head):
+        type_, size = struct.unpack_from("<4sI", head, offset)
+        if type_ == b"fmt " and offset + 24 <= len(head):
+            fmt = struct.unpack_from("<HHII", head, offset + 8)
+        elif type_ == b"data" and fmt is not None:
+            _, channels, rate, byte_rate = fmt
+            if size in (0, 0xFFFFFFFF):  # written while streaming
+                size = file_size - offset - 8
+            size = min(size, file_size - offset - 8)
+            return MediaInfo(
+                kind="audio",
+                container="wav",
+                duration_seconds=size / byte_rate if byte_rate else None,
+                audio_codec="pcm" if fmt[0] in (1, 0xFFFE) else f"0x{fmt[0]:04x}",
+                sample_rate=rate,
+                channels=channels,
+            )
+        offset += 8 + size + (size & 1)
+    return None
+
+
+def _id3v2_length(data: bytes) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in data[6:10]:  # "syncsafe": 7 bits per byte
+        size = (size << 7) | (byte & 0x7F)
+    return 10 + size + (10 if data[5] & 0x10 else 0)
+
+
+def _probe_mp3(
+    f: typing.BinaryIO, head: bytes, file_size: int
+) -> typing.Optional[MediaInfo]:
+    start = _id3v2_length(head)
+    frame = _read_at(f, start, 4096) if start else head
+    # skip padding between the tag and the first frame
+    sync = next(
+        (
+            i
+            for i in range(len(frame) - 3)
+            if frame[i] == 0xFF and frame[i + 1] & 0xE0 == 0xE0
+        ),
+        None,
+    )
+    if sync is None:
+        return None
+    (header,) = struct.unpack_from(">I", frame, sync)
+    version = (header >> 19) & 3
+    layer = 4 - ((header >> 17) & 3)
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    rate = _MPEG_SAMPLE_RATES[version][rate_index]
+    channels = 1 if (header >> 6) & 3 == 3 else 2
+    samples_per_frame = 384 if layer == 1 else 1152 if layer == 2 or mpeg1 else 576
+
+    # a Xing/Info or VBRI header in the first frame gives the frame count of VBR files
+    side_info = (17 if channels == 1 else 32) if mpeg1 else (9 if channels == 1 else 17)
+    xing = sync + 4 + side_info
+    frames: typing.Optional[int] = None
+    if frame[xing : xing + 4] in (b"Xing", b"Info") and frame[xing + 7] & 1:
+        (frames,) = struct.unpack_from(">I", frame, xing + 8)
+    elif frame[sync + 36 : sync + 40] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", frame, sync + 50)
+    if frames:
+        duration = frames * samples_per_frame / rate
+    else:
+        audio_bytes = file_size - start - sync
+        f.seek(max(0, file_size - 128))
+        if f.read(3) == b"TAG":
+            audio_bytes -= 128
+        duration = audio_bytes * 8 / bitrate
+    return MediaInfo(
+        kind="audio",
+        container="mp3",
+        duration_seconds=duration,
+        audio_codec=f"mp{layer}" if layer > 1 else "mp1",
+        sample_rate=rate,
+        channels=channels,
+    )
+
+
+def _probe_flac(head: bytes) -> typing.Optional[MediaInfo]:
+    # the STREAMINFO block always comes first
+    if len(head) < 8 + 18 or head[4] & 0x7F != 0:
+        return None
+    (packed,) = struct.unpack_from(">Q", head, 8 + 10)
+    rate = packed >> 44
+    channels = ((packed >> 41) & 7) + 1
+    samples = packed & 0xFFFFFFFFF
+    return MediaInfo(
+        kind="audio",
+        container="flac",
+        duration_seconds=samples / rate if rate and samples else None,
+        audio_codec="flac",
+        sample_rate=rate or None,
+        channels=channels,
+    )
+
+
+def _image(container: str, width: int, height: int) -> MediaInfo:
+    return MediaInfo(kind="image", container=container, width=width, height=height)
+
+
+def _probe_jpeg(head: bytes) -> typing.Optional[MediaInfo]:
+    offset = 2
+    while offset + 9 <= len(head):
+        if head[offset] != 0xFF:
+            return None
+        marker = head[offset + 1]
+        if marker == 0xFF:  # fill byte
+            offset += 1
+            continue
+        (length,) = struct.unpack_from(">H", head, offset + 2)
+        if marker in _JPEG_FRAME_MARKERS:
+            height, width = struct.unpack_from(">HH", head, offset + 5)
+            return _image("jpeg", width, height)
+        offset += 2 + length
+    return None
+
+
+def _probe_webp(head: bytes) -> typing.Optional[MediaInfo]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30:
+        width, height = struct.unpack_from("<HH", head, 26)
+        return _image("webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and len(head) >= 25:
+        (bits,) = struct.unpack_from("<I", head, 21)
+        return _image("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return _image("webp", width, height)
+    return None
+
+
+def _probe(f: typing.BinaryIO, file_size: int) -> typing.Optional[MediaInfo]:
+    head = f.read(_HEADER_BYTES)
+    if head[4:8] in _MP4_BRANDS:
+        return _probe_mp4(f, head, file_size)
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return _probe_wav(head, file_size)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _probe_webp(head)
+    if head[:4] == b"fLaC":
+        return _probe_flac(head)
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and len(head) >= 24:
+        return _image("png", *struct.unpack_from(">II", head, 16))
+    if head[:6] in (b"GIF87a", b"GIF89a") and len(head) >= 10:
+        return _image("gif", *struct.unpack_from("<HH", head, 6))
+    if head[:2] == b"\xff\xd8":
+        return _probe_jpeg(head)
+    if head[:3] == b"ID3" or (
+        len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0
+    ):
+        return _probe_mp3(f, head, file_size)
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_cached(path: str, size: int, mtime_ns: int) -> typing.Optional[MediaInfo]:
+    with open(path, "rb") as f:
+        return _probe(f, size)
+
+
+def probe_media(
+    path: typing.Union[str, "os.PathLike[str]"],
+) -> typing.Optional[MediaInfo]:
+    """
+    Duration, frame rate, resolution and codecs of a local media file, read from
+    its headers only: MP4/MOV boxes, WAV, MP3 and FLAC headers, and PNG, JPEG, GIF
+    and WebP dimensions. Returns None for other formats and for files whose
+    headers can't be parsed. Results are cached while the file is unchanged.
+
+    ```py
+    info = probe_media("talk.mp4")
+    print(info.duration_seconds, info.fps, info.width, info.height)
+    ```
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    try:
+        return _probe_cached(path, stat.st_size, stat.st_mtime_ns)
+    except (struct.error, IndexError, ValueError, KeyError, ZeroDivisionError) as e:
+        logger.debug("Couldn't probe %s: %r", path, e)
+        return None
+
+
+def _local_file(value: typing.Any) -> typing.Optional[str]:
+    if isinstance(value, pathlib.Path) or (
+        isinstance(value, str) and os.path.isfile(value)
+    ):
+        return os.fspath(value)
+    return None  # URLs, `api-assets/` paths and output references aren't probed
+
+
+def _duration(
+    path: str,
+) -> typing.Tuple[typing.Optional[MediaInfo], typing.Optional[float]]:
+    info = probe_media(path)
+    return info, info.duration_seconds if info is not None else None
+
+
+def check_time_range(
+    assets: typing.Any,
+    start_seconds: typing.Any,
+    end_seconds: typing.Any,
+) -> None:
+    """
+    Check `start_seconds`/`end_seconds` against the local media in `assets` before
+    anything is uploaded: the range must lie within `video_file_path`, or within
+    `audio_file_path` when there is no video, and with both (lip sync) the audio
+    must last at least as long as the range. Files that can't be probed pass.
+
+    Raises:
+        MediaRangeError: If the range doesn't fit a file
+    """
+    if not isinstance(assets, typing.Mapping):
+        return
+    if not isinstance(start_seconds, (int, float)) or not isinstance(
+        end_seconds, (int, float)
+    ):
+        return
+    video = _local_file(assets.get("video_file_path"))
+    audio = _local_file(assets.get("audio_file_path"))
+    source = video if video is not None else audio
+    if source is not None:
+        info, duration = _duration(source)
+        if info is not None and duration is not None:
+            if end_seconds > duration + RANGE_TOLERANCE_SECONDS:
+                raise MediaRangeError(
+                    f"end_seconds={end_seconds:g} is past the end of {source} "
+                    f"({duration:.3f}s long)",
+                    source,
+                    info,
+                )
+            if start_seconds >= duration:
+                raise MediaRangeError(
+                    f"start_seconds={start_seconds:g} is past the end of {source} "
+                    f"({duration:.3f}s long)",
+                    source,
+                    info,
+                )
+    if video is not None and audio is not None:
+        info, duration = _duration(audio)
+        needed = end_seconds - start_seconds
+        if info is not None and duration is not None:
+            if duration + RANGE_TOLERANCE_SECONDS < needed:
+                raise MediaRangeError(
+                    f"{audio} is {duration:.3f}s long, shorter than the "
+                    f"{needed:g}s range from start_seconds to end_seconds",
+                    audio,
+                    info,
+                )
@@ -0,0 +1,145 @@
+import pathlib
+import pytest
+import struct
+import typing
+import wave
+
+from magic_hour.helpers.media_probe import MediaRangeError, probe_media
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _box(type_: bytes, *children: bytes) -> bytes:
+    body = b"".join(children)
+    return struct.pack(">I4s", 8 + len(body), type_) + body
+
+
+def _trak(handler: bytes, entry: bytes, timescale: int, samples: int) -> bytes:
+    mdhd = _box(b"mdhd", struct.pack(">I4xIII4x", 0, 0, timescale, timescale * 10))
+    hdlr = _box(b"hdlr", struct.pack(">II4s12x", 0, 0, handler))
+    stsd = _box(b"stsd", struct.pack(">II", 0, 1), entry)
+    stts = _box(b"stts", struct.pack(">IIII", 0, 1, samples, 1))
+    stbl = _box(b"stbl", stsd, stts)
+    return _box(b"trak", _box(b"mdia", mdhd, hdlr, _box(b"minf", stbl)))
+
+
+def _mp4(seconds: int) -> bytes:
+    """A 1280x720 25 FPS H.264 + 2 channel 48 kHz AAC MP4 with `moov` at the end"""
+    mvhd = _box(b"mvhd", struct.pack(">I4x4xII", 0, 1000, seconds * 1000))
+    video = _box(b"avc1", bytes(8 + 16) + struct.pack(">HH", 1280, 720) + bytes(50))
+    audio = _box(
+        b"mp4a", bytes(8 + 8) + struct.pack(">HHHHI", 2, 16, 0, 0, 48000 << 16)
+    )
+    moov = _box(
+        b"moov",
+        mvhd,
+        _trak(b"vide", video, 12800, 250),
+        _trak(b"soun", audio, 48000, 470),
+    )
+    return _box(b"ftyp", b"isom\0\0\2\0isomavc1") + _box(b"mdat", bytes(4096)) + moov
+
+
+def _write_wav(path: pathlib.Path, seconds: float) -> None:
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(bytes(int(16000 * seconds)))
+
+
+def test_headers_are_probed(tmp_path: pathlib.Path) -> None:
+    files: typing.Dict[str, bytes] = {
+        "clip.mp4": _mp4(10),
+        # 128 kbit/s, 44.1 kHz, stereo MPEG-1 layer III frames: 2 seconds of data
+        "voice.mp3": b"ID3\3\0\0\0\0\0\0" + b"\xff\xfb\x90\x00" + bytes(32_000 - 4),
+        "voice.flac": b"fLaC\x80\0\0\x22"
+        + bytes(10)
+        + struct.pack(">Q", (44100 << 44) | (1 << 41) | (15 << 36) | 132300)
+        + bytes(16),
+        "face.png": b"\x89PNG\r\n\x1a\n" + _box(b"IHDR", struct.pack(">II", 640, 480)),
+        "face.gif": b"GIF89a" + struct.pack("<HH", 32, 16),
+        "notes.txt": b"not media",
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+    _write_wav(tmp_path / "voice.wav", 1.5)
+
+    mp4 = probe_media(tmp_path / "clip.mp4")
+    assert mp4 is not None
+    assert (mp4.kind, mp4.container, mp4.duration_seconds) == ("video", "mp4", 10.0)
+    assert (mp4.width, mp4.height, mp4.fps) == (1280, 720, 25.0)
+    assert (mp4.video_codec, mp4.audio_codec) == ("avc1", "mp4a")
+    assert (mp4.channels, mp4.sample_rate) == (2, 48000)
+    assert mp4.estimated_frames(2, 6) == 100
+    assert mp4.estimated_frames(2, 6, max_fps_limit=12) == 48
+
+    mp3 = probe_media(tmp_path / "voice.mp3")
+    assert mp3 is not None and mp3.duration_seconds == pytest.approx(2.0)
+    assert (mp3.sample_rate, mp3.channels, mp3.audio_codec) == (44100, 2, "mp3")
+    flac = probe_media(tmp_path / "voice.flac")
+    assert flac is not None and flac.duration_seconds == pytest.approx(3.0)
+    assert (flac.sample_rate, flac.channels) == (44100, 2)
+    wav = probe_media(tmp_path / "voice.wav")
+    assert wav is not None and wav.duration_seconds == pytest.approx(1.5)
+    png = probe_media(tmp_path / "face.png")
+    gif = probe_media(tmp_path / "face.gif")
+    assert png is not None and (png.width, png.height) == (640, 480)
+    assert gif is not None and (gif.width, gif.height) == (32, 16)
+    assert probe_media(tmp_path / "notes.txt") is None
+
+
+def test_ranges_are_rejected_before_upload(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(_mp4(10))
+    audio = tmp_path / "voice.wav"
+    _write_wav(audio, 3)
+
+    with pytest.raises(MediaRangeError, match="past the end") as e:
+        client.v1.face_swap.generate(
+            assets={
+                "face_swap_mode": "all-faces",
+                "video_source": "file",
+                "video_file_path": str(video),
+                "image_file_path": "api-assets/face.png",
+            },
+            start_seconds=0,
+            end_seconds=30,
+        )
+    assert e.value.path == str(video)
+    with pytest.raises(MediaRangeError, match="shorter than"):
+        client.v1.lip_sync.generate(
+            assets={
+                "video_source": "file",
+                "video_file_path": str(video),
+                "audio_file_path": str(audio),
+            },
+            start_seconds=2,
+            end_seconds=8,
+        )
+    with pytest.raises(MediaRangeError):
+        client.v1.video_to_video.generate_segmented(
+            assets={"video_source": "file", "video_file_path": str(video)},
+            start_seconds=0,
+            end_seconds=60,
+            segments=4,
+            style={"art_style": "Cyberpunk"},
+        )
+    assert mock.requests == []
+
+    result = client.v1.lip_sync.generate(
+        assets={
+            "video_source": "file",
+            "video_file_path": str(video),
+            "audio_file_path": str(audio),
+        },
+        start_seconds=2,
+        end_seconds=5,
+        download_outputs=False,
+    )
+    assert result.status == "complete"
@@ -0,0 +1,434 @@
+import bisect
+import math
+import threading
+import typing
+
+from magic_hour.helpers.response_parsing import _type_adapter
+from magic_hour.helpers.serialization import _adapter
+from magic_hour.helpers.tracing import (
+    DOWNLOAD,
+    GENERATE,
+    REQUEST,
+    UPLOAD_PUT,
+    WAIT,
+    Span,
+    SpanListener,
+)
+
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Seconds, for single requests, transfers and rate-limiter waits"""
+JOB_BUCKETS = (5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+"""Seconds, for whole `generate()` calls"""
+POLL_BUCKETS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0)
+THROUGHPUT_BUCKETS = tuple(float(2**n) for n in range(16, 31, 2))
+"""Bytes per second, 64 KiB/s to 1 GiB/s"""
+
+Labels = typing.Tuple[str, ...]
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help: str, label_names: typing.Sequence[str]):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: typing.Mapping[str, typing.Any]) -> Labels:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _labels(self, key: Labels) -> typing.Dict[str, str]:
+        return dict(zip(self.label_names, key))
+
+
+class Counter(_Metric):
+    """A monotonically increasing value per label set"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, label_names: typing.Sequence[str] = ()):
+        super().__init__(name, help, label_names)
+        self._values: typing.Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: typing.Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: typing.Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": self._labels(k), "value": v} for k, v in items]
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed buckets per label set, plus their sum"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: typing.Sequence[str] = (),
+        buckets: typing.Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [count per bucket (+Inf last)..., sum]
+        self._values: typing.Dict[Labels, typing.List[float]] = {}
+
+    def observe(self, value: float, **labels: typing.Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            row[index] += 1
+            row[-1] += value
+
+    def samples(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        samples = []
+        for key, row in items:
+            cumulative: typing.Dict[str, float] = {}
+            total = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), row[:-1]):
+                total += count
+                cumulative[_format_value(bound)] = total
+            samples.append(
+                {
+                    "labels": self._labels(key),
+                    "count": total,
+                    "sum": row[-1],
+                    "buckets": cumulative,
+                }
+            )
+        return samples
+
+
+class MetricsRegistry(SpanListener):
+    """
+    Counters and histograms for everything a client does, exportable as Prometheus
+    text or a plain dict.
+
+    The registry is a `SpanListener`: pass it to a client and it records
+
+    - `magic_hour_request_duration_seconds{endpoint,status_code}`: API request latency
+    - `magic_hour_token_pool_wait_seconds{token}` and
+      `magic_hour_rate_limit_wait_seconds{token}`: time spent waiting for a
+      `TokenPool` token before sending (not part of the request latency)
+    - `magic_hour_upload_bytes_total`, `magic_hour_upload_duration_seconds` and
+      `magic_hour_upload_throughput_bytes_per_second` (and the `download` equivalents)
+    - `magic_hour_job_polls{kind}`: status checks per project before it finished
+    - `magic_hour_job_duration_seconds{resource,status}`: end-to-end `generate()` time
+    - `magic_hour_cache_hit_ratio{cache}`: for every cache tracked with `track_cache()`
+      or fed with `record_cache_lookup()`, including the SDK's type adapter caches
+
+    ```py
+    metrics = MetricsRegistry()
+    client = Client(span_listeners=[metrics])
+    ...
+    print(metrics.to_prometheus())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._metrics: typing.Dict[str, typing.Union[Counter, Histogram]] = {}
+        self._cache_sources: typing.Dict[
+            str, typing.Callable[[], typing.Tuple[int, int]]
+        ] = {}
+        self._lock = threading.Lock()
+
+        self.request_duration = self.histogram(
+            "magic_hour_request_duration_seconds",
+            "Latency of Magic Hour API requests",
+            ["endpoint", "status_code"],
+        )
+        self.token_pool_wait = self.histogram(
+            "magic_hour_token_pool_wait_seconds",
+            "Time requests waited for a TokenPool token, rate limiting included",
+            ["token"],
+        )
+        self.rate_limit_wait = self.histogram(
+            "magic_hour_rate_limit_wait_seconds",
+            "Time requests waited for their token's rate limiter",
+            ["token"],
+        )
+        self.transfer_bytes = {
+            kind: self.counter(
+                f"magic_hour_{kind}_bytes_total", f"Bytes {kind}ed", ["status"]
+            )
+            for kind in ("upload", "download")
+        }
+        self.transfer_duration = {
+            kind: self.histogram(
+                f"magic_hour_{kind}_duration_seconds",
+                f"Duration of file {kind}s",
+                ["status"],
+            )
+            for kind in ("upload", "download")
+        }
+        self.transfer_throughput = {
+            kind: self.histogram(
+                f"magic_hour_{kind}_throughput_bytes_per_second",
+                f"Throughput of successful file {kind}s",
+                buckets=THROUGHPUT_BUCKETS,
+            )
+            for kind in ("upload", "download")
+        }
+        self.job_polls = self.histogram(
+            "magic_hour_job_polls",
+            "Status checks made while waiting for a project",
+            ["kind", "status"],
+            buckets=POLL_BUCKETS,
+        )
+        self.job_duration = self.histogram(
+            "magic_hour_job_duration_seconds",
+            "End-to-end duration of generate() calls",
+            ["resource", "status"],
+            buckets=JOB_BUCKETS,
+        )
+        self.cache_lookups = self.counter(
+            "magic_hour_cache_lookups_total",
+            "Cache lookups recorded with record_cache_lookup()",
+            ["cache", "result"],
+        )
+
+        for name, cached in (
+            ("serializer_adapters", _adapter),
+            ("response_adapters", _type_adapter),
+        ):
+            self.track_cache(name, _lru_stats(cached))
+
+    def counter(
+        self, name: str, help: str, label_names: typing.Sequence[str] = ()
+    ) -> Counter:
+        """Register (or return the existing) counter called `name`"""
+        return typing.cast(Counter, self._register(Counter(name, help, label_names)))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: typing.Sequence[str] = (),
+        buckets: typing.Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Register (or return the existing) histogram called `name`"""
+        return typing.cast(
+            Histogram, self._register(Histogram(name, help, label_names, buckets))
+        )
+
+    def _register(
+        self, metric: typing.Union[Counter, Histogram]
+    ) -> typing.Union[Counter, Histogram]:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(
+                        f"Metric {metric.name} is already registered as a {existing.type_name}"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def track_cache(
+        self, name: str, stats: typing.Callable[[], typing.Tuple[int, int]]
+    ) -> None:
+        """Report the hit ratio of a cache; `stats()` returns `(hits, misses)`"""
+        with self._lock:
+            self._cache_sources[name] = stats
+
+    def record_cache_lookup(self, name: str, hit: bool) -> None:
+        """Count one lookup of a cache that does not keep its own statistics"""
+        self.cache_lookups.inc(cache=name, result="hit" if hit else "miss")
+
+    def on_end(self, span: Span) -> None:
+        attributes = span.attributes
+        duration = span.duration_seconds or 0.0
+        if span.name == REQUEST:
+            self.request_duration.observe(
+                duration,
+                endpoint=attributes.get("magic_hour.endpoint"),
+                status_code=attributes.get("http.response.status_code") or "error",
+            )
+            token = attributes.get("magic_hour.token")
+            wait = attributes.get("magic_hour.token_pool.wait_seconds")
+            if isinstance(wait, (int, float)):
+                self.token_pool_wait.observe(wait, token=token)
+            wait = attributes.get("magic_hour.rate_limit.wait_seconds")
+            if isinstance(wait, (int, float)):
+                self.rate_limit_wait.observe(wait, token=token)
+        elif span.name == UPLOAD_PUT:
+            self._transfer(
+                "upload", span, duration, attributes.get("http.request.body.size")
+            )
+        elif span.name == DOWNLOAD:
+            self._transfer(
+                "download", span, duration, attributes.get("http.response.body.size")
+            )
+        elif span.name == WAIT:
+            polls = attributes.get("magic_hour.poll_count")
+            if isinstance(polls, int):
+                self.job_polls.observe(
+                    polls,
+                    kind=attributes.get("magic_hour.project_kind"),
+                    status=attributes.get("magic_hour.project_status"),
+                )
+        elif span.name == GENERATE:
+            status = attributes.get("magic_hour.project_status")
+            self.job_duration.observe(
+                duration,
+                resource=attributes.get("magic_hour.resource"),
+                status="exception" if span.status == "error" else status,
+            )
+
+    def _transfer(
+        self, kind: str, span: Span, duration: float, size: typing.Any
+    ) -> None:
+        status = span.status
+        self.transfer_duration[kind].observe(duration, status=status)
+        if not isinstance(size, int):
+            return
+        self.transfer_bytes[kind].inc(size, status=status)
+        if status == "ok" and duration > 0:
+            self.transfer_throughput[kind].observe(size / duration)
+
+    def cache_stats(self) -> typing.Dict[str, typing.Dict[str, float]]:
+        """Hits, misses and hit ratio for every tracked cache"""
+        with self._lock:
+            sources = dict(self._cache_sources)
+        stats: typing.Dict[str, typing.Tuple[float, float]] = {}
+        for name, fn in sources.items():
+            source_hits, source_misses = fn()
+            stats[name] = (float(source_hits), float(source_misses))
+        for sample in self.cache_lookups.samples():
+            name = sample["labels"]["cache"]
+            hits, misses = stats.get(name, (0.0, 0.0))
+            if sample["labels"]["result"] == "hit":
+                hits += sample["value"]
+            else:
+                misses += sample["value"]
+            stats[name] = (hits, misses)
+        return {
+            name: {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            }
+            for name, (hits, misses) in sorted(stats.items())
+        }
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """
+        Every metric as a plain, JSON-serializable dict:
+
+        ```py
+        {
+            "magic_hour_request_duration_seconds": {
+                "type": "histogram",
+                "help": "...",
+                "samples": [
+                    {
+                        "labels": {"endpoint": "POST /v1/face-swap", "status_code": "200"},
+                        "count": 3.0,
+                        "sum": 0.42,
+                        "buckets": {"0.01": 0.0, ..., "+Inf": 3.0},
+                    }
+                ],
+            },
+            "magic_hour_cache_hit_ratio": {...},
+        }
+        ```
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        result: typing.Dict[str, typing.Any] = {
+            metric.name: {
+                "type": metric.type_name,
+                "help": metric.help,
+                "samples": metric.samples(),
+            }
+            for metric in metrics
+        }
+        result["magic_hour_cache_hit_ratio"] = {
+            "type": "gauge",
+            "help": "Share of cache lookups that were hits",
+            "samples": [
+                {"labels": {"cache": name}, "value": stats["hit_ratio"]}
+                for name, stats in self.cache_stats().items()
+            ],
+        }
+        return result
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        lines: typing.List[str] = []
+        for name, metric in self.snapshot().items():
+            lines.append(f"# HELP {name} {_escape_help(metric['help'])}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            for sample in metric["samples"]:
+                labels = sample["labels"]
+                if metric["type"] != "histogram":
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(sample['value'])}"
+                    )
+                    continue
+                for bound, count in sample["buckets"].items():
+                    lines.append(
+                        f"{name}_bucket{_format_labels({**labels, 'le': bound})} "
+                        f"{_format_value(count)}"
+                    )
+                lines.append(
+                    f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}"
+                )
+                lines.append(
+                    f"{name}_count{_format_labels(labels)} {_format_value(sample['count'])}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _lru_stats(
+    cached: typing.Any,
+) -> typing.Callable[[], typing.Tuple[int, int]]:
+    def stats() -> typing.Tuple[int, int]:
+        info = cached.cache_info()
+        return info.hits, info.misses
+
+    return stats
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return f"{int(value)}.0"
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: typing.Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(
+            key,
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for key, value in labels.items()
+    )
+    return "{" + rendered + "}"
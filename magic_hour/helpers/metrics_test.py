@@ -0,0 +1,133 @@
+import httpx
+import pytest
+import typing
+
+from magic_hour import Client
+from magic_hour.helpers import MetricsRegistry, TokenPool
+from magic_hour.helpers.tracing import DOWNLOAD, UPLOAD_PUT, Tracer
+
+
+def _video_project(status: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "created_at": "2024-10-18T05:16:19.027Z",
+        "credits_charged": 450,
+        "download": None,
+        "downloads": [],
+        "enabled": True,
+        "end_seconds": 5.0,
+        "error": None,
+        "fps": 30.0,
+        "height": 960,
+        "id": "cuid-example",
+        "name": "Example Name",
+        "start_seconds": 0.0,
+        "status": status,
+        "total_frame_cost": 450,
+        "type": "TEXT_TO_VIDEO",
+        "width": 512,
+    }
+
+
+def _client(
+    metrics: MetricsRegistry, **kwargs: typing.Any
+) -> typing.Tuple[Client, typing.List[str]]:
+    statuses = ["queued", "rendering", "complete"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={
+                    "credits_charged": 450,
+                    "estimated_frame_cost": 450,
+                    "id": "cuid-example",
+                },
+            )
+        return httpx.Response(200, json=_video_project(statuses.pop(0)))
+
+    client = Client(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        span_listeners=[metrics],
+        **kwargs,
+    )
+    return client, statuses
+
+
+def test_generate_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    metrics = MetricsRegistry()
+    client, _ = _client(metrics, token="API_TOKEN")
+
+    client.v1.text_to_video.generate(
+        end_seconds=5.0, style={"prompt": "a dog running"}, download_outputs=False
+    )
+
+    snapshot = metrics.snapshot()
+    requests = {
+        sample["labels"]["endpoint"]: sample["count"]
+        for sample in snapshot["magic_hour_request_duration_seconds"]["samples"]
+    }
+    assert requests == {"POST /v1/text-to-video": 1, "GET /v1/video-projects/{id}": 3}
+    (job,) = snapshot["magic_hour_job_duration_seconds"]["samples"]
+    assert job["labels"] == {"resource": "text_to_video", "status": "complete"}
+    assert job["count"] == 1
+    (polls,) = snapshot["magic_hour_job_polls"]["samples"]
+    assert polls["labels"] == {"kind": "video", "status": "complete"}
+    assert polls["sum"] == 2
+    assert polls["buckets"]["2.0"] == 1 and polls["buckets"]["1.0"] == 0
+    assert snapshot["magic_hour_token_pool_wait_seconds"]["samples"] == []
+
+
+def test_token_pool_wait_is_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    metrics = MetricsRegistry()
+    client, _ = _client(
+        metrics,
+        token_pool=TokenPool([{"token": "token-a", "label": "a"}]),
+    )
+
+    client.v1.text_to_video.create(end_seconds=5.0, style={"prompt": "a dog"})
+
+    (wait,) = metrics.snapshot()["magic_hour_rate_limit_wait_seconds"]["samples"]
+    assert wait["labels"] == {"token": "a"} and wait["count"] == 1
+
+
+def test_transfers_and_prometheus_text() -> None:
+    metrics = MetricsRegistry()
+    tracer = Tracer([metrics])
+
+    with tracer.span(UPLOAD_PUT, {"http.request.body.size": 1024}):
+        pass
+    with pytest.raises(httpx.HTTPError):
+        with tracer.span(DOWNLOAD, {"http.response.body.size": 10}):
+            raise httpx.HTTPError("reset")
+    metrics.record_cache_lookup("faces", hit=True)
+    metrics.record_cache_lookup("faces", hit=False)
+    metrics.record_cache_lookup("faces", hit=True)
+
+    assert metrics.transfer_bytes["upload"].value(status="ok") == 1024
+    assert metrics.transfer_bytes["download"].value(status="error") == 10
+    assert metrics.cache_stats()["faces"]["hit_ratio"] == pytest.approx(2 / 3)
+    assert "serializer_adapters" in metrics.cache_stats()
+
+    text = metrics.to_prometheus()
+    assert "# TYPE magic_hour_upload_bytes_total counter" in text
+    assert 'magic_hour_upload_bytes_total{status="ok"} 1024.0' in text
+    assert (
+        'magic_hour_upload_duration_seconds_bucket{status="ok",le="+Inf"} 1.0' in text
+    )
+    assert 'magic_hour_upload_duration_seconds_count{status="ok"} 1.0' in text
+    assert "# TYPE magic_hour_cache_hit_ratio gauge" in text
+    assert text.endswith("\n")
+
+
+def test_registering_a_name_twice_returns_the_same_metric() -> None:
+    metrics = MetricsRegistry()
+
+    counter = metrics.counter("app_jobs_total", "Jobs", ["queue"])
+    assert metrics.counter("app_jobs_total", "Jobs", ["queue"]) is counter
+    with pytest.raises(ValueError):
+        metrics.histogram("app_jobs_total", "Jobs")
+
+    counter.inc(queue='say "hi"\n')
+    assert 'app_jobs_total{queue="say \\"hi\\"\\n"} 1.0' in metrics.to_prometheus()
@@ -0,0 +1,345 @@
+import asyncio
+import copy
+import time
+import typing
+
+from magic_hour.helpers.batch import BatchItemResult, run_in_thread
+from magic_hour.helpers.download import download_files_async
+from magic_hour.helpers.ledger import (
+    SUBMITTED,
+    LedgerEntry,
+    get_ledger,
+    project_kind,
+    request_fingerprint,
+)
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.media_probe import check_time_range
+from magic_hour.helpers.timing import JobTimer, leave_job, start_job
+from magic_hour.helpers.tracing import get_tracer
+from magic_hour.helpers.transfer import get_transfer_client
+from magic_hour.helpers.validation import check_capabilities
+
+
+if typing.TYPE_CHECKING:
+    from magic_hour.client import AsyncClient
+
+
+logger = get_sdk_logger(__name__)
+
+UPLOAD = "upload"
+SUBMIT = "submit"
+WAIT = "wait"
+DOWNLOAD = "download"
+
+# arguments of generate() that create() doesn't take
+_GENERATE_ONLY = ("wait_for_completion", "download_outputs", "download_directory")
+
+JobSpec = typing.Mapping[str, typing.Any]
+"""
+`generate()` arguments for one job, plus an optional `"resource"` (e.g.
+`"face_swap_photo"`) overriding the pipeline's default resource
+"""
+
+
+class PipelineItemResult(BatchItemResult[JobSpec, typing.Any]):
+    """
+    A `BatchItemResult` for one pipeline job, which also records the stage that
+    failed (`stage`, None on success) and the time spent in each stage
+    (`stage_seconds`, excluding time spent queued between stages).
+    """
+
+    __slots__ = ("stage", "stage_seconds")
+
+    def __init__(self, index: int, item: JobSpec):
+        super().__init__(index, item)
+        self.stage: typing.Optional[str] = None
+        self.stage_seconds: typing.Dict[str, float] = {}
+
+
+class _Job:
+    __slots__ = (
+        "outcome",
+        "resource",
+        "arguments",
+        "project_id",
+        "fingerprint",
+        "started",
+        "timer",
+    )
+
+    def __init__(self, index: int, spec: JobSpec, resource: typing.Optional[str]):
+        self.outcome = PipelineItemResult(index, spec)
+        arguments = copy.deepcopy(dict(spec))  # uploads rewrite the assets in place
+        self.resource = arguments.pop("resource", resource)
+        self.arguments = arguments
+        self.project_id: typing.Optional[str] = None
+        self.fingerprint: typing.Optional[str] = None
+        self.started = time.perf_counter()
+        self.timer = JobTimer()
+
+    def finish(self) -> None:
+        self.outcome.seconds = time.perf_counter() - self.started
+        result: typing.Any = self.outcome.result
+        if self.outcome.error is None and "timings" in getattr(
+            type(result), "model_fields", {}
+        ):
+            result.timings = self.timer.build()
+
+
+_DONE = object()
+
+
+async def upload_assets(
+    file_client: typing.Any, assets: typing.MutableMapping[str, typing.Any]
+) -> None:
+    """
+    Upload every local file referenced by `assets`, in parallel, replacing the paths
+    with the uploaded `api-assets/...` paths: `*_file_path` and `*_file_paths`
+    values (unless a matching `*_source` says the input isn't a file) and
+    `face_mappings[].new_face`. URLs and already uploaded paths are left as-is.
+    """
+    uploads: typing.List[typing.Tuple[typing.Any, typing.Any, str]] = []
+    for key, value in assets.items():
+        source = assets.get(key.rsplit("_file_path", 1)[0] + "_source")
+        if source not in (None, "file"):
+            continue
+        if key.endswith("_file_path") and isinstance(value, str):
+            uploads.append((assets, key, value))
+        elif key.endswith("_file_paths") and isinstance(value, list):
+            uploads.extend((value, i, path) for i, path in enumerate(value))
+    for mapping in assets.get("face_mappings") or []:
+        if mapping.get("new_face"):
+            uploads.append((mapping, "new_face", mapping["new_face"]))
+
+    paths = await asyncio.gather(
+        *(file_client.upload_file(file=path) for _, _, path in uploads)
+    )
+    for (container, key, _), path in zip(uploads, paths):
+        container[key] = path
+
+
+class AsyncPipeline:
+    """
+    Runs jobs through four stages, upload → submit → wait → download, each with its
+    own number of workers and a bounded queue in front of the next stage. Uploads of
+    later jobs overlap earlier jobs' renders, and memory stays bounded however long
+    the input is, since jobs are only read from `jobs` while there is queue room.
+    Created with `AsyncClient.pipeline()`.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncClient",
+        *,
+        resource: typing.Optional[str] = None,
+        upload_concurrency: int = 4,
+        submit_concurrency: int = 4,
+        wait_concurrency: int = 256,
+        download_concurrency: int = 4,
+        queue_size: int = 16,
+        download_outputs: bool = True,
+        download_directory: typing.Optional[str] = None,
+    ):
+        workers = {
+            UPLOAD: upload_concurrency,
+            SUBMIT: submit_concurrency,
+            WAIT: wait_concurrency,
+            DOWNLOAD: download_concurrency,
+        }
+        for stage, count in workers.items():
+            if count < 1:
+                raise ValueError(f"{stage}_concurrency must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self._client = client
+        self._resource = resource
+        self._workers = workers
+        self._queue_size = queue_size
+        self._download_outputs = download_outputs
+        self._download_directory = download_directory
+
+    async def run(
+        self,
+        jobs: typing.Union[typing.AsyncIterable[JobSpec], typing.Iterable[JobSpec]],
+    ) -> typing.AsyncGenerator[PipelineItemResult, None]:
+        """Yield a `PipelineItemResult` per job, as soon as each one finishes"""
+        stages = [
+            (UPLOAD, self._upload),
+            (SUBMIT, self._submit),
+            (WAIT, self._wait),
+            (DOWNLOAD, self._download),
+        ]
+        queues: typing.List["asyncio.Queue[typing.Any]"] = [
+            asyncio.Queue(maxsize=self._queue_size) for _ in range(len(stages) + 1)
+        ]
+        tasks = [asyncio.ensure_future(self._feed(jobs, queues[0]))]
+        for i, (name, fn) in enumerate(stages):
+            tasks.append(
+                asyncio.ensure_future(
+                    self._stage(name, fn, queues[i], queues[i + 1], queues[-1])
+                )
+            )
+
+        try:
+            while True:
+                job = await queues[-1].get()
+                if job is _DONE:
+                    break
+                yield job.outcome
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _feed(
+        self,
+        jobs: typing.Union[typing.AsyncIterable[JobSpec], typing.Iterable[JobSpec]],
+        queue: "asyncio.Queue[typing.Any]",
+    ) -> None:
+        index = 0
+        try:
+            if isinstance(jobs, typing.AsyncIterable):
+                async for spec in jobs:
+                    await queue.put(_Job(index, spec, self._resource))
+                    index += 1
+            else:
+                for spec in jobs:
+                    await queue.put(_Job(index, spec, self._resource))
+                    index += 1
+        except Exception:
+            # finish the jobs already read; the error is raised once they're done
+            await queue.put(_DONE)
+            raise
+        await queue.put(_DONE)
+
+    async def _stage(
+        self,
+        name: str,
+        fn: typing.Callable[[_Job], typing.Awaitable[bool]],
+        inbox: "asyncio.Queue[typing.Any]",
+        outbox: "asyncio.Queue[typing.Any]",
+        results: "asyncio.Queue[typing.Any]",
+    ) -> None:
+        async def worker() -> None:
+            while True:
+                job = await inbox.get()
+                if job is _DONE:
+                    await inbox.put(_DONE)  # let the other workers see it too
+                    return
+                started = time.perf_counter()
+                token = start_job(job.timer)  # requests report into the job's timings
+                try:
+                    proceed = await fn(job)
+                except Exception as e:
+                    logger.warning(
+                        "Pipeline job %s failed to %s: %r", job.outcome.index, name, e
+                    )
+                    job.outcome.error = e
+                    job.outcome.stage = name
+                    proceed = False
+                finally:
+                    leave_job(token)
+                job.outcome.stage_seconds[name] = time.perf_counter() - started
+                if proceed and outbox is not results:
+                    await outbox.put(job)
+                else:
+                    job.finish()
+                    await results.put(job)
+
+        await asyncio.gather(*(worker() for _ in range(self._workers[name])))
+        await outbox.put(_DONE)
+
+    def _resource_client(self, job: _Job) -> typing.Any:
+        if job.resource is None:
+            raise ValueError(
+                f"Job {job.outcome.index} has no resource; pass `resource=` to the "
+                "pipeline or set `resource` in the job"
+            )
+        if job.resource == "face_detection":
+            raise ValueError("face_detection is not supported in a pipeline")
+        return getattr(self._client.v1, job.resource)
+
+    async def _record(self, job: _Job, status: str) -> None:
+        ledger = get_ledger(self._client._base_client)
+        if ledger is None or job.fingerprint is None or job.project_id is None:
+            return
+        await run_in_thread(
+            ledger.put,
+            LedgerEntry(
+                fingerprint=job.fingerprint,
+                resource=typing.cast(str, job.resource),
+                project_id=job.project_id,
+                status=status,
+                download_directory=job.arguments.get(
+                    "download_directory", self._download_directory
+                ),
+                downloaded_paths=getattr(job.outcome.result, "downloaded_paths", None),
+            ),
+        )
+
+    async def _upload(self, job: _Job) -> bool:
+        self._resource_client(job)  # fail unknown resources before uploading
+        # what generate() checks before uploading, see `checked_generate()`
+        check_capabilities(typing.cast(str, job.resource), job.arguments)
+        await run_in_thread(
+            check_time_range,
+            job.arguments.get("assets"),
+            job.arguments.get("start_seconds"),
+            job.arguments.get("end_seconds"),
+        )
+        ledger = get_ledger(self._client._base_client)
+        if ledger is not None:
+            job.fingerprint = request_fingerprint(
+                typing.cast(str, job.resource), job.arguments
+            )
+            entry = await run_in_thread(ledger.get, job.fingerprint)
+            if entry is not None and entry.resumable:
+                logger.info("Resuming project %s from the ledger", entry.project_id)
+                job.project_id = entry.project_id
+                return True
+        assets = job.arguments.get("assets")
+        if assets:
+            await upload_assets(self._client.v1.files, assets)
+        return True
+
+    async def _submit(self, job: _Job) -> bool:
+        if job.project_id is not None:  # resumed from the ledger
+            return True
+        arguments = {k: v for k, v in job.arguments.items() if k not in _GENERATE_ONLY}
+        created = await self._resource_client(job).create(**arguments)
+        job.project_id = created.id
+        await self._record(job, SUBMITTED)
+        return True
+
+    async def _wait(self, job: _Job) -> bool:
+        projects = getattr(
+            self._client.v1, f"{project_kind(job.resource or '')}_projects"
+        )
+        result = await projects.check_result(
+            id=job.project_id, wait_for_completion=True, download_outputs=False
+        )
+        job.outcome.result = result
+        download = (
+            result.status == "complete"
+            and job.arguments.get("download_outputs", self._download_outputs)
+            and bool(result.downloads)
+        )
+        if not download:  # otherwise still pending in the ledger until downloaded
+            await self._record(job, result.status)
+        return download
+
+    async def _download(self, job: _Job) -> bool:
+        base_client = self._client._base_client
+        result: typing.Any = job.outcome.result
+        result.downloaded_paths = await download_files_async(
+            downloads=result.downloads,
+            download_directory=job.arguments.get(
+                "download_directory", self._download_directory
+            ),
+            tracer=get_tracer(base_client),
+            transfer_client=get_transfer_client(base_client),
+        )
+        await self._record(job, result.status)
+        return True
@@ -0,0 +1,152 @@
+import asyncio
+import pathlib
+import pytest
+import time
+import typing
+
+from magic_hour import ApiError
+from magic_hour.helpers.pipeline import upload_assets
+from magic_hour.helpers.validation import UnsupportedRequestError
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _image(tmp_path: pathlib.Path, name: str) -> str:
+    path = tmp_path / name
+    path.write_bytes(b"\x89PNG" + b"\x00" * 1020)
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap_and_results_stream(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.2, bandwidth_bytes_per_second=20_000)
+    client = mock.async_client()
+    photos = [_image(tmp_path, f"photo-{i}.png") for i in range(6)]
+    face = _image(tmp_path, "face.png")
+    out = tmp_path / "out"
+    out.mkdir()
+
+    async def specs() -> typing.AsyncIterator[typing.Dict[str, typing.Any]]:
+        for photo in photos:
+            yield {"assets": {"source_file_path": face, "target_file_path": photo}}
+
+    started = time.perf_counter()
+    outcomes = [
+        outcome
+        async for outcome in client.pipeline(
+            specs(),
+            resource="face_swap_photo",
+            upload_concurrency=2,
+            download_directory=str(out),
+        )
+    ]
+    elapsed = time.perf_counter() - started
+
+    assert sorted(o.index for o in outcomes) == list(range(6))
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert len(list(out.iterdir())) == 6
+    assert len(mock.uploads) == 12
+    # each job uploads ~0.1s and renders 0.2s; run one at a time it would be 1.8s+
+    assert elapsed < 1.2
+    assert set(outcomes[0].stage_seconds) == {"upload", "submit", "wait", "download"}
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_per_stage(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour()
+    mock.inject(500, count=1, path="/v1/ai-image-generator")
+    client = mock.async_client()
+    jobs: typing.List[typing.Dict[str, typing.Any]] = [
+        {"resource": "ai_image_generator", "image_count": 1, "orientation": "square"},
+        {"resource": "ai_image_generator", "image_count": 1, "orientation": "square"},
+        {"resource": "no_such_resource"},
+        {"resource": "ai_image_generator", "model": "nano-banana", "resolution": "4k"},
+    ]
+
+    outcomes = {
+        o.index: o
+        async for o in client.pipeline(
+            [dict(job, style={"prompt": "a cat"}) for job in jobs],
+            submit_concurrency=1,
+            download_outputs=False,
+        )
+    }
+
+    assert outcomes[0].stage == "submit" and isinstance(outcomes[0].error, ApiError)
+    assert outcomes[1].ok and outcomes[1].unwrap().downloaded_paths is None
+    timings = outcomes[1].unwrap().timings
+    assert timings.create_seconds is not None and timings.poll_count >= 1
+    assert outcomes[2].stage == "upload"
+    assert isinstance(outcomes[2].error, AttributeError)
+    # checked like generate() before anything is uploaded or submitted
+    assert outcomes[3].stage == "upload"
+    assert isinstance(outcomes[3].error, UnsupportedRequestError)
+
+
+@pytest.mark.asyncio
+async def test_input_is_read_only_as_queues_have_room() -> None:
+    mock = MockMagicHour(render_seconds=10)
+    client = mock.async_client()
+    read = 0
+
+    async def endless() -> typing.AsyncIterator[typing.Dict[str, typing.Any]]:
+        nonlocal read
+        while True:
+            read += 1
+            yield {"image_count": 1, "orientation": "square", "style": {"prompt": "x"}}
+
+    pipeline = client.pipeline(
+        endless(), resource="ai_image_generator", wait_concurrency=2, queue_size=2
+    )
+    consumer = asyncio.ensure_future(pipeline.__anext__())
+    await asyncio.sleep(0.3)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    await pipeline.aclose()
+
+    # 2 queue slots in front of each of the 4 stages, plus the jobs in progress
+    assert read < 30
+
+
+@pytest.mark.asyncio
+async def test_upload_assets_follows_sources(tmp_path: pathlib.Path) -> None:
+    client = MockMagicHour().async_client()
+    image = _image(tmp_path, "a.png")
+    assets: typing.Dict[str, typing.Any] = {
+        "image_file_paths": [image, "https://example.com/b.png"],
+        "video_source": "youtube",
+        "video_file_path": "ignored.mp4",
+        "face_mappings": [{"new_face": image, "original_face": "0-0"}],
+    }
+
+    await upload_assets(client.v1.files, assets)
+
+    assert assets["image_file_paths"][0].startswith("api-assets/")
+    assert assets["image_file_paths"][1] == "https://example.com/b.png"
+    assert assets["video_file_path"] == "ignored.mp4"
+    assert assets["face_mappings"][0]["new_face"].startswith("api-assets/")
+
+
+@pytest.mark.asyncio
+async def test_video_renders_are_waited_on_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.2")
+    client = MockMagicHour(render_seconds=0.05).async_client()
+    job = {"end_seconds": 2.0, "orientation": "landscape", "style": {"prompt": "x"}}
+
+    started = time.perf_counter()
+    outcomes = [
+        o
+        async for o in client.pipeline(
+            [job] * 8, resource="text_to_video", download_outputs=False
+        )
+    ]
+
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert time.perf_counter() - started < 0.8  # 1.6s+ if each poll blocked the loop
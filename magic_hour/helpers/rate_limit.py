@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+import typing
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter that can be shared across threads and asyncio tasks.
+
+    Callers reserve a slot with `reserve()`, which never blocks and returns how long
+    the caller has to wait before its slot starts. `acquire()` / `acquire_async()`
+    reserve and then sleep for that long. Reservations are handed out in order, so
+    waiters are served first-come first-served.
+
+    Args:
+        rate: Sustained number of acquisitions per second
+        burst: Maximum number of acquisitions allowed back to back. Defaults to
+            `max(1, rate)`
+    """
+
+    def __init__(self, rate: float, burst: typing.Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.total_wait_seconds = 0.0
+        """Total time callers were asked to wait, across every reservation"""
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def expected_wait(self) -> float:
+        """How long a reservation made now would have to wait, without reserving"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def reserve(self) -> float:
+        """Reserve one slot and return the number of seconds to wait before using it"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+            self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self) -> float:
+        """Block until a slot is available. Returns the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait (without blocking the event loop) until a slot is available"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
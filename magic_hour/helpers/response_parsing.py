@@ -0,0 +1,78 @@
+import functools
+import httpx
+import pydantic
+import typing
+
+
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+TERMINAL_STATUSES = ("complete", "error", "canceled")
+"""Project statuses after which polling stops"""
+
+
+class _ProjectStatus(pydantic.BaseModel):
+    status: str
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(model: typing.Type[M]) -> pydantic.TypeAdapter[M]:
+    return pydantic.TypeAdapter(model)
+
+
+def parse_json_model(model: typing.Type[M], content: bytes) -> M:
+    """
+    Parse a JSON response body straight into `model`.
+
+    The body is decoded and validated in one pass by pydantic-core with a cached
+    `TypeAdapter`, so no intermediate `dict` or throwaway model class is built.
+    Validation is the same as `model.model_validate(json.loads(content))`.
+    """
+    return _type_adapter(model).validate_json(content)
+
+
+def copy_with_fields(
+    model: typing.Type[M], source: pydantic.BaseModel, **extra: typing.Any
+) -> M:
+    """
+    Re-type an already validated response as `model` (usually a subclass adding
+    fields such as `downloaded_paths`) without a `model_dump()` and re-validation
+    round trip. Nested objects are shared with `source`.
+    """
+    values = dict(source.__dict__)
+    values.update(extra)
+    fields_set = source.model_fields_set | set(extra)
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow":
+        return model.model_construct(_fields_set=fields_set, **values)
+
+    for name, field in model.model_fields.items():
+        if name not in values and not field.is_required():
+            values[name] = field.get_default(call_default_factory=True)
+    # the same state `model_construct` sets up, minus its per-field alias lookups
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def decode_poll(
+    result: typing.Any, model: typing.Type[M]
+) -> typing.Tuple[str, typing.Optional[M]]:
+    """
+    Read the status of a project poll, building the full `model` only once the
+    project has reached a terminal status.
+
+    `result` is the raw `httpx.Response` of the GET request; until the project is
+    terminal only its `status` field is decoded. Base clients that return parsed
+    models instead are supported as well.
+
+    Returns:
+        The project status, and the parsed response if the status is terminal
+    """
+    if not isinstance(result, httpx.Response):
+        return result.status, result
+    status = parse_json_model(_ProjectStatus, result.content).status
+    if status not in TERMINAL_STATUSES:
+        return status, None
+    return status, parse_json_model(model, result.content)
@@ -0,0 +1,114 @@
+import httpx
+import json
+import pydantic
+import pytest
+import typing
+
+from magic_hour import Client
+from magic_hour.helpers.response_parsing import (
+    copy_with_fields,
+    decode_poll,
+    parse_json_model,
+)
+from magic_hour.resources.v1.video_projects import (
+    V1VideoProjectsGetResponseWithDownloads,
+)
+from magic_hour.types import models
+
+
+def _video_project(status: str = "complete") -> typing.Dict[str, typing.Any]:
+    downloads = [
+        {"expires_at": "2024-10-19T05:16:19.027Z", "url": "https://cdn.test/out.mp4"}
+    ]
+    return {
+        "created_at": "2024-10-18T05:16:19.027Z",
+        "credits_charged": 450,
+        "download": downloads[0],
+        "downloads": downloads if status == "complete" else [],
+        "enabled": True,
+        "end_seconds": 15.0,
+        "error": None,
+        "fps": 30.0,
+        "height": 960,
+        "id": "cuid-example",
+        "name": "Example Name",
+        "start_seconds": 0.0,
+        "status": status,
+        "total_frame_cost": 450,
+        "type": "FACE_SWAP",
+        "width": 512,
+    }
+
+
+def test_parse_json_model_matches_model_validate() -> None:
+    data = _video_project()
+
+    parsed = parse_json_model(
+        models.V1VideoProjectsGetResponse, json.dumps(data).encode()
+    )
+
+    assert parsed == models.V1VideoProjectsGetResponse.model_validate(data)
+    assert parsed.downloads[0].url == "https://cdn.test/out.mp4"
+
+    with pytest.raises(pydantic.ValidationError):
+        parse_json_model(
+            models.V1VideoProjectsGetResponse,
+            json.dumps({**data, "status": "unknown"}).encode(),
+        )
+
+
+def test_copy_with_fields_matches_dump_and_rebuild() -> None:
+    source = models.V1VideoProjectsGetResponse.model_validate(_video_project())
+
+    copied = copy_with_fields(
+        V1VideoProjectsGetResponseWithDownloads, source, downloaded_paths=["out.mp4"]
+    )
+    rebuilt = V1VideoProjectsGetResponseWithDownloads(
+        **source.model_dump(), downloaded_paths=["out.mp4"]
+    )
+
+    assert isinstance(copied, V1VideoProjectsGetResponseWithDownloads)
+    assert copied.model_dump() == rebuilt.model_dump()
+    assert (
+        copy_with_fields(
+            V1VideoProjectsGetResponseWithDownloads, source
+        ).downloaded_paths
+        is None
+    )
+
+
+def test_decode_poll_builds_model_only_when_terminal() -> None:
+    model = models.V1VideoProjectsGetResponse
+    rendering = httpx.Response(200, json=_video_project("rendering"))
+    complete = httpx.Response(200, json=_video_project("complete"))
+
+    assert decode_poll(rendering, model) == ("rendering", None)
+
+    status, parsed = decode_poll(complete, model)
+    assert status == "complete"
+    assert isinstance(parsed, model)
+
+    already_parsed = model.model_validate(_video_project("queued"))
+    assert decode_poll(already_parsed, model) == ("queued", already_parsed)
+
+
+def test_check_result_polls_until_complete(monkeypatch: pytest.MonkeyPatch) -> None:
+    statuses = iter(["queued", "rendering", "rendering", "complete"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_video_project(next(statuses)))
+
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    client = Client(
+        token="API_TOKEN",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    result = client.v1.video_projects.check_result(
+        id="cuid-example", wait_for_completion=True, download_outputs=False
+    )
+
+    assert isinstance(result, V1VideoProjectsGetResponseWithDownloads)
+    assert result.status == "complete"
+    assert result.downloads[0].url == "https://cdn.test/out.mp4"
+    assert result.downloaded_paths is None
@@ -0,0 +1,342 @@
+import asyncio
+import math
+import os
+import pydantic
+import shutil
+import subprocess
+import tempfile
+import time
+import typing
+
+from magic_hour.helpers.batch import run_batch
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.media_probe import check_time_range
+from magic_hour.helpers.sweep import upload_shared_files, upload_shared_files_async
+from magic_hour.helpers.timing import JobTimings
+
+
+logger = get_sdk_logger(__name__)
+
+COST_FPS = 30.0
+"""Frame rate the API estimates video frame costs at"""
+
+DEFAULT_MIN_SEGMENT_SECONDS = 1.0
+
+Stitcher = typing.Callable[[typing.List[str], str], None]
+"""Joins the video files at the given paths, in order, into the output path"""
+
+
+class VideoSegment(pydantic.BaseModel):
+    index: int
+    start_seconds: float
+    end_seconds: float
+    project_id: typing.Optional[str] = None
+    status: typing.Optional[str] = None
+    """Final status of the segment's project, None if it wasn't created"""
+
+    credits_charged: typing.Optional[int] = None
+    downloaded_paths: typing.List[str] = pydantic.Field(default_factory=list)
+    seconds: typing.Optional[float] = None
+    """Wall-clock time of the segment's `generate()` call"""
+
+    timings: typing.Optional[JobTimings] = None
+    error: typing.Optional[str] = None
+    """Why the segment failed, if it raised"""
+
+
+class SegmentedVideoResult(pydantic.BaseModel):
+    """The segments of `generate_segmented()`, in time order"""
+
+    segments: typing.List[VideoSegment]
+    output_path: typing.Optional[str] = None
+    """The stitched video, if a stitcher was given"""
+
+    total_seconds: float = 0.0
+
+    @property
+    def downloaded_paths(self) -> typing.List[str]:
+        return [path for s in self.segments for path in s.downloaded_paths]
+
+    @property
+    def credits_charged(self) -> int:
+        return sum(s.credits_charged or 0 for s in self.segments)
+
+
+class SegmentError(Exception):
+    """Raised by `generate_segmented()` when a segment doesn't complete"""
+
+    def __init__(self, message: str, result: SegmentedVideoResult):
+        super().__init__(message)
+        self.result = result
+
+
+def plan_segments(
+    start_seconds: float,
+    end_seconds: float,
+    *,
+    segments: typing.Optional[int] = None,
+    segment_seconds: typing.Optional[float] = None,
+    min_segment_seconds: float = DEFAULT_MIN_SEGMENT_SECONDS,
+) -> typing.List[typing.Tuple[float, float]]:
+    """
+    Split `[start_seconds, end_seconds)` into adjacent windows: `segments` equal
+    ones, or as many of `segment_seconds` as it takes. Boundaries fall on whole
+    frames at `COST_FPS`, so the windows' estimated frame costs add up to the cost
+    of the whole range, and no window is shorter than `min_segment_seconds` (fewer
+    windows are used if needed).
+    """
+    if (segments is None) == (segment_seconds is None):
+        raise ValueError("Pass exactly one of segments and segment_seconds")
+    duration = end_seconds - start_seconds
+    if duration <= 0:
+        raise ValueError("end_seconds must be greater than start_seconds")
+    if segment_seconds is not None:
+        if segment_seconds <= 0:
+            raise ValueError("segment_seconds must be greater than 0")
+        wanted = math.ceil(duration / segment_seconds - 1e-9)
+    else:
+        if segments is None or segments < 1:
+            raise ValueError("segments must be at least 1")
+        wanted = segments
+    count = max(1, min(wanted, math.floor(duration / min_segment_seconds)))
+    # windows too short for min_segment_seconds: fewer, equal ones instead
+    step = segment_seconds if segment_seconds and count == wanted else duration / count
+
+    frames = round(duration * COST_FPS)
+    boundaries = [start_seconds]
+    for i in range(1, count):
+        frame = min(round(i * step * COST_FPS), frames)
+        boundary = round(start_seconds + frame / COST_FPS, 6)
+        if end_seconds - boundary < min_segment_seconds:
+            break  # the remainder joins the last window instead
+        boundaries.append(boundary)
+    boundaries.append(end_seconds)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def ffmpeg_stitcher(paths: typing.List[str], output_path: str) -> None:
+    """
+    A `Stitcher` that joins MP4 segments losslessly with ffmpeg's concat demuxer,
+    which must be on the PATH
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileNotFoundError("ffmpeg_stitcher needs ffmpeg on the PATH")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            listing.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0"]
+            + ["-i", listing.name, "-c", "copy", output_path],
+            check=True,
+        )
+    finally:
+        os.unlink(listing.name)
+
+
+def _requests(
+    arguments: typing.Mapping[str, typing.Any],
+    windows: typing.List[typing.Tuple[float, float]],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    name = arguments.get("name")
+    requests = []
+    for i, (start, end) in enumerate(windows):
+        request = {**arguments, "start_seconds": start, "end_seconds": end}
+        if isinstance(name, str):
+            request["name"] = f"{name} ({i + 1}/{len(windows)})"
+        requests.append(request)
+    return requests
+
+
+def _record(segment: VideoSegment, result: typing.Any, started: float) -> None:
+    segment.seconds = time.perf_counter() - started
+    segment.project_id = result.id
+    segment.status = result.status
+    segment.credits_charged = result.credits_charged
+    segment.downloaded_paths = list(result.downloaded_paths or [])
+    segment.timings = getattr(result, "timings", None)
+
+
+def _finish(
+    result: SegmentedVideoResult,
+    stitcher: typing.Optional[Stitcher],
+    output_path: typing.Optional[str],
+    download_directory: typing.Optional[str],
+    started: float,
+) -> SegmentedVideoResult:
+    result.total_seconds = time.perf_counter() - started
+    failed = [s for s in result.segments if s.status != "complete"]
+    if failed:
+        raise SegmentError(
+            f"{len(failed)} of {len(result.segments)} segment(s) failed, first: "
+            f"{failed[0].start_seconds:g}s-{failed[0].end_seconds:g}s "
+            f"({failed[0].error or failed[0].status})",
+            result,
+        )
+    if stitcher is None:
+        return result
+    paths = result.downloaded_paths
+    if len(paths) != len(result.segments):
+        raise ValueError("Stitching needs exactly one downloaded output per segment")
+    if output_path is None:
+        extension = os.path.splitext(paths[0])[1]
+        output_path = os.path.join(
+            download_directory or ".",
+            f"{result.segments[0].project_id}-segmented{extension}",
+        )
+    stitcher(paths, output_path)
+    result.output_path = output_path
+    result.total_seconds = time.perf_counter() - started
+    return result
+
+
+class SegmentedGenerateMixin:
+    """
+    Adds `generate_segmented()` to a sync resource client whose `generate()` takes
+    `start_seconds` and `end_seconds`
+    """
+
+    _base_client: typing.Any
+
+    def generate_segmented(
+        self,
+        *,
+        start_seconds: float,
+        end_seconds: float,
+        segments: typing.Optional[int] = None,
+        segment_seconds: typing.Optional[float] = None,
+        min_segment_seconds: float = DEFAULT_MIN_SEGMENT_SECONDS,
+        max_concurrency: typing.Optional[int] = None,
+        stitcher: typing.Optional[Stitcher] = None,
+        output_path: typing.Optional[str] = None,
+        **kwargs: typing.Any,
+    ) -> SegmentedVideoResult:
+        """
+        Render a long range of the source as adjacent time windows in parallel
+        jobs, cutting wall-clock time roughly by the number of segments.
+
+        The source is uploaded once, then one job per window of `plan_segments()`
+        is submitted, waited for and downloaded concurrently. Segments come back in
+        time order. Pass a `stitcher` (e.g. `ffmpeg_stitcher`) to join them into
+        `output_path`.
+
+        ```py
+        result = client.v1.face_swap.generate_segmented(
+            assets={"video_file_path": "talk.mp4", "video_source": "file", ...},
+            start_seconds=0,
+            end_seconds=1800,
+            segment_seconds=120,
+            download_directory="segments",
+        )
+        print(result.downloaded_paths)
+        ```
+
+        Args:
+            start_seconds: Start of the range to render
+            end_seconds: End of the range to render
+            segments: Number of equal windows
+            segment_seconds: Length of each window (the last one may be shorter)
+            min_segment_seconds: Shortest window to submit
+            max_concurrency: Most segments in progress at once; all of them if None
+            stitcher: Joins the segment files, in order, into `output_path`
+            output_path: Where the stitcher writes. Defaults to `<download_directory>/<first project id>-segmented.<extension>`
+            **kwargs: Other `generate()` arguments, shared by every segment
+
+        Raises:
+            SegmentError: If a segment fails; its `.result` has every segment.
+        """
+        started = time.perf_counter()
+        # the segments' generate() calls only see the uploaded paths
+        check_time_range(kwargs.get("assets"), start_seconds, end_seconds)
+        windows = plan_segments(
+            start_seconds,
+            end_seconds,
+            segments=segments,
+            segment_seconds=segment_seconds,
+            min_segment_seconds=min_segment_seconds,
+        )
+        concurrency = max_concurrency or len(windows)
+        requests = upload_shared_files(
+            self._base_client, _requests(kwargs, windows), concurrency
+        )
+        result = SegmentedVideoResult(
+            segments=[
+                VideoSegment(index=i, start_seconds=start, end_seconds=end)
+                for i, (start, end) in enumerate(windows)
+            ]
+        )
+        generate = getattr(self, "generate")
+
+        def run(segment: VideoSegment) -> None:
+            segment_started = time.perf_counter()
+            _record(segment, generate(**requests[segment.index]), segment_started)
+
+        for outcome in run_batch(run, result.segments, max_concurrency=concurrency):
+            if outcome.error is not None:
+                outcome.item.error = repr(outcome.error)
+        return _finish(
+            result, stitcher, output_path, kwargs.get("download_directory"), started
+        )
+
+
+class AsyncSegmentedGenerateMixin:
+    """Async version of `SegmentedGenerateMixin`"""
+
+    _base_client: typing.Any
+
+    async def generate_segmented(
+        self,
+        *,
+        start_seconds: float,
+        end_seconds: float,
+        segments: typing.Optional[int] = None,
+        segment_seconds: typing.Optional[float] = None,
+        min_segment_seconds: float = DEFAULT_MIN_SEGMENT_SECONDS,
+        max_concurrency: typing.Optional[int] = None,
+        stitcher: typing.Optional[Stitcher] = None,
+        output_path: typing.Optional[str] = None,
+        **kwargs: typing.Any,
+    ) -> SegmentedVideoResult:
+        """
+        Render a long range of the source as adjacent time windows in parallel
+        jobs. See the sync client's `generate_segmented()`.
+        """
+        started = time.perf_counter()
+        # the segments' generate() calls only see the uploaded paths
+        check_time_range(kwargs.get("assets"), start_seconds, end_seconds)
+        windows = plan_segments(
+            start_seconds,
+            end_seconds,
+            segments=segments,
+            segment_seconds=segment_seconds,
+            min_segment_seconds=min_segment_seconds,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency or len(windows))
+        requests = await upload_shared_files_async(
+            self._base_client, _requests(kwargs, windows)
+        )
+        result = SegmentedVideoResult(
+            segments=[
+                VideoSegment(index=i, start_seconds=start, end_seconds=end)
+                for i, (start, end) in enumerate(windows)
+            ]
+        )
+        generate = getattr(self, "generate")
+
+        async def run(segment: VideoSegment) -> None:
+            async with semaphore:
+                segment_started = time.perf_counter()
+                try:
+                    output = await generate(**requests[segment.index])
+                except Exception as e:
+                    logger.warning("Segment %s failed: %r", segment.index, e)
+                    segment.error = repr(e)
+                    return
+            _record(segment, output, segment_started)
+
+        await asyncio.gather(*(run(segment) for segment in result.segments))
+        return _finish(
+            result, stitcher, output_path, kwargs.get("download_directory"), started
+        )
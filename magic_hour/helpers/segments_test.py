@@ -0,0 +1,90 @@
+import pathlib
+import pytest
+import time
+import typing
+
+from magic_hour.helpers.segments import SegmentError, plan_segments
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def test_windows_are_adjacent_and_frame_aligned() -> None:
+    windows = plan_segments(0, 1800, segment_seconds=120)
+    assert len(windows) == 15 and windows[-1] == (1680, 1800)
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+
+    for start, _ in plan_segments(1.5, 11.5, segments=7)[1:]:
+        assert abs(start * 30 - round(start * 30)) < 1e-3
+
+    # a remainder shorter than min_segment_seconds joins the last window
+    assert plan_segments(0, 10.5, segment_seconds=5) == [(0, 5.0), (5.0, 10.5)]
+    assert plan_segments(0, 2, segments=8) == [(0, 1.0), (1.0, 2)]
+    # windows shorter than min_segment_seconds: fewer, equal ones
+    windows = plan_segments(0, 10, segment_seconds=0.5)
+    assert windows == [(i, i + 1) for i in range(10)]
+    with pytest.raises(ValueError):
+        plan_segments(0, 10)
+
+
+def test_segments_render_in_parallel_from_one_upload(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.2)
+    client = mock.client()
+    video = tmp_path / "talk.mp4"
+    video.write_bytes(b"\x00\x00\x00\x18ftypmp42")
+    stitched: typing.List[typing.List[str]] = []
+
+    started = time.perf_counter()
+    result = client.v1.face_swap.generate_segmented(
+        assets={
+            "video_file_path": str(video),
+            "video_source": "file",
+            "image_file_path": "api-assets/face.png",
+        },
+        start_seconds=0,
+        end_seconds=40,
+        segments=4,
+        download_directory=str(tmp_path),
+        stitcher=lambda paths, output: stitched.append(paths),
+    )
+
+    assert time.perf_counter() - started < 0.2 * 3  # sequential would take 0.8s+
+    assert len(mock.uploads) == 1
+    assert [(s.start_seconds, s.end_seconds) for s in result.segments] == [
+        (0, 10.0),
+        (10.0, 20.0),
+        (20.0, 30.0),
+        (30.0, 40),
+    ]
+    assert result.credits_charged == 40 * 30
+    assert stitched == [result.downloaded_paths] and len(stitched[0]) == 4
+    assert result.output_path == str(
+        tmp_path / f"{result.segments[0].project_id}-segmented.mp4"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_failed_segments_raise_with_every_segment() -> None:
+    mock = MockMagicHour(job_failure_rate=1.0)
+    client = mock.async_client()
+
+    with pytest.raises(SegmentError) as raised:
+        await client.v1.video_to_video.generate_segmented(
+            assets={"video_file_path": "api-assets/clip.mp4", "video_source": "file"},
+            start_seconds=5,
+            end_seconds=65,
+            segment_seconds=20,
+            style={"art_style": "Cyberpunk"},
+            download_outputs=False,
+        )
+
+    segments = raised.value.result.segments
+    assert [(s.start_seconds, s.status) for s in segments] == [
+        (5, "error"),
+        (25.0, "error"),
+        (45.0, "error"),
+    ]
+    assert len({s.project_id for s in segments}) == 3
@@ -0,0 +1,64 @@
+import functools
+import pydantic
+import typing
+
+from make_api_request import filter_not_given
+from make_api_request.request import model_dump
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(dump_with: typing.Any) -> pydantic.TypeAdapter[typing.Any]:
+    return pydantic.TypeAdapter(dump_with)
+
+
+def to_encodable(*, item: typing.Any, dump_with: typing.Any) -> typing.Any:
+    """
+    Drop-in replacement for `make_api_request.to_encodable` that compiles the
+    `TypeAdapter` for each `_Serializer*` class once and reuses it, instead of
+    building a new one for every request.
+    """
+    try:
+        adapter = _adapter(dump_with)
+    except TypeError:  # unhashable `dump_with`
+        adapter = pydantic.TypeAdapter(dump_with)
+    return model_dump(adapter.validate_python(filter_not_given(item)))
+
+
+def precompile(*, serializers: bool = True, responses: bool = True) -> int:
+    """
+    Import every request serializer and response model and build their adapters
+    up front.
+
+    Types are otherwise loaded and compiled the first time an endpoint is used, which
+    moves that cost into the first request. Long-running workers can call this once
+    at startup to keep first-request latency flat.
+
+    ```py
+    from magic_hour.helpers import precompile
+
+    precompile()
+    ```
+
+    Args:
+        serializers: Compile the `_Serializer*` request body types
+        responses: Compile the response models
+
+    Returns:
+        The number of types compiled
+    """
+    from magic_hour.helpers.response_parsing import _type_adapter
+    from magic_hour.types import models, params
+
+    count = 0
+    if serializers:
+        for name in params.__all__:
+            if name.startswith("_Serializer"):
+                _adapter(getattr(params, name))
+                count += 1
+    if responses:
+        for name in models.__all__:
+            model = getattr(models, name)
+            if isinstance(model, type) and issubclass(model, pydantic.BaseModel):
+                _type_adapter(model)
+                count += 1
+    return count
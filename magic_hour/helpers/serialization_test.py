@@ -0,0 +1,83 @@
+import httpx
+import json
+import pytest
+import typing
+
+from magic_hour import Client
+from magic_hour.helpers import JsonCodec, OrjsonCodec, precompile
+from magic_hour.helpers.serialization import _adapter, to_encodable
+from magic_hour.types import params
+from make_api_request import to_encodable as to_encodable_uncached
+from make_api_request.type_utils import NOT_GIVEN
+
+
+_BODY: typing.Dict[str, typing.Any] = {
+    "name": "Animation video",
+    "assets": {
+        "audio_source": "file",
+        "audio_file_path": "api-assets/id/1234.mp3",
+        "image_file_path": "api-assets/id/1234.png",
+        "youtube_url": NOT_GIVEN,
+    },
+    "end_seconds": 15.0,
+    "fps": 12.0,
+    "height": 960,
+    "width": 512,
+    "style": {
+        "art_style": "Painterly Illustration",
+        "camera_effect": "Accelerate",
+        "prompt": "Cyberpunk city – ünïcode",
+        "prompt_type": "custom",
+        "transition_speed": 5,
+    },
+}
+
+
+def test_to_encodable_matches_make_api_request() -> None:
+    serializer = params._SerializerV1AnimationCreateBody
+
+    encoded = to_encodable(item=_BODY, dump_with=serializer)
+
+    assert encoded == to_encodable_uncached(item=_BODY, dump_with=serializer)
+    assert "youtube_url" not in encoded["assets"]
+    assert _adapter(serializer) is _adapter(serializer)
+
+
+def test_precompile_compiles_serializers_and_models() -> None:
+    assert precompile(responses=False) == len(
+        [n for n in params.__all__ if n.startswith("_Serializer")]
+    )
+    assert precompile(serializers=False) > 0
+
+
+@pytest.mark.parametrize("codec_name", [None, "json", "orjson"])
+def test_json_codec_sends_equivalent_body(codec_name: typing.Optional[str]) -> None:
+    codec: typing.Optional[JsonCodec] = None
+    if codec_name == "json":
+        codec = JsonCodec()
+    elif codec_name == "orjson":
+        pytest.importorskip("orjson")
+        codec = OrjsonCodec()
+    seen: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json={"credits_charged": 10, "estimated_frame_cost": 10, "id": "cuid"},
+        )
+
+    client = Client(
+        token="API_TOKEN",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        json_codec=codec,
+    )
+    body = {k: v for k, v in _BODY.items() if k != "name"}
+
+    response = client.v1.animation.create(**body)
+
+    assert response.id == "cuid"
+    assert seen[0].headers["content-type"] == "application/json"
+    assert json.loads(seen[0].content) == to_encodable(
+        item=body, dump_with=params._SerializerV1AnimationCreateBody
+    )
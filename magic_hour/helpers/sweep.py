@@ -0,0 +1,306 @@
+import asyncio
+import copy
+import importlib
+import itertools
+import os
+import pathlib
+import time
+import typing
+
+from magic_hour.helpers.batch import (
+    DEFAULT_MAX_CONCURRENCY,
+    BatchItemResult,
+    run_batch,
+)
+from magic_hour.helpers.logger import get_sdk_logger
+
+
+logger = get_sdk_logger(__name__)
+
+Overrides = typing.Mapping[str, typing.Any]
+
+
+def sweep_variants(
+    variants: typing.Optional[typing.Iterable[Overrides]] = None,
+    grid: typing.Optional[typing.Mapping[str, typing.Sequence[typing.Any]]] = None,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    The overrides of every variant of a sweep: each of `variants`, combined with
+    every combination of the `grid` values (its cartesian product).
+
+    Keys may be dotted to reach into nested arguments, e.g. `"style.prompt"`.
+
+    ```py
+    sweep_variants([{"model": "a"}, {"model": "b"}], grid={"style.prompt": ["x", "y"]})
+    # [{"model": "a", "style.prompt": "x"}, {"model": "a", "style.prompt": "y"},
+    #  {"model": "b", "style.prompt": "x"}, {"model": "b", "style.prompt": "y"}]
+    ```
+    """
+    bases = [dict(v) for v in variants] if variants is not None else [{}]
+    if not grid:
+        return bases
+    keys = list(grid)
+    combinations = [
+        dict(zip(keys, values)) for values in itertools.product(*grid.values())
+    ]
+    return [{**base, **combination} for base in bases for combination in combinations]
+
+
+def apply_overrides(
+    base: Overrides, overrides: Overrides
+) -> typing.Dict[str, typing.Any]:
+    """
+    A deep copy of `base` with `overrides` merged in: nested dicts are merged
+    rather than replaced, and dotted keys set nested values
+    """
+    merged = copy.deepcopy(dict(base))
+    for key, value in overrides.items():
+        *parents, leaf = key.split(".")
+        target = merged
+        for parent in parents:
+            child = target.get(parent)
+            target[parent] = child = dict(child) if isinstance(child, dict) else {}
+            target = child
+        if isinstance(value, dict) and isinstance(target.get(leaf), dict):
+            target[leaf] = apply_overrides(target[leaf], value)
+        else:
+            target[leaf] = copy.deepcopy(value)
+    return merged
+
+
+def _is_file_field(key: str) -> bool:
+    # the `assets` fields generate() uploads, e.g. `face_mappings[].new_face`
+    return key.endswith(("_file_path", "_file_paths")) or key == "new_face"
+
+
+def _is_local_file(value: typing.Any) -> bool:
+    if isinstance(value, pathlib.Path):
+        return True
+    # URLs, output references and `api-assets/` paths aren't files on disk
+    return isinstance(value, str) and os.path.isfile(value)
+
+
+def _local_files(
+    value: typing.Any, upload: bool = False
+) -> typing.Iterator[typing.Any]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _local_files(item, _is_file_field(key))
+    elif isinstance(value, list):
+        for item in value:
+            yield from _local_files(item, upload)
+    elif upload and _is_local_file(value):
+        yield value
+
+
+def _replace_files(
+    value: typing.Any, uploaded: typing.Mapping[str, str], upload: bool = False
+) -> typing.Any:
+    if isinstance(value, dict):
+        return {
+            k: _replace_files(v, uploaded, _is_file_field(k)) for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_replace_files(v, uploaded, upload) for v in value]
+    if upload and _is_local_file(value):
+        return uploaded[os.fspath(value)]
+    return value
+
+
+def _distinct_files(
+    requests: typing.Sequence[typing.Mapping[str, typing.Any]],
+) -> typing.List[typing.Any]:
+    paths: typing.Dict[str, typing.Any] = {}
+    for request in requests:
+        for file in _local_files(request.get("assets")):
+            paths.setdefault(os.fspath(file), file)
+    return list(paths.values())
+
+
+def _with_uploads(
+    requests: typing.Sequence[typing.Mapping[str, typing.Any]],
+    uploaded: typing.Mapping[str, str],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    logger.info(
+        "Uploaded %s shared file(s) for %s request(s)", len(uploaded), len(requests)
+    )
+    return [
+        {**request, "assets": _replace_files(request["assets"], uploaded)}
+        if "assets" in request
+        else dict(request)
+        for request in requests
+    ]
+
+
+def upload_shared_files(
+    base_client: typing.Any,
+    requests: typing.Sequence[typing.Mapping[str, typing.Any]],
+    max_concurrency: int,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Upload every distinct local file in the file fields of the `assets` of
+    `requests` (the ones `generate()` uploads) once, returning the requests with
+    those files replaced by their `api-assets/` paths
+    """
+    files = importlib.import_module("magic_hour.resources.v1.files.client")
+    file_client = files.FilesClient(base_client=base_client)
+    uploaded: typing.Dict[str, str] = {}
+    for outcome in run_batch(
+        file_client.upload_file,
+        _distinct_files(requests),
+        max_concurrency=max_concurrency,
+    ):
+        uploaded[os.fspath(outcome.item)] = outcome.unwrap()
+    return _with_uploads(requests, uploaded)
+
+
+async def upload_shared_files_async(
+    base_client: typing.Any,
+    requests: typing.Sequence[typing.Mapping[str, typing.Any]],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Async version of `upload_shared_files()`, uploading all files concurrently"""
+    files = importlib.import_module("magic_hour.resources.v1.files.client")
+    file_client = files.AsyncFilesClient(base_client=base_client)
+    distinct = _distinct_files(requests)
+    paths = await asyncio.gather(*(file_client.upload_file(f) for f in distinct))
+    return _with_uploads(
+        requests, {os.fspath(f): path for f, path in zip(distinct, paths)}
+    )
+
+
+class SweepMixin:
+    """Adds `sweep()` to a sync resource client with a `generate()` method"""
+
+    _base_client: typing.Any
+
+    def sweep(
+        self,
+        variants: typing.Optional[typing.Iterable[Overrides]] = None,
+        *,
+        grid: typing.Optional[typing.Mapping[str, typing.Sequence[typing.Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+        **kwargs: typing.Any,
+    ) -> typing.Generator[BatchItemResult[Overrides, typing.Any], None, None]:
+        """
+        Run one request in many variants: `kwargs` are the `generate()` arguments
+        shared by every variant, and each variant overrides some of them. Variants
+        are the dicts in `variants`, each combined with every combination of the
+        `grid` values; keys may be dotted (`"style.prompt"`) to override one nested
+        value.
+
+        Local files are uploaded once before anything is submitted, however many
+        variants use them, then the variants run like `generate_many()`: up to
+        `max_concurrency` at a time, under the client's rate limiter. Each result's
+        `.item` is the overrides of its variant.
+
+        ```py
+        for outcome in client.v1.video_to_video.sweep(
+            grid={"style.art_style": ["Painterly Illustration", "Cyberpunk", "Oil Painting"]},
+            assets={"video_file_path": "clip.mp4", "video_source": "file"},
+            end_seconds=15,
+            style={"prompt_type": "default"},
+        ):
+            print(outcome.item, outcome.result.downloaded_paths if outcome.ok else outcome.error)
+        ```
+
+        Args:
+            variants: Overrides of each variant
+            grid: Values to try for each key, all combinations of which are run
+            max_concurrency: Maximum number of variants in progress at once
+            ordered: Yield results in variant order rather than as they complete
+            **kwargs: `generate()` arguments shared by every variant
+        """
+        overrides = sweep_variants(variants, grid)
+        requests = upload_shared_files(
+            self._base_client,
+            [apply_overrides(kwargs, o) for o in overrides],
+            max_concurrency,
+        )
+        generate = getattr(self, "generate")
+        results = run_batch(
+            lambda index: generate(**requests[index]),
+            range(len(requests)),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+        return _labeled(results, overrides)
+
+
+class AsyncSweepMixin:
+    """Async version of `SweepMixin`"""
+
+    _base_client: typing.Any
+
+    async def sweep(
+        self,
+        variants: typing.Optional[typing.Iterable[Overrides]] = None,
+        *,
+        grid: typing.Optional[typing.Mapping[str, typing.Sequence[typing.Any]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+        **kwargs: typing.Any,
+    ) -> typing.AsyncGenerator[BatchItemResult[Overrides, typing.Any], None]:
+        """
+        Run one request in many variants, up to `max_concurrency` at a time. See
+        the sync client's `sweep()`.
+
+        ```py
+        async for outcome in client.v1.video_to_video.sweep(
+            grid={"style.art_style": ["Painterly Illustration", "Cyberpunk"]},
+            assets={"video_file_path": "clip.mp4", "video_source": "file"},
+            end_seconds=15,
+            style={"prompt_type": "default"},
+        ):
+            print(outcome.item, outcome.result.downloaded_paths if outcome.ok else outcome.error)
+        ```
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        overrides = sweep_variants(variants, grid)
+        requests = await upload_shared_files_async(
+            self._base_client, [apply_overrides(kwargs, o) for o in overrides]
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+        generate = getattr(self, "generate")
+
+        async def run(index: int) -> BatchItemResult[Overrides, typing.Any]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    result = await generate(**requests[index])
+                except Exception as e:
+                    logger.warning("Sweep variant %s failed: %r", index, e)
+                    return BatchItemResult(
+                        index,
+                        overrides[index],
+                        error=e,
+                        seconds=time.perf_counter() - started,
+                    )
+                return BatchItemResult(
+                    index,
+                    overrides[index],
+                    result=result,
+                    seconds=time.perf_counter() - started,
+                )
+
+        tasks = [asyncio.ensure_future(run(i)) for i in range(len(requests))]
+        try:
+            for next_done in tasks if ordered else asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def _labeled(
+    results: typing.Generator[BatchItemResult[int, typing.Any], None, None],
+    overrides: typing.Sequence[Overrides],
+) -> typing.Generator[BatchItemResult[Overrides, typing.Any], None, None]:
+    try:
+        for r in results:
+            yield BatchItemResult(
+                r.index, overrides[r.index], r.result, r.error, r.seconds
+            )
+    finally:
+        results.close()
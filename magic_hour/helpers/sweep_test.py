@@ -0,0 +1,123 @@
+import pathlib
+import pytest
+
+from magic_hour.helpers.sweep import apply_overrides, sweep_variants
+from magic_hour.testing import MockMagicHour
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def test_variants_and_grid_expand_to_their_product() -> None:
+    variants = sweep_variants(
+        [{"model": "a"}, {"model": "b"}], grid={"style.prompt": ["x", "y"]}
+    )
+
+    assert variants == [
+        {"model": "a", "style.prompt": "x"},
+        {"model": "a", "style.prompt": "y"},
+        {"model": "b", "style.prompt": "x"},
+        {"model": "b", "style.prompt": "y"},
+    ]
+    assert sweep_variants() == [{}]
+
+    base = {"style": {"prompt": "p", "tool": "t"}, "assets": {"a": "1"}}
+    merged = apply_overrides(base, {"style.prompt": "q", "assets": {"b": "2"}})
+    assert merged == {
+        "style": {"prompt": "q", "tool": "t"},
+        "assets": {"a": "1", "b": "2"},
+    }
+    assert base["style"]["prompt"] == "p"
+
+
+def test_shared_files_are_uploaded_once(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+    face = tmp_path / "face.png"
+    face.write_bytes(b"\x89PNG face")
+    targets = []
+    for i in range(2):
+        target = tmp_path / f"target-{i}.png"
+        target.write_bytes(b"\x89PNG target %d" % i)
+        targets.append(str(target))
+
+    outcomes = list(
+        client.v1.face_swap_photo.sweep(
+            grid={"assets.target_file_path": targets + targets},
+            assets={"source_file_path": str(face)},
+            download_outputs=False,
+        )
+    )
+
+    assert [o.item["assets.target_file_path"] for o in outcomes] == targets + targets
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert len(mock.uploads) == 3
+    projects = {o.unwrap().id for o in outcomes}
+    assert len(projects) == 4
+    sources = {mock._jobs[p].body["assets"]["source_file_path"] for p in projects}
+    assert len(sources) == 1 and next(iter(sources)) in mock.uploads
+
+
+def test_only_file_fields_are_uploaded(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "individual-faces").write_bytes(b"not an asset")
+    face = tmp_path / "face.png"
+    face.write_bytes(b"\x89PNG face")
+    new_face = tmp_path / "new-face.png"
+    new_face.write_bytes(b"\x89PNG new face")
+    mock = MockMagicHour()
+
+    outcomes = list(
+        mock.client().v1.face_swap.sweep(
+            grid={"name": ["a", "b"]},
+            assets={
+                "video_source": "file",
+                "video_file_path": "api-assets/id/video.mp4",
+                "image_file_path": str(face),
+                "face_swap_mode": "individual-faces",
+                "face_mappings": [
+                    {
+                        "original_face": "api-assets/id/0-0.png",
+                        "new_face": str(new_face),
+                    }
+                ],
+            },
+            start_seconds=0.0,
+            end_seconds=5.0,
+            download_outputs=False,
+        )
+    )
+
+    assert all(o.ok for o in outcomes)
+    assert len(mock.uploads) == 2
+    for outcome in outcomes:
+        assets = mock._jobs[outcome.unwrap().id].body["assets"]
+        assert assets["face_swap_mode"] == "individual-faces"
+        assert assets["image_file_path"] in mock.uploads
+        assert assets["face_mappings"][0]["new_face"] in mock.uploads
+
+
+@pytest.mark.asyncio
+async def test_async_sweep_uploads_shared_files_once(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour()
+    client = mock.async_client()
+    face = tmp_path / "face.png"
+    face.write_bytes(b"\x89PNG face")
+
+    outcomes = [
+        outcome
+        async for outcome in client.v1.face_swap_photo.sweep(
+            grid={"assets.target_file_path": ["api-assets/a.png", "api-assets/b.png"]},
+            assets={"source_file_path": str(face)},
+            max_concurrency=1,
+            download_outputs=False,
+        )
+    ]
+
+    assert [o.index for o in outcomes] == [0, 1]
+    assert all(o.ok and o.unwrap().status == "complete" for o in outcomes)
+    assert len(mock.uploads) == 1
@@ -0,0 +1,179 @@
+import contextvars
+import pydantic
+import threading
+import time
+import typing
+
+
+_UPLOAD_URLS_PATH = "/v1/files/upload-urls"
+_QUEUED_STATUSES = frozenset({"draft", "queued"})
+_TERMINAL_STATUSES = frozenset({"complete", "error", "canceled"})
+
+
+class AssetUploadTiming(pydantic.BaseModel):
+    source: str
+    """The local path (or file name) that was uploaded"""
+
+    file_path: str
+    """Where the asset was stored (`api-assets/...`)"""
+
+    seconds: float
+    """Presigning plus the upload itself"""
+
+    bytes: int
+
+
+class JobTimings(pydantic.BaseModel):
+    """
+    Where the time of a `generate()` call went.
+
+    Queued and rendering times are inferred from the statuses seen while polling, so
+    they are accurate to about one poll interval (`MAGIC_HOUR_POLL_INTERVAL`).
+    """
+
+    total_seconds: float
+    """Wall-clock time of the whole `generate()` call"""
+
+    uploads: typing.List[AssetUploadTiming] = pydantic.Field(default_factory=list)
+    """One entry per local file uploaded (URLs and `api-assets/` paths are skipped)"""
+
+    upload_seconds: float = 0.0
+    create_seconds: typing.Optional[float] = None
+    """Latency of the create request"""
+
+    queued_seconds: typing.Optional[float] = None
+    """From the create response until a poll first saw the project leave the queue"""
+
+    rendering_seconds: typing.Optional[float] = None
+    """
+    From the first poll that saw the project rendering until the first poll that
+    saw it finished. `None` if no poll saw it rendering.
+    """
+
+    wait_seconds: typing.Optional[float] = None
+    """Time spent polling for completion (queued plus rendering)"""
+
+    download_seconds: float = 0.0
+    poll_count: int = 0
+    """Status checks made after the project was created"""
+
+    bytes_uploaded: int = 0
+    bytes_downloaded: int = 0
+
+
+class JobTimer:
+    """
+    Collects the phase timings of the `generate()` call running in the current
+    thread or asyncio task. SDK internals report into it via `current_job()`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.uploads: typing.List[AssetUploadTiming] = []
+        self.create_seconds: typing.Optional[float] = None
+        self.created_at: typing.Optional[float] = None
+        self.status_checks = 0
+        self.status_first_seen: typing.Dict[str, float] = {}
+        self.download_seconds = 0.0
+        self.bytes_downloaded = 0
+
+    def record_request(
+        self, method: str, path: str, started: float, finished: float
+    ) -> None:
+        if method.upper() == "POST" and path.rstrip("/") != _UPLOAD_URLS_PATH:
+            with self._lock:
+                self.create_seconds = finished - started
+                self.created_at = finished
+
+    def record_upload(
+        self, source: str, file_path: str, seconds: float, size: int
+    ) -> None:
+        with self._lock:
+            self.uploads.append(
+                AssetUploadTiming(
+                    source=source, file_path=file_path, seconds=seconds, bytes=size
+                )
+            )
+
+    def record_status(self, status: str) -> None:
+        """Report the status returned by one status check of the project"""
+        now = time.perf_counter()
+        with self._lock:
+            self.status_checks += 1
+            self.status_first_seen.setdefault(status, now)
+
+    def record_download(self, seconds: float, size: int) -> None:
+        with self._lock:
+            self.download_seconds += seconds
+            self.bytes_downloaded += size
+
+    def _first_seen(self, statuses: typing.Iterable[str]) -> typing.Optional[float]:
+        seen = [t for s, t in self.status_first_seen.items() if s in statuses]
+        return min(seen) if seen else None
+
+    def build(self) -> JobTimings:
+        with self._lock:
+            created = self.created_at
+            left_queue = self._first_seen(
+                set(self.status_first_seen) - _QUEUED_STATUSES
+            )
+            rendering = self.status_first_seen.get("rendering")
+            finished = self._first_seen(_TERMINAL_STATUSES)
+
+            queued_seconds = None
+            if created is not None and left_queue is not None:
+                queued_seconds = max(0.0, left_queue - created)
+            rendering_seconds = None
+            if rendering is not None and finished is not None:
+                rendering_seconds = max(0.0, finished - rendering)
+            wait_seconds = None
+            if created is not None and finished is not None:
+                wait_seconds = max(0.0, finished - created)
+
+            return JobTimings(
+                total_seconds=time.perf_counter() - self.started,
+                uploads=list(self.uploads),
+                upload_seconds=sum(u.seconds for u in self.uploads),
+                create_seconds=self.create_seconds,
+                queued_seconds=queued_seconds,
+                rendering_seconds=rendering_seconds,
+                wait_seconds=wait_seconds,
+                download_seconds=self.download_seconds,
+                poll_count=self.status_checks,
+                bytes_uploaded=sum(u.bytes for u in self.uploads),
+                bytes_downloaded=self.bytes_downloaded,
+            )
+
+
+_current_job: "contextvars.ContextVar[typing.Optional[JobTimer]]" = (
+    contextvars.ContextVar("magic_hour_current_job", default=None)
+)
+
+
+def current_job() -> typing.Optional[JobTimer]:
+    """The timer of the `generate()` call running in this thread / task, if any"""
+    return _current_job.get()
+
+
+def start_job(
+    timer: typing.Optional[JobTimer] = None,
+) -> "contextvars.Token[typing.Optional[JobTimer]]":
+    """Make `timer` (a new one by default) the current job's timer"""
+    return _current_job.set(timer if timer is not None else JobTimer())
+
+
+def leave_job(token: "contextvars.Token[typing.Optional[JobTimer]]") -> None:
+    """
+    Stop reporting into the timer set by `start_job()` without building its
+    timings, e.g. between the stages of a pipelined job
+    """
+    _current_job.reset(token)
+
+
+def end_job(
+    token: "contextvars.Token[typing.Optional[JobTimer]]",
+) -> typing.Optional[JobTimings]:
+    timer = _current_job.get()
+    _current_job.reset(token)
+    return timer.build() if timer is not None else None
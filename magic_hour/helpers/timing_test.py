@@ -0,0 +1,140 @@
+import httpx
+import pathlib
+import pytest
+import typing
+
+from magic_hour import Client
+from magic_hour.helpers.timing import JobTimer, current_job
+
+
+_IMAGE = b"\x89PNG" + b"\x00" * 2044
+_OUTPUT = b"\xff\xd8" + b"\x00" * 998
+
+
+def _image_project(status: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "created_at": "2024-10-18T05:16:19.027Z",
+        "credits_charged": 50,
+        "downloads": (
+            [
+                {
+                    "expires_at": "2024-10-19T05:16:19.027Z",
+                    "url": "https://cdn.test/out.jpg",
+                }
+            ]
+            if status == "complete"
+            else []
+        ),
+        "enabled": True,
+        "error": None,
+        "id": "cuid-example",
+        "image_count": 1,
+        "name": "Example Name",
+        "status": status,
+        "total_frame_cost": 50,
+        "type": "AI_IMAGE_UPSCALER",
+    }
+
+
+@pytest.fixture
+def transport(monkeypatch: pytest.MonkeyPatch) -> httpx.MockTransport:
+    """Serves the API, the presigned upload and the CDN, for every httpx client"""
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    statuses = ["queued", "queued", "rendering", "complete"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "storage.test":
+            return httpx.Response(200)
+        if request.url.host == "cdn.test":
+            return httpx.Response(200, content=_OUTPUT)
+        if request.url.path == "/v1/files/upload-urls":
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "expires_at": "2024-07-25T16:56:21.932Z",
+                            "file_path": "api-assets/id/1234.png",
+                            "upload_url": "https://storage.test/api-assets/id/1234.png",
+                        }
+                    ]
+                },
+            )
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={"credits_charged": 50, "frame_cost": 50, "id": "cuid-example"},
+            )
+        return httpx.Response(200, json=_image_project(statuses.pop(0)))
+
+    mock = httpx.MockTransport(handler)
+    for name in ("Client", "AsyncClient"):
+        original = getattr(httpx, name)
+
+        def factory(
+            *args: typing.Any, _original: typing.Any = original, **kwargs: typing.Any
+        ) -> typing.Any:
+            kwargs["transport"] = mock
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(httpx, name, factory)
+    return mock
+
+
+def test_generate_reports_timings(
+    transport: httpx.MockTransport, tmp_path: pathlib.Path
+) -> None:
+    image = tmp_path / "in.png"
+    image.write_bytes(_IMAGE)
+    client = Client(token="API_TOKEN")
+
+    result = client.v1.ai_image_upscaler.generate(
+        assets={"image_file_path": str(image)},
+        scale_factor=2.0,
+        style={"enhancement": "Balanced"},
+        download_directory=str(tmp_path),
+    )
+
+    timings = result.timings
+    assert timings is not None
+    assert [(u.source, u.file_path, u.bytes) for u in timings.uploads] == [
+        (str(image), "api-assets/id/1234.png", len(_IMAGE))
+    ]
+    assert timings.bytes_uploaded == len(_IMAGE)
+    assert timings.bytes_downloaded == len(_OUTPUT)
+    assert timings.poll_count == 4
+    assert timings.create_seconds is not None
+    assert timings.queued_seconds is not None
+    assert timings.rendering_seconds is not None
+    assert timings.wait_seconds is not None
+    assert timings.wait_seconds >= timings.rendering_seconds
+    assert timings.total_seconds >= (
+        timings.upload_seconds + timings.create_seconds + timings.wait_seconds
+    )
+    assert result.downloaded_paths == [str(tmp_path / "out.jpg")]
+    assert current_job() is None
+
+
+def test_check_result_alone_has_no_timings(transport: httpx.MockTransport) -> None:
+    client = Client(token="API_TOKEN")
+
+    result = client.v1.image_projects.check_result(
+        id="cuid-example", wait_for_completion=True, download_outputs=False
+    )
+
+    assert result.status == "complete"
+    assert result.timings is None
+
+
+def test_rendering_unknown_when_never_observed() -> None:
+    timer = JobTimer()
+    timer.record_request("POST", "/v1/face-swap", started=0.0, finished=0.0)
+    timer.created_at = timer.started
+    timer.record_status("queued")
+    timer.record_status("complete")
+
+    timings = timer.build()
+
+    assert timings.rendering_seconds is None
+    assert timings.queued_seconds is not None
+    assert timings.poll_count == 2
@@ -0,0 +1,331 @@
+import asyncio
+import pydantic
+import re
+import threading
+import time
+import typing
+import typing_extensions
+
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.rate_limit import RateLimiter
+
+
+logger = get_sdk_logger(__name__)
+
+# GET/DELETE paths that refer to a project created by an earlier POST
+_PROJECT_PATH = re.compile(
+    r"^/?v1/(?:video-projects|image-projects|audio-projects|face-detection)/([^/]+)$"
+)
+_UPLOAD_URLS_PATH = "/v1/files/upload-urls"
+
+
+class TokenPoolEntry(typing_extensions.TypedDict):
+    """
+    One API token in a `TokenPool` together with its budget.
+    """
+
+    token: typing_extensions.Required[str]
+    """
+    The Magic Hour API token
+    """
+
+    label: typing_extensions.NotRequired[str]
+    """
+    Name used in utilization reports. Defaults to the last 4 characters of the token.
+    """
+
+    max_concurrency: typing_extensions.NotRequired[int]
+    """
+    Maximum number of requests in flight for this token. Unlimited if omitted.
+    """
+
+    requests_per_second: typing_extensions.NotRequired[float]
+    """
+    Sustained request rate allowed for this token. Unlimited if omitted.
+    """
+
+
+class TokenUtilization(pydantic.BaseModel):
+    """
+    Point-in-time usage of one token in a `TokenPool`.
+    """
+
+    label: str
+    in_flight: int
+    max_concurrency: typing.Optional[int]
+    requests: int
+    creates: int
+    errors: int
+    pinned_projects: int
+    busy_seconds: float
+    """
+    Sum of the durations of every request made with this token
+    """
+    rate_limit_wait_seconds: float
+    """
+    Total time requests waited on this token's rate limit
+    """
+    utilization: typing.Optional[float]
+    """
+    `busy_seconds / (pool age * max_concurrency)`. Only set when `max_concurrency` is.
+    """
+
+
+class _TokenState:
+    def __init__(self, entry: TokenPoolEntry):
+        self.token = entry["token"]
+        self.label = entry.get("label") or f"...{self.token[-4:]}"
+        self.max_concurrency = entry.get("max_concurrency")
+        rps = entry.get("requests_per_second")
+        self.limiter = RateLimiter(rps) if rps else None
+        self.in_flight = 0
+        self.requests = 0
+        self.creates = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    def has_capacity(self) -> bool:
+        return self.max_concurrency is None or self.in_flight < self.max_concurrency
+
+    def load(self) -> typing.Tuple[float, float, int]:
+        occupancy = (
+            self.in_flight / self.max_concurrency
+            if self.max_concurrency
+            else float(self.in_flight)
+        )
+        rate_wait = self.limiter.expected_wait() if self.limiter else 0.0
+        return (occupancy, rate_wait, self.requests)
+
+
+class TokenLease:
+    """
+    A token checked out of a `TokenPool` for the duration of a single request.
+    """
+
+    def __init__(self, state: _TokenState, is_create: bool):
+        self._state = state
+        self.is_create = is_create
+        self.started = time.monotonic()
+        self.wait_seconds = 0.0
+        """Time `acquire()` spent waiting for capacity and for the rate limiter"""
+        self.rate_limit_wait_seconds = 0.0
+        """The part of `wait_seconds` spent waiting for the token's rate limiter"""
+
+    @property
+    def token(self) -> str:
+        return self._state.token
+
+    @property
+    def label(self) -> str:
+        return self._state.label
+
+
+class TokenPool:
+    """
+    Spreads requests over several API tokens (for example several Magic Hour
+    accounts) to scale past per-account concurrency and rate limits.
+
+    - Every create (`POST`) goes to the least-loaded token that has spare capacity.
+    - Follow-up `get`/`delete` calls for a project go to the token that created it.
+    - Files uploaded with a token are pinned to it, so a create that references those
+      files is sent with the same token.
+
+    Pass a pool to `Client(token_pool=...)` / `AsyncClient(token_pool=...)`:
+
+    ```py
+    pool = TokenPool(
+        [
+            {"token": "token-a", "max_concurrency": 8, "requests_per_second": 5},
+            {"token": "token-b", "max_concurrency": 4},
+        ]
+    )
+    client = Client(token_pool=pool)
+    ...
+    for usage in pool.utilization():
+        print(usage.label, usage.in_flight, usage.utilization)
+    ```
+
+    A pool can be shared by several clients, threads and asyncio tasks.
+
+    Args:
+        tokens: API tokens, either as plain strings or as `TokenPoolEntry` dicts with a
+            per-token concurrency and rate budget
+        max_pinned_projects: Upper bound on remembered project and file pins. The
+            oldest pins are forgotten first.
+    """
+
+    def __init__(
+        self,
+        tokens: typing.Sequence[typing.Union[str, TokenPoolEntry]],
+        *,
+        max_pinned_projects: int = 100_000,
+    ):
+        if not tokens:
+            raise ValueError("TokenPool requires at least one token")
+        self._states = [
+            _TokenState({"token": t} if isinstance(t, str) else t) for t in tokens
+        ]
+        self._cond = threading.Condition()
+        self._pins: typing.Dict[str, _TokenState] = {}
+        self._max_pins = max_pinned_projects
+        self._created_at = time.monotonic()
+
+    # ----- routing -----
+
+    def _pinned_state(
+        self, method: str, path: str, json: typing.Any
+    ) -> typing.Optional[_TokenState]:
+        match = _PROJECT_PATH.match(path)
+        if match and method.upper() in ("GET", "DELETE"):
+            return self._pins.get(match.group(1))
+        if method.upper() == "POST" and isinstance(json, dict):
+            for value in _iter_strings(json):
+                state = self._pins.get(value)
+                if state is not None:
+                    return state
+        return None
+
+    def _try_checkout(
+        self, method: str, path: str, json: typing.Any
+    ) -> typing.Optional[TokenLease]:
+        pinned = self._pinned_state(method, path, json)
+        if pinned is not None:
+            candidates = [pinned] if pinned.has_capacity() else []
+        else:
+            candidates = [s for s in self._states if s.has_capacity()]
+        if not candidates:
+            return None
+        state = min(candidates, key=lambda s: s.load())
+        state.in_flight += 1
+        state.requests += 1
+        is_create = method.upper() == "POST" and path.rstrip("/") != _UPLOAD_URLS_PATH
+        if is_create:
+            state.creates += 1
+        return TokenLease(state, is_create=is_create)
+
+    def acquire(self, *, method: str, path: str, json: typing.Any = None) -> TokenLease:
+        """Check out a token for a request, blocking while every candidate is busy"""
+        start = time.monotonic()
+        with self._cond:
+            lease = self._try_checkout(method, path, json)
+            while lease is None:
+                self._cond.wait(timeout=0.05)
+                lease = self._try_checkout(method, path, json)
+        if lease._state.limiter is not None:
+            lease.rate_limit_wait_seconds = lease._state.limiter.acquire()
+        lease.started = time.monotonic()
+        lease.wait_seconds = lease.started - start
+        return lease
+
+    async def acquire_async(
+        self, *, method: str, path: str, json: typing.Any = None
+    ) -> TokenLease:
+        """Async variant of `acquire` that never blocks the event loop"""
+        start = time.monotonic()
+        delay = 0.001
+        while True:
+            with self._cond:
+                lease = self._try_checkout(method, path, json)
+            if lease is not None:
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        if lease._state.limiter is not None:
+            lease.rate_limit_wait_seconds = await lease._state.limiter.acquire_async()
+        lease.started = time.monotonic()
+        lease.wait_seconds = lease.started - start
+        return lease
+
+    def release(
+        self,
+        lease: TokenLease,
+        *,
+        method: str,
+        path: str,
+        result: typing.Any = None,
+        error: typing.Optional[BaseException] = None,
+    ) -> None:
+        """Return a token to the pool and record pins derived from the response"""
+        state = lease._state
+        with self._cond:
+            state.in_flight -= 1
+            state.busy_seconds += time.monotonic() - lease.started
+            if error is not None:
+                state.errors += 1
+            else:
+                for key in _pin_keys(path, result):
+                    self._pin(key, state)
+                match = _PROJECT_PATH.match(path)
+                if match and method.upper() == "DELETE":
+                    self._pins.pop(match.group(1), None)
+            self._cond.notify_all()
+
+    def _pin(self, key: str, state: _TokenState) -> None:
+        self._pins.pop(key, None)
+        self._pins[key] = state
+        while len(self._pins) > self._max_pins:
+            self._pins.pop(next(iter(self._pins)))
+
+    def pin(self, project_id: str, token: str) -> None:
+        """Route future calls for `project_id` to `token` (e.g. after a restart)"""
+        for state in self._states:
+            if state.token == token:
+                with self._cond:
+                    self._pin(project_id, state)
+                return
+        raise ValueError("token is not part of this pool")
+
+    def token_for(self, project_id: str) -> typing.Optional[str]:
+        """The token a project is pinned to, if known"""
+        state = self._pins.get(project_id)
+        return state.token if state is not None else None
+
+    # ----- reporting -----
+
+    def utilization(self) -> typing.List[TokenUtilization]:
+        """Per-token usage counters"""
+        age = max(time.monotonic() - self._created_at, 1e-9)
+        with self._cond:
+            pinned: typing.Dict[int, int] = {}
+            for state in self._pins.values():
+                pinned[id(state)] = pinned.get(id(state), 0) + 1
+            return [
+                TokenUtilization(
+                    label=s.label,
+                    in_flight=s.in_flight,
+                    max_concurrency=s.max_concurrency,
+                    requests=s.requests,
+                    creates=s.creates,
+                    errors=s.errors,
+                    pinned_projects=pinned.get(id(s), 0),
+                    busy_seconds=s.busy_seconds,
+                    rate_limit_wait_seconds=(
+                        s.limiter.total_wait_seconds if s.limiter else 0.0
+                    ),
+                    utilization=(
+                        s.busy_seconds / (age * s.max_concurrency)
+                        if s.max_concurrency
+                        else None
+                    ),
+                )
+                for s in self._states
+            ]
+
+
+def _iter_strings(value: typing.Any) -> typing.Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
+
+
+def _pin_keys(path: str, result: typing.Any) -> typing.List[str]:
+    """Project ids / uploaded file paths that should stick to the token used"""
+    if path.rstrip("/") == _UPLOAD_URLS_PATH:
+        return [item.file_path for item in getattr(result, "items", None) or []]
+    project_id = getattr(result, "id", None)
+    return [project_id] if isinstance(project_id, str) else []
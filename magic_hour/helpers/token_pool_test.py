@@ -0,0 +1,183 @@
+import httpx
+import pytest
+import threading
+import time
+import typing
+
+from magic_hour import AsyncClient, Client
+from magic_hour.helpers import RateLimiter, TokenPool
+
+
+def _handler(
+    seen: typing.List[typing.Tuple[str, str, typing.Optional[str]]],
+    delay: float = 0.0,
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    counter = iter(range(1_000_000))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(
+            (request.method, request.url.path, request.headers.get("Authorization"))
+        )
+        if delay:
+            time.sleep(delay)
+        if request.url.path == "/v1/files/upload-urls":
+            n = next(counter)
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "expires_at": "2024-07-25T16:56:21.932Z",
+                            "file_path": f"api-assets/id/{n}.png",
+                            "upload_url": f"https://upload.example.com/{n}.png",
+                        }
+                    ]
+                },
+            )
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={"credits_charged": 5, "frame_cost": 5, "id": f"p{next(counter)}"},
+            )
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(
+            200,
+            json={
+                "created_at": "2024-01-01T00:00:00Z",
+                "credits_charged": 5,
+                "downloads": [],
+                "enabled": True,
+                "error": None,
+                "id": request.url.path.rsplit("/", 1)[-1],
+                "image_count": 1,
+                "name": None,
+                "status": "complete",
+                "total_frame_cost": 5,
+                "type": "AI_IMAGE",
+            },
+        )
+
+    return handler
+
+
+def test_creates_are_spread_and_follow_ups_are_pinned() -> None:
+    seen: typing.List[typing.Tuple[str, str, typing.Optional[str]]] = []
+    pool = TokenPool(["tok-a", {"token": "tok-b", "label": "b"}])
+    client = Client(
+        token_pool=pool,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(seen))),
+    )
+
+    first = client.v1.ai_image_generator.create(
+        image_count=1, orientation="square", style={"prompt": "a"}
+    )
+    second = client.v1.ai_image_generator.create(
+        image_count=1, orientation="square", style={"prompt": "b"}
+    )
+    client.v1.image_projects.get(id=first.id)
+    client.v1.image_projects.get(id=second.id)
+    client.v1.image_projects.delete(id=first.id)
+
+    auth = [a for _, _, a in seen]
+    assert auth[0] != auth[1]
+    assert auth[2] == auth[0]
+    assert auth[3] == auth[1]
+    assert auth[4] == auth[0]
+    assert pool.token_for(first.id) is None
+    assert pool.token_for(second.id) in ("tok-a", "tok-b")
+
+    usage = {u.label: u for u in pool.utilization()}
+    assert set(usage) == {"...ok-a", "b"}
+    assert sum(u.creates for u in usage.values()) == 2
+    assert sum(u.requests for u in usage.values()) == 5
+    assert all(u.in_flight == 0 for u in usage.values())
+
+
+def test_create_follows_token_used_for_upload() -> None:
+    seen: typing.List[typing.Tuple[str, str, typing.Optional[str]]] = []
+    pool = TokenPool(["tok-a", "tok-b"])
+    client = Client(
+        token_pool=pool,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_handler(seen))),
+    )
+
+    # the upload then goes to the other token, which the create must follow
+    client.v1.ai_image_generator.create(
+        image_count=1, orientation="square", style={"prompt": "a"}
+    )
+    upload = client.v1.files.upload_urls.create(
+        items=[{"extension": "png", "type_": "image"}]
+    )
+    client.v1.ai_image_upscaler.create(
+        assets={"image_file_path": upload.items[0].file_path},
+        scale_factor=2.0,
+        style={"enhancement": "Balanced"},
+    )
+
+    assert seen[2][2] == seen[1][2]
+
+
+def test_max_concurrency_is_respected() -> None:
+    seen: typing.List[typing.Tuple[str, str, typing.Optional[str]]] = []
+    pool = TokenPool([{"token": "tok-a", "max_concurrency": 1}])
+    client = Client(
+        token_pool=pool,
+        httpx_client=httpx.Client(
+            transport=httpx.MockTransport(_handler(seen, delay=0.05))
+        ),
+    )
+    peak = 0
+
+    def watch() -> None:
+        nonlocal peak
+        for _ in range(40):
+            peak = max(peak, pool.utilization()[0].in_flight)
+            time.sleep(0.005)
+
+    watcher = threading.Thread(target=watch)
+    workers = [
+        threading.Thread(target=client.v1.image_projects.get, kwargs={"id": str(i)})
+        for i in range(3)
+    ]
+    watcher.start()
+    for w in workers:
+        w.start()
+    for w in workers + [watcher]:
+        w.join()
+
+    assert peak == 1
+    assert pool.utilization()[0].requests == 3
+
+
+def test_token_and_token_pool_are_exclusive() -> None:
+    with pytest.raises(ValueError):
+        Client(token="x", token_pool=TokenPool(["y"]))
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_pool() -> None:
+    seen: typing.List[typing.Tuple[str, str, typing.Optional[str]]] = []
+    pool = TokenPool(["tok-a", "tok-b"])
+    client = AsyncClient(
+        token_pool=pool,
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler(seen))),
+    )
+
+    created = await client.v1.ai_image_generator.create(
+        image_count=1, orientation="square", style={"prompt": "a"}
+    )
+    await client.v1.image_projects.get(id=created.id)
+
+    assert seen[0][2] == seen[1][2] == f"Bearer {pool.token_for(created.id)}"
+
+
+def test_rate_limiter_spaces_out_reservations() -> None:
+    limiter = RateLimiter(rate=10, burst=1)
+
+    waits = [limiter.reserve() for _ in range(3)]
+
+    assert waits[0] == 0
+    assert waits[1] == pytest.approx(0.1, abs=0.02)
+    assert waits[2] == pytest.approx(0.2, abs=0.02)
+    assert limiter.total_wait_seconds == pytest.approx(0.3, abs=0.04)
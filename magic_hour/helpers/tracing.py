@@ -0,0 +1,401 @@
+import asyncio
+import contextvars
+import functools
+import importlib
+import itertools
+import re
+import time
+import typing
+
+from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.timing import JobTimings, end_job, start_job
+
+
+logger = get_sdk_logger(__name__)
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+AttributeValue = typing.Union[str, bool, int, float, None]
+
+# span names
+REQUEST = "magic_hour.request"
+"""One call to the Magic Hour API (`SyncBaseClient.request`)"""
+UPLOAD = "magic_hour.upload"
+"""`files.upload_file()`: presigning (a `REQUEST` child) and the `UPLOAD_PUT`"""
+UPLOAD_PUT = "magic_hour.upload.put"
+"""The PUT of the file bytes to the presigned URL"""
+GENERATE = "magic_hour.generate"
+"""A whole `generate()` call"""
+WAIT = "magic_hour.wait"
+"""Polling a project until it is complete, errored or canceled"""
+DOWNLOAD = "magic_hour.download"
+"""Downloading one output file"""
+
+_PROJECT_ID_PATH = re.compile(
+    r"^(/?v1/(?:video-projects|image-projects|audio-projects|face-detection))/[^/]+$"
+)
+
+_span_ids = itertools.count(1)
+_current_span: "contextvars.ContextVar[typing.Optional[Span]]" = contextvars.ContextVar(
+    "magic_hour_current_span", default=None
+)
+
+
+def endpoint_template(path: str) -> str:
+    """`/v1/video-projects/abc123` -> `/v1/video-projects/{id}`, other paths unchanged"""
+    return _PROJECT_ID_PATH.sub(r"\1/{id}", path)
+
+
+class Span:
+    """
+    One timed SDK operation. Spans nest: a span started while another one is
+    active (in the same thread or asyncio task) records it as its `parent`.
+
+    Times follow OpenTelemetry: `start_time_ns` / `end_time_ns` are nanoseconds since
+    the epoch, and `status` is `"unset"`, `"ok"` or `"error"`.
+    """
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "events",
+        "parent",
+        "span_id",
+        "trace_id",
+        "start_time_ns",
+        "end_time_ns",
+        "status",
+        "exception",
+        "_start_perf_ns",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Dict[str, AttributeValue]] = None,
+        parent: typing.Optional["Span"] = None,
+    ):
+        self.name = name
+        self.attributes: typing.Dict[str, AttributeValue] = attributes or {}
+        self.events: typing.List[
+            typing.Tuple[str, int, typing.Dict[str, AttributeValue]]
+        ] = []
+        self.parent = parent
+        self.span_id: int = next(_span_ids)
+        self.trace_id: int = parent.trace_id if parent is not None else self.span_id
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: typing.Optional[int] = None
+        self.status = "unset"
+        self.exception: typing.Optional[BaseException] = None
+        self._start_perf_ns = time.perf_counter_ns()
+        self._token: typing.Optional[contextvars.Token[typing.Optional[Span]]] = None
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    @property
+    def duration_seconds(self) -> typing.Optional[float]:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: typing.Mapping[str, AttributeValue]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Dict[str, AttributeValue]] = None,
+    ) -> None:
+        """Record a point in time inside the span, e.g. a project status change"""
+        self.events.append((name, time.time_ns(), attributes or {}))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.status = "error"
+        self.exception = exception
+
+    def _end(self) -> None:
+        elapsed = time.perf_counter_ns() - self._start_perf_ns
+        self.end_time_ns = self.start_time_ns + elapsed
+        if self.status == "unset":
+            self.status = "ok"
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.attributes!r}, status={self.status!r})"
+
+
+class _NoopSpan:
+    """Stands in for `Span` when nothing listens, so instrumented code stays cheap"""
+
+    __slots__ = ()
+
+    is_recording = False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_attributes(self, attributes: typing.Mapping[str, AttributeValue]) -> None:
+        pass
+
+    def add_event(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Dict[str, AttributeValue]] = None,
+    ) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+SpanLike = typing.Union[Span, _NoopSpan]
+
+
+class SpanListener:
+    """
+    Receives every span the SDK starts and ends. Subclass it and override the
+    callbacks you need; listeners are called synchronously on the thread (or event
+    loop) doing the work, so they should be fast.
+
+    ```py
+    class PrintSpans(SpanListener):
+        def on_end(self, span: Span) -> None:
+            print(span.name, span.attributes, span.duration_seconds)
+
+
+    client = Client(span_listeners=[PrintSpans()])
+    ```
+    """
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+
+    def __enter__(self) -> Span:
+        span = self._span
+        span._token = _current_span.set(span)
+        self._tracer._notify("on_start", span)
+        return span
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc: typing.Optional[BaseException],
+        tb: typing.Any,
+    ) -> None:
+        span = self._span
+        if exc is not None:
+            span.record_exception(exc)
+        span._end()
+        if span._token is not None:
+            _current_span.reset(span._token)
+            span._token = None
+        self._tracer._notify("on_end", span)
+
+
+class Tracer:
+    """
+    Creates spans around SDK operations and hands them to `SpanListener`s.
+
+    Every `Client` / `AsyncClient` owns one (`client.tracer`). With no listeners
+    registered `span()` returns a shared no-op span, so instrumentation costs
+    next to nothing.
+    """
+
+    def __init__(
+        self, listeners: typing.Optional[typing.Iterable[SpanListener]] = None
+    ):
+        self._listeners: typing.Tuple[SpanListener, ...] = tuple(listeners or ())
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._listeners)
+
+    @property
+    def listeners(self) -> typing.Tuple[SpanListener, ...]:
+        return self._listeners
+
+    def add_listener(self, listener: SpanListener) -> None:
+        self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: SpanListener) -> None:
+        self._listeners = tuple(
+            item for item in self._listeners if item is not listener
+        )
+
+    def span(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Dict[str, AttributeValue]] = None,
+    ) -> typing.ContextManager[SpanLike]:
+        """Context manager that times the enclosed block as a span called `name`"""
+        if not self._listeners:
+            return NOOP_SPAN
+        return _SpanScope(self, Span(name, attributes, parent=_current_span.get()))
+
+    def _notify(self, method: str, span: Span) -> None:
+        for listener in self._listeners:
+            try:
+                getattr(listener, method)(span)
+            except Exception:
+                logger.warning("Span listener %r failed", listener, exc_info=True)
+
+
+NOOP_TRACER = Tracer()
+
+
+def get_tracer(base_client: typing.Any) -> Tracer:
+    """The tracer configured on a base client, or a no-op tracer"""
+    tracer = getattr(base_client, "tracer", None)
+    return tracer if isinstance(tracer, Tracer) else NOOP_TRACER
+
+
+def current_span() -> typing.Optional[Span]:
+    """The innermost span active in this thread / asyncio task, if any"""
+    return _current_span.get()
+
+
+def traced_generate(resource: str) -> typing.Callable[[F], F]:
+    """
+    Wrap a resource client's (sync or async) `generate()` in a `GENERATE` span, and
+    attach the `JobTimings` of the call to its result. The call also goes through
+    the client's `JobLedger`, if it has one (see `ledgered_generate()`), and its
+    arguments are validated before any upload (see `checked_generate()`).
+    """
+    # imported with the resource clients rather than with `magic_hour`
+    ledger = importlib.import_module("magic_hour.helpers.ledger")
+    validation = importlib.import_module("magic_hour.helpers.validation")
+
+    def finish(
+        self: typing.Any,
+        span: SpanLike,
+        result: typing.Any,
+        timings: typing.Optional[JobTimings],
+    ) -> None:
+        span.set_attribute("magic_hour.project_id", getattr(result, "id", None))
+        span.set_attribute("magic_hour.project_status", getattr(result, "status", None))
+        if timings is not None and "timings" in getattr(
+            type(result), "model_fields", {}
+        ):
+            result.timings = timings
+
+    def decorator(fn: F) -> F:
+        fn = ledger.ledgered_generate(
+            resource, validation.checked_generate(resource, fn)
+        )
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(
+                self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+            ) -> typing.Any:
+                tracer = get_tracer(self._base_client)
+                with tracer.span(GENERATE, {"magic_hour.resource": resource}) as span:
+                    job = start_job()
+                    try:
+                        result = await fn(self, *args, **kwargs)
+                    finally:
+                        timings = end_job(job)
+                    finish(self, span, result, timings)
+                    return result
+
+            return typing.cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(
+            self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            tracer = get_tracer(self._base_client)
+            with tracer.span(GENERATE, {"magic_hour.resource": resource}) as span:
+                job = start_job()
+                try:
+                    result = fn(self, *args, **kwargs)
+                finally:
+                    timings = end_job(job)
+                finish(self, span, result, timings)
+                return result
+
+        return typing.cast(F, wrapper)
+
+    return decorator
+
+
+class OpenTelemetryListener(SpanListener):
+    """
+    Mirrors SDK spans into OpenTelemetry. Requires `opentelemetry-api` (and an SDK
+    / exporter configured by your application).
+
+    ```py
+    from magic_hour.helpers.tracing import OpenTelemetryListener
+
+    client = Client(span_listeners=[OpenTelemetryListener()])
+    ```
+
+    Args:
+        tracer_provider: Provider to create the tracer from. Defaults to the global one.
+    """
+
+    def __init__(self, tracer_provider: typing.Any = None):
+        try:
+            from opentelemetry import trace  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryListener requires opentelemetry-api: "
+                "pip install opentelemetry-api"
+            ) from e
+        self._trace = trace
+        self._tracer = trace.get_tracer("magic_hour", tracer_provider=tracer_provider)
+        self._open: typing.Dict[int, typing.Any] = {}
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        if span.parent is not None and span.parent.span_id in self._open:
+            context = self._trace.set_span_in_context(self._open[span.parent.span_id])
+        self._open[span.span_id] = self._tracer.start_span(
+            span.name,
+            context=context,
+            attributes={k: v for k, v in span.attributes.items() if v is not None},
+            start_time=span.start_time_ns,
+        )
+
+    def on_end(self, span: Span) -> None:
+        otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value)
+        for name, timestamp, attributes in span.events:
+            otel_span.add_event(name, attributes=attributes, timestamp=timestamp)
+        if span.exception is not None:
+            otel_span.record_exception(span.exception)
+        status_code = (
+            self._trace.StatusCode.ERROR
+            if span.status == "error"
+            else self._trace.StatusCode.OK
+        )
+        otel_span.set_status(self._trace.Status(status_code))
+        otel_span.end(end_time=span.end_time_ns)
@@ -0,0 +1,215 @@
+import httpx
+import pytest
+import typing
+
+from magic_hour import AsyncClient, Client
+from magic_hour.helpers.tracing import (
+    GENERATE,
+    NOOP_SPAN,
+    REQUEST,
+    WAIT,
+    Span,
+    SpanListener,
+    Tracer,
+    current_span,
+    endpoint_template,
+)
+from make_api_request import ApiError
+
+
+class _Recorder(SpanListener):
+    def __init__(self) -> None:
+        self.started: typing.List[Span] = []
+        self.ended: typing.List[Span] = []
+
+    def on_start(self, span: Span) -> None:
+        self.started.append(span)
+
+    def on_end(self, span: Span) -> None:
+        self.ended.append(span)
+
+    def named(self, name: str) -> typing.List[Span]:
+        return [span for span in self.ended if span.name == name]
+
+
+def _video_project(status: str) -> typing.Dict[str, typing.Any]:
+    return {
+        "created_at": "2024-10-18T05:16:19.027Z",
+        "credits_charged": 450,
+        "download": None,
+        "downloads": [],
+        "enabled": True,
+        "end_seconds": 5.0,
+        "error": None,
+        "fps": 30.0,
+        "height": 960,
+        "id": "cuid-example",
+        "name": "Example Name",
+        "start_seconds": 0.0,
+        "status": status,
+        "total_frame_cost": 450,
+        "type": "TEXT_TO_VIDEO",
+        "width": 512,
+    }
+
+
+def _project_handler() -> typing.Callable[[httpx.Request], httpx.Response]:
+    statuses = iter(["queued", "rendering", "rendering", "complete"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={
+                    "credits_charged": 450,
+                    "estimated_frame_cost": 450,
+                    "id": "cuid-example",
+                },
+            )
+        return httpx.Response(200, json=_video_project(next(statuses)))
+
+    return handler
+
+
+def test_tracer_without_listeners_is_noop() -> None:
+    tracer = Tracer()
+
+    with tracer.span(REQUEST) as span:
+        assert span is NOOP_SPAN
+        assert current_span() is None
+
+
+def test_spans_nest_and_record_errors() -> None:
+    recorder = _Recorder()
+    tracer = Tracer([recorder])
+
+    with pytest.raises(RuntimeError):
+        with tracer.span("outer") as outer:
+            with tracer.span("inner", {"a": 1}) as inner:
+                assert current_span() is inner
+                raise RuntimeError("boom")
+
+    assert [span.name for span in recorder.started] == ["outer", "inner"]
+    assert [span.name for span in recorder.ended] == ["inner", "outer"]
+    assert isinstance(inner, Span) and isinstance(outer, Span)
+    assert inner.parent is outer and inner.trace_id == outer.trace_id
+    assert inner.status == outer.status == "error"
+    assert inner.duration_seconds is not None
+    assert current_span() is None
+
+
+def test_failing_listener_does_not_break_requests() -> None:
+    class Broken(SpanListener):
+        def on_end(self, span: Span) -> None:
+            raise ValueError("listener bug")
+
+    tracer = Tracer([Broken()])
+
+    with tracer.span("ok") as span:
+        pass
+
+    assert isinstance(span, Span) and span.status == "ok"
+
+
+def test_endpoint_template() -> None:
+    assert endpoint_template("/v1/video-projects/abc") == "/v1/video-projects/{id}"
+    assert endpoint_template("/v1/face-detection/abc") == "/v1/face-detection/{id}"
+    assert endpoint_template("/v1/face-swap") == "/v1/face-swap"
+
+
+def test_request_span_attributes() -> None:
+    recorder = _Recorder()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(200, json=_video_project("complete"))
+
+    client = Client(
+        token="API_TOKEN",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        span_listeners=[recorder],
+    )
+
+    client.v1.video_projects.get(id="cuid-example")
+    with pytest.raises(ApiError):
+        client.with_token("OTHER").v1.video_projects.get(id="missing")
+
+    ok, missing = recorder.named(REQUEST)
+    assert ok.attributes == {
+        "http.request.method": "GET",
+        "url.path": "/v1/video-projects/{id}",
+        "magic_hour.endpoint": "GET /v1/video-projects/{id}",
+        "http.response.status_code": 200,
+        "http.request.body.size": 0,
+        "http.response.body.size": len(
+            httpx.Response(200, json=_video_project("complete")).content
+        ),
+    }
+    assert ok.status == "ok"
+    assert missing.attributes["http.response.status_code"] == 404
+    assert missing.status == "error"
+
+
+def test_generate_wait_spans(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    recorder = _Recorder()
+    client = Client(
+        token="API_TOKEN",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_project_handler())),
+    )
+    client.tracer.add_listener(recorder)
+
+    result = client.v1.text_to_video.generate(
+        end_seconds=5.0,
+        style={"prompt": "a dog running"},
+        orientation="landscape",
+        download_outputs=False,
+    )
+
+    assert result.status == "complete"
+    (generate,) = recorder.named(GENERATE)
+    (wait,) = recorder.named(WAIT)
+    assert generate.attributes == {
+        "magic_hour.resource": "text_to_video",
+        "magic_hour.project_id": "cuid-example",
+        "magic_hour.project_status": "complete",
+    }
+    assert wait.parent is generate
+    assert wait.attributes["magic_hour.poll_count"] == 3
+    assert [attrs["status"] for _, _, attrs in wait.events] == [
+        "queued",
+        "rendering",
+        "complete",
+    ]
+    requests = recorder.named(REQUEST)
+    assert [span.attributes["magic_hour.endpoint"] for span in requests] == [
+        "POST /v1/text-to-video"
+    ] + ["GET /v1/video-projects/{id}"] * 4
+    assert sum(span.parent is wait for span in requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_generate_span(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0")
+    recorder = _Recorder()
+    client = AsyncClient(
+        token="API_TOKEN",
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_project_handler())
+        ),
+        span_listeners=[recorder],
+    )
+
+    await client.v1.text_to_video.generate(
+        end_seconds=5.0,
+        style={"prompt": "a dog running"},
+        orientation="landscape",
+        download_outputs=False,
+    )
+
+    (generate,) = recorder.named(GENERATE)
+    assert all(span.trace_id == generate.trace_id for span in recorder.ended), (
+        "every span belongs to the generate() trace"
+    )
+    assert current_span() is None
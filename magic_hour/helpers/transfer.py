@@ -0,0 +1,40 @@
+import contextlib
+import httpx
+import typing
+
+
+_CLIENT_TYPES = (httpx.Client, httpx.AsyncClient)
+
+
+@contextlib.contextmanager
+def sync_transfer_client(
+    shared: typing.Optional[httpx.Client], **kwargs: typing.Any
+) -> typing.Iterator[httpx.Client]:
+    """
+    The client to move file bytes with (presigned uploads, output downloads):
+    `shared` if the SDK client was configured with a `transfer_client`, otherwise
+    a new `httpx.Client(**kwargs)` that is closed afterwards.
+    """
+    if shared is not None:
+        yield shared
+        return
+    with httpx.Client(**kwargs) as client:
+        yield client
+
+
+@contextlib.asynccontextmanager
+async def async_transfer_client(
+    shared: typing.Optional[httpx.AsyncClient], **kwargs: typing.Any
+) -> typing.AsyncIterator[httpx.AsyncClient]:
+    """Async variant of `sync_transfer_client`"""
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(**kwargs) as client:
+        yield client
+
+
+def get_transfer_client(base_client: typing.Any) -> typing.Any:
+    """The `transfer_client` configured on a base client, if any"""
+    client = getattr(base_client, "transfer_client", None)
+    return client if isinstance(client, _CLIENT_TYPES) else None
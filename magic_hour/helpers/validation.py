@@ -0,0 +1,140 @@
+import asyncio
+import functools
+import importlib
+import typing
+
+from magic_hour.helpers.media_probe import check_time_range
+
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+_AUDIO_SUFFIX = "-audio"
+# values the API resolves itself, which any model accepts
+_UNCHECKED_VALUES = frozenset({"default", "auto"})
+
+
+class UnsupportedRequestError(ValueError):
+    """
+    Raised before sending a request whose arguments the chosen model doesn't
+    support, per `magic_hour.types.capabilities`
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        resource: str,
+        field: str,
+        model: str,
+        allowed: typing.Any,
+    ):
+        super().__init__(message)
+        self.resource = resource
+        self.field = field
+        self.model = model
+        self.allowed = allowed
+
+
+@functools.lru_cache(maxsize=None)
+def _capabilities() -> typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]]:
+    # imported on first use, like the resource clients, to keep `import magic_hour` fast
+    table = importlib.import_module("magic_hour.types.capabilities")
+    return table.CAPABILITIES
+
+
+def _given(value: typing.Any) -> bool:
+    return isinstance(value, (str, int, float)) and value not in _UNCHECKED_VALUES
+
+
+def _additional_images(assets: typing.Any) -> int:
+    if not isinstance(assets, typing.Mapping):
+        return 0
+    paths = assets.get("image_file_paths")
+    count = len(paths) if isinstance(paths, (list, tuple)) else 0
+    if isinstance(assets.get("image_file_path"), str):
+        count += 1
+    return max(0, count - 1)
+
+
+def check_capabilities(
+    resource: str, arguments: typing.Mapping[str, typing.Any]
+) -> None:
+    """
+    Check the `create()`/`generate()` arguments of `resource` against what its
+    `model` supports: `resolution`, `image_count`, `end_seconds`, `audio` and the
+    number of additional input images. Arguments not given, and models the table
+    doesn't know, pass.
+
+    Raises:
+        UnsupportedRequestError: If the model doesn't support an argument
+    """
+    rules = _capabilities().get(resource)
+    if rules is None:
+        return
+    model = arguments.get("model")
+    if not isinstance(model, str) or model in _UNCHECKED_VALUES:
+        return
+    audio = arguments.get("audio")
+    if model.endswith(_AUDIO_SUFFIX):  # deprecated spelling of `audio=True`
+        model, audio = model[: -len(_AUDIO_SUFFIX)], True
+
+    def reject(field: str, value: typing.Any, allowed: typing.Any, what: str) -> None:
+        raise UnsupportedRequestError(
+            f"{resource} model {model!r} doesn't support {field}={value!r}; {what}",
+            resource=resource,
+            field=field,
+            model=model,
+            allowed=allowed,
+        )
+
+    for field in ("resolution", "image_count", "end_seconds"):
+        allowed = rules.get(field, {}).get(model)
+        value = arguments.get(field)
+        if allowed is not None and _given(value) and value not in allowed:
+            reject(field, value, allowed, f"supported: {', '.join(map(str, allowed))}")
+    if audio is True and rules.get("audio", {}).get(model) is False:
+        reject("audio", audio, False, "the model can't include audio")
+    limit = rules.get("additional_images", {}).get(model)
+    if limit is not None:
+        count = _additional_images(arguments.get("assets"))
+        if count > limit:
+            reject(
+                "assets.image_file_paths",
+                f"{count + 1} images",
+                limit,
+                f"at most {limit} additional input image(s) after the first",
+            )
+
+
+def checked_generate(resource: str, fn: F) -> F:
+    """
+    Wrap a resource client's `generate()` to validate its arguments before it
+    uploads anything: `check_capabilities()`, then `check_time_range()` against
+    local media
+    """
+
+    def check(kwargs: typing.Mapping[str, typing.Any]) -> None:
+        check_capabilities(resource, kwargs)
+        check_time_range(
+            kwargs.get("assets"), kwargs.get("start_seconds"), kwargs.get("end_seconds")
+        )
+
+    if asyncio.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(
+            self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+        ) -> typing.Any:
+            check(kwargs)
+            return await fn(self, *args, **kwargs)
+
+        return typing.cast(F, async_wrapper)
+
+    @functools.wraps(fn)
+    def wrapper(
+        self: typing.Any, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Any:
+        check(kwargs)
+        return fn(self, *args, **kwargs)
+
+    return typing.cast(F, wrapper)
@@ -0,0 +1,71 @@
+import importlib.util
+import pathlib
+import pytest
+
+from magic_hour.helpers.validation import UnsupportedRequestError, check_capabilities
+from magic_hour.testing import MockMagicHour
+from magic_hour.types.capabilities import CAPABILITIES
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def test_capability_table_matches_the_docstrings() -> None:
+    root = pathlib.Path(__file__).resolve().parents[2]
+    spec = importlib.util.spec_from_file_location(
+        "generate_capabilities", root / "codemod" / "generate_capabilities.py"
+    )
+    assert spec is not None and spec.loader is not None
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    assert generator.build_table(str(root)) == CAPABILITIES
+    assert CAPABILITIES["ai_image_editor"]["additional_images"]["qwen-edit"] == 2
+
+
+def test_unsupported_arguments_are_rejected_before_any_request() -> None:
+    mock = MockMagicHour()
+    client = mock.client()
+
+    with pytest.raises(UnsupportedRequestError, match="resolution='4k'") as e:
+        client.v1.ai_image_generator.create(
+            image_count=1,
+            model="nano-banana",
+            resolution="4k",
+            style={"prompt": "a fox", "tool": "general"},
+        )
+    assert (e.value.field, e.value.allowed) == ("resolution", ("640px", "1k"))
+    with pytest.raises(UnsupportedRequestError, match="image_count=3"):
+        client.v1.ai_image_generator.generate(
+            image_count=3,
+            model="nano-banana-pro",
+            style={"prompt": "a fox", "tool": "general"},
+        )
+    with pytest.raises(UnsupportedRequestError, match="additional input image"):
+        client.v1.ai_image_editor.generate(
+            assets={"image_file_paths": [f"api-assets/{i}.png" for i in range(4)]},
+            model="qwen-edit",
+            style={"prompt": "add sunglasses"},
+        )
+    with pytest.raises(UnsupportedRequestError, match="end_seconds=7"):
+        check_capabilities("image_to_video", {"model": "kling-2.5", "end_seconds": 7})
+    with pytest.raises(UnsupportedRequestError, match="audio"):
+        check_capabilities("text_to_video", {"model": "wan-2.2", "audio": True})
+    assert mock.requests == []
+
+    # unknown and server-chosen values aren't second-guessed
+    check_capabilities(
+        "image_to_video", {"model": "kling-2.5-audio", "end_seconds": 10.0}
+    )
+    check_capabilities("ai_image_generator", {"model": "default", "resolution": "4k"})
+    check_capabilities("ai_image_generator", {"model": "new-model", "image_count": 99})
+    result = client.v1.ai_image_generator.generate(
+        image_count=4,
+        model="flux-schnell",
+        resolution="auto",
+        style={"prompt": "a fox", "tool": "general"},
+        download_outputs=False,
+    )
+    assert result.status == "complete"
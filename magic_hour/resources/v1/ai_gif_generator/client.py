@@ -1,7 +1,11 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
     ImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiGifGeneratorClient:
+class AiGifGeneratorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_gif_generator")
     def generate(
         self,
         *,
@@ -74,7 +78,7 @@ class AiGifGeneratorClient:
             output_format=output_format,
             request_options=request_options,
         )
-        logger.info(f"AI GIF Generator response: {create_response}")
+        logger.info("AI GIF Generator response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -142,10 +146,11 @@ class AiGifGeneratorClient:
         )
 
 
-class AsyncAiGifGeneratorClient:
+class AsyncAiGifGeneratorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_gif_generator")
     async def generate(
         self,
         *,
@@ -196,7 +201,7 @@ class AsyncAiGifGeneratorClient:
             output_format=output_format,
             request_options=request_options,
         )
-        logger.info(f"AI GIF Generator response: {create_response}")
+        logger.info("AI GIF Generator response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiHeadshotGeneratorClient:
+class AiHeadshotGeneratorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_headshot_generator")
     def generate(
         self,
         *,
@@ -77,7 +81,7 @@ class AiHeadshotGeneratorClient:
         create_response = self.create(
             assets=assets, style=style, name=name, request_options=request_options
         )
-        logger.info(f"AI Headshot Generator response: {create_response}")
+        logger.info("AI Headshot Generator response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -144,10 +148,11 @@ class AiHeadshotGeneratorClient:
         )
 
 
-class AsyncAiHeadshotGeneratorClient:
+class AsyncAiHeadshotGeneratorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_headshot_generator")
     async def generate(
         self,
         *,
@@ -201,7 +206,7 @@ class AsyncAiHeadshotGeneratorClient:
         create_response = await self.create(
             assets=assets, style=style, name=name, request_options=request_options
         )
-        logger.info(f"AI Headshot Generator response: {create_response}")
+        logger.info("AI Headshot Generator response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
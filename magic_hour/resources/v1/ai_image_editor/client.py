@@ -1,7 +1,12 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
+from magic_hour.helpers.validation import check_capabilities
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -13,7 +18,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -21,10 +25,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiImageEditorClient:
+class AiImageEditorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_editor")
     def generate(
         self,
         *,
@@ -119,7 +124,7 @@ class AiImageEditorClient:
             resolution=resolution,
             request_options=request_options,
         )
-        logger.info(f"AI Image Editor response: {create_response}")
+        logger.info("AI Image Editor response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -256,6 +261,15 @@ class AiImageEditorClient:
         )
         ```
         """
+        check_capabilities(
+            "ai_image_editor",
+            {
+                "model": model,
+                "resolution": resolution,
+                "image_count": image_count,
+                "assets": assets,
+            },
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
@@ -278,10 +292,11 @@ class AiImageEditorClient:
         )
 
 
-class AsyncAiImageEditorClient:
+class AsyncAiImageEditorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_editor")
     async def generate(
         self,
         *,
@@ -378,7 +393,7 @@ class AsyncAiImageEditorClient:
             resolution=resolution,
             request_options=request_options,
         )
-        logger.info(f"AI Image Editor response: {create_response}")
+        logger.info("AI Image Editor response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -515,6 +530,15 @@ class AsyncAiImageEditorClient:
         )
         ```
         """
+        check_capabilities(
+            "ai_image_editor",
+            {
+                "model": model,
+                "resolution": resolution,
+                "image_count": image_count,
+                "assets": assets,
+            },
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
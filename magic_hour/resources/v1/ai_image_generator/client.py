@@ -1,7 +1,12 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
+from magic_hour.helpers.validation import check_capabilities
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
     ImageProjectsClient,
@@ -12,7 +17,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +24,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiImageGeneratorClient:
+class AiImageGeneratorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_generator")
     def generate(
         self,
         *,
@@ -106,7 +111,7 @@ class AiImageGeneratorClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Image Generator response: {create_response}")
+        logger.info("AI Image Generator response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -245,6 +250,10 @@ class AiImageGeneratorClient:
         )
         ```
         """
+        check_capabilities(
+            "ai_image_generator",
+            {"model": model, "resolution": resolution, "image_count": image_count},
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
@@ -267,10 +276,11 @@ class AiImageGeneratorClient:
         )
 
 
-class AsyncAiImageGeneratorClient:
+class AsyncAiImageGeneratorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_generator")
     async def generate(
         self,
         *,
@@ -347,7 +357,7 @@ class AsyncAiImageGeneratorClient:
             resolution=resolution,
             request_options=request_options,
         )
-        logger.info(f"AI Image Generator response: {create_response}")
+        logger.info("AI Image Generator response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -486,6 +496,10 @@ class AsyncAiImageGeneratorClient:
         )
         ```
         """
+        check_capabilities(
+            "ai_image_generator",
+            {"model": model, "resolution": resolution, "image_count": image_count},
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
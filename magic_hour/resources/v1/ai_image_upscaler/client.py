@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiImageUpscalerClient:
+class AiImageUpscalerClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_upscaler")
     def generate(
         self,
         *,
@@ -82,7 +86,7 @@ class AiImageUpscalerClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Image Upscaler response: {create_response}")
+        logger.info("AI Image Upscaler response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -157,10 +161,11 @@ class AiImageUpscalerClient:
         )
 
 
-class AsyncAiImageUpscalerClient:
+class AsyncAiImageUpscalerClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_image_upscaler")
     async def generate(
         self,
         *,
@@ -219,7 +224,7 @@ class AsyncAiImageUpscalerClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Image Upscaler response: {create_response}")
+        logger.info("AI Image Upscaler response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
     ImageProjectsClient,
@@ -11,7 +15,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -19,10 +22,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiMemeGeneratorClient:
+class AiMemeGeneratorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_meme_generator")
     def generate(
         self,
         *,
@@ -70,7 +74,7 @@ class AiMemeGeneratorClient:
         create_response = self.create(
             style=style, name=name, request_options=request_options
         )
-        logger.info(f"AI Meme Generator response: {create_response}")
+        logger.info("AI Meme Generator response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -136,10 +140,11 @@ class AiMemeGeneratorClient:
         )
 
 
-class AsyncAiMemeGeneratorClient:
+class AsyncAiMemeGeneratorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_meme_generator")
     async def generate(
         self,
         *,
@@ -187,7 +192,7 @@ class AsyncAiMemeGeneratorClient:
         create_response = await self.create(
             style=style, name=name, request_options=request_options
         )
-        logger.info(f"AI Meme Generator response: {create_response}")
+        logger.info("AI Meme Generator response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
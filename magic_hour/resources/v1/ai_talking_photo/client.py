@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiTalkingPhotoClient:
+class AiTalkingPhotoClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_talking_photo")
     def generate(
         self,
         *,
@@ -97,7 +101,7 @@ class AiTalkingPhotoClient:
             style=style,
             request_options=request_options,
         )
-        logger.info(f"AI Talking Photo response: {create_response}")
+        logger.info("AI Talking Photo response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -184,10 +188,11 @@ class AiTalkingPhotoClient:
         )
 
 
-class AsyncAiTalkingPhotoClient:
+class AsyncAiTalkingPhotoClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_talking_photo")
     async def generate(
         self,
         *,
@@ -261,7 +266,7 @@ class AsyncAiTalkingPhotoClient:
             style=style,
             request_options=request_options,
         )
-        logger.info(f"AI Talking Photo response: {create_response}")
+        logger.info("AI Talking Photo response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
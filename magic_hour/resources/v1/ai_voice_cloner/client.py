@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.audio_projects.client import (
     AsyncAudioProjectsClient,
     AudioProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiVoiceClonerClient:
+class AiVoiceClonerClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_voice_cloner")
     def generate(
         self,
         *,
@@ -79,7 +83,7 @@ class AiVoiceClonerClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Voice Cloner response: {create_response}")
+        logger.info("AI Voice Cloner response: %s", create_response)
 
         audio_projects_client = AudioProjectsClient(base_client=self._base_client)
         response = audio_projects_client.check_result(
@@ -146,10 +150,11 @@ class AiVoiceClonerClient:
         )
 
 
-class AsyncAiVoiceClonerClient:
+class AsyncAiVoiceClonerClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_voice_cloner")
     async def generate(
         self,
         *,
@@ -205,7 +210,7 @@ class AsyncAiVoiceClonerClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Voice Cloner response: {create_response}")
+        logger.info("AI Voice Cloner response: %s", create_response)
 
         audio_projects_client = AsyncAudioProjectsClient(base_client=self._base_client)
         response = await audio_projects_client.check_result(
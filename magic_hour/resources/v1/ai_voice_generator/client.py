@@ -1,6 +1,17 @@
 import typing
 
+from magic_hour.helpers.batch import DEFAULT_MAX_CONCURRENCY, GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.long_form import (
+    DEFAULT_MAX_SHARD_CHARS,
+    Concatenator,
+    LongFormResult,
+    generate_long_form,
+    generate_long_form_async,
+)
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.audio_projects.client import (
     AsyncAudioProjectsClient,
     AudioProjectsClient,
@@ -11,7 +22,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -19,10 +29,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AiVoiceGeneratorClient:
+class AiVoiceGeneratorClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_voice_generator")
     def generate(
         self,
         *,
@@ -68,7 +79,7 @@ class AiVoiceGeneratorClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Voice Generator response: {create_response}")
+        logger.info("AI Voice Generator response: %s", create_response)
 
         audio_projects_client = AudioProjectsClient(base_client=self._base_client)
         response = audio_projects_client.check_result(
@@ -80,6 +91,66 @@ class AiVoiceGeneratorClient:
 
         return response
 
+    def generate_long_form(
+        self,
+        *,
+        style: params.V1AiVoiceGeneratorCreateBodyStyle,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_shard_chars: int = DEFAULT_MAX_SHARD_CHARS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        output_path: typing.Optional[str] = None,
+        download_directory: typing.Optional[str] = None,
+        concatenator: typing.Optional[Concatenator] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> LongFormResult:
+        """
+        Generate speech for a script of any length.
+
+        The prompt is split into shards of at most `max_shard_chars` characters, at
+        paragraph or sentence boundaries where possible. The shards render as
+        separate jobs, up to `max_concurrency` at a time, and their audio is
+        downloaded and stitched into one file. WAV and MP3 are joined natively;
+        for other formats pass a `concatenator(shard_paths, output_path)`.
+
+        Args:
+            style: The content used to generate speech, with the whole script as `prompt`.
+            name: The name of audio. Each shard's project is named "<name> (i/n)".
+            max_shard_chars: Most characters per shard
+            max_concurrency: Maximum number of shards in progress at once
+            output_path: Where to write the stitched audio. Defaults to `<download_directory>/<first project id>-long-form.<extension>`
+            download_directory: The directory of the default `output_path`, created if missing
+            concatenator: Joins the shard files, in order, into `output_path`
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            LongFormResult: The output path, plus the shard plan with each shard's project, credits and timings.
+
+        Raises:
+            LongFormError: If a shard fails or the shards can't be stitched; its `.result` lists every shard's project.
+
+        Examples:
+        ```py
+        result = client.v1.ai_voice_generator.generate_long_form(
+            style={"prompt": open("chapter-1.txt").read(), "voice_name": "Morgan Freeman"},
+            download_directory="audiobook",
+        )
+        print(result.output_path, [s.seconds for s in result.shards])
+        ```
+        """
+        return generate_long_form(
+            self.generate,
+            style=style,
+            name=name,
+            max_shard_chars=max_shard_chars,
+            max_concurrency=max_concurrency,
+            output_path=output_path,
+            download_directory=download_directory,
+            concatenator=concatenator,
+            request_options=request_options,
+        )
+
     def create(
         self,
         *,
@@ -130,10 +201,11 @@ class AiVoiceGeneratorClient:
         )
 
 
-class AsyncAiVoiceGeneratorClient:
+class AsyncAiVoiceGeneratorClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("ai_voice_generator")
     async def generate(
         self,
         *,
@@ -179,7 +251,7 @@ class AsyncAiVoiceGeneratorClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"AI Voice Generator response: {create_response}")
+        logger.info("AI Voice Generator response: %s", create_response)
 
         audio_projects_client = AsyncAudioProjectsClient(base_client=self._base_client)
         response = await audio_projects_client.check_result(
@@ -191,6 +263,66 @@ class AsyncAiVoiceGeneratorClient:
 
         return response
 
+    async def generate_long_form(
+        self,
+        *,
+        style: params.V1AiVoiceGeneratorCreateBodyStyle,
+        name: typing.Union[
+            typing.Optional[str], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        max_shard_chars: int = DEFAULT_MAX_SHARD_CHARS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        output_path: typing.Optional[str] = None,
+        download_directory: typing.Optional[str] = None,
+        concatenator: typing.Optional[Concatenator] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> LongFormResult:
+        """
+        Generate speech for a script of any length.
+
+        The prompt is split into shards of at most `max_shard_chars` characters, at
+        paragraph or sentence boundaries where possible. The shards render as
+        separate jobs, up to `max_concurrency` at a time, and their audio is
+        downloaded and stitched into one file. WAV and MP3 are joined natively;
+        for other formats pass a `concatenator(shard_paths, output_path)`.
+
+        Args:
+            style: The content used to generate speech, with the whole script as `prompt`.
+            name: The name of audio. Each shard's project is named "<name> (i/n)".
+            max_shard_chars: Most characters per shard
+            max_concurrency: Maximum number of shards in progress at once
+            output_path: Where to write the stitched audio. Defaults to `<download_directory>/<first project id>-long-form.<extension>`
+            download_directory: The directory of the default `output_path`, created if missing
+            concatenator: Joins the shard files, in order, into `output_path`
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            LongFormResult: The output path, plus the shard plan with each shard's project, credits and timings.
+
+        Raises:
+            LongFormError: If a shard fails or the shards can't be stitched; its `.result` lists every shard's project.
+
+        Examples:
+        ```py
+        result = await client.v1.ai_voice_generator.generate_long_form(
+            style={"prompt": open("chapter-1.txt").read(), "voice_name": "Morgan Freeman"},
+            download_directory="audiobook",
+        )
+        print(result.output_path, [s.seconds for s in result.shards])
+        ```
+        """
+        return await generate_long_form_async(
+            self.generate,
+            style=style,
+            name=name,
+            max_shard_chars=max_shard_chars,
+            max_concurrency=max_concurrency,
+            output_path=output_path,
+            download_directory=download_directory,
+            concatenator=concatenator,
+            request_options=request_options,
+        )
+
     async def create(
         self,
         *,
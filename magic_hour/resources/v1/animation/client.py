@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AnimationClient:
+class AnimationClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("animation")
     def generate(
         self,
         *,
@@ -114,7 +118,7 @@ class AnimationClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Animation response: {create_response}")
+        logger.info("Animation response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -209,10 +213,11 @@ class AnimationClient:
         )
 
 
-class AsyncAnimationClient:
+class AsyncAnimationClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("animation")
     async def generate(
         self,
         *,
@@ -307,7 +312,7 @@ class AsyncAnimationClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Animation response: {create_response}")
+        logger.info("Animation response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
@@ -334,7 +334,10 @@ async def test_async_check_result_wait_until_complete(
         DummyResponse(status="complete"),
     ]
 
-    monkeypatch.setattr("time.sleep", lambda _: None)  # type: ignore
+    async def async_mock_sleep(_: float) -> None:
+        pass
+
+    monkeypatch.setattr("asyncio.sleep", async_mock_sleep)
 
     resp = await client.check_result(
         id="xyz", wait_for_completion=True, download_outputs=False
@@ -434,13 +437,13 @@ async def test_async_check_result_poll_interval_default(
         DummyResponse(status="complete"),
     ]
 
-    # Mock time.sleep to track calls
+    # Mock asyncio.sleep to track calls
     sleep_calls: List[float] = []
 
-    def mock_sleep(seconds: float) -> None:
+    async def async_mock_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("time.sleep", mock_sleep)
+    monkeypatch.setattr("asyncio.sleep", async_mock_sleep)
 
     resp = await client.check_result(
         id="xyz", wait_for_completion=True, download_outputs=False
@@ -467,13 +470,13 @@ async def test_async_check_result_poll_interval_custom(
         DummyResponse(status="complete"),
     ]
 
-    # Mock time.sleep to track calls
+    # Mock asyncio.sleep to track calls
     sleep_calls: List[float] = []
 
-    def mock_sleep(seconds: float) -> None:
+    async def async_mock_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("time.sleep", mock_sleep)
+    monkeypatch.setattr("asyncio.sleep", async_mock_sleep)
 
     resp = await client.check_result(
         id="xyz", wait_for_completion=True, download_outputs=False
@@ -502,13 +505,13 @@ async def test_async_check_result_poll_interval_multiple_polls(
         DummyResponse(status="complete"),
     ]
 
-    # Mock time.sleep to track calls
+    # Mock asyncio.sleep to track calls
     sleep_calls: List[float] = []
 
-    def mock_sleep(seconds: float) -> None:
+    async def async_mock_sleep(seconds: float) -> None:
         sleep_calls.append(seconds)
 
-    monkeypatch.setattr("time.sleep", mock_sleep)
+    monkeypatch.setattr("asyncio.sleep", async_mock_sleep)
 
     resp = await client.check_result(
         id="xyz", wait_for_completion=True, download_outputs=False
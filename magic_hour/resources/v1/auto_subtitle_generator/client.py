@@ -1,6 +1,14 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.segments import (
+    AsyncSegmentedGenerateMixin,
+    SegmentedGenerateMixin,
+)
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -12,7 +20,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +27,13 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class AutoSubtitleGeneratorClient:
+class AutoSubtitleGeneratorClient(
+    GenerateManyMixin, SegmentedGenerateMixin, SweepMixin
+):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("auto_subtitle_generator")
     def generate(
         self,
         *,
@@ -96,7 +106,7 @@ class AutoSubtitleGeneratorClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Auto Subtitle Generator response: {create_response}")
+        logger.info("Auto Subtitle Generator response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -183,10 +193,11 @@ class AutoSubtitleGeneratorClient:
         )
 
 
-class AsyncAutoSubtitleGeneratorClient:
+class AsyncAutoSubtitleGeneratorClient(AsyncSegmentedGenerateMixin, AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("auto_subtitle_generator")
     async def generate(
         self,
         *,
@@ -259,7 +270,7 @@ class AsyncAutoSubtitleGeneratorClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Auto Subtitle Generator response: {create_response}")
+        logger.info("Auto Subtitle Generator response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
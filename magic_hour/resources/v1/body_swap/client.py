@@ -1,7 +1,11 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -13,17 +17,17 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
 logger = get_sdk_logger(__name__)
 
 
-class BodySwapClient:
+class BodySwapClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("body_swap")
     def generate(
         self,
         *,
@@ -83,7 +87,7 @@ class BodySwapClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Body Swap response: {create_response}")
+        logger.info("Body Swap response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -151,10 +155,11 @@ class BodySwapClient:
         )
 
 
-class AsyncBodySwapClient:
+class AsyncBodySwapClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("body_swap")
     async def generate(
         self,
         *,
@@ -208,9 +213,7 @@ class AsyncBodySwapClient:
         assets["person_file_path"] = await file_client.upload_file(
             file=person_file_path
         )
-        assets["scene_file_path"] = await file_client.upload_file(
-            file=scene_file_path
-        )
+        assets["scene_file_path"] = await file_client.upload_file(file=scene_file_path)
 
         create_response = await self.create(
             assets=assets,
@@ -218,7 +221,7 @@ class AsyncBodySwapClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Body Swap response: {create_response}")
+        logger.info("Body Swap response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -1,195 +1,493 @@
-from magic_hour.resources.v1.ai_clothes_changer import (
-    AiClothesChangerClient,
-    AsyncAiClothesChangerClient,
-)
-from magic_hour.resources.v1.ai_face_editor import (
-    AiFaceEditorClient,
-    AsyncAiFaceEditorClient,
-)
-from magic_hour.resources.v1.ai_gif_generator import (
-    AiGifGeneratorClient,
-    AsyncAiGifGeneratorClient,
-)
-from magic_hour.resources.v1.ai_headshot_generator import (
-    AiHeadshotGeneratorClient,
-    AsyncAiHeadshotGeneratorClient,
-)
-from magic_hour.resources.v1.ai_image_editor import (
-    AiImageEditorClient,
-    AsyncAiImageEditorClient,
-)
-from magic_hour.resources.v1.ai_image_generator import (
-    AiImageGeneratorClient,
-    AsyncAiImageGeneratorClient,
-)
-from magic_hour.resources.v1.ai_image_upscaler import (
-    AiImageUpscalerClient,
-    AsyncAiImageUpscalerClient,
-)
-from magic_hour.resources.v1.ai_meme_generator import (
-    AiMemeGeneratorClient,
-    AsyncAiMemeGeneratorClient,
-)
-from magic_hour.resources.v1.ai_qr_code_generator import (
-    AiQrCodeGeneratorClient,
-    AsyncAiQrCodeGeneratorClient,
-)
-from magic_hour.resources.v1.ai_talking_photo import (
-    AiTalkingPhotoClient,
-    AsyncAiTalkingPhotoClient,
-)
-from magic_hour.resources.v1.ai_voice_cloner import (
-    AiVoiceClonerClient,
-    AsyncAiVoiceClonerClient,
-)
-from magic_hour.resources.v1.ai_voice_generator import (
-    AiVoiceGeneratorClient,
-    AsyncAiVoiceGeneratorClient,
-)
-from magic_hour.resources.v1.animation import AnimationClient, AsyncAnimationClient
-from magic_hour.resources.v1.audio_projects import (
-    AsyncAudioProjectsClient,
-    AudioProjectsClient,
-)
-from magic_hour.resources.v1.auto_subtitle_generator import (
-    AsyncAutoSubtitleGeneratorClient,
-    AutoSubtitleGeneratorClient,
-)
-from magic_hour.resources.v1.body_swap import AsyncBodySwapClient, BodySwapClient
-from magic_hour.resources.v1.face_detection import (
-    AsyncFaceDetectionClient,
-    FaceDetectionClient,
-)
-from magic_hour.resources.v1.face_swap import AsyncFaceSwapClient, FaceSwapClient
-from magic_hour.resources.v1.face_swap_photo import (
-    AsyncFaceSwapPhotoClient,
-    FaceSwapPhotoClient,
-)
-from magic_hour.resources.v1.files import AsyncFilesClient, FilesClient
-from magic_hour.resources.v1.head_swap import AsyncHeadSwapClient, HeadSwapClient
-from magic_hour.resources.v1.image_background_remover import (
-    AsyncImageBackgroundRemoverClient,
-    ImageBackgroundRemoverClient,
-)
-from magic_hour.resources.v1.image_projects import (
-    AsyncImageProjectsClient,
-    ImageProjectsClient,
-)
-from magic_hour.resources.v1.image_to_video import (
-    AsyncImageToVideoClient,
-    ImageToVideoClient,
-)
-from magic_hour.resources.v1.lip_sync import AsyncLipSyncClient, LipSyncClient
-from magic_hour.resources.v1.photo_colorizer import (
-    AsyncPhotoColorizerClient,
-    PhotoColorizerClient,
-)
-from magic_hour.resources.v1.text_to_video import (
-    AsyncTextToVideoClient,
-    TextToVideoClient,
-)
-from magic_hour.resources.v1.video_projects import (
-    AsyncVideoProjectsClient,
-    VideoProjectsClient,
-)
-from magic_hour.resources.v1.video_to_video import (
-    AsyncVideoToVideoClient,
-    VideoToVideoClient,
-)
+import functools
+import typing
+
 from make_api_request import AsyncBaseClient, SyncBaseClient
 
 
+if typing.TYPE_CHECKING:
+    from magic_hour.resources.v1.ai_clothes_changer import (
+        AiClothesChangerClient,
+        AsyncAiClothesChangerClient,
+    )
+    from magic_hour.resources.v1.ai_face_editor import (
+        AiFaceEditorClient,
+        AsyncAiFaceEditorClient,
+    )
+    from magic_hour.resources.v1.ai_gif_generator import (
+        AiGifGeneratorClient,
+        AsyncAiGifGeneratorClient,
+    )
+    from magic_hour.resources.v1.ai_headshot_generator import (
+        AiHeadshotGeneratorClient,
+        AsyncAiHeadshotGeneratorClient,
+    )
+    from magic_hour.resources.v1.ai_image_editor import (
+        AiImageEditorClient,
+        AsyncAiImageEditorClient,
+    )
+    from magic_hour.resources.v1.ai_image_generator import (
+        AiImageGeneratorClient,
+        AsyncAiImageGeneratorClient,
+    )
+    from magic_hour.resources.v1.ai_image_upscaler import (
+        AiImageUpscalerClient,
+        AsyncAiImageUpscalerClient,
+    )
+    from magic_hour.resources.v1.ai_meme_generator import (
+        AiMemeGeneratorClient,
+        AsyncAiMemeGeneratorClient,
+    )
+    from magic_hour.resources.v1.ai_qr_code_generator import (
+        AiQrCodeGeneratorClient,
+        AsyncAiQrCodeGeneratorClient,
+    )
+    from magic_hour.resources.v1.ai_talking_photo import (
+        AiTalkingPhotoClient,
+        AsyncAiTalkingPhotoClient,
+    )
+    from magic_hour.resources.v1.ai_voice_cloner import (
+        AiVoiceClonerClient,
+        AsyncAiVoiceClonerClient,
+    )
+    from magic_hour.resources.v1.ai_voice_generator import (
+        AiVoiceGeneratorClient,
+        AsyncAiVoiceGeneratorClient,
+    )
+    from magic_hour.resources.v1.animation import AnimationClient, AsyncAnimationClient
+    from magic_hour.resources.v1.audio_projects import (
+        AsyncAudioProjectsClient,
+        AudioProjectsClient,
+    )
+    from magic_hour.resources.v1.auto_subtitle_generator import (
+        AsyncAutoSubtitleGeneratorClient,
+        AutoSubtitleGeneratorClient,
+    )
+    from magic_hour.resources.v1.body_swap import AsyncBodySwapClient, BodySwapClient
+    from magic_hour.resources.v1.face_detection import (
+        AsyncFaceDetectionClient,
+        FaceDetectionClient,
+    )
+    from magic_hour.resources.v1.face_swap import AsyncFaceSwapClient, FaceSwapClient
+    from magic_hour.resources.v1.face_swap_photo import (
+        AsyncFaceSwapPhotoClient,
+        FaceSwapPhotoClient,
+    )
+    from magic_hour.resources.v1.files import AsyncFilesClient, FilesClient
+    from magic_hour.resources.v1.head_swap import AsyncHeadSwapClient, HeadSwapClient
+    from magic_hour.resources.v1.image_background_remover import (
+        AsyncImageBackgroundRemoverClient,
+        ImageBackgroundRemoverClient,
+    )
+    from magic_hour.resources.v1.image_projects import (
+        AsyncImageProjectsClient,
+        ImageProjectsClient,
+    )
+    from magic_hour.resources.v1.image_to_video import (
+        AsyncImageToVideoClient,
+        ImageToVideoClient,
+    )
+    from magic_hour.resources.v1.lip_sync import AsyncLipSyncClient, LipSyncClient
+    from magic_hour.resources.v1.photo_colorizer import (
+        AsyncPhotoColorizerClient,
+        PhotoColorizerClient,
+    )
+    from magic_hour.resources.v1.text_to_video import (
+        AsyncTextToVideoClient,
+        TextToVideoClient,
+    )
+    from magic_hour.resources.v1.video_projects import (
+        AsyncVideoProjectsClient,
+        VideoProjectsClient,
+    )
+    from magic_hour.resources.v1.video_to_video import (
+        AsyncVideoToVideoClient,
+        VideoToVideoClient,
+    )
+
+
 class V1Client:
+    """
+    Resource clients are created (and their modules imported) the first time they
+    are accessed, so constructing a client only pays for the endpoints it uses.
+    """
+
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
-        self.image_projects = ImageProjectsClient(base_client=self._base_client)
-        self.video_projects = VideoProjectsClient(base_client=self._base_client)
-        self.face_detection = FaceDetectionClient(base_client=self._base_client)
-        self.ai_clothes_changer = AiClothesChangerClient(base_client=self._base_client)
-        self.ai_face_editor = AiFaceEditorClient(base_client=self._base_client)
-        self.ai_gif_generator = AiGifGeneratorClient(base_client=self._base_client)
-        self.ai_headshot_generator = AiHeadshotGeneratorClient(
-            base_client=self._base_client
-        )
-        self.ai_image_editor = AiImageEditorClient(base_client=self._base_client)
-        self.ai_image_generator = AiImageGeneratorClient(base_client=self._base_client)
-        self.ai_image_upscaler = AiImageUpscalerClient(base_client=self._base_client)
-        self.ai_meme_generator = AiMemeGeneratorClient(base_client=self._base_client)
 
-        self.ai_qr_code_generator = AiQrCodeGeneratorClient(
-            base_client=self._base_client
+    @functools.cached_property
+    def image_projects(self) -> "ImageProjectsClient":
+        from magic_hour.resources.v1.image_projects import ImageProjectsClient
+
+        return ImageProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def video_projects(self) -> "VideoProjectsClient":
+        from magic_hour.resources.v1.video_projects import VideoProjectsClient
+
+        return VideoProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_detection(self) -> "FaceDetectionClient":
+        from magic_hour.resources.v1.face_detection import FaceDetectionClient
+
+        return FaceDetectionClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_clothes_changer(self) -> "AiClothesChangerClient":
+        from magic_hour.resources.v1.ai_clothes_changer import AiClothesChangerClient
+
+        return AiClothesChangerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_face_editor(self) -> "AiFaceEditorClient":
+        from magic_hour.resources.v1.ai_face_editor import AiFaceEditorClient
+
+        return AiFaceEditorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_gif_generator(self) -> "AiGifGeneratorClient":
+        from magic_hour.resources.v1.ai_gif_generator import AiGifGeneratorClient
+
+        return AiGifGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_headshot_generator(self) -> "AiHeadshotGeneratorClient":
+        from magic_hour.resources.v1.ai_headshot_generator import (
+            AiHeadshotGeneratorClient,
         )
-        self.ai_talking_photo = AiTalkingPhotoClient(base_client=self._base_client)
-        self.animation = AnimationClient(base_client=self._base_client)
-        self.auto_subtitle_generator = AutoSubtitleGeneratorClient(
-            base_client=self._base_client
+
+        return AiHeadshotGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_editor(self) -> "AiImageEditorClient":
+        from magic_hour.resources.v1.ai_image_editor import AiImageEditorClient
+
+        return AiImageEditorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_generator(self) -> "AiImageGeneratorClient":
+        from magic_hour.resources.v1.ai_image_generator import AiImageGeneratorClient
+
+        return AiImageGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_upscaler(self) -> "AiImageUpscalerClient":
+        from magic_hour.resources.v1.ai_image_upscaler import AiImageUpscalerClient
+
+        return AiImageUpscalerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_meme_generator(self) -> "AiMemeGeneratorClient":
+        from magic_hour.resources.v1.ai_meme_generator import AiMemeGeneratorClient
+
+        return AiMemeGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_qr_code_generator(self) -> "AiQrCodeGeneratorClient":
+        from magic_hour.resources.v1.ai_qr_code_generator import AiQrCodeGeneratorClient
+
+        return AiQrCodeGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_talking_photo(self) -> "AiTalkingPhotoClient":
+        from magic_hour.resources.v1.ai_talking_photo import AiTalkingPhotoClient
+
+        return AiTalkingPhotoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def animation(self) -> "AnimationClient":
+        from magic_hour.resources.v1.animation import AnimationClient
+
+        return AnimationClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def auto_subtitle_generator(self) -> "AutoSubtitleGeneratorClient":
+        from magic_hour.resources.v1.auto_subtitle_generator import (
+            AutoSubtitleGeneratorClient,
         )
-        self.face_swap = FaceSwapClient(base_client=self._base_client)
-        self.face_swap_photo = FaceSwapPhotoClient(base_client=self._base_client)
-        self.files = FilesClient(base_client=self._base_client)
-        self.image_background_remover = ImageBackgroundRemoverClient(
-            base_client=self._base_client
+
+        return AutoSubtitleGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_swap(self) -> "FaceSwapClient":
+        from magic_hour.resources.v1.face_swap import FaceSwapClient
+
+        return FaceSwapClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_swap_photo(self) -> "FaceSwapPhotoClient":
+        from magic_hour.resources.v1.face_swap_photo import FaceSwapPhotoClient
+
+        return FaceSwapPhotoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "FilesClient":
+        from magic_hour.resources.v1.files import FilesClient
+
+        return FilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def image_background_remover(self) -> "ImageBackgroundRemoverClient":
+        from magic_hour.resources.v1.image_background_remover import (
+            ImageBackgroundRemoverClient,
         )
-        self.image_to_video = ImageToVideoClient(base_client=self._base_client)
-        self.lip_sync = LipSyncClient(base_client=self._base_client)
-        self.photo_colorizer = PhotoColorizerClient(base_client=self._base_client)
-        self.text_to_video = TextToVideoClient(base_client=self._base_client)
-        self.video_to_video = VideoToVideoClient(base_client=self._base_client)
-        self.audio_projects = AudioProjectsClient(base_client=self._base_client)
-        self.ai_voice_generator = AiVoiceGeneratorClient(base_client=self._base_client)
-        self.ai_voice_cloner = AiVoiceClonerClient(base_client=self._base_client)
-        self.head_swap = HeadSwapClient(base_client=self._base_client)
-        self.body_swap = BodySwapClient(base_client=self._base_client)
+
+        return ImageBackgroundRemoverClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def image_to_video(self) -> "ImageToVideoClient":
+        from magic_hour.resources.v1.image_to_video import ImageToVideoClient
+
+        return ImageToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def lip_sync(self) -> "LipSyncClient":
+        from magic_hour.resources.v1.lip_sync import LipSyncClient
+
+        return LipSyncClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def photo_colorizer(self) -> "PhotoColorizerClient":
+        from magic_hour.resources.v1.photo_colorizer import PhotoColorizerClient
+
+        return PhotoColorizerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def text_to_video(self) -> "TextToVideoClient":
+        from magic_hour.resources.v1.text_to_video import TextToVideoClient
+
+        return TextToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def video_to_video(self) -> "VideoToVideoClient":
+        from magic_hour.resources.v1.video_to_video import VideoToVideoClient
+
+        return VideoToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def audio_projects(self) -> "AudioProjectsClient":
+        from magic_hour.resources.v1.audio_projects import AudioProjectsClient
+
+        return AudioProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_voice_generator(self) -> "AiVoiceGeneratorClient":
+        from magic_hour.resources.v1.ai_voice_generator import AiVoiceGeneratorClient
+
+        return AiVoiceGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_voice_cloner(self) -> "AiVoiceClonerClient":
+        from magic_hour.resources.v1.ai_voice_cloner import AiVoiceClonerClient
+
+        return AiVoiceClonerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def head_swap(self) -> "HeadSwapClient":
+        from magic_hour.resources.v1.head_swap import HeadSwapClient
+
+        return HeadSwapClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def body_swap(self) -> "BodySwapClient":
+        from magic_hour.resources.v1.body_swap import BodySwapClient
+
+        return BodySwapClient(base_client=self._base_client)
 
 
 class AsyncV1Client:
+    """
+    Resource clients are created (and their modules imported) the first time they
+    are accessed, so constructing a client only pays for the endpoints it uses.
+    """
+
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
-        self.image_projects = AsyncImageProjectsClient(base_client=self._base_client)
-        self.video_projects = AsyncVideoProjectsClient(base_client=self._base_client)
-        self.face_detection = AsyncFaceDetectionClient(base_client=self._base_client)
-        self.ai_clothes_changer = AsyncAiClothesChangerClient(
-            base_client=self._base_client
-        )
-        self.ai_face_editor = AsyncAiFaceEditorClient(base_client=self._base_client)
-        self.ai_gif_generator = AsyncAiGifGeneratorClient(base_client=self._base_client)
-        self.ai_headshot_generator = AsyncAiHeadshotGeneratorClient(
-            base_client=self._base_client
-        )
-        self.ai_image_editor = AsyncAiImageEditorClient(base_client=self._base_client)
-        self.ai_image_generator = AsyncAiImageGeneratorClient(
-            base_client=self._base_client
+
+    @functools.cached_property
+    def image_projects(self) -> "AsyncImageProjectsClient":
+        from magic_hour.resources.v1.image_projects import AsyncImageProjectsClient
+
+        return AsyncImageProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def video_projects(self) -> "AsyncVideoProjectsClient":
+        from magic_hour.resources.v1.video_projects import AsyncVideoProjectsClient
+
+        return AsyncVideoProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_detection(self) -> "AsyncFaceDetectionClient":
+        from magic_hour.resources.v1.face_detection import AsyncFaceDetectionClient
+
+        return AsyncFaceDetectionClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_clothes_changer(self) -> "AsyncAiClothesChangerClient":
+        from magic_hour.resources.v1.ai_clothes_changer import (
+            AsyncAiClothesChangerClient,
         )
-        self.ai_image_upscaler = AsyncAiImageUpscalerClient(
-            base_client=self._base_client
+
+        return AsyncAiClothesChangerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_face_editor(self) -> "AsyncAiFaceEditorClient":
+        from magic_hour.resources.v1.ai_face_editor import AsyncAiFaceEditorClient
+
+        return AsyncAiFaceEditorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_gif_generator(self) -> "AsyncAiGifGeneratorClient":
+        from magic_hour.resources.v1.ai_gif_generator import AsyncAiGifGeneratorClient
+
+        return AsyncAiGifGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_headshot_generator(self) -> "AsyncAiHeadshotGeneratorClient":
+        from magic_hour.resources.v1.ai_headshot_generator import (
+            AsyncAiHeadshotGeneratorClient,
         )
-        self.ai_meme_generator = AsyncAiMemeGeneratorClient(
-            base_client=self._base_client
+
+        return AsyncAiHeadshotGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_editor(self) -> "AsyncAiImageEditorClient":
+        from magic_hour.resources.v1.ai_image_editor import AsyncAiImageEditorClient
+
+        return AsyncAiImageEditorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_generator(self) -> "AsyncAiImageGeneratorClient":
+        from magic_hour.resources.v1.ai_image_generator import (
+            AsyncAiImageGeneratorClient,
         )
 
-        self.ai_qr_code_generator = AsyncAiQrCodeGeneratorClient(
-            base_client=self._base_client
+        return AsyncAiImageGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_image_upscaler(self) -> "AsyncAiImageUpscalerClient":
+        from magic_hour.resources.v1.ai_image_upscaler import AsyncAiImageUpscalerClient
+
+        return AsyncAiImageUpscalerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_meme_generator(self) -> "AsyncAiMemeGeneratorClient":
+        from magic_hour.resources.v1.ai_meme_generator import AsyncAiMemeGeneratorClient
+
+        return AsyncAiMemeGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_qr_code_generator(self) -> "AsyncAiQrCodeGeneratorClient":
+        from magic_hour.resources.v1.ai_qr_code_generator import (
+            AsyncAiQrCodeGeneratorClient,
         )
-        self.ai_talking_photo = AsyncAiTalkingPhotoClient(base_client=self._base_client)
-        self.animation = AsyncAnimationClient(base_client=self._base_client)
-        self.auto_subtitle_generator = AsyncAutoSubtitleGeneratorClient(
-            base_client=self._base_client
+
+        return AsyncAiQrCodeGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_talking_photo(self) -> "AsyncAiTalkingPhotoClient":
+        from magic_hour.resources.v1.ai_talking_photo import AsyncAiTalkingPhotoClient
+
+        return AsyncAiTalkingPhotoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def animation(self) -> "AsyncAnimationClient":
+        from magic_hour.resources.v1.animation import AsyncAnimationClient
+
+        return AsyncAnimationClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def auto_subtitle_generator(self) -> "AsyncAutoSubtitleGeneratorClient":
+        from magic_hour.resources.v1.auto_subtitle_generator import (
+            AsyncAutoSubtitleGeneratorClient,
         )
-        self.face_swap = AsyncFaceSwapClient(base_client=self._base_client)
-        self.face_swap_photo = AsyncFaceSwapPhotoClient(base_client=self._base_client)
-        self.files = AsyncFilesClient(base_client=self._base_client)
-        self.image_background_remover = AsyncImageBackgroundRemoverClient(
-            base_client=self._base_client
+
+        return AsyncAutoSubtitleGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_swap(self) -> "AsyncFaceSwapClient":
+        from magic_hour.resources.v1.face_swap import AsyncFaceSwapClient
+
+        return AsyncFaceSwapClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def face_swap_photo(self) -> "AsyncFaceSwapPhotoClient":
+        from magic_hour.resources.v1.face_swap_photo import AsyncFaceSwapPhotoClient
+
+        return AsyncFaceSwapPhotoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def files(self) -> "AsyncFilesClient":
+        from magic_hour.resources.v1.files import AsyncFilesClient
+
+        return AsyncFilesClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def image_background_remover(self) -> "AsyncImageBackgroundRemoverClient":
+        from magic_hour.resources.v1.image_background_remover import (
+            AsyncImageBackgroundRemoverClient,
         )
-        self.image_to_video = AsyncImageToVideoClient(base_client=self._base_client)
-        self.lip_sync = AsyncLipSyncClient(base_client=self._base_client)
-        self.photo_colorizer = AsyncPhotoColorizerClient(base_client=self._base_client)
-        self.text_to_video = AsyncTextToVideoClient(base_client=self._base_client)
-        self.video_to_video = AsyncVideoToVideoClient(base_client=self._base_client)
-        self.audio_projects = AsyncAudioProjectsClient(base_client=self._base_client)
-        self.ai_voice_generator = AsyncAiVoiceGeneratorClient(
-            base_client=self._base_client
+
+        return AsyncImageBackgroundRemoverClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def image_to_video(self) -> "AsyncImageToVideoClient":
+        from magic_hour.resources.v1.image_to_video import AsyncImageToVideoClient
+
+        return AsyncImageToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def lip_sync(self) -> "AsyncLipSyncClient":
+        from magic_hour.resources.v1.lip_sync import AsyncLipSyncClient
+
+        return AsyncLipSyncClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def photo_colorizer(self) -> "AsyncPhotoColorizerClient":
+        from magic_hour.resources.v1.photo_colorizer import AsyncPhotoColorizerClient
+
+        return AsyncPhotoColorizerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def text_to_video(self) -> "AsyncTextToVideoClient":
+        from magic_hour.resources.v1.text_to_video import AsyncTextToVideoClient
+
+        return AsyncTextToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def video_to_video(self) -> "AsyncVideoToVideoClient":
+        from magic_hour.resources.v1.video_to_video import AsyncVideoToVideoClient
+
+        return AsyncVideoToVideoClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def audio_projects(self) -> "AsyncAudioProjectsClient":
+        from magic_hour.resources.v1.audio_projects import AsyncAudioProjectsClient
+
+        return AsyncAudioProjectsClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_voice_generator(self) -> "AsyncAiVoiceGeneratorClient":
+        from magic_hour.resources.v1.ai_voice_generator import (
+            AsyncAiVoiceGeneratorClient,
         )
-        self.ai_voice_cloner = AsyncAiVoiceClonerClient(base_client=self._base_client)
-        self.head_swap = AsyncHeadSwapClient(base_client=self._base_client)
-        self.body_swap = AsyncBodySwapClient(base_client=self._base_client)
+
+        return AsyncAiVoiceGeneratorClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def ai_voice_cloner(self) -> "AsyncAiVoiceClonerClient":
+        from magic_hour.resources.v1.ai_voice_cloner import AsyncAiVoiceClonerClient
+
+        return AsyncAiVoiceClonerClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def head_swap(self) -> "AsyncHeadSwapClient":
+        from magic_hour.resources.v1.head_swap import AsyncHeadSwapClient
+
+        return AsyncHeadSwapClient(base_client=self._base_client)
+
+    @functools.cached_property
+    def body_swap(self) -> "AsyncBodySwapClient":
+        from magic_hour.resources.v1.body_swap import AsyncBodySwapClient
+
+        return AsyncBodySwapClient(base_client=self._base_client)
@@ -1,11 +1,24 @@
 import asyncio
+import httpx
 import os
 import pydantic
 import time
 import typing
 
 from magic_hour.helpers.download import download_files_async, download_files_sync
+from magic_hour.helpers.batch import GenerateManyMixin
+from magic_hour.helpers.face_cache import (
+    build_face_mappings,
+    detection_cache_key,
+    detection_cache_key_async,
+    get_face_detection_cache,
+)
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.timing import JobTimings, current_job
+from magic_hour.helpers.tracing import WAIT, get_tracer, traced_generate
+from magic_hour.helpers.transfer import get_transfer_client
 from magic_hour.resources.v1.files import AsyncFilesClient, FilesClient
 from magic_hour.types import models, params
 from make_api_request import (
@@ -13,7 +26,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -31,11 +43,19 @@ class V1FaceDetectionGetResponseWithDownloads(models.V1FaceDetectionGetResponse)
     This field is only populated if `download_outputs` is True and the face detection is complete.
     """
 
+    timings: typing.Optional[JobTimings] = pydantic.Field(default=None, alias="timings")
+    """
+    Where the time went (uploads, create, queued, rendering, downloads).
+
+    This field is only populated on results returned by `generate()`.
+    """
+
 
-class FaceDetectionClient:
+class FaceDetectionClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_detection")
     def generate(
         self,
         *,
@@ -67,6 +87,24 @@ class FaceDetectionClient:
             V1FaceDetectionGetResponseWithDownloads: The face detection response with optional
                 downloaded face image paths included
         """
+        cache, cache_key = detection_cache_key(
+            self._base_client,
+            assets["target_file_path"],
+            confidence_score,
+            request_options,
+        )
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return self._download_faces(
+                        cached, download_outputs, download_directory, cache_key
+                    )
+                except httpx.HTTPError as e:
+                    # the cached face crop URLs may have expired
+                    logger.info("Detecting faces again: cached crops failed: %r", e)
+                    cache.discard(cache_key)
+
         # Handle file upload if needed
         file_client = FilesClient(base_client=self._base_client)
         target_file_path = assets["target_file_path"]
@@ -81,23 +119,69 @@ class FaceDetectionClient:
         task_id = create_response.id
 
         api_response = self.get(id=task_id)
+        job = current_job()
+        if job is not None:
+            job.record_status(api_response.status)
         if not wait_for_completion:
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
         poll_interval = float(os.getenv("MAGIC_HOUR_POLL_INTERVAL", "0.5"))
 
-        while api_response.status not in ["complete", "error"]:
-            api_response = self.get(id=task_id)
-            time.sleep(poll_interval)
+        tracer = get_tracer(self._base_client)
+        with tracer.span(
+            WAIT,
+            {
+                "magic_hour.project_id": task_id,
+                "magic_hour.project_kind": "face_detection",
+            },
+        ) as span:
+            span.add_event("status", {"status": api_response.status})
+            polls = 0
+            while api_response.status not in ["complete", "error"]:
+                previous = api_response.status
+                api_response = self.get(id=task_id)
+                polls += 1
+                if job is not None:
+                    job.record_status(api_response.status)
+                if api_response.status != previous:
+                    span.add_event("status", {"status": api_response.status})
+                time.sleep(poll_interval)
+            span.set_attributes(
+                {
+                    "magic_hour.poll_count": polls,
+                    "magic_hour.project_status": api_response.status,
+                }
+            )
 
         if api_response.status != "complete":
             log = logger.error if api_response.status == "error" else logger.info
-            log(f"Face detection {task_id} has status {api_response.status}")
+            log("Face detection %s has status %s", task_id, api_response.status)
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, api_response)
+        return self._download_faces(
+            api_response, download_outputs, download_directory, cache_key
+        )
+
+    def _download_faces(
+        self,
+        api_response: models.V1FaceDetectionGetResponse,
+        download_outputs: bool,
+        download_directory: typing.Optional[str],
+        cache_key: typing.Optional[str],
+    ) -> V1FaceDetectionGetResponseWithDownloads:
         if not download_outputs or not api_response.faces:
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
+        cache = get_face_detection_cache(self._base_client)
+        if cache is not None and cache_key is not None:
+            downloaded_paths = cache.downloaded_paths(cache_key, download_directory)
+            if downloaded_paths is not None:
+                return V1FaceDetectionGetResponseWithDownloads(
+                    **api_response.model_dump(), downloaded_paths=downloaded_paths
+                )
+
         face_downloads = [
             models.V1ImageProjectsGetResponseDownloadsItem(
                 url=face.url,
@@ -108,12 +192,71 @@ class FaceDetectionClient:
         downloaded_paths = download_files_sync(
             downloads=face_downloads,
             download_directory=download_directory,
+            tracer=get_tracer(self._base_client),
+            transfer_client=get_transfer_client(self._base_client),
         )
+        if cache is not None and cache_key is not None:
+            cache.record_downloads(cache_key, download_directory, downloaded_paths)
 
         return V1FaceDetectionGetResponseWithDownloads(
             **api_response.model_dump(), downloaded_paths=downloaded_paths
         )
 
+    def face_mappings(
+        self,
+        *,
+        target_file_path: str,
+        new_faces: typing.Union[
+            typing.Sequence[typing.Optional[str]],
+            typing.Mapping[typing.Union[int, str], str],
+        ],
+        confidence_score: typing.Union[
+            typing.Optional[float], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[typing.Dict[str, str]]:
+        """
+        Detect the faces in a target and build the `face_mappings` of a multi-face
+        swap. With a `FaceDetectionCache` on the client, a target detected before
+        makes no API calls.
+
+        Args:
+            target_file_path: The image or video to swap faces in
+            new_faces: The face to put in place of each detected one: a list in the
+                order the faces were detected (None leaves a face as is), or a dict
+                keyed by the face's index or `path`
+            confidence_score: Confidence threshold for filtering detected faces
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            The `face_mappings` for `face_swap` or `face_swap_photo` assets
+
+        Examples:
+        ```py
+        mappings = client.v1.face_detection.face_mappings(
+            target_file_path="team.png", new_faces=["alice.png", None, "bob.png"]
+        )
+        client.v1.face_swap_photo.generate(
+            assets={
+                "face_swap_mode": "individual-faces",
+                "target_file_path": "team.png",
+                "face_mappings": mappings,
+            }
+        )
+        ```
+        """
+        detection = self.generate(
+            assets={"target_file_path": target_file_path},
+            confidence_score=confidence_score,
+            download_outputs=False,
+            request_options=request_options,
+        )
+        if detection.status != "complete":
+            raise ValueError(
+                f"Face detection {detection.id} has status {detection.status}"
+            )
+        return build_face_mappings(detection, new_faces)
+
     def get(
         self, *, id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.V1FaceDetectionGetResponse:
@@ -205,10 +348,11 @@ class FaceDetectionClient:
         )
 
 
-class AsyncFaceDetectionClient:
+class AsyncFaceDetectionClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_detection")
     async def generate(
         self,
         *,
@@ -240,6 +384,24 @@ class AsyncFaceDetectionClient:
             V1FaceDetectionGetResponseWithDownloads: The face detection response with optional
                 downloaded face image paths included
         """
+        cache, cache_key = await detection_cache_key_async(
+            self._base_client,
+            assets["target_file_path"],
+            confidence_score,
+            request_options,
+        )
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                try:
+                    return await self._download_faces(
+                        cached, download_outputs, download_directory, cache_key
+                    )
+                except httpx.HTTPError as e:
+                    # the cached face crop URLs may have expired
+                    logger.info("Detecting faces again: cached crops failed: %r", e)
+                    cache.discard(cache_key)
+
         # Handle file upload if needed
         file_client = AsyncFilesClient(base_client=self._base_client)
         target_file_path = assets["target_file_path"]
@@ -256,23 +418,69 @@ class AsyncFaceDetectionClient:
         task_id = create_response.id
 
         api_response = await self.get(id=task_id)
+        job = current_job()
+        if job is not None:
+            job.record_status(api_response.status)
         if not wait_for_completion:
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
         poll_interval = float(os.getenv("MAGIC_HOUR_POLL_INTERVAL", "0.5"))
 
-        while api_response.status not in ["complete", "error"]:
-            api_response = await self.get(id=task_id)
-            await asyncio.sleep(poll_interval)
+        tracer = get_tracer(self._base_client)
+        with tracer.span(
+            WAIT,
+            {
+                "magic_hour.project_id": task_id,
+                "magic_hour.project_kind": "face_detection",
+            },
+        ) as span:
+            span.add_event("status", {"status": api_response.status})
+            polls = 0
+            while api_response.status not in ["complete", "error"]:
+                previous = api_response.status
+                api_response = await self.get(id=task_id)
+                polls += 1
+                if job is not None:
+                    job.record_status(api_response.status)
+                if api_response.status != previous:
+                    span.add_event("status", {"status": api_response.status})
+                await asyncio.sleep(poll_interval)
+            span.set_attributes(
+                {
+                    "magic_hour.poll_count": polls,
+                    "magic_hour.project_status": api_response.status,
+                }
+            )
 
         if api_response.status != "complete":
             log = logger.error if api_response.status == "error" else logger.info
-            log(f"Face detection {task_id} has status {api_response.status}")
+            log("Face detection %s has status %s", task_id, api_response.status)
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, api_response)
+        return await self._download_faces(
+            api_response, download_outputs, download_directory, cache_key
+        )
+
+    async def _download_faces(
+        self,
+        api_response: models.V1FaceDetectionGetResponse,
+        download_outputs: bool,
+        download_directory: typing.Optional[str],
+        cache_key: typing.Optional[str],
+    ) -> V1FaceDetectionGetResponseWithDownloads:
         if not download_outputs or not api_response.faces:
             return V1FaceDetectionGetResponseWithDownloads(**api_response.model_dump())
 
+        cache = get_face_detection_cache(self._base_client)
+        if cache is not None and cache_key is not None:
+            downloaded_paths = cache.downloaded_paths(cache_key, download_directory)
+            if downloaded_paths is not None:
+                return V1FaceDetectionGetResponseWithDownloads(
+                    **api_response.model_dump(), downloaded_paths=downloaded_paths
+                )
+
         face_downloads = [
             models.V1ImageProjectsGetResponseDownloadsItem(
                 url=face.url,
@@ -283,12 +491,71 @@ class AsyncFaceDetectionClient:
         downloaded_paths = await download_files_async(
             downloads=face_downloads,
             download_directory=download_directory,
+            tracer=get_tracer(self._base_client),
+            transfer_client=get_transfer_client(self._base_client),
         )
+        if cache is not None and cache_key is not None:
+            cache.record_downloads(cache_key, download_directory, downloaded_paths)
 
         return V1FaceDetectionGetResponseWithDownloads(
             **api_response.model_dump(), downloaded_paths=downloaded_paths
         )
 
+    async def face_mappings(
+        self,
+        *,
+        target_file_path: str,
+        new_faces: typing.Union[
+            typing.Sequence[typing.Optional[str]],
+            typing.Mapping[typing.Union[int, str], str],
+        ],
+        confidence_score: typing.Union[
+            typing.Optional[float], type_utils.NotGiven
+        ] = type_utils.NOT_GIVEN,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.List[typing.Dict[str, str]]:
+        """
+        Detect the faces in a target and build the `face_mappings` of a multi-face
+        swap. With a `FaceDetectionCache` on the client, a target detected before
+        makes no API calls.
+
+        Args:
+            target_file_path: The image or video to swap faces in
+            new_faces: The face to put in place of each detected one: a list in the
+                order the faces were detected (None leaves a face as is), or a dict
+                keyed by the face's index or `path`
+            confidence_score: Confidence threshold for filtering detected faces
+            request_options: Additional options to customize the HTTP request
+
+        Returns:
+            The `face_mappings` for `face_swap` or `face_swap_photo` assets
+
+        Examples:
+        ```py
+        mappings = await client.v1.face_detection.face_mappings(
+            target_file_path="team.png", new_faces=["alice.png", None, "bob.png"]
+        )
+        await client.v1.face_swap_photo.generate(
+            assets={
+                "face_swap_mode": "individual-faces",
+                "target_file_path": "team.png",
+                "face_mappings": mappings,
+            }
+        )
+        ```
+        """
+        detection = await self.generate(
+            assets={"target_file_path": target_file_path},
+            confidence_score=confidence_score,
+            download_outputs=False,
+            request_options=request_options,
+        )
+        if detection.status != "complete":
+            raise ValueError(
+                f"Face detection {detection.id} has status {detection.status}"
+            )
+        return build_face_mappings(detection, new_faces)
+
     async def get(
         self, *, id: str, request_options: typing.Optional[RequestOptions] = None
     ) -> models.V1FaceDetectionGetResponse:
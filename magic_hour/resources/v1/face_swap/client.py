@@ -1,6 +1,14 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.segments import (
+    AsyncSegmentedGenerateMixin,
+    SegmentedGenerateMixin,
+)
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -12,7 +20,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +27,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class FaceSwapClient:
+class FaceSwapClient(GenerateManyMixin, SegmentedGenerateMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_swap")
     def generate(
         self,
         *,
@@ -120,7 +128,7 @@ class FaceSwapClient:
             width=width,
             request_options=request_options,
         )
-        logger.info(f"Face Swap response: {create_response}")
+        logger.info("Face Swap response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -245,10 +253,11 @@ class FaceSwapClient:
         )
 
 
-class AsyncFaceSwapClient:
+class AsyncFaceSwapClient(AsyncSegmentedGenerateMixin, AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_swap")
     async def generate(
         self,
         *,
@@ -349,7 +358,7 @@ class AsyncFaceSwapClient:
             width=width,
             request_options=request_options,
         )
-        logger.info(f"Face Swap response: {create_response}")
+        logger.info("Face Swap response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class FaceSwapPhotoClient:
+class FaceSwapPhotoClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_swap_photo")
     def generate(
         self,
         *,
@@ -91,7 +95,7 @@ class FaceSwapPhotoClient:
         create_response = self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Face Swap Photo response: {create_response}")
+        logger.info("Face Swap Photo response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -163,10 +167,11 @@ class FaceSwapPhotoClient:
         )
 
 
-class AsyncFaceSwapPhotoClient:
+class AsyncFaceSwapPhotoClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("face_swap_photo")
     async def generate(
         self,
         *,
@@ -238,7 +243,7 @@ class AsyncFaceSwapPhotoClient:
         create_response = await self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Face Swap Photo response: {create_response}")
+        logger.info("Face Swap Photo response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -3,10 +3,20 @@ import io
 import mimetypes
 import os
 import pathlib
+import time
 import typing
 import typing_extensions
 
+from magic_hour.helpers.chain import OutputRef, resolve_output, resolve_output_async
+from magic_hour.helpers.dedupe import get_deduplicator
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.timing import current_job
+from magic_hour.helpers.tracing import UPLOAD, UPLOAD_PUT, get_tracer
+from magic_hour.helpers.transfer import (
+    async_transfer_client,
+    get_transfer_client,
+    sync_transfer_client,
+)
 from magic_hour.resources.v1.files.upload_urls import (
     AsyncUploadUrlsClient,
     UploadUrlsClient,
@@ -204,6 +214,7 @@ class FilesClient:
             file: The file to upload. Can be:
                 - **str**: Path to a local file (e.g., "/path/to/image.jpg")
                 - **str**: URL of the file to upload, this will be skipped and the URL will be returned as is
+                - **OutputRef**: an output of another project (`result.output()`), returned as its URL, refreshed if about to expire
                 - **str**: if the string begins with "api-assets", the file will be assumed to be a blob path and already uploaded to Magic Hour's storage
                 - **pathlib.Path**: Path object to a local file
                 - **typing.BinaryIO or io.IOBase**: File-like object (must have a 'name' attribute)
@@ -253,46 +264,81 @@ class FilesClient:
             ```
         """
 
-        logger.debug(f"upload_file called with: {type(file).__name__}")
+        logger.debug("upload_file called with: %s", type(file).__name__)
 
-        if isinstance(file, str) and is_url(file):
-            logger.debug(f"Input is a URL, skipping upload: {file}")
+        if isinstance(file, OutputRef):
+            return resolve_output(self, file)
+        elif isinstance(file, str) and is_url(file):
+            logger.debug("Input is a URL, skipping upload: %s", file)
             return file
         elif isinstance(file, str) and is_already_uploaded(file):
             logger.debug(
-                f"Input is already uploaded (api-assets/), skipping upload: {file}"
+                "Input is already uploaded (api-assets/), skipping upload: %s",
+                file,
             )
             return file
 
         file_path, file_to_upload, file_type, extension = _process_file_input(file)
-        logger.debug(f"Detected file type: {file_type}, extension: {extension}")
-
-        logger.debug("Requesting presigned upload URL...")
-        response = self.upload_urls.create(
-            items=[
-                V1FilesUploadUrlsCreateBodyItemsItem(
-                    extension=extension, type_=file_type
-                )
-            ]
-        )
-
-        if not response.items:
-            raise ValueError("No upload URL was returned from the server")
-
-        upload_info = response.items[0]
-        logger.debug(f"Received upload URL, target path: {upload_info.file_path}")
-
-        with httpx.Client(timeout=None) as client:
-            content = _prepare_file_for_upload(
-                file_path=file_path, file_to_upload=file_to_upload
+        tracer = get_tracer(self._base_client)
+        started = time.perf_counter()
+        with tracer.span(
+            UPLOAD,
+            {"magic_hour.file_type": file_type, "magic_hour.extension": extension},
+        ) as span:
+            logger.debug("Detected file type: %s, extension: %s", file_type, extension)
+
+            logger.debug("Requesting presigned upload URL...")
+            response = self.upload_urls.create(
+                items=[
+                    V1FilesUploadUrlsCreateBodyItemsItem(
+                        extension=extension, type_=file_type
+                    )
+                ]
             )
-            logger.debug(f"Uploading {len(content)} bytes to presigned URL...")
 
-            upload_response = client.put(url=upload_info.upload_url, content=content)
-            upload_response.raise_for_status()
+            if not response.items:
+                raise ValueError("No upload URL was returned from the server")
+
+            upload_info = response.items[0]
+            logger.debug("Received upload URL, target path: %s", upload_info.file_path)
 
-        logger.debug(f"Upload complete: {upload_info.file_path}")
-        return upload_info.file_path
+            with sync_transfer_client(
+                get_transfer_client(self._base_client), timeout=None
+            ) as client:
+                content = _prepare_file_for_upload(
+                    file_path=file_path, file_to_upload=file_to_upload
+                )
+                logger.debug("Uploading %s bytes to presigned URL...", len(content))
+
+                with tracer.span(
+                    UPLOAD_PUT,
+                    {
+                        "http.request.method": "PUT",
+                        "http.request.body.size": len(content),
+                    },
+                ) as put_span:
+                    upload_response = client.put(
+                        url=upload_info.upload_url, content=content
+                    )
+                    put_span.set_attribute(
+                        "http.response.status_code", upload_response.status_code
+                    )
+                    upload_response.raise_for_status()
+                span.set_attribute("magic_hour.upload.bytes", len(content))
+
+            logger.debug("Upload complete: %s", upload_info.file_path)
+            dedupe = get_deduplicator(self._base_client)
+            if dedupe is not None:
+                dedupe.register_asset(upload_info.file_path, content)
+            job = current_job()
+            if job is not None:
+                job.record_upload(
+                    source=file_path or getattr(file_to_upload, "name", ""),
+                    file_path=upload_info.file_path,
+                    seconds=time.perf_counter() - started,
+                    size=len(content),
+                )
+            return upload_info.file_path
 
 
 class AsyncFilesClient:
@@ -329,6 +375,7 @@ class AsyncFilesClient:
             file: The file to upload. Can be:
                 - **str**: Path to a local file (e.g., "/path/to/image.jpg")
                 - **str**: URL of the file to upload, this will be skipped and the URL will be returned as is
+                - **OutputRef**: an output of another project (`result.output()`), returned as its URL, refreshed if about to expire
                 - **str**: if the string begins with "api-assets", the file will be assumed to be a blob path and already uploaded to Magic Hour's storage
                 - **pathlib.Path**: Path object to a local file
                 - **typing.BinaryIO or io.IOBase**: File-like object (must have a 'name' attribute)
@@ -367,45 +414,78 @@ class AsyncFilesClient:
             asyncio.run(upload_example())
             ```
         """
-        logger.debug(f"upload_file called with: {type(file).__name__}")
+        logger.debug("upload_file called with: %s", type(file).__name__)
 
-        if isinstance(file, str) and is_url(file):
-            logger.debug(f"Input is a URL, skipping upload: {file}")
+        if isinstance(file, OutputRef):
+            return await resolve_output_async(self, file)
+        elif isinstance(file, str) and is_url(file):
+            logger.debug("Input is a URL, skipping upload: %s", file)
             return file
         elif isinstance(file, str) and is_already_uploaded(file):
             logger.debug(
-                f"Input is already uploaded (api-assets/), skipping upload: {file}"
+                "Input is already uploaded (api-assets/), skipping upload: %s",
+                file,
             )
             return file
 
         file_path, file_to_upload, file_type, extension = _process_file_input(file)
-        logger.debug(f"Detected file type: {file_type}, extension: {extension}")
-
-        logger.debug("Requesting presigned upload URL...")
-        response = await self.upload_urls.create(
-            items=[
-                V1FilesUploadUrlsCreateBodyItemsItem(
-                    extension=extension, type_=file_type
-                )
-            ]
-        )
-
-        if not response.items:
-            raise ValueError("No upload URL was returned from the server")
-
-        upload_info = response.items[0]
-        logger.debug(f"Received upload URL, target path: {upload_info.file_path}")
-
-        async with httpx.AsyncClient(timeout=None) as client:
-            content = _prepare_file_for_upload(
-                file_path=file_path, file_to_upload=file_to_upload
+        tracer = get_tracer(self._base_client)
+        started = time.perf_counter()
+        with tracer.span(
+            UPLOAD,
+            {"magic_hour.file_type": file_type, "magic_hour.extension": extension},
+        ) as span:
+            logger.debug("Detected file type: %s, extension: %s", file_type, extension)
+
+            logger.debug("Requesting presigned upload URL...")
+            response = await self.upload_urls.create(
+                items=[
+                    V1FilesUploadUrlsCreateBodyItemsItem(
+                        extension=extension, type_=file_type
+                    )
+                ]
             )
-            logger.debug(f"Uploading {len(content)} bytes to presigned URL...")
 
-            upload_response = await client.put(
-                url=upload_info.upload_url, content=content
-            )
-            upload_response.raise_for_status()
+            if not response.items:
+                raise ValueError("No upload URL was returned from the server")
+
+            upload_info = response.items[0]
+            logger.debug("Received upload URL, target path: %s", upload_info.file_path)
 
-        logger.debug(f"Upload complete: {upload_info.file_path}")
-        return upload_info.file_path
+            async with async_transfer_client(
+                get_transfer_client(self._base_client), timeout=None
+            ) as client:
+                content = _prepare_file_for_upload(
+                    file_path=file_path, file_to_upload=file_to_upload
+                )
+                logger.debug("Uploading %s bytes to presigned URL...", len(content))
+
+                with tracer.span(
+                    UPLOAD_PUT,
+                    {
+                        "http.request.method": "PUT",
+                        "http.request.body.size": len(content),
+                    },
+                ) as put_span:
+                    upload_response = await client.put(
+                        url=upload_info.upload_url, content=content
+                    )
+                    put_span.set_attribute(
+                        "http.response.status_code", upload_response.status_code
+                    )
+                    upload_response.raise_for_status()
+                span.set_attribute("magic_hour.upload.bytes", len(content))
+
+            logger.debug("Upload complete: %s", upload_info.file_path)
+            dedupe = get_deduplicator(self._base_client)
+            if dedupe is not None:
+                await dedupe.register_asset_async(upload_info.file_path, content)
+            job = current_job()
+            if job is not None:
+                job.record_upload(
+                    source=file_path or getattr(file_to_upload, "name", ""),
+                    file_path=upload_info.file_path,
+                    seconds=time.perf_counter() - started,
+                    size=len(content),
+                )
+            return upload_info.file_path
@@ -1,12 +1,12 @@
 import typing
 
+from magic_hour.helpers.serialization import to_encodable
 from magic_hour.types import models, params
 from make_api_request import (
     AsyncBaseClient,
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
 )
 
 
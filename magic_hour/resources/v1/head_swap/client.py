@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class HeadSwapClient:
+class HeadSwapClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("head_swap")
     def generate(
         self,
         *,
@@ -86,7 +90,7 @@ class HeadSwapClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Head Swap response: {create_response}")
+        logger.info("Head Swap response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -156,10 +160,11 @@ class HeadSwapClient:
         )
 
 
-class AsyncHeadSwapClient:
+class AsyncHeadSwapClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("head_swap")
     async def generate(
         self,
         *,
@@ -222,7 +227,7 @@ class AsyncHeadSwapClient:
             name=name,
             request_options=request_options,
         )
-        logger.info(f"Head Swap response: {create_response}")
+        logger.info("Head Swap response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class ImageBackgroundRemoverClient:
+class ImageBackgroundRemoverClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("image_background_remover")
     def generate(
         self,
         *,
@@ -72,7 +76,7 @@ class ImageBackgroundRemoverClient:
         create_response = self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Image Background Remover response: {create_response}")
+        logger.info("Image Background Remover response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -137,10 +141,11 @@ class ImageBackgroundRemoverClient:
         )
 
 
-class AsyncImageBackgroundRemoverClient:
+class AsyncImageBackgroundRemoverClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("image_background_remover")
     async def generate(
         self,
         *,
@@ -189,7 +194,7 @@ class AsyncImageBackgroundRemoverClient:
         create_response = await self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Image Background Remover response: {create_response}")
+        logger.info("Image Background Remover response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
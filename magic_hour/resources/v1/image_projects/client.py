@@ -1,11 +1,27 @@
 import asyncio
+import httpx
 import os
 import pydantic
 import time
 import typing
 
+from magic_hour.helpers.budget import observe_credits
+from magic_hour.helpers.dedupe import observe_status
+from magic_hour.helpers.chain import (
+    DEFAULT_MIN_VALIDITY_SECONDS,
+    OutputRef,
+    output_ref,
+)
 from magic_hour.helpers.download import download_files_async, download_files_sync
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.response_parsing import (
+    TERMINAL_STATUSES,
+    copy_with_fields,
+    decode_poll,
+)
+from magic_hour.helpers.timing import JobTimings, current_job
+from magic_hour.helpers.tracing import WAIT, get_tracer
+from magic_hour.helpers.transfer import get_transfer_client
 from magic_hour.types import models
 from make_api_request import (
     AsyncBaseClient,
@@ -28,6 +44,29 @@ class V1ImageProjectsGetResponseWithDownloads(models.V1ImageProjectsGetResponse)
     This field is only populated if `download_outputs` is True and the image project is complete.
     """
 
+    timings: typing.Optional[JobTimings] = pydantic.Field(default=None, alias="timings")
+    """
+    Where the time went (uploads, create, queued, rendering, downloads).
+
+    This field is only populated on results returned by `generate()`.
+    """
+
+    def output(
+        self,
+        index: int = 0,
+        min_validity_seconds: float = DEFAULT_MIN_VALIDITY_SECONDS,
+    ) -> OutputRef:
+        """
+        The `index`-th output of this (complete) image project, to pass as an input
+        file of another job without downloading and re-uploading it.
+
+        Args:
+            index: Which output, in the order of `downloads`
+            min_validity_seconds: How long the URL must still be valid when the next
+                job is submitted before it is refreshed
+        """
+        return output_ref(self, "image", index, min_validity_seconds)
+
 
 class ImageProjectsClient:
     def __init__(self, *, base_client: SyncBaseClient):
@@ -58,38 +97,79 @@ class ImageProjectsClient:
                 downloaded file paths included
         """
         api_response = self.get(id=id)
+        job = current_job()
+        if job is not None:
+            job.record_status(api_response.status)
         if not wait_for_completion:
-            response = V1ImageProjectsGetResponseWithDownloads(
-                **api_response.model_dump()
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
             )
-            return response
 
         poll_interval = float(os.getenv("MAGIC_HOUR_POLL_INTERVAL", "0.5"))
 
-        status = api_response.status
-
-        while status not in ["complete", "error", "canceled"]:
-            api_response = self.get(id=id)
-            status = api_response.status
-            time.sleep(poll_interval)
+        status: str = api_response.status
+
+        tracer = get_tracer(self._base_client)
+        with tracer.span(
+            WAIT, {"magic_hour.project_id": id, "magic_hour.project_kind": "image"}
+        ) as span:
+            span.add_event("status", {"status": status})
+            polls = 0
+            # only the status is decoded until the project reaches a terminal status
+            while status not in TERMINAL_STATUSES:
+                raw_response: httpx.Response = self._base_client.request(
+                    method="GET",
+                    path=f"/v1/image-projects/{id}",
+                    auth_names=["bearerAuth"],
+                    cast_to=httpx.Response,
+                    request_options=default_request_options(),
+                )
+                polls += 1
+                previous = status
+                status, polled = decode_poll(
+                    raw_response, models.V1ImageProjectsGetResponse
+                )
+                if job is not None:
+                    job.record_status(status)
+                if status != previous:
+                    span.add_event("status", {"status": status})
+                if polled is not None:
+                    api_response = polled
+                    observe_credits(self._base_client, polled)
+                    observe_status(self._base_client, polled)
+                time.sleep(poll_interval)
+            span.set_attributes(
+                {"magic_hour.poll_count": polls, "magic_hour.project_status": status}
+            )
 
         if api_response.status != "complete":
             log = logger.error if api_response.status == "error" else logger.info
             log(
-                f"Image project {id} has status {api_response.status}: {api_response.error}"
+                "Image project %s has status %s: %s",
+                id,
+                api_response.status,
+                api_response.error,
+            )
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
             )
-            return V1ImageProjectsGetResponseWithDownloads(**api_response.model_dump())
 
         if not download_outputs:
-            return V1ImageProjectsGetResponseWithDownloads(**api_response.model_dump())
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
+            )
 
         downloaded_paths = download_files_sync(
             downloads=api_response.downloads,
             download_directory=download_directory,
+            tracer=tracer,
+            transfer_client=get_transfer_client(self._base_client),
         )
 
-        return V1ImageProjectsGetResponseWithDownloads(
-            **api_response.model_dump(), downloaded_paths=downloaded_paths
+        return copy_with_fields(
+            V1ImageProjectsGetResponseWithDownloads,
+            api_response,
+            downloaded_paths=downloaded_paths,
         )
 
     def delete(
@@ -198,38 +278,79 @@ class AsyncImageProjectsClient:
                 downloaded file paths included
         """
         api_response = await self.get(id=id)
+        job = current_job()
+        if job is not None:
+            job.record_status(api_response.status)
         if not wait_for_completion:
-            response = V1ImageProjectsGetResponseWithDownloads(
-                **api_response.model_dump()
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
             )
-            return response
 
         poll_interval = float(os.getenv("MAGIC_HOUR_POLL_INTERVAL", "0.5"))
 
-        status = api_response.status
-
-        while status not in ["complete", "error", "canceled"]:
-            api_response = await self.get(id=id)
-            status = api_response.status
-            await asyncio.sleep(poll_interval)
+        status: str = api_response.status
+
+        tracer = get_tracer(self._base_client)
+        with tracer.span(
+            WAIT, {"magic_hour.project_id": id, "magic_hour.project_kind": "image"}
+        ) as span:
+            span.add_event("status", {"status": status})
+            polls = 0
+            # only the status is decoded until the project reaches a terminal status
+            while status not in TERMINAL_STATUSES:
+                raw_response: httpx.Response = await self._base_client.request(
+                    method="GET",
+                    path=f"/v1/image-projects/{id}",
+                    auth_names=["bearerAuth"],
+                    cast_to=httpx.Response,
+                    request_options=default_request_options(),
+                )
+                polls += 1
+                previous = status
+                status, polled = decode_poll(
+                    raw_response, models.V1ImageProjectsGetResponse
+                )
+                if job is not None:
+                    job.record_status(status)
+                if status != previous:
+                    span.add_event("status", {"status": status})
+                if polled is not None:
+                    api_response = polled
+                    observe_credits(self._base_client, polled)
+                    observe_status(self._base_client, polled)
+                await asyncio.sleep(poll_interval)
+            span.set_attributes(
+                {"magic_hour.poll_count": polls, "magic_hour.project_status": status}
+            )
 
         if api_response.status != "complete":
             log = logger.error if api_response.status == "error" else logger.info
             log(
-                f"Image project {id} has status {api_response.status}: {api_response.error}"
+                "Image project %s has status %s: %s",
+                id,
+                api_response.status,
+                api_response.error,
+            )
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
             )
-            return V1ImageProjectsGetResponseWithDownloads(**api_response.model_dump())
 
         if not download_outputs:
-            return V1ImageProjectsGetResponseWithDownloads(**api_response.model_dump())
+            return copy_with_fields(
+                V1ImageProjectsGetResponseWithDownloads, api_response
+            )
 
         downloaded_paths = await download_files_async(
             downloads=api_response.downloads,
             download_directory=download_directory,
+            tracer=tracer,
+            transfer_client=get_transfer_client(self._base_client),
         )
 
-        return V1ImageProjectsGetResponseWithDownloads(
-            **api_response.model_dump(), downloaded_paths=downloaded_paths
+        return copy_with_fields(
+            V1ImageProjectsGetResponseWithDownloads,
+            api_response,
+            downloaded_paths=downloaded_paths,
         )
 
     async def delete(
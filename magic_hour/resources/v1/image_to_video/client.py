@@ -1,7 +1,12 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
+from magic_hour.helpers.validation import check_capabilities
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -13,7 +18,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -21,10 +25,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class ImageToVideoClient:
+class ImageToVideoClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("image_to_video")
     def generate(
         self,
         *,
@@ -120,7 +125,7 @@ class ImageToVideoClient:
             audio=audio,
             request_options=request_options,
         )
-        logger.info(f"Image-to-Video response: {create_response}")
+        logger.info("Image-to-Video response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -300,6 +305,15 @@ class ImageToVideoClient:
         )
         ```
         """
+        check_capabilities(
+            "image_to_video",
+            {
+                "model": model,
+                "resolution": resolution,
+                "end_seconds": end_seconds,
+                "audio": audio,
+            },
+        )
         _json = to_encodable(
             item={
                 "audio": audio,
@@ -324,10 +338,11 @@ class ImageToVideoClient:
         )
 
 
-class AsyncImageToVideoClient:
+class AsyncImageToVideoClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("image_to_video")
     async def generate(
         self,
         *,
@@ -423,7 +438,7 @@ class AsyncImageToVideoClient:
             audio=audio,
             request_options=request_options,
         )
-        logger.info(f"Image-to-Video response: {create_response}")
+        logger.info("Image-to-Video response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
@@ -603,6 +618,15 @@ class AsyncImageToVideoClient:
         )
         ```
         """
+        check_capabilities(
+            "image_to_video",
+            {
+                "model": model,
+                "resolution": resolution,
+                "end_seconds": end_seconds,
+                "audio": audio,
+            },
+        )
         _json = to_encodable(
             item={
                 "audio": audio,
@@ -1,6 +1,10 @@
 import typing
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.image_projects.client import (
     AsyncImageProjectsClient,
@@ -12,7 +16,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +23,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class PhotoColorizerClient:
+class PhotoColorizerClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("photo_colorizer")
     def generate(
         self,
         *,
@@ -72,7 +76,7 @@ class PhotoColorizerClient:
         create_response = self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Photo Colorizer response: {create_response}")
+        logger.info("Photo Colorizer response: %s", create_response)
 
         image_projects_client = ImageProjectsClient(base_client=self._base_client)
         response = image_projects_client.check_result(
@@ -134,10 +138,11 @@ class PhotoColorizerClient:
         )
 
 
-class AsyncPhotoColorizerClient:
+class AsyncPhotoColorizerClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("photo_colorizer")
     async def generate(
         self,
         *,
@@ -186,7 +191,7 @@ class AsyncPhotoColorizerClient:
         create_response = await self.create(
             assets=assets, name=name, request_options=request_options
         )
-        logger.info(f"Photo Colorizer response: {create_response}")
+        logger.info("Photo Colorizer response: %s", create_response)
 
         image_projects_client = AsyncImageProjectsClient(base_client=self._base_client)
         response = await image_projects_client.check_result(
@@ -1,7 +1,12 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
+from magic_hour.helpers.validation import check_capabilities
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
     VideoProjectsClient,
@@ -12,7 +17,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -20,10 +24,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class TextToVideoClient:
+class TextToVideoClient(GenerateManyMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("text_to_video")
     def generate(
         self,
         *,
@@ -112,7 +117,7 @@ class TextToVideoClient:
             audio=audio,
             request_options=request_options,
         )
-        logger.info(f"Text-to-Video response: {create_response}")
+        logger.info("Text-to-Video response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -300,6 +305,15 @@ class TextToVideoClient:
         )
         ```
         """
+        check_capabilities(
+            "text_to_video",
+            {
+                "model": model,
+                "resolution": resolution,
+                "end_seconds": end_seconds,
+                "audio": audio,
+            },
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
@@ -323,10 +337,11 @@ class TextToVideoClient:
         )
 
 
-class AsyncTextToVideoClient:
+class AsyncTextToVideoClient(AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("text_to_video")
     async def generate(
         self,
         *,
@@ -410,7 +425,7 @@ class AsyncTextToVideoClient:
             audio=audio,
             request_options=request_options,
         )
-        logger.info(f"Text-to-Video response: {create_response}")
+        logger.info("Text-to-Video response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
@@ -598,6 +613,15 @@ class AsyncTextToVideoClient:
         )
         ```
         """
+        check_capabilities(
+            "text_to_video",
+            {
+                "model": model,
+                "resolution": resolution,
+                "end_seconds": end_seconds,
+                "audio": audio,
+            },
+        )
         _json = to_encodable(
             item={
                 "aspect_ratio": aspect_ratio,
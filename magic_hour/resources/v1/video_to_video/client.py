@@ -1,7 +1,15 @@
 import typing
 import typing_extensions
 
+from magic_hour.helpers.batch import GenerateManyMixin
 from magic_hour.helpers.logger import get_sdk_logger
+from magic_hour.helpers.segments import (
+    AsyncSegmentedGenerateMixin,
+    SegmentedGenerateMixin,
+)
+from magic_hour.helpers.serialization import to_encodable
+from magic_hour.helpers.sweep import AsyncSweepMixin, SweepMixin
+from magic_hour.helpers.tracing import traced_generate
 from magic_hour.resources.v1.files.client import AsyncFilesClient, FilesClient
 from magic_hour.resources.v1.video_projects.client import (
     AsyncVideoProjectsClient,
@@ -13,7 +21,6 @@ from make_api_request import (
     RequestOptions,
     SyncBaseClient,
     default_request_options,
-    to_encodable,
     type_utils,
 )
 
@@ -21,10 +28,11 @@ from make_api_request import (
 logger = get_sdk_logger(__name__)
 
 
-class VideoToVideoClient:
+class VideoToVideoClient(GenerateManyMixin, SegmentedGenerateMixin, SweepMixin):
     def __init__(self, *, base_client: SyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("video_to_video")
     def generate(
         self,
         *,
@@ -118,7 +126,7 @@ class VideoToVideoClient:
             width=width,
             request_options=request_options,
         )
-        logger.info(f"Video-to-Video response: {create_response}")
+        logger.info("Video-to-Video response: %s", create_response)
 
         video_projects_client = VideoProjectsClient(base_client=self._base_client)
         response = video_projects_client.check_result(
@@ -247,10 +255,11 @@ class VideoToVideoClient:
         )
 
 
-class AsyncVideoToVideoClient:
+class AsyncVideoToVideoClient(AsyncSegmentedGenerateMixin, AsyncSweepMixin):
     def __init__(self, *, base_client: AsyncBaseClient):
         self._base_client = base_client
 
+    @traced_generate("video_to_video")
     async def generate(
         self,
         *,
@@ -346,7 +355,7 @@ class AsyncVideoToVideoClient:
             width=width,
             request_options=request_options,
         )
-        logger.info(f"Video-to-Video response: {create_response}")
+        logger.info("Video-to-Video response: %s", create_response)
 
         video_projects_client = AsyncVideoProjectsClient(base_client=self._base_client)
         response = await video_projects_client.check_result(
@@ -0,0 +1,14 @@
+from .mock_server import MOCK_BASE_URL, MockMagicHour, MockRequest, MockServer
+from .recording import TrafficRecorder, TrafficReplay, load_entries, redact_urls
+
+
+__all__ = [
+    "MOCK_BASE_URL",
+    "MockMagicHour",
+    "MockRequest",
+    "MockServer",
+    "TrafficRecorder",
+    "TrafficReplay",
+    "load_entries",
+    "redact_urls",
+]
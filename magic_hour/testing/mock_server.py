@@ -0,0 +1,625 @@
+import asyncio
+import datetime
+import http.server
+import httpx
+import json
+import random
+import re
+import threading
+import time
+import typing
+import urllib.parse
+import uuid
+
+from magic_hour.client import AsyncClient, Client
+
+
+MOCK_BASE_URL = "https://api.magichour.mock"
+
+# POST endpoint -> (project kind, project type)
+ENDPOINTS: typing.Dict[str, typing.Tuple[str, str]] = {
+    "/v1/ai-clothes-changer": ("image", "CLOTHES_CHANGER"),
+    "/v1/ai-face-editor": ("image", "AI_FACE_EDITOR"),
+    "/v1/ai-gif-generator": ("image", "AI_GIF"),
+    "/v1/ai-headshot-generator": ("image", "AI_HEADSHOT"),
+    "/v1/ai-image-editor": ("image", "AI_IMAGE_EDITOR"),
+    "/v1/ai-image-generator": ("image", "AI_IMAGE"),
+    "/v1/ai-image-upscaler": ("image", "AI_IMAGE_UPSCALER"),
+    "/v1/ai-meme-generator": ("image", "AI_MEME"),
+    "/v1/ai-qr-code-generator": ("image", "QR_CODE"),
+    "/v1/ai-talking-photo": ("video", "AI_TALKING_PHOTO"),
+    "/v1/ai-voice-cloner": ("audio", "VOICE_CLONER"),
+    "/v1/ai-voice-generator": ("audio", "VOICE_GENERATOR"),
+    "/v1/animation": ("video", "ANIMATION"),
+    "/v1/auto-subtitle-generator": ("video", "AUTO_SUBTITLE"),
+    "/v1/body-swap": ("image", "BODY_SWAP"),
+    "/v1/face-detection": ("face-detection", "FACE_DETECTION"),
+    "/v1/face-swap": ("video", "FACE_SWAP"),
+    "/v1/face-swap-photo": ("image", "FACE_SWAP"),
+    "/v1/head-swap": ("image", "HEAD_SWAP"),
+    "/v1/image-background-remover": ("image", "BACKGROUND_REMOVER"),
+    "/v1/image-to-video": ("video", "IMAGE_TO_VIDEO"),
+    "/v1/lip-sync": ("video", "LIP_SYNC"),
+    "/v1/photo-colorizer": ("image", "PHOTO_COLORIZER"),
+    "/v1/text-to-video": ("video", "TEXT_TO_VIDEO"),
+    "/v1/video-to-video": ("video", "VIDEO_TO_VIDEO"),
+}
+
+_PROJECT_PATH = re.compile(
+    r"^/v1/(video-projects|image-projects|audio-projects|face-detection)/([^/]+)$"
+)
+_PROJECT_KINDS = {
+    "video-projects": "video",
+    "image-projects": "image",
+    "audio-projects": "audio",
+    "face-detection": "face-detection",
+}
+_CHUNK_SIZE = 1 << 20
+_EXTENSIONS = {"video": "mp4", "image": "png", "audio": "mp3", "face-detection": "png"}
+
+
+class MockRequest(typing.NamedTuple):
+    """A request served by `MockMagicHour`"""
+
+    method: str
+    path: str
+    status_code: int
+
+
+class _Job:
+    __slots__ = (
+        "id",
+        "kind",
+        "type",
+        "created",
+        "created_at",
+        "queue_seconds",
+        "render_seconds",
+        "fails",
+        "credits",
+        "body",
+    )
+
+    def __init__(
+        self,
+        *,
+        kind: str,
+        type_: str,
+        queue_seconds: float,
+        render_seconds: float,
+        fails: bool,
+        credits: int,
+        body: typing.Dict[str, typing.Any],
+    ):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.type = type_
+        self.created = time.monotonic()
+        self.created_at = _iso(datetime.datetime.now(datetime.timezone.utc))
+        self.queue_seconds = queue_seconds
+        self.render_seconds = render_seconds
+        self.fails = fails
+        self.credits = credits
+        self.body = body
+
+    def status(self) -> str:
+        elapsed = time.monotonic() - self.created
+        if elapsed < self.queue_seconds:
+            return "queued"
+        if elapsed < self.queue_seconds + self.render_seconds:
+            return "rendering"
+        return "error" if self.fails else "complete"
+
+
+def _iso(value: datetime.datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def _json_response(
+    status_code: int,
+    body: typing.Any,
+    headers: typing.Optional[typing.Dict[str, str]] = None,
+) -> httpx.Response:
+    return httpx.Response(status_code, json=body, headers=headers)
+
+
+class MockMagicHour:
+    """
+    An in-process stand-in for the Magic Hour API, its presigned upload storage and
+    its CDN, for tests and offline benchmarks.
+
+    Every `/v1` endpoint used by the resource clients is implemented. Projects move
+    from `queued` to `rendering` to `complete` as time passes, and latency, rate
+    limits, server errors, failed renders and bandwidth can be simulated:
+
+    ```py
+    from magic_hour.testing import MockMagicHour
+
+    mock = MockMagicHour(queue_seconds=0.2, render_seconds=1.0, rate_limit_rate=0.05)
+    client = mock.client()  # or mock.async_client()
+    result = client.v1.face_swap_photo.generate(...)
+
+    with mock.serve() as url:  # a real HTTP server, for other processes
+        ...
+    ```
+
+    Args:
+        queue_seconds: How long a project stays `queued`
+        render_seconds: How long a project stays `rendering`, either for every
+            endpoint or keyed by endpoint path (`"/v1/face-swap"`) or project kind
+            (`"video"`, `"image"`, `"audio"`, `"face-detection"`)
+        latency_seconds: Delay added to every API request
+        error_rate: Fraction of API requests answered with a 5xx
+        rate_limit_rate: Fraction of API requests answered with a 429
+        retry_after: `Retry-After` header sent with 429 responses, in seconds
+        transfer_error_rate: Fraction of uploads and downloads answered with a 503
+        job_failure_rate: Fraction of projects that end with status `error`
+        bandwidth_bytes_per_second: Simulated transfer speed of uploads and downloads
+        output_bytes: Size of every output file served by the CDN
+        seed: Seed for the random failures, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_seconds: float = 0.0,
+        render_seconds: typing.Union[float, typing.Mapping[str, float]] = 0.0,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        transfer_error_rate: float = 0.0,
+        job_failure_rate: float = 0.0,
+        bandwidth_bytes_per_second: typing.Optional[float] = None,
+        output_bytes: int = 1024,
+        seed: typing.Optional[int] = None,
+    ):
+        self.queue_seconds = queue_seconds
+        self.render_seconds = render_seconds
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.transfer_error_rate = transfer_error_rate
+        self.job_failure_rate = job_failure_rate
+        self.bandwidth_bytes_per_second = bandwidth_bytes_per_second
+        self.output_bytes = output_bytes
+
+        self.requests: typing.List[MockRequest] = []
+        """Every request served, in order"""
+        self.uploads: typing.Dict[str, int] = {}
+        """Size of every file uploaded, keyed by its `api-assets/...` path"""
+
+        self._random = random.Random(seed)
+        self._jobs: typing.Dict[str, _Job] = {}
+        self._injected: typing.List[typing.List[typing.Any]] = []
+        self._lock = threading.Lock()
+
+    def inject(
+        self, status_code: int, count: int = 1, path: typing.Optional[str] = None
+    ) -> None:
+        """
+        Answer the next `count` requests whose path starts with `path` (any request by
+        default) with `status_code`, before any random failure is considered.
+        """
+        with self._lock:
+            self._injected.append([status_code, count, path])
+
+    def job_status(self, id: str) -> typing.Optional[str]:
+        """The current status of a project, or None if it doesn't exist"""
+        with self._lock:
+            job = self._jobs.get(id)
+        return job.status() if job is not None else None
+
+    def client(self, **kwargs: typing.Any) -> Client:
+        """A `Client` wired to this mock; keyword arguments are passed to `Client`"""
+        kwargs.setdefault("token", "mock-token")
+        kwargs.setdefault("base_url", MOCK_BASE_URL)
+        kwargs.setdefault("httpx_client", httpx.Client(transport=self.transport()))
+        kwargs.setdefault("transfer_client", httpx.Client(transport=self.transport()))
+        return Client(**kwargs)
+
+    def async_client(self, **kwargs: typing.Any) -> AsyncClient:
+        """An `AsyncClient` wired to this mock; keyword arguments are passed on"""
+        kwargs.setdefault("token", "mock-token")
+        kwargs.setdefault("base_url", MOCK_BASE_URL)
+        kwargs.setdefault(
+            "httpx_client", httpx.AsyncClient(transport=self.async_transport())
+        )
+        kwargs.setdefault(
+            "transfer_client", httpx.AsyncClient(transport=self.async_transport())
+        )
+        return AsyncClient(**kwargs)
+
+    def transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.Client`; simulated delays block the caller"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay, response = self.respond(request)
+            if delay > 0:
+                time.sleep(delay)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.AsyncClient`; simulated delays yield to the loop"""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay, response = self.respond(request)
+            await asyncio.sleep(delay)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> "MockServer":
+        """
+        Serve this mock over real HTTP on a background thread, until closed.
+        Upload and download URLs point back at the server.
+        """
+        return MockServer(self, host=host, port=port)
+
+    def respond(self, request: httpx.Request) -> typing.Tuple[float, httpx.Response]:
+        """
+        Answer `request`, returning the simulated delay (latency and transfer time)
+        alongside the response. The delay is applied by the transport.
+        """
+        path = request.url.path
+        body = request.read()
+        is_transfer = path.startswith(("/upload/", "/cdn/"))
+        delay = 0.0 if is_transfer else self.latency_seconds
+
+        response = self._failure(path, is_transfer)
+        if response is None:
+            if is_transfer:
+                response = self._transfer(request.method, path, body)
+            elif not request.headers.get("authorization"):
+                response = _json_response(401, {"message": "Unauthorized"})
+            else:
+                response = self._api(request, path, body)
+
+        if is_transfer and self.bandwidth_bytes_per_second:
+            size = len(body) + len(response.content)
+            delay += size / self.bandwidth_bytes_per_second
+        self._record(request.method, path, response.status_code)
+        return delay, response
+
+    def _record(self, method: str, path: str, status_code: int) -> None:
+        with self._lock:
+            self.requests.append(MockRequest(method, path, status_code))
+
+    def _failure(self, path: str, is_transfer: bool) -> typing.Optional[httpx.Response]:
+        with self._lock:
+            for injected in self._injected:
+                status_code, count, prefix = injected
+                if prefix is None or path.startswith(prefix):
+                    injected[1] = count - 1
+                    if injected[1] <= 0:
+                        self._injected.remove(injected)
+                    return self._error_response(status_code)
+
+            roll = self._random.random()
+        if is_transfer:
+            if roll < self.transfer_error_rate:
+                return httpx.Response(503)
+            return None
+        if roll < self.rate_limit_rate:
+            return self._error_response(429)
+        if roll < self.rate_limit_rate + self.error_rate:
+            return self._error_response(self._random.choice((500, 502, 503)))
+        return None
+
+    def _error_response(self, status_code: int) -> httpx.Response:
+        if status_code == 429:
+            return _json_response(
+                429,
+                {"message": "Too many requests"},
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        return _json_response(status_code, {"message": "Injected failure"})
+
+    def _transfer(self, method: str, path: str, body: bytes) -> httpx.Response:
+        if method == "PUT" and path.startswith("/upload/"):
+            with self._lock:
+                self.uploads[path[len("/upload/") :]] = len(body)
+            return httpx.Response(200)
+        if method == "GET" and path.startswith("/cdn/"):
+            return httpx.Response(
+                200,
+                content=b"\x00" * self.output_bytes,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+        return httpx.Response(405)
+
+    def _api(self, request: httpx.Request, path: str, body: bytes) -> httpx.Response:
+        method = request.method
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}"
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return _json_response(400, {"message": "Invalid JSON body"})
+
+        if path == "/v1/files/upload-urls":
+            if method != "POST":
+                return _json_response(405, {"message": "Method not allowed"})
+            return self._upload_urls(payload, origin)
+
+        if path in ENDPOINTS:
+            if method != "POST":
+                return _json_response(405, {"message": "Method not allowed"})
+            return self._create(path, payload)
+
+        match = _PROJECT_PATH.match(path)
+        if match is None:
+            return _json_response(404, {"message": "Not found"})
+        kind = _PROJECT_KINDS[match.group(1)]
+        with self._lock:
+            job = self._jobs.get(match.group(2))
+            if job is None or job.kind != kind:
+                return _json_response(404, {"message": "Project not found"})
+            if method == "DELETE" and kind != "face-detection":
+                del self._jobs[job.id]
+                return httpx.Response(204)
+        if method != "GET":
+            return _json_response(405, {"message": "Method not allowed"})
+        return _json_response(200, self._project(job, origin))
+
+    def _upload_urls(
+        self, payload: typing.Dict[str, typing.Any], origin: str
+    ) -> httpx.Response:
+        items = payload.get("items")
+        if not isinstance(items, list) or not items:
+            return _json_response(422, {"message": "items is required"})
+        expires_at = _iso(
+            datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        )
+        urls = []
+        for item in items:
+            file_path = (
+                f"api-assets/mock/{uuid.uuid4().hex}.{item.get('extension', 'bin')}"
+            )
+            urls.append(
+                {
+                    "expires_at": expires_at,
+                    "file_path": file_path,
+                    "upload_url": f"{origin}/upload/{file_path}",
+                }
+            )
+        return _json_response(200, {"items": urls})
+
+    def _create(
+        self, path: str, payload: typing.Dict[str, typing.Any]
+    ) -> httpx.Response:
+        kind, type_ = ENDPOINTS[path]
+        if isinstance(self.render_seconds, (int, float)):
+            render_seconds = float(self.render_seconds)
+        else:
+            render_seconds = self.render_seconds.get(
+                path, self.render_seconds.get(kind, 0.0)
+            )
+        with self._lock:
+            fails = self._random.random() < self.job_failure_rate
+        job = _Job(
+            kind=kind,
+            type_=type_,
+            queue_seconds=self.queue_seconds,
+            render_seconds=render_seconds,
+            fails=fails,
+            credits=_credits(kind, payload),
+            body=payload,
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+
+        response: typing.Dict[str, typing.Any] = {
+            "credits_charged": job.credits,
+            "id": job.id,
+        }
+        if kind == "video":
+            response["estimated_frame_cost"] = job.credits
+        elif kind == "image":
+            response["frame_cost"] = job.credits
+        return _json_response(200, response)
+
+    def _project(self, job: _Job, origin: str) -> typing.Dict[str, typing.Any]:
+        status = job.status()
+        extension = _EXTENSIONS[job.kind]
+        count = _output_count(job)
+        outputs = (
+            [
+                {
+                    "expires_at": _iso(
+                        datetime.datetime.now(datetime.timezone.utc)
+                        + datetime.timedelta(days=1)
+                    ),
+                    "url": f"{origin}/cdn/{job.id}/{job.id}-{i}.{extension}",
+                }
+                for i in range(count)
+            ]
+            if status == "complete"
+            else []
+        )
+        if job.kind == "face-detection":
+            return {
+                "credits_charged": job.credits,
+                "faces": [
+                    {"path": f"api-assets/mock/{job.id}-{i}.png", "url": output["url"]}
+                    for i, output in enumerate(outputs)
+                ],
+                "id": job.id,
+                "status": status,
+            }
+
+        project: typing.Dict[str, typing.Any] = {
+            "created_at": job.created_at,
+            "credits_charged": job.credits,
+            "downloads": outputs,
+            "enabled": True,
+            "error": (
+                {"code": "render_failed", "message": "Simulated render failure"}
+                if status == "error"
+                else None
+            ),
+            "id": job.id,
+            "name": job.body.get("name"),
+            "status": status,
+            "type": job.type,
+        }
+        if job.kind == "image":
+            project["image_count"] = count
+            project["total_frame_cost"] = job.credits
+        elif job.kind == "video":
+            start = float(job.body.get("start_seconds") or 0.0)
+            project.update(
+                {
+                    "download": outputs[0] if outputs else None,
+                    "end_seconds": float(job.body.get("end_seconds") or start + 5.0),
+                    "fps": 30.0,
+                    "height": 960,
+                    "start_seconds": start,
+                    "total_frame_cost": job.credits,
+                    "width": 512,
+                }
+            )
+        return project
+
+
+def _output_count(job: _Job) -> int:
+    count = job.body.get("image_count")
+    return count if isinstance(count, int) and count > 0 else 1
+
+
+def _credits(kind: str, payload: typing.Dict[str, typing.Any]) -> int:
+    if kind == "video":
+        start = float(payload.get("start_seconds") or 0.0)
+        end = float(payload.get("end_seconds") or start + 5.0)
+        return max(1, round((end - start) * 30))
+    if kind == "image":
+        count = payload.get("image_count")
+        return 5 * (count if isinstance(count, int) and count > 0 else 1)
+    if kind == "audio":
+        return 50
+    return 0
+
+
+class MockServer:
+    """
+    A `MockMagicHour` served over HTTP on a background thread, as returned by
+    `MockMagicHour.serve()`. Use it as a context manager, or call `close()`.
+    """
+
+    def __init__(self, mock: MockMagicHour, *, host: str, port: int):
+        self.mock = mock
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port), _make_handler(mock)
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="magic-hour-mock", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as `Client(base_url=...)`"""
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode("ascii")
+        return f"http://{host}:{port}"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> str:
+        return self.url
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+
+def _make_handler(
+    mock: MockMagicHour,
+) -> typing.Type[http.server.BaseHTTPRequestHandler]:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            path = urllib.parse.urlsplit(self.path).path
+            if path.startswith(("/upload/", "/cdn/")):
+                self._transfer(path, length)
+                return
+            request = httpx.Request(
+                self.command,
+                f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                headers=dict(self.headers.items()),
+                content=self.rfile.read(length) if length else b"",
+            )
+            delay, response = mock.respond(request)
+            if delay > 0:
+                time.sleep(delay)
+            self._send(response)
+
+        def _transfer(self, path: str, length: int) -> None:
+            # file bodies are streamed in chunks rather than held in memory, so
+            # multi-gigabyte transfers can be simulated
+            failure = mock._failure(path, is_transfer=True)
+            is_upload = self.command == "PUT" and path.startswith("/upload/")
+            is_download = self.command == "GET" and path.startswith("/cdn/")
+            if failure is None and not (is_upload or is_download):
+                failure = httpx.Response(405)
+            self._drain(length, throttle=failure is None)
+            if failure is not None:
+                mock._record(self.command, path, failure.status_code)
+                self._send(failure)
+                return
+
+            if is_upload:
+                with mock._lock:
+                    mock.uploads[path[len("/upload/") :]] = length
+                self._send(httpx.Response(200))
+            else:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(mock.output_bytes))
+                self.end_headers()
+                remaining = mock.output_bytes
+                chunk = b"\x00" * min(_CHUNK_SIZE, remaining)
+                while remaining > 0:
+                    size = min(len(chunk), remaining)
+                    self.wfile.write(chunk[:size])
+                    self._throttle(size)
+                    remaining -= size
+            mock._record(self.command, path, 200)
+
+        def _drain(self, length: int, throttle: bool) -> None:
+            while length > 0:
+                size = len(self.rfile.read(min(_CHUNK_SIZE, length)))
+                if size == 0:
+                    break
+                if throttle:
+                    self._throttle(size)
+                length -= size
+
+        def _throttle(self, size: int) -> None:
+            if mock.bandwidth_bytes_per_second:
+                time.sleep(size / mock.bandwidth_bytes_per_second)
+
+        def _send(self, response: httpx.Response) -> None:
+            content = response.read()
+            self.send_response(response.status_code)
+            for name, value in response.headers.items():
+                if name.lower() not in ("content-length", "transfer-encoding"):
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        def log_message(self, format: str, *args: typing.Any) -> None:
+            pass
+
+    return Handler
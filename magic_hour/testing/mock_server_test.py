@@ -0,0 +1,152 @@
+import httpx
+import pathlib
+import pytest
+import re
+import time
+
+from magic_hour import ApiError, Client
+from magic_hour.testing import MockMagicHour
+from magic_hour.testing.mock_server import ENDPOINTS
+
+
+_RESOURCES = pathlib.Path(__file__).parent.parent / "resources"
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _image(tmp_path: pathlib.Path, name: str = "in.png") -> str:
+    path = tmp_path / name
+    path.write_bytes(b"\x89PNG" + b"\x00" * 1020)
+    return str(path)
+
+
+def test_every_resource_endpoint_is_served() -> None:
+    paths = set()
+    for source in _RESOURCES.glob("**/client.py"):
+        paths.update(re.findall(r'path=f?"(/v1/[^"]*)"', source.read_text()))
+    mock = MockMagicHour()
+    client = mock.client()
+
+    for path in sorted(paths):
+        if "{id}" in path:
+            response = client._base_client.httpx_client.get(
+                f"https://api.magichour.mock{path.replace('{id}', 'missing')}",
+                headers={"Authorization": "Bearer mock-token"},
+            )
+            assert response.json() == {"message": "Project not found"}, path
+        else:
+            assert path in ENDPOINTS or path == "/v1/files/upload-urls", path
+
+
+def test_generate_uploads_renders_and_downloads(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(queue_seconds=0.02, render_seconds=0.05, output_bytes=64)
+    client = mock.client()
+
+    result = client.v1.face_swap_photo.generate(
+        assets={
+            "source_file_path": _image(tmp_path, "source.png"),
+            "target_file_path": _image(tmp_path, "target.png"),
+        },
+        download_directory=str(tmp_path),
+    )
+
+    assert result.status == "complete"
+    assert result.downloaded_paths is not None
+    assert [pathlib.Path(p).stat().st_size for p in result.downloaded_paths] == [64]
+    assert sorted(mock.uploads.values()) == [1024, 1024]
+    statuses = [r.path for r in mock.requests if r.method == "GET"]
+    assert len(statuses) >= 3  # queued, rendering, then complete
+    assert result.timings is not None
+    assert result.timings.queued_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_async_client_and_failed_renders() -> None:
+    mock = MockMagicHour(job_failure_rate=1.0, render_seconds={"video": 0.02})
+    client = mock.async_client()
+
+    result = await client.v1.text_to_video.generate(
+        end_seconds=2.0,
+        style={"prompt": "a dog running"},
+        orientation="landscape",
+        download_outputs=False,
+    )
+
+    assert result.status == "error"
+    assert result.error is not None
+    assert result.credits_charged == 60
+    assert mock.job_status(result.id) == "error"
+
+    await client.v1.video_projects.delete(id=result.id)
+    assert mock.job_status(result.id) is None
+
+
+def test_injected_rate_limit() -> None:
+    mock = MockMagicHour(retry_after=3)
+    mock.inject(429, count=2, path="/v1/ai-image-generator")
+    client = mock.client()
+
+    for _ in range(2):
+        with pytest.raises(ApiError) as exc_info:
+            client.v1.ai_image_generator.create(
+                image_count=1, orientation="square", style={"prompt": "a cat"}
+            )
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.response.headers["Retry-After"] == "3"
+
+    created = client.v1.ai_image_generator.create(
+        image_count=2, orientation="square", style={"prompt": "a cat"}
+    )
+    assert created.credits_charged == 10
+    assert [r.status_code for r in mock.requests] == [429, 429, 200]
+
+
+def test_random_failures_are_seeded() -> None:
+    def run() -> list:
+        mock = MockMagicHour(error_rate=0.3, rate_limit_rate=0.2, seed=7)
+        client = mock.client()
+        for _ in range(20):
+            try:
+                client.v1.ai_image_generator.create(
+                    image_count=1, orientation="square", style={"prompt": "a cat"}
+                )
+            except ApiError:
+                pass
+        return [r.status_code for r in mock.requests]
+
+    codes = run()
+    assert codes == run()
+    assert {429, 200} <= set(codes)
+    assert any(code >= 500 for code in codes)
+
+
+def test_bandwidth_limit_slows_transfers(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(bandwidth_bytes_per_second=10_000)
+    client = mock.client()
+
+    started = time.perf_counter()
+    client.v1.files.upload_file(_image(tmp_path))
+
+    assert time.perf_counter() - started >= 0.1
+
+
+def test_real_server(tmp_path: pathlib.Path) -> None:
+    mock = MockMagicHour(render_seconds=0.02)
+
+    with mock.serve() as url:
+        client = Client(token="mock-token", base_url=url)
+        result = client.v1.ai_image_upscaler.generate(
+            assets={"image_file_path": _image(tmp_path)},
+            scale_factor=2.0,
+            style={"enhancement": "Balanced"},
+            download_directory=str(tmp_path),
+        )
+        unauthorized = httpx.get(f"{url}/v1/image-projects/{result.id}")
+
+    assert result.status == "complete"
+    assert result.downloaded_paths == [str(tmp_path / f"{result.id}-0.png")]
+    assert unauthorized.status_code == 401
+    assert next(iter(mock.uploads)).startswith("api-assets/mock/")
@@ -0,0 +1,476 @@
+import asyncio
+import collections
+import datetime
+import gzip
+import httpx
+import json
+import os
+import re
+import threading
+import time
+import typing
+
+from magic_hour.client import AsyncClient, Client
+from magic_hour.helpers.tracing import endpoint_template
+
+
+LOG_VERSION = 1
+
+# Presigned upload and CDN URLs carry their credentials in the query string
+_URL_QUERY = re.compile(r"(https?://[^\"'\s?]+)\?[^\"'\s]*")
+_TEXT_TYPES = ("application/json", "text/", "application/problem+json")
+# headers that change how the SDK behaves and are safe to keep
+_KEPT_HEADERS = ("content-type", "retry-after", "x-ratelimit-remaining")
+# the body is stored decoded, so these would no longer describe it
+_TRANSPORT_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+Entry = typing.Dict[str, typing.Any]
+"""
+One recorded exchange. Keys are kept short since logs can hold many polls:
+`t` start offset and `d` duration in seconds, `m` method, `p` path (hosts and query
+strings are dropped), `q` request body size, `s` status code, `h` kept response
+headers, and either `b` the text body or `n` the size of a binary body (served back
+as zero bytes).
+"""
+
+
+def _open(path: typing.Union[str, "os.PathLike[str]"], mode: str) -> typing.IO[str]:
+    if os.fspath(path).endswith(".gz"):
+        return typing.cast(typing.IO[str], gzip.open(path, mode + "t"))
+    return open(path, mode)
+
+
+def redact_urls(text: str) -> str:
+    """Strip the query string (signatures, tokens) from every URL in `text`"""
+    return _URL_QUERY.sub(r"\1", text)
+
+
+class TrafficRecorder:
+    """
+    Records the SDK's HTTP traffic (API requests, presigned uploads and output
+    downloads) to a compact JSON-lines log, which `TrafficReplay` can serve back.
+
+    Logs are redacted as they are written: request headers and bodies are never
+    stored (only the body size), query strings are dropped from URLs, including
+    presigned URLs inside response bodies, and binary bodies are reduced to their
+    size, counted as they stream through rather than read into memory. Pass
+    `redact` to scrub response entries further, e.g. project names. A `.gz` path
+    is compressed.
+
+    ```py
+    with TrafficRecorder("traffic.jsonl.gz") as recorder:
+        client = recorder.client(token=os.environ["MAGIC_HOUR_API_KEY"])
+        client.v1.face_swap_photo.generate(...)
+    ```
+
+    Args:
+        path: File to write the log to
+        redact: Called with every entry before it is written; returns the entry to
+            write, or None to leave it out
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, "os.PathLike[str]"],
+        *,
+        redact: typing.Optional[
+            typing.Callable[[Entry], typing.Optional[Entry]]
+        ] = None,
+    ):
+        self.path = path
+        self.redact = redact
+        self._file = _open(path, "w")
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._write(
+            {
+                "version": LOG_VERSION,
+                "recorded_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+        )
+
+    def transport(
+        self, transport: typing.Optional[httpx.BaseTransport] = None
+    ) -> httpx.BaseTransport:
+        """A transport for `httpx.Client` that records what `transport` sends"""
+        return _RecordingTransport(self, transport or httpx.HTTPTransport())
+
+    def async_transport(
+        self, transport: typing.Optional[httpx.AsyncBaseTransport] = None
+    ) -> httpx.AsyncBaseTransport:
+        """A transport for `httpx.AsyncClient` that records what `transport` sends"""
+        return _AsyncRecordingTransport(self, transport or httpx.AsyncHTTPTransport())
+
+    def client(
+        self,
+        transport: typing.Optional[httpx.BaseTransport] = None,
+        **kwargs: typing.Any,
+    ) -> Client:
+        """
+        A `Client` whose API, upload and download traffic is recorded; it is sent
+        through `transport` (the network by default). Other keyword arguments are
+        passed to `Client`.
+        """
+        kwargs.setdefault(
+            "httpx_client", httpx.Client(transport=self.transport(transport))
+        )
+        kwargs.setdefault(
+            "transfer_client",
+            httpx.Client(transport=self.transport(transport), timeout=None),
+        )
+        return Client(**kwargs)
+
+    def async_client(
+        self,
+        transport: typing.Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: typing.Any,
+    ) -> AsyncClient:
+        """Async variant of `client()`"""
+        kwargs.setdefault(
+            "httpx_client",
+            httpx.AsyncClient(transport=self.async_transport(transport)),
+        )
+        kwargs.setdefault(
+            "transfer_client",
+            httpx.AsyncClient(transport=self.async_transport(transport), timeout=None),
+        )
+        return AsyncClient(**kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "TrafficRecorder":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
+
+    def _entry(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        started: float,
+        finished: float,
+    ) -> Entry:
+        entry: Entry = {
+            "t": round(started - self._started, 6),
+            "d": round(finished - started, 6),
+            "m": request.method,
+            "p": request.url.path,
+            "q": int(request.headers.get("content-length", 0)),
+            "s": response.status_code,
+        }
+        headers = {
+            name: response.headers[name]
+            for name in _KEPT_HEADERS
+            if name in response.headers
+        }
+        if headers:
+            entry["h"] = headers
+        return entry
+
+    def _emit(self, entry: Entry) -> None:
+        redacted = self.redact(entry) if self.redact is not None else entry
+        if redacted is not None:
+            self._write(redacted)
+
+    def _record(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        started: float,
+        finished: float,
+    ) -> httpx.Response:
+        """Log a text response, which the transport has read in full"""
+        content = response.content
+        entry = self._entry(request, response, started, finished)
+        if content:
+            entry["b"] = redact_urls(response.text)
+        self._emit(entry)
+
+        return httpx.Response(
+            response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _TRANSPORT_HEADERS
+            ],
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def _record_stream(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        started: float,
+        asynchronous: bool,
+    ) -> httpx.Response:
+        """
+        Pass a binary response through unread, logging its size once the body has
+        been consumed, so large downloads are never held in memory
+        """
+
+        def done(size: int) -> None:
+            entry = self._entry(request, response, started, time.perf_counter())
+            if size:
+                entry["n"] = size
+            self._emit(entry)
+
+        stream: typing.Union[httpx.SyncByteStream, httpx.AsyncByteStream]
+        if asynchronous:
+            stream = _AsyncCountingStream(
+                typing.cast(httpx.AsyncByteStream, response.stream), done
+            )
+        else:
+            stream = _CountingStream(
+                typing.cast(httpx.SyncByteStream, response.stream), done
+            )
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=stream,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def _write(self, entry: Entry) -> None:
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+
+def _is_text(response: httpx.Response) -> bool:
+    return response.headers.get("content-type", "").startswith(_TEXT_TYPES)
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Counts the bytes of a response body as they pass through"""
+
+    def __init__(
+        self, stream: httpx.SyncByteStream, done: typing.Callable[[int], None]
+    ):
+        self._stream = stream
+        self._done: typing.Optional[typing.Callable[[int], None]] = done
+        self._size = 0
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            done, self._done = self._done, None
+            if done is not None:
+                done(self._size)
+
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    """Async variant of `_CountingStream`"""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, done: typing.Callable[[int], None]
+    ):
+        self._stream = stream
+        self._done: typing.Optional[typing.Callable[[int], None]] = done
+        self._size = 0
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            done, self._done = self._done, None
+            if done is not None:
+                done(self._size)
+
+
+class _RecordingTransport(httpx.BaseTransport):
+    def __init__(self, recorder: TrafficRecorder, transport: httpx.BaseTransport):
+        self._recorder = recorder
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        if not _is_text(response):
+            return self._recorder._record_stream(request, response, started, False)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._recorder._record(request, response, started, time.perf_counter())
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, recorder: TrafficRecorder, transport: httpx.AsyncBaseTransport):
+        self._recorder = recorder
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        if not _is_text(response):
+            return self._recorder._record_stream(request, response, started, True)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._recorder._record(request, response, started, time.perf_counter())
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class TrafficReplay:
+    """
+    Serves a log written by `TrafficRecorder` back to the SDK, with no network.
+
+    Responses are matched by method and path, in recorded order; once the
+    responses recorded for a path are used up, the last one is repeated (e.g. a
+    project's final status). Paths that were never recorded fall back to responses
+    recorded for the same endpoint (`/v1/video-projects/{id}`), so a log can drive
+    more jobs than it captured. Binary bodies are served as zero bytes of the
+    recorded size.
+
+    ```py
+    replay = TrafficReplay("traffic.jsonl.gz", speed=1.0)  # original timing
+    client = replay.client(token="replay")
+    client.v1.face_swap_photo.generate(...)
+    ```
+
+    Args:
+        path: Log written by `TrafficRecorder`
+        speed: None to answer immediately; otherwise every response is delayed by
+            its recorded duration divided by `speed` (1.0 is the original timing,
+            2.0 twice as fast)
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, "os.PathLike[str]"],
+        *,
+        speed: typing.Optional[float] = None,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be greater than 0")
+        self.speed = speed
+        self._lock = threading.Lock()
+        self._exact: typing.Dict[typing.Tuple[str, str], typing.Deque[Entry]] = (
+            collections.defaultdict(collections.deque)
+        )
+        self._templates: typing.Dict[typing.Tuple[str, str], typing.Deque[Entry]] = (
+            collections.defaultdict(collections.deque)
+        )
+        self._last: typing.Dict[typing.Tuple[str, str], Entry] = {}
+        self._served: typing.Set[int] = set()
+
+        with _open(path, "r") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != LOG_VERSION:
+                raise ValueError(
+                    f"Unsupported traffic log version: {header.get('version')!r}"
+                )
+            self.entries: typing.List[Entry] = [
+                json.loads(line) for line in f if line.strip()
+            ]
+        for entry in self.entries:
+            self._exact[(entry["m"], entry["p"])].append(entry)
+            self._templates[(entry["m"], endpoint_template(entry["p"]))].append(entry)
+
+    def transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.Client`; recorded durations block the caller"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay, response = self.respond(request)
+            if delay > 0:
+                time.sleep(delay)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """A transport for `httpx.AsyncClient`; recorded durations yield to the loop"""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay, response = self.respond(request)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return response
+
+        return httpx.MockTransport(handler)
+
+    def client(self, **kwargs: typing.Any) -> Client:
+        """A `Client` served entirely from the log"""
+        kwargs.setdefault("token", "replay")
+        kwargs.setdefault("httpx_client", httpx.Client(transport=self.transport()))
+        kwargs.setdefault("transfer_client", httpx.Client(transport=self.transport()))
+        return Client(**kwargs)
+
+    def async_client(self, **kwargs: typing.Any) -> AsyncClient:
+        """An `AsyncClient` served entirely from the log"""
+        kwargs.setdefault("token", "replay")
+        kwargs.setdefault(
+            "httpx_client", httpx.AsyncClient(transport=self.async_transport())
+        )
+        kwargs.setdefault(
+            "transfer_client", httpx.AsyncClient(transport=self.async_transport())
+        )
+        return AsyncClient(**kwargs)
+
+    def respond(self, request: httpx.Request) -> typing.Tuple[float, httpx.Response]:
+        """The recorded response for `request` and how long to delay it"""
+        entry = self._next(request.method, request.url.path)
+        if "b" in entry:
+            content = entry["b"].encode("utf-8")
+        else:
+            content = b"\x00" * entry.get("n", 0)
+        response = httpx.Response(
+            entry["s"], headers=entry.get("h"), content=content, request=request
+        )
+        delay = entry["d"] / self.speed if self.speed is not None else 0.0
+        return delay, response
+
+    def _next(self, method: str, path: str) -> Entry:
+        exact = (method, path)
+        template = (method, endpoint_template(path))
+        with self._lock:
+            entry = self._pop(self._exact.get(exact))
+            if entry is None and exact not in self._exact:
+                entry = self._pop(self._templates.get(template))
+            if entry is None:
+                entry = self._last.get(exact) or self._last.get(template)
+            if entry is None:
+                raise LookupError(f"No recorded response for {method} {path}")
+            self._last[exact] = self._last[template] = entry
+            return entry
+
+    def _pop(
+        self, queue: typing.Optional[typing.Deque[Entry]]
+    ) -> typing.Optional[Entry]:
+        # entries are queued under their path and their endpoint, so skip the ones
+        # already served through the other queue
+        while queue:
+            entry = queue.popleft()
+            if id(entry) not in self._served:
+                self._served.add(id(entry))
+                return entry
+        return None
+
+
+def load_entries(path: typing.Union[str, "os.PathLike[str]"]) -> typing.List[Entry]:
+    """The entries of a traffic log, for analysis"""
+    return TrafficReplay(path).entries
@@ -0,0 +1,163 @@
+import httpx
+import json
+import pathlib
+import pytest
+import time
+import typing
+
+from magic_hour import Client
+from magic_hour.testing import (
+    MOCK_BASE_URL,
+    MockMagicHour,
+    TrafficRecorder,
+    TrafficReplay,
+    redact_urls,
+)
+from magic_hour.testing.recording import Entry
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGIC_HOUR_POLL_INTERVAL", "0.01")
+
+
+def _generate(client: Client, tmp_path: pathlib.Path) -> typing.Any:
+    image = tmp_path / "in.png"
+    image.write_bytes(b"\x89PNG" + b"\x00" * 1020)
+    return client.v1.ai_image_upscaler.generate(
+        assets={"image_file_path": str(image)},
+        scale_factor=2.0,
+        style={"enhancement": "Balanced"},
+        download_directory=str(tmp_path),
+    )
+
+
+def _record(tmp_path: pathlib.Path, log: pathlib.Path) -> MockMagicHour:
+    mock = MockMagicHour(render_seconds=0.05, latency_seconds=0.02, output_bytes=64)
+    with TrafficRecorder(log) as recorder:
+        client = recorder.client(
+            mock.transport(), token="secret-token", base_url=MOCK_BASE_URL
+        )
+        _generate(client, tmp_path)
+    return mock
+
+
+@pytest.mark.parametrize("name", ["traffic.jsonl", "traffic.jsonl.gz"])
+def test_replay_serves_recorded_traffic(tmp_path: pathlib.Path, name: str) -> None:
+    log = tmp_path / name
+    mock = _record(tmp_path, log)
+
+    replay = TrafficReplay(log)
+    result = _generate(replay.client(), tmp_path)
+
+    assert result.status == "complete"
+    assert result.downloaded_paths is not None
+    assert pathlib.Path(result.downloaded_paths[0]).read_bytes() == b"\x00" * 64
+    recorded = [(e["m"], e["p"]) for e in replay.entries]
+    assert recorded == [(r.method, r.path) for r in mock.requests]
+
+
+def test_log_is_redacted(tmp_path: pathlib.Path) -> None:
+    log = tmp_path / "traffic.jsonl"
+    _record(tmp_path, log)
+
+    text = log.read_text()
+    entries = [json.loads(line) for line in text.splitlines()[1:]]
+
+    assert "secret-token" not in text
+    assert "Balanced" not in text  # request bodies
+    upload = next(e for e in entries if e["m"] == "PUT")
+    assert upload["q"] == 1024 and "b" not in upload and "n" not in upload
+    download = next(e for e in entries if e["p"].startswith("/cdn/"))
+    assert download["n"] == 64 and "b" not in download
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+@pytest.mark.asyncio
+async def test_binary_bodies_stream_through(
+    tmp_path: pathlib.Path, asynchronous: bool
+) -> None:
+    log = tmp_path / "traffic.jsonl"
+    produced: typing.List[int] = []
+
+    def chunks() -> typing.Iterator[bytes]:
+        for i in range(4):
+            produced.append(i)
+            yield b"\x00" * 1024
+
+    async def async_chunks() -> typing.AsyncIterator[bytes]:
+        for chunk in chunks():
+            yield chunk
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = async_chunks() if asynchronous else chunks()
+        return httpx.Response(200, headers={"content-type": "video/mp4"}, content=body)
+
+    received = []
+    with TrafficRecorder(log) as recorder:
+        if asynchronous:
+            transport = recorder.async_transport(httpx.MockTransport(respond))
+            async with httpx.AsyncClient(transport=transport) as async_client:
+                async with async_client.stream("GET", "https://cdn.test/out.mp4") as r:
+                    async for chunk in r.aiter_raw():
+                        received.append((len(chunk), len(produced)))
+        else:
+            with httpx.Client(
+                transport=recorder.transport(httpx.MockTransport(respond))
+            ) as client:
+                with client.stream("GET", "https://cdn.test/out.mp4") as r:
+                    for chunk in r.iter_raw():
+                        received.append((len(chunk), len(produced)))
+
+    # each chunk reached the caller before the next one was produced
+    assert received == [(1024, 1), (1024, 2), (1024, 3), (1024, 4)]
+    entry = json.loads(log.read_text().splitlines()[1])
+    assert entry["p"] == "/out.mp4" and entry["n"] == 4096 and "b" not in entry
+
+
+def test_redact_hook_and_url_queries(tmp_path: pathlib.Path) -> None:
+    log = tmp_path / "traffic.jsonl"
+    mock = MockMagicHour()
+
+    def drop_names(entry: Entry) -> Entry:
+        if entry["m"] == "GET" and "b" in entry:
+            body = json.loads(entry["b"])
+            body["name"] = None
+            entry["b"] = json.dumps(body)
+        return entry
+
+    with TrafficRecorder(log, redact=drop_names) as recorder:
+        client = recorder.client(mock.transport(), base_url=MOCK_BASE_URL, token="t")
+        created = client.v1.ai_image_generator.create(
+            name="private", image_count=1, orientation="square", style={"prompt": "x"}
+        )
+        client.v1.image_projects.get(id=created.id)
+
+    assert "private" not in log.read_text()
+    assert redact_urls('{"url": "https://cdn.test/a.png?X-Amz-Signature=abc"}') == (
+        '{"url": "https://cdn.test/a.png"}'
+    )
+
+
+def test_original_timing_and_fallback(tmp_path: pathlib.Path) -> None:
+    log = tmp_path / "traffic.jsonl"
+    _record(tmp_path, log)
+
+    fast = TrafficReplay(log).client()
+    started = time.perf_counter()
+    _generate(fast, tmp_path)
+    fast_seconds = time.perf_counter() - started
+
+    timed = TrafficReplay(log, speed=1.0).client()
+    started = time.perf_counter()
+    _generate(timed, tmp_path)
+    timed_seconds = time.perf_counter() - started
+
+    assert timed_seconds > fast_seconds
+    assert timed_seconds >= 0.02 * 3  # at least the create and two API requests
+
+    # a project id that was never recorded is served from the same endpoint
+    project = TrafficReplay(log).client().v1.image_projects.get(id="other")
+    assert project.status in ("queued", "rendering", "complete")
+    with pytest.raises(LookupError):
+        TrafficReplay(log).client().v1.video_projects.get(id="other")
@@ -0,0 +1,114 @@
+"""
+Per-model capabilities of each resource, as documented by the API.
+
+Generated by codemod/generate_capabilities.py from the create() docstrings; do not
+edit by hand. Keyed by resource, then by the checked argument, then by model:
+
+- `resolution`, `image_count`, `end_seconds`: the values the model accepts
+- `additional_images`: most `assets.image_file_paths` beyond the first
+- `audio`: False where the model can't include audio
+"""
+
+import typing
+
+
+CAPABILITIES: typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]] = {
+    "ai_image_editor": {
+        "additional_images": {
+            "nano-banana": 9,
+            "nano-banana-2": 9,
+            "nano-banana-pro": 9,
+            "qwen-edit": 2,
+            "seedream-v4": 9,
+            "seedream-v4.5": 9,
+        },
+        "resolution": {
+            "nano-banana": ("640px", "1k"),
+            "nano-banana-2": ("640px", "1k", "2k", "4k"),
+            "nano-banana-pro": ("1k", "2k", "4k"),
+            "qwen-edit": ("640px", "1k", "2k"),
+            "seedream-v4": ("640px", "1k", "2k", "4k"),
+            "seedream-v4.5": ("640px", "1k", "2k", "4k"),
+        },
+    },
+    "ai_image_generator": {
+        "image_count": {
+            "flux-schnell": (1, 2, 3, 4),
+            "nano-banana": (1, 2, 3, 4),
+            "nano-banana-2": (1, 4, 9, 16),
+            "nano-banana-pro": (1, 4, 9, 16),
+            "seedream-v4": (1, 2, 3, 4),
+            "z-image-turbo": (1, 2, 3, 4),
+        },
+        "resolution": {
+            "flux-schnell": ("640px", "1k", "2k"),
+            "nano-banana": ("640px", "1k"),
+            "nano-banana-2": ("640px", "1k", "2k", "4k"),
+            "nano-banana-pro": ("1k", "2k", "4k"),
+            "seedream-v4": ("640px", "1k", "2k", "4k"),
+            "z-image-turbo": ("640px", "1k", "2k"),
+        },
+    },
+    "image_to_video": {
+        "audio": {
+            "kling-1.6": False,
+            "seedance": False,
+            "wan-2.2": False,
+        },
+        "end_seconds": {
+            "kling-1.6": (5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60),
+            "kling-2.5": (5, 10),
+            "kling-3.0": (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+            "ltx-2": (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 20, 25, 30),
+            "seedance": (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12),
+            "seedance-2.0": (4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+            "sora-2": (4, 8, 12, 24, 36, 48, 60),
+            "veo3.1": (4, 6, 8, 16, 24, 32, 40, 48, 56),
+            "veo3.1-lite": (8, 16, 24, 32, 40, 48, 56),
+            "wan-2.2": (3, 4, 5, 6, 7, 8, 9, 10, 15),
+        },
+        "resolution": {
+            "kling-1.6": ("720p", "1080p"),
+            "kling-2.5": ("720p", "1080p"),
+            "kling-3.0": ("720p", "1080p"),
+            "ltx-2": ("480p", "720p", "1080p"),
+            "seedance": ("480p", "720p", "1080p"),
+            "seedance-2.0": ("480p", "720p"),
+            "sora-2": ("720p",),
+            "veo3.1": ("720p", "1080p"),
+            "veo3.1-lite": ("720p", "1080p"),
+            "wan-2.2": ("480p", "720p", "1080p"),
+        },
+    },
+    "text_to_video": {
+        "audio": {
+            "kling-1.6": False,
+            "seedance": False,
+            "wan-2.2": False,
+        },
+        "end_seconds": {
+            "kling-1.6": (5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60),
+            "kling-2.5": (5, 10),
+            "kling-3.0": (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+            "ltx-2": (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 20, 25, 30),
+            "seedance": (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12),
+            "seedance-2.0": (4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+            "sora-2": (4, 8, 12, 24, 36, 48, 60),
+            "veo3.1": (4, 6, 8, 16, 24, 32, 40, 48, 56),
+            "veo3.1-lite": (8, 16, 24, 32, 40, 48, 56),
+            "wan-2.2": (3, 4, 5, 6, 7, 8, 9, 10, 15),
+        },
+        "resolution": {
+            "kling-1.6": ("720p", "1080p"),
+            "kling-2.5": ("720p", "1080p"),
+            "kling-3.0": ("720p", "1080p"),
+            "ltx-2": ("480p", "720p", "1080p"),
+            "seedance": ("480p", "720p", "1080p"),
+            "seedance-2.0": ("480p", "720p"),
+            "sora-2": ("720p",),
+            "veo3.1": ("720p", "1080p"),
+            "veo3.1-lite": ("720p", "1080p"),
+            "wan-2.2": ("480p", "720p", "1080p"),
+        },
+    },
+}
@@ -1,58 +1,125 @@
-from .v1_ai_clothes_changer_create_response import V1AiClothesChangerCreateResponse
-from .v1_ai_face_editor_create_response import V1AiFaceEditorCreateResponse
-from .v1_ai_gif_generator_create_response import V1AiGifGeneratorCreateResponse
-from .v1_ai_headshot_generator_create_response import (
-    V1AiHeadshotGeneratorCreateResponse,
-)
-from .v1_ai_image_editor_create_response import V1AiImageEditorCreateResponse
-from .v1_ai_image_generator_create_response import V1AiImageGeneratorCreateResponse
-from .v1_ai_image_upscaler_create_response import V1AiImageUpscalerCreateResponse
-from .v1_ai_meme_generator_create_response import V1AiMemeGeneratorCreateResponse
-from .v1_ai_qr_code_generator_create_response import V1AiQrCodeGeneratorCreateResponse
-from .v1_ai_talking_photo_create_response import V1AiTalkingPhotoCreateResponse
-from .v1_ai_voice_cloner_create_response import V1AiVoiceClonerCreateResponse
-from .v1_ai_voice_generator_create_response import V1AiVoiceGeneratorCreateResponse
-from .v1_animation_create_response import V1AnimationCreateResponse
-from .v1_audio_projects_get_response import V1AudioProjectsGetResponse
-from .v1_audio_projects_get_response_downloads_item import (
-    V1AudioProjectsGetResponseDownloadsItem,
-)
-from .v1_audio_projects_get_response_error import V1AudioProjectsGetResponseError
-from .v1_auto_subtitle_generator_create_response import (
-    V1AutoSubtitleGeneratorCreateResponse,
-)
-from .v1_body_swap_create_response import V1BodySwapCreateResponse
-from .v1_face_detection_create_response import V1FaceDetectionCreateResponse
-from .v1_face_detection_get_response import V1FaceDetectionGetResponse
-from .v1_face_detection_get_response_faces_item import (
-    V1FaceDetectionGetResponseFacesItem,
-)
-from .v1_face_swap_create_response import V1FaceSwapCreateResponse
-from .v1_face_swap_photo_create_response import V1FaceSwapPhotoCreateResponse
-from .v1_files_upload_urls_create_response import V1FilesUploadUrlsCreateResponse
-from .v1_files_upload_urls_create_response_items_item import (
-    V1FilesUploadUrlsCreateResponseItemsItem,
-)
-from .v1_head_swap_create_response import V1HeadSwapCreateResponse
-from .v1_image_background_remover_create_response import (
-    V1ImageBackgroundRemoverCreateResponse,
-)
-from .v1_image_projects_get_response import V1ImageProjectsGetResponse
-from .v1_image_projects_get_response_downloads_item import (
-    V1ImageProjectsGetResponseDownloadsItem,
-)
-from .v1_image_projects_get_response_error import V1ImageProjectsGetResponseError
-from .v1_image_to_video_create_response import V1ImageToVideoCreateResponse
-from .v1_lip_sync_create_response import V1LipSyncCreateResponse
-from .v1_photo_colorizer_create_response import V1PhotoColorizerCreateResponse
-from .v1_text_to_video_create_response import V1TextToVideoCreateResponse
-from .v1_video_projects_get_response import V1VideoProjectsGetResponse
-from .v1_video_projects_get_response_download import V1VideoProjectsGetResponseDownload
-from .v1_video_projects_get_response_downloads_item import (
-    V1VideoProjectsGetResponseDownloadsItem,
-)
-from .v1_video_projects_get_response_error import V1VideoProjectsGetResponseError
-from .v1_video_to_video_create_response import V1VideoToVideoCreateResponse
+import importlib
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from .v1_ai_clothes_changer_create_response import V1AiClothesChangerCreateResponse
+    from .v1_ai_face_editor_create_response import V1AiFaceEditorCreateResponse
+    from .v1_ai_gif_generator_create_response import V1AiGifGeneratorCreateResponse
+    from .v1_ai_headshot_generator_create_response import (
+        V1AiHeadshotGeneratorCreateResponse,
+    )
+    from .v1_ai_image_editor_create_response import V1AiImageEditorCreateResponse
+    from .v1_ai_image_generator_create_response import V1AiImageGeneratorCreateResponse
+    from .v1_ai_image_upscaler_create_response import V1AiImageUpscalerCreateResponse
+    from .v1_ai_meme_generator_create_response import V1AiMemeGeneratorCreateResponse
+    from .v1_ai_qr_code_generator_create_response import (
+        V1AiQrCodeGeneratorCreateResponse,
+    )
+    from .v1_ai_talking_photo_create_response import V1AiTalkingPhotoCreateResponse
+    from .v1_ai_voice_cloner_create_response import V1AiVoiceClonerCreateResponse
+    from .v1_ai_voice_generator_create_response import V1AiVoiceGeneratorCreateResponse
+    from .v1_animation_create_response import V1AnimationCreateResponse
+    from .v1_audio_projects_get_response import V1AudioProjectsGetResponse
+    from .v1_audio_projects_get_response_downloads_item import (
+        V1AudioProjectsGetResponseDownloadsItem,
+    )
+    from .v1_audio_projects_get_response_error import V1AudioProjectsGetResponseError
+    from .v1_auto_subtitle_generator_create_response import (
+        V1AutoSubtitleGeneratorCreateResponse,
+    )
+    from .v1_body_swap_create_response import V1BodySwapCreateResponse
+    from .v1_face_detection_create_response import V1FaceDetectionCreateResponse
+    from .v1_face_detection_get_response import V1FaceDetectionGetResponse
+    from .v1_face_detection_get_response_faces_item import (
+        V1FaceDetectionGetResponseFacesItem,
+    )
+    from .v1_face_swap_create_response import V1FaceSwapCreateResponse
+    from .v1_face_swap_photo_create_response import V1FaceSwapPhotoCreateResponse
+    from .v1_files_upload_urls_create_response import V1FilesUploadUrlsCreateResponse
+    from .v1_files_upload_urls_create_response_items_item import (
+        V1FilesUploadUrlsCreateResponseItemsItem,
+    )
+    from .v1_head_swap_create_response import V1HeadSwapCreateResponse
+    from .v1_image_background_remover_create_response import (
+        V1ImageBackgroundRemoverCreateResponse,
+    )
+    from .v1_image_projects_get_response import V1ImageProjectsGetResponse
+    from .v1_image_projects_get_response_downloads_item import (
+        V1ImageProjectsGetResponseDownloadsItem,
+    )
+    from .v1_image_projects_get_response_error import V1ImageProjectsGetResponseError
+    from .v1_image_to_video_create_response import V1ImageToVideoCreateResponse
+    from .v1_lip_sync_create_response import V1LipSyncCreateResponse
+    from .v1_photo_colorizer_create_response import V1PhotoColorizerCreateResponse
+    from .v1_text_to_video_create_response import V1TextToVideoCreateResponse
+    from .v1_video_projects_get_response import V1VideoProjectsGetResponse
+    from .v1_video_projects_get_response_download import (
+        V1VideoProjectsGetResponseDownload,
+    )
+    from .v1_video_projects_get_response_downloads_item import (
+        V1VideoProjectsGetResponseDownloadsItem,
+    )
+    from .v1_video_projects_get_response_error import V1VideoProjectsGetResponseError
+    from .v1_video_to_video_create_response import V1VideoToVideoCreateResponse
+
+
+# Exported names are resolved on first access so that importing the SDK does not
+# import (and build pydantic schemas for) every model up front.
+_LAZY_EXPORTS: typing.Dict[str, str] = {
+    "V1AiClothesChangerCreateResponse": ".v1_ai_clothes_changer_create_response",
+    "V1AiFaceEditorCreateResponse": ".v1_ai_face_editor_create_response",
+    "V1AiGifGeneratorCreateResponse": ".v1_ai_gif_generator_create_response",
+    "V1AiHeadshotGeneratorCreateResponse": ".v1_ai_headshot_generator_create_response",
+    "V1AiImageEditorCreateResponse": ".v1_ai_image_editor_create_response",
+    "V1AiImageGeneratorCreateResponse": ".v1_ai_image_generator_create_response",
+    "V1AiImageUpscalerCreateResponse": ".v1_ai_image_upscaler_create_response",
+    "V1AiMemeGeneratorCreateResponse": ".v1_ai_meme_generator_create_response",
+    "V1AiQrCodeGeneratorCreateResponse": ".v1_ai_qr_code_generator_create_response",
+    "V1AiTalkingPhotoCreateResponse": ".v1_ai_talking_photo_create_response",
+    "V1AiVoiceClonerCreateResponse": ".v1_ai_voice_cloner_create_response",
+    "V1AiVoiceGeneratorCreateResponse": ".v1_ai_voice_generator_create_response",
+    "V1AnimationCreateResponse": ".v1_animation_create_response",
+    "V1AudioProjectsGetResponse": ".v1_audio_projects_get_response",
+    "V1AudioProjectsGetResponseDownloadsItem": ".v1_audio_projects_get_response_downloads_item",
+    "V1AudioProjectsGetResponseError": ".v1_audio_projects_get_response_error",
+    "V1AutoSubtitleGeneratorCreateResponse": ".v1_auto_subtitle_generator_create_response",
+    "V1BodySwapCreateResponse": ".v1_body_swap_create_response",
+    "V1FaceDetectionCreateResponse": ".v1_face_detection_create_response",
+    "V1FaceDetectionGetResponse": ".v1_face_detection_get_response",
+    "V1FaceDetectionGetResponseFacesItem": ".v1_face_detection_get_response_faces_item",
+    "V1FaceSwapCreateResponse": ".v1_face_swap_create_response",
+    "V1FaceSwapPhotoCreateResponse": ".v1_face_swap_photo_create_response",
+    "V1FilesUploadUrlsCreateResponse": ".v1_files_upload_urls_create_response",
+    "V1FilesUploadUrlsCreateResponseItemsItem": ".v1_files_upload_urls_create_response_items_item",
+    "V1HeadSwapCreateResponse": ".v1_head_swap_create_response",
+    "V1ImageBackgroundRemoverCreateResponse": ".v1_image_background_remover_create_response",
+    "V1ImageProjectsGetResponse": ".v1_image_projects_get_response",
+    "V1ImageProjectsGetResponseDownloadsItem": ".v1_image_projects_get_response_downloads_item",
+    "V1ImageProjectsGetResponseError": ".v1_image_projects_get_response_error",
+    "V1ImageToVideoCreateResponse": ".v1_image_to_video_create_response",
+    "V1LipSyncCreateResponse": ".v1_lip_sync_create_response",
+    "V1PhotoColorizerCreateResponse": ".v1_photo_colorizer_create_response",
+    "V1TextToVideoCreateResponse": ".v1_text_to_video_create_response",
+    "V1VideoProjectsGetResponse": ".v1_video_projects_get_response",
+    "V1VideoProjectsGetResponseDownload": ".v1_video_projects_get_response_download",
+    "V1VideoProjectsGetResponseDownloadsItem": ".v1_video_projects_get_response_downloads_item",
+    "V1VideoProjectsGetResponseError": ".v1_video_projects_get_response_error",
+    "V1VideoToVideoCreateResponse": ".v1_video_to_video_create_response",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [
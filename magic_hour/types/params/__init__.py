@@ -1,303 +1,499 @@
-from .v1_ai_clothes_changer_create_body import (
-    V1AiClothesChangerCreateBody,
-    _SerializerV1AiClothesChangerCreateBody,
-)
-from .v1_ai_clothes_changer_create_body_assets import (
-    V1AiClothesChangerCreateBodyAssets,
-    _SerializerV1AiClothesChangerCreateBodyAssets,
-)
-from .v1_ai_clothes_changer_generate_body_assets import (
-    V1AiClothesChangerGenerateBodyAssets,
-)
-from .v1_ai_face_editor_create_body import (
-    V1AiFaceEditorCreateBody,
-    _SerializerV1AiFaceEditorCreateBody,
-)
-from .v1_ai_face_editor_create_body_assets import (
-    V1AiFaceEditorCreateBodyAssets,
-    _SerializerV1AiFaceEditorCreateBodyAssets,
-)
-from .v1_ai_face_editor_create_body_style import (
-    V1AiFaceEditorCreateBodyStyle,
-    _SerializerV1AiFaceEditorCreateBodyStyle,
-)
-from .v1_ai_face_editor_generate_body_assets import V1AiFaceEditorGenerateBodyAssets
-from .v1_ai_gif_generator_create_body import (
-    V1AiGifGeneratorCreateBody,
-    _SerializerV1AiGifGeneratorCreateBody,
-)
-from .v1_ai_gif_generator_create_body_style import (
-    V1AiGifGeneratorCreateBodyStyle,
-    _SerializerV1AiGifGeneratorCreateBodyStyle,
-)
-from .v1_ai_headshot_generator_create_body import (
-    V1AiHeadshotGeneratorCreateBody,
-    _SerializerV1AiHeadshotGeneratorCreateBody,
-)
-from .v1_ai_headshot_generator_create_body_assets import (
-    V1AiHeadshotGeneratorCreateBodyAssets,
-    _SerializerV1AiHeadshotGeneratorCreateBodyAssets,
-)
-from .v1_ai_headshot_generator_create_body_style import (
-    V1AiHeadshotGeneratorCreateBodyStyle,
-    _SerializerV1AiHeadshotGeneratorCreateBodyStyle,
-)
-from .v1_ai_headshot_generator_generate_body_assets import (
-    V1AiHeadshotGeneratorGenerateBodyAssets,
-)
-from .v1_ai_image_editor_create_body import (
-    V1AiImageEditorCreateBody,
-    _SerializerV1AiImageEditorCreateBody,
-)
-from .v1_ai_image_editor_create_body_assets import (
-    V1AiImageEditorCreateBodyAssets,
-    _SerializerV1AiImageEditorCreateBodyAssets,
-)
-from .v1_ai_image_editor_create_body_style import (
-    V1AiImageEditorCreateBodyStyle,
-    _SerializerV1AiImageEditorCreateBodyStyle,
-)
-from .v1_ai_image_editor_generate_body_assets import V1AiImageEditorGenerateBodyAssets
-from .v1_ai_image_generator_create_body import (
-    V1AiImageGeneratorCreateBody,
-    _SerializerV1AiImageGeneratorCreateBody,
-)
-from .v1_ai_image_generator_create_body_style import (
-    V1AiImageGeneratorCreateBodyStyle,
-    _SerializerV1AiImageGeneratorCreateBodyStyle,
-)
-from .v1_ai_image_upscaler_create_body import (
-    V1AiImageUpscalerCreateBody,
-    _SerializerV1AiImageUpscalerCreateBody,
-)
-from .v1_ai_image_upscaler_create_body_assets import (
-    V1AiImageUpscalerCreateBodyAssets,
-    _SerializerV1AiImageUpscalerCreateBodyAssets,
-)
-from .v1_ai_image_upscaler_create_body_style import (
-    V1AiImageUpscalerCreateBodyStyle,
-    _SerializerV1AiImageUpscalerCreateBodyStyle,
-)
-from .v1_ai_image_upscaler_generate_body_assets import (
-    V1AiImageUpscalerGenerateBodyAssets,
-)
-from .v1_ai_meme_generator_create_body import (
-    V1AiMemeGeneratorCreateBody,
-    _SerializerV1AiMemeGeneratorCreateBody,
-)
-from .v1_ai_meme_generator_create_body_style import (
-    V1AiMemeGeneratorCreateBodyStyle,
-    _SerializerV1AiMemeGeneratorCreateBodyStyle,
-)
-from .v1_ai_photo_editor_generate_body_assets import V1AiPhotoEditorGenerateBodyAssets
-from .v1_ai_qr_code_generator_create_body import (
-    V1AiQrCodeGeneratorCreateBody,
-    _SerializerV1AiQrCodeGeneratorCreateBody,
-)
-from .v1_ai_qr_code_generator_create_body_style import (
-    V1AiQrCodeGeneratorCreateBodyStyle,
-    _SerializerV1AiQrCodeGeneratorCreateBodyStyle,
-)
-from .v1_ai_talking_photo_create_body import (
-    V1AiTalkingPhotoCreateBody,
-    _SerializerV1AiTalkingPhotoCreateBody,
-)
-from .v1_ai_talking_photo_create_body_assets import (
-    V1AiTalkingPhotoCreateBodyAssets,
-    _SerializerV1AiTalkingPhotoCreateBodyAssets,
-)
-from .v1_ai_talking_photo_create_body_style import (
-    V1AiTalkingPhotoCreateBodyStyle,
-    _SerializerV1AiTalkingPhotoCreateBodyStyle,
-)
-from .v1_ai_talking_photo_generate_body_assets import V1AiTalkingPhotoGenerateBodyAssets
-from .v1_ai_voice_cloner_create_body import (
-    V1AiVoiceClonerCreateBody,
-    _SerializerV1AiVoiceClonerCreateBody,
-)
-from .v1_ai_voice_cloner_create_body_assets import (
-    V1AiVoiceClonerCreateBodyAssets,
-    _SerializerV1AiVoiceClonerCreateBodyAssets,
-)
-from .v1_ai_voice_cloner_create_body_style import (
-    V1AiVoiceClonerCreateBodyStyle,
-    _SerializerV1AiVoiceClonerCreateBodyStyle,
-)
-from .v1_ai_voice_cloner_generate_body_assets import V1AiVoiceClonerGenerateBodyAssets
-from .v1_ai_voice_generator_create_body import (
-    V1AiVoiceGeneratorCreateBody,
-    _SerializerV1AiVoiceGeneratorCreateBody,
-)
-from .v1_ai_voice_generator_create_body_style import (
-    V1AiVoiceGeneratorCreateBodyStyle,
-    _SerializerV1AiVoiceGeneratorCreateBodyStyle,
-)
-from .v1_animation_create_body import (
-    V1AnimationCreateBody,
-    _SerializerV1AnimationCreateBody,
-)
-from .v1_animation_create_body_assets import (
-    V1AnimationCreateBodyAssets,
-    _SerializerV1AnimationCreateBodyAssets,
-)
-from .v1_animation_create_body_style import (
-    V1AnimationCreateBodyStyle,
-    _SerializerV1AnimationCreateBodyStyle,
-)
-from .v1_animation_generate_body_assets import V1AnimationGenerateBodyAssets
-from .v1_auto_subtitle_generator_create_body import (
-    V1AutoSubtitleGeneratorCreateBody,
-    _SerializerV1AutoSubtitleGeneratorCreateBody,
-)
-from .v1_auto_subtitle_generator_create_body_assets import (
-    V1AutoSubtitleGeneratorCreateBodyAssets,
-    _SerializerV1AutoSubtitleGeneratorCreateBodyAssets,
-)
-from .v1_auto_subtitle_generator_create_body_style import (
-    V1AutoSubtitleGeneratorCreateBodyStyle,
-    _SerializerV1AutoSubtitleGeneratorCreateBodyStyle,
-)
-from .v1_auto_subtitle_generator_create_body_style_custom_config import (
-    V1AutoSubtitleGeneratorCreateBodyStyleCustomConfig,
-    _SerializerV1AutoSubtitleGeneratorCreateBodyStyleCustomConfig,
-)
-from .v1_auto_subtitle_generator_generate_body_assets import (
-    V1AutoSubtitleGeneratorGenerateBodyAssets,
-)
-from .v1_body_swap_create_body import (
-    V1BodySwapCreateBody,
-    _SerializerV1BodySwapCreateBody,
-)
-from .v1_body_swap_create_body_assets import (
-    V1BodySwapCreateBodyAssets,
-    _SerializerV1BodySwapCreateBodyAssets,
-)
-from .v1_face_detection_create_body import (
-    V1FaceDetectionCreateBody,
-    _SerializerV1FaceDetectionCreateBody,
-)
-from .v1_face_detection_create_body_assets import (
-    V1FaceDetectionCreateBodyAssets,
-    _SerializerV1FaceDetectionCreateBodyAssets,
-)
-from .v1_face_detection_generate_body_assets import V1FaceDetectionGenerateBodyAssets
-from .v1_face_swap_create_body import (
-    V1FaceSwapCreateBody,
-    _SerializerV1FaceSwapCreateBody,
-)
-from .v1_face_swap_create_body_assets import (
-    V1FaceSwapCreateBodyAssets,
-    _SerializerV1FaceSwapCreateBodyAssets,
-)
-from .v1_face_swap_create_body_assets_face_mappings_item import (
-    V1FaceSwapCreateBodyAssetsFaceMappingsItem,
-    _SerializerV1FaceSwapCreateBodyAssetsFaceMappingsItem,
-)
-from .v1_face_swap_create_body_style import (
-    V1FaceSwapCreateBodyStyle,
-    _SerializerV1FaceSwapCreateBodyStyle,
-)
-from .v1_face_swap_generate_body_assets import V1FaceSwapGenerateBodyAssets
-from .v1_face_swap_generate_body_assets_face_mappings_item import (
-    V1FaceSwapGenerateBodyAssetsFaceMappingsItem,
-)
-from .v1_face_swap_photo_create_body import (
-    V1FaceSwapPhotoCreateBody,
-    _SerializerV1FaceSwapPhotoCreateBody,
-)
-from .v1_face_swap_photo_create_body_assets import (
-    V1FaceSwapPhotoCreateBodyAssets,
-    _SerializerV1FaceSwapPhotoCreateBodyAssets,
-)
-from .v1_face_swap_photo_create_body_assets_face_mappings_item import (
-    V1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem,
-    _SerializerV1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem,
-)
-from .v1_face_swap_photo_generate_body_assets import V1FaceSwapPhotoGenerateBodyAssets
-from .v1_face_swap_photo_generate_body_assets_face_mappings_item import (
-    V1FaceSwapPhotoGenerateBodyAssetsFaceMappingsItem,
-)
-from .v1_files_upload_urls_create_body import (
-    V1FilesUploadUrlsCreateBody,
-    _SerializerV1FilesUploadUrlsCreateBody,
-)
-from .v1_files_upload_urls_create_body_items_item import (
-    V1FilesUploadUrlsCreateBodyItemsItem,
-    _SerializerV1FilesUploadUrlsCreateBodyItemsItem,
-)
-from .v1_head_swap_create_body import (
-    V1HeadSwapCreateBody,
-    _SerializerV1HeadSwapCreateBody,
-)
-from .v1_head_swap_create_body_assets import (
-    V1HeadSwapCreateBodyAssets,
-    _SerializerV1HeadSwapCreateBodyAssets,
-)
-from .v1_head_swap_generate_body_assets import V1HeadSwapGenerateBodyAssets
-from .v1_image_background_remover_create_body import (
-    V1ImageBackgroundRemoverCreateBody,
-    _SerializerV1ImageBackgroundRemoverCreateBody,
-)
-from .v1_image_background_remover_create_body_assets import (
-    V1ImageBackgroundRemoverCreateBodyAssets,
-    _SerializerV1ImageBackgroundRemoverCreateBodyAssets,
-)
-from .v1_image_background_remover_generate_body_assets import (
-    V1ImageBackgroundRemoverGenerateBodyAssets,
-)
-from .v1_image_to_video_create_body import (
-    V1ImageToVideoCreateBody,
-    _SerializerV1ImageToVideoCreateBody,
-)
-from .v1_image_to_video_create_body_assets import (
-    V1ImageToVideoCreateBodyAssets,
-    _SerializerV1ImageToVideoCreateBodyAssets,
-)
-from .v1_image_to_video_create_body_style import (
-    V1ImageToVideoCreateBodyStyle,
-    _SerializerV1ImageToVideoCreateBodyStyle,
-)
-from .v1_image_to_video_generate_body_assets import V1ImageToVideoGenerateBodyAssets
-from .v1_lip_sync_create_body import V1LipSyncCreateBody, _SerializerV1LipSyncCreateBody
-from .v1_lip_sync_create_body_assets import (
-    V1LipSyncCreateBodyAssets,
-    _SerializerV1LipSyncCreateBodyAssets,
-)
-from .v1_lip_sync_create_body_style import (
-    V1LipSyncCreateBodyStyle,
-    _SerializerV1LipSyncCreateBodyStyle,
-)
-from .v1_lip_sync_generate_body_assets import V1LipSyncGenerateBodyAssets
-from .v1_photo_colorizer_create_body import (
-    V1PhotoColorizerCreateBody,
-    _SerializerV1PhotoColorizerCreateBody,
-)
-from .v1_photo_colorizer_create_body_assets import (
-    V1PhotoColorizerCreateBodyAssets,
-    _SerializerV1PhotoColorizerCreateBodyAssets,
-)
-from .v1_photo_colorizer_generate_body_assets import V1PhotoColorizerGenerateBodyAssets
-from .v1_text_to_video_create_body import (
-    V1TextToVideoCreateBody,
-    _SerializerV1TextToVideoCreateBody,
-)
-from .v1_text_to_video_create_body_style import (
-    V1TextToVideoCreateBodyStyle,
-    _SerializerV1TextToVideoCreateBodyStyle,
-)
-from .v1_video_to_video_create_body import (
-    V1VideoToVideoCreateBody,
-    _SerializerV1VideoToVideoCreateBody,
-)
-from .v1_video_to_video_create_body_assets import (
-    V1VideoToVideoCreateBodyAssets,
-    _SerializerV1VideoToVideoCreateBodyAssets,
-)
-from .v1_video_to_video_create_body_style import (
-    V1VideoToVideoCreateBodyStyle,
-    _SerializerV1VideoToVideoCreateBodyStyle,
-)
-from .v1_video_to_video_generate_body_assets import V1VideoToVideoGenerateBodyAssets
+import importlib
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from .v1_ai_clothes_changer_create_body import (
+        V1AiClothesChangerCreateBody,
+        _SerializerV1AiClothesChangerCreateBody,
+    )
+    from .v1_ai_clothes_changer_create_body_assets import (
+        V1AiClothesChangerCreateBodyAssets,
+        _SerializerV1AiClothesChangerCreateBodyAssets,
+    )
+    from .v1_ai_clothes_changer_generate_body_assets import (
+        V1AiClothesChangerGenerateBodyAssets,
+    )
+    from .v1_ai_face_editor_create_body import (
+        V1AiFaceEditorCreateBody,
+        _SerializerV1AiFaceEditorCreateBody,
+    )
+    from .v1_ai_face_editor_create_body_assets import (
+        V1AiFaceEditorCreateBodyAssets,
+        _SerializerV1AiFaceEditorCreateBodyAssets,
+    )
+    from .v1_ai_face_editor_create_body_style import (
+        V1AiFaceEditorCreateBodyStyle,
+        _SerializerV1AiFaceEditorCreateBodyStyle,
+    )
+    from .v1_ai_face_editor_generate_body_assets import V1AiFaceEditorGenerateBodyAssets
+    from .v1_ai_gif_generator_create_body import (
+        V1AiGifGeneratorCreateBody,
+        _SerializerV1AiGifGeneratorCreateBody,
+    )
+    from .v1_ai_gif_generator_create_body_style import (
+        V1AiGifGeneratorCreateBodyStyle,
+        _SerializerV1AiGifGeneratorCreateBodyStyle,
+    )
+    from .v1_ai_headshot_generator_create_body import (
+        V1AiHeadshotGeneratorCreateBody,
+        _SerializerV1AiHeadshotGeneratorCreateBody,
+    )
+    from .v1_ai_headshot_generator_create_body_assets import (
+        V1AiHeadshotGeneratorCreateBodyAssets,
+        _SerializerV1AiHeadshotGeneratorCreateBodyAssets,
+    )
+    from .v1_ai_headshot_generator_create_body_style import (
+        V1AiHeadshotGeneratorCreateBodyStyle,
+        _SerializerV1AiHeadshotGeneratorCreateBodyStyle,
+    )
+    from .v1_ai_headshot_generator_generate_body_assets import (
+        V1AiHeadshotGeneratorGenerateBodyAssets,
+    )
+    from .v1_ai_image_editor_create_body import (
+        V1AiImageEditorCreateBody,
+        _SerializerV1AiImageEditorCreateBody,
+    )
+    from .v1_ai_image_editor_create_body_assets import (
+        V1AiImageEditorCreateBodyAssets,
+        _SerializerV1AiImageEditorCreateBodyAssets,
+    )
+    from .v1_ai_image_editor_create_body_style import (
+        V1AiImageEditorCreateBodyStyle,
+        _SerializerV1AiImageEditorCreateBodyStyle,
+    )
+    from .v1_ai_image_editor_generate_body_assets import (
+        V1AiImageEditorGenerateBodyAssets,
+    )
+    from .v1_ai_image_generator_create_body import (
+        V1AiImageGeneratorCreateBody,
+        _SerializerV1AiImageGeneratorCreateBody,
+    )
+    from .v1_ai_image_generator_create_body_style import (
+        V1AiImageGeneratorCreateBodyStyle,
+        _SerializerV1AiImageGeneratorCreateBodyStyle,
+    )
+    from .v1_ai_image_upscaler_create_body import (
+        V1AiImageUpscalerCreateBody,
+        _SerializerV1AiImageUpscalerCreateBody,
+    )
+    from .v1_ai_image_upscaler_create_body_assets import (
+        V1AiImageUpscalerCreateBodyAssets,
+        _SerializerV1AiImageUpscalerCreateBodyAssets,
+    )
+    from .v1_ai_image_upscaler_create_body_style import (
+        V1AiImageUpscalerCreateBodyStyle,
+        _SerializerV1AiImageUpscalerCreateBodyStyle,
+    )
+    from .v1_ai_image_upscaler_generate_body_assets import (
+        V1AiImageUpscalerGenerateBodyAssets,
+    )
+    from .v1_ai_meme_generator_create_body import (
+        V1AiMemeGeneratorCreateBody,
+        _SerializerV1AiMemeGeneratorCreateBody,
+    )
+    from .v1_ai_meme_generator_create_body_style import (
+        V1AiMemeGeneratorCreateBodyStyle,
+        _SerializerV1AiMemeGeneratorCreateBodyStyle,
+    )
+    from .v1_ai_photo_editor_generate_body_assets import (
+        V1AiPhotoEditorGenerateBodyAssets,
+    )
+    from .v1_ai_qr_code_generator_create_body import (
+        V1AiQrCodeGeneratorCreateBody,
+        _SerializerV1AiQrCodeGeneratorCreateBody,
+    )
+    from .v1_ai_qr_code_generator_create_body_style import (
+        V1AiQrCodeGeneratorCreateBodyStyle,
+        _SerializerV1AiQrCodeGeneratorCreateBodyStyle,
+    )
+    from .v1_ai_talking_photo_create_body import (
+        V1AiTalkingPhotoCreateBody,
+        _SerializerV1AiTalkingPhotoCreateBody,
+    )
+    from .v1_ai_talking_photo_create_body_assets import (
+        V1AiTalkingPhotoCreateBodyAssets,
+        _SerializerV1AiTalkingPhotoCreateBodyAssets,
+    )
+    from .v1_ai_talking_photo_create_body_style import (
+        V1AiTalkingPhotoCreateBodyStyle,
+        _SerializerV1AiTalkingPhotoCreateBodyStyle,
+    )
+    from .v1_ai_talking_photo_generate_body_assets import (
+        V1AiTalkingPhotoGenerateBodyAssets,
+    )
+    from .v1_ai_voice_cloner_create_body import (
+        V1AiVoiceClonerCreateBody,
+        _SerializerV1AiVoiceClonerCreateBody,
+    )
+    from .v1_ai_voice_cloner_create_body_assets import (
+        V1AiVoiceClonerCreateBodyAssets,
+        _SerializerV1AiVoiceClonerCreateBodyAssets,
+    )
+    from .v1_ai_voice_cloner_create_body_style import (
+        V1AiVoiceClonerCreateBodyStyle,
+        _SerializerV1AiVoiceClonerCreateBodyStyle,
+    )
+    from .v1_ai_voice_cloner_generate_body_assets import (
+        V1AiVoiceClonerGenerateBodyAssets,
+    )
+    from .v1_ai_voice_generator_create_body import (
+        V1AiVoiceGeneratorCreateBody,
+        _SerializerV1AiVoiceGeneratorCreateBody,
+    )
+    from .v1_ai_voice_generator_create_body_style import (
+        V1AiVoiceGeneratorCreateBodyStyle,
+        _SerializerV1AiVoiceGeneratorCreateBodyStyle,
+    )
+    from .v1_animation_create_body import (
+        V1AnimationCreateBody,
+        _SerializerV1AnimationCreateBody,
+    )
+    from .v1_animation_create_body_assets import (
+        V1AnimationCreateBodyAssets,
+        _SerializerV1AnimationCreateBodyAssets,
+    )
+    from .v1_animation_create_body_style import (
+        V1AnimationCreateBodyStyle,
+        _SerializerV1AnimationCreateBodyStyle,
+    )
+    from .v1_animation_generate_body_assets import V1AnimationGenerateBodyAssets
+    from .v1_auto_subtitle_generator_create_body import (
+        V1AutoSubtitleGeneratorCreateBody,
+        _SerializerV1AutoSubtitleGeneratorCreateBody,
+    )
+    from .v1_auto_subtitle_generator_create_body_assets import (
+        V1AutoSubtitleGeneratorCreateBodyAssets,
+        _SerializerV1AutoSubtitleGeneratorCreateBodyAssets,
+    )
+    from .v1_auto_subtitle_generator_create_body_style import (
+        V1AutoSubtitleGeneratorCreateBodyStyle,
+        _SerializerV1AutoSubtitleGeneratorCreateBodyStyle,
+    )
+    from .v1_auto_subtitle_generator_create_body_style_custom_config import (
+        V1AutoSubtitleGeneratorCreateBodyStyleCustomConfig,
+        _SerializerV1AutoSubtitleGeneratorCreateBodyStyleCustomConfig,
+    )
+    from .v1_auto_subtitle_generator_generate_body_assets import (
+        V1AutoSubtitleGeneratorGenerateBodyAssets,
+    )
+    from .v1_body_swap_create_body import (
+        V1BodySwapCreateBody,
+        _SerializerV1BodySwapCreateBody,
+    )
+    from .v1_body_swap_create_body_assets import (
+        V1BodySwapCreateBodyAssets,
+        _SerializerV1BodySwapCreateBodyAssets,
+    )
+    from .v1_face_detection_create_body import (
+        V1FaceDetectionCreateBody,
+        _SerializerV1FaceDetectionCreateBody,
+    )
+    from .v1_face_detection_create_body_assets import (
+        V1FaceDetectionCreateBodyAssets,
+        _SerializerV1FaceDetectionCreateBodyAssets,
+    )
+    from .v1_face_detection_generate_body_assets import (
+        V1FaceDetectionGenerateBodyAssets,
+    )
+    from .v1_face_swap_create_body import (
+        V1FaceSwapCreateBody,
+        _SerializerV1FaceSwapCreateBody,
+    )
+    from .v1_face_swap_create_body_assets import (
+        V1FaceSwapCreateBodyAssets,
+        _SerializerV1FaceSwapCreateBodyAssets,
+    )
+    from .v1_face_swap_create_body_assets_face_mappings_item import (
+        V1FaceSwapCreateBodyAssetsFaceMappingsItem,
+        _SerializerV1FaceSwapCreateBodyAssetsFaceMappingsItem,
+    )
+    from .v1_face_swap_create_body_style import (
+        V1FaceSwapCreateBodyStyle,
+        _SerializerV1FaceSwapCreateBodyStyle,
+    )
+    from .v1_face_swap_generate_body_assets import V1FaceSwapGenerateBodyAssets
+    from .v1_face_swap_generate_body_assets_face_mappings_item import (
+        V1FaceSwapGenerateBodyAssetsFaceMappingsItem,
+    )
+    from .v1_face_swap_photo_create_body import (
+        V1FaceSwapPhotoCreateBody,
+        _SerializerV1FaceSwapPhotoCreateBody,
+    )
+    from .v1_face_swap_photo_create_body_assets import (
+        V1FaceSwapPhotoCreateBodyAssets,
+        _SerializerV1FaceSwapPhotoCreateBodyAssets,
+    )
+    from .v1_face_swap_photo_create_body_assets_face_mappings_item import (
+        V1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem,
+        _SerializerV1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem,
+    )
+    from .v1_face_swap_photo_generate_body_assets import (
+        V1FaceSwapPhotoGenerateBodyAssets,
+    )
+    from .v1_face_swap_photo_generate_body_assets_face_mappings_item import (
+        V1FaceSwapPhotoGenerateBodyAssetsFaceMappingsItem,
+    )
+    from .v1_files_upload_urls_create_body import (
+        V1FilesUploadUrlsCreateBody,
+        _SerializerV1FilesUploadUrlsCreateBody,
+    )
+    from .v1_files_upload_urls_create_body_items_item import (
+        V1FilesUploadUrlsCreateBodyItemsItem,
+        _SerializerV1FilesUploadUrlsCreateBodyItemsItem,
+    )
+    from .v1_head_swap_create_body import (
+        V1HeadSwapCreateBody,
+        _SerializerV1HeadSwapCreateBody,
+    )
+    from .v1_head_swap_create_body_assets import (
+        V1HeadSwapCreateBodyAssets,
+        _SerializerV1HeadSwapCreateBodyAssets,
+    )
+    from .v1_head_swap_generate_body_assets import V1HeadSwapGenerateBodyAssets
+    from .v1_image_background_remover_create_body import (
+        V1ImageBackgroundRemoverCreateBody,
+        _SerializerV1ImageBackgroundRemoverCreateBody,
+    )
+    from .v1_image_background_remover_create_body_assets import (
+        V1ImageBackgroundRemoverCreateBodyAssets,
+        _SerializerV1ImageBackgroundRemoverCreateBodyAssets,
+    )
+    from .v1_image_background_remover_generate_body_assets import (
+        V1ImageBackgroundRemoverGenerateBodyAssets,
+    )
+    from .v1_image_to_video_create_body import (
+        V1ImageToVideoCreateBody,
+        _SerializerV1ImageToVideoCreateBody,
+    )
+    from .v1_image_to_video_create_body_assets import (
+        V1ImageToVideoCreateBodyAssets,
+        _SerializerV1ImageToVideoCreateBodyAssets,
+    )
+    from .v1_image_to_video_create_body_style import (
+        V1ImageToVideoCreateBodyStyle,
+        _SerializerV1ImageToVideoCreateBodyStyle,
+    )
+    from .v1_image_to_video_generate_body_assets import V1ImageToVideoGenerateBodyAssets
+    from .v1_lip_sync_create_body import (
+        V1LipSyncCreateBody,
+        _SerializerV1LipSyncCreateBody,
+    )
+    from .v1_lip_sync_create_body_assets import (
+        V1LipSyncCreateBodyAssets,
+        _SerializerV1LipSyncCreateBodyAssets,
+    )
+    from .v1_lip_sync_create_body_style import (
+        V1LipSyncCreateBodyStyle,
+        _SerializerV1LipSyncCreateBodyStyle,
+    )
+    from .v1_lip_sync_generate_body_assets import V1LipSyncGenerateBodyAssets
+    from .v1_photo_colorizer_create_body import (
+        V1PhotoColorizerCreateBody,
+        _SerializerV1PhotoColorizerCreateBody,
+    )
+    from .v1_photo_colorizer_create_body_assets import (
+        V1PhotoColorizerCreateBodyAssets,
+        _SerializerV1PhotoColorizerCreateBodyAssets,
+    )
+    from .v1_photo_colorizer_generate_body_assets import (
+        V1PhotoColorizerGenerateBodyAssets,
+    )
+    from .v1_text_to_video_create_body import (
+        V1TextToVideoCreateBody,
+        _SerializerV1TextToVideoCreateBody,
+    )
+    from .v1_text_to_video_create_body_style import (
+        V1TextToVideoCreateBodyStyle,
+        _SerializerV1TextToVideoCreateBodyStyle,
+    )
+    from .v1_video_to_video_create_body import (
+        V1VideoToVideoCreateBody,
+        _SerializerV1VideoToVideoCreateBody,
+    )
+    from .v1_video_to_video_create_body_assets import (
+        V1VideoToVideoCreateBodyAssets,
+        _SerializerV1VideoToVideoCreateBodyAssets,
+    )
+    from .v1_video_to_video_create_body_style import (
+        V1VideoToVideoCreateBodyStyle,
+        _SerializerV1VideoToVideoCreateBodyStyle,
+    )
+    from .v1_video_to_video_generate_body_assets import V1VideoToVideoGenerateBodyAssets
+
+
+# Exported names are resolved on first access so that importing the SDK does not
+# import (and build pydantic schemas for) every model up front.
+_LAZY_EXPORTS: typing.Dict[str, str] = {
+    "V1AiClothesChangerCreateBody": ".v1_ai_clothes_changer_create_body",
+    "V1AiClothesChangerCreateBodyAssets": ".v1_ai_clothes_changer_create_body_assets",
+    "V1AiClothesChangerGenerateBodyAssets": ".v1_ai_clothes_changer_generate_body_assets",
+    "V1AiFaceEditorCreateBody": ".v1_ai_face_editor_create_body",
+    "V1AiFaceEditorCreateBodyAssets": ".v1_ai_face_editor_create_body_assets",
+    "V1AiFaceEditorCreateBodyStyle": ".v1_ai_face_editor_create_body_style",
+    "V1AiFaceEditorGenerateBodyAssets": ".v1_ai_face_editor_generate_body_assets",
+    "V1AiGifGeneratorCreateBody": ".v1_ai_gif_generator_create_body",
+    "V1AiGifGeneratorCreateBodyStyle": ".v1_ai_gif_generator_create_body_style",
+    "V1AiHeadshotGeneratorCreateBody": ".v1_ai_headshot_generator_create_body",
+    "V1AiHeadshotGeneratorCreateBodyAssets": ".v1_ai_headshot_generator_create_body_assets",
+    "V1AiHeadshotGeneratorCreateBodyStyle": ".v1_ai_headshot_generator_create_body_style",
+    "V1AiHeadshotGeneratorGenerateBodyAssets": ".v1_ai_headshot_generator_generate_body_assets",
+    "V1AiImageEditorCreateBody": ".v1_ai_image_editor_create_body",
+    "V1AiImageEditorCreateBodyAssets": ".v1_ai_image_editor_create_body_assets",
+    "V1AiImageEditorCreateBodyStyle": ".v1_ai_image_editor_create_body_style",
+    "V1AiImageEditorGenerateBodyAssets": ".v1_ai_image_editor_generate_body_assets",
+    "V1AiImageGeneratorCreateBody": ".v1_ai_image_generator_create_body",
+    "V1AiImageGeneratorCreateBodyStyle": ".v1_ai_image_generator_create_body_style",
+    "V1AiImageUpscalerCreateBody": ".v1_ai_image_upscaler_create_body",
+    "V1AiImageUpscalerCreateBodyAssets": ".v1_ai_image_upscaler_create_body_assets",
+    "V1AiImageUpscalerCreateBodyStyle": ".v1_ai_image_upscaler_create_body_style",
+    "V1AiImageUpscalerGenerateBodyAssets": ".v1_ai_image_upscaler_generate_body_assets",
+    "V1AiMemeGeneratorCreateBody": ".v1_ai_meme_generator_create_body",
+    "V1AiMemeGeneratorCreateBodyStyle": ".v1_ai_meme_generator_create_body_style",
+    "V1AiPhotoEditorGenerateBodyAssets": ".v1_ai_photo_editor_generate_body_assets",
+    "V1AiQrCodeGeneratorCreateBody": ".v1_ai_qr_code_generator_create_body",
+    "V1AiQrCodeGeneratorCreateBodyStyle": ".v1_ai_qr_code_generator_create_body_style",
+    "V1AiTalkingPhotoCreateBody": ".v1_ai_talking_photo_create_body",
+    "V1AiTalkingPhotoCreateBodyAssets": ".v1_ai_talking_photo_create_body_assets",
+    "V1AiTalkingPhotoCreateBodyStyle": ".v1_ai_talking_photo_create_body_style",
+    "V1AiTalkingPhotoGenerateBodyAssets": ".v1_ai_talking_photo_generate_body_assets",
+    "V1AiVoiceClonerCreateBody": ".v1_ai_voice_cloner_create_body",
+    "V1AiVoiceClonerCreateBodyAssets": ".v1_ai_voice_cloner_create_body_assets",
+    "V1AiVoiceClonerCreateBodyStyle": ".v1_ai_voice_cloner_create_body_style",
+    "V1AiVoiceClonerGenerateBodyAssets": ".v1_ai_voice_cloner_generate_body_assets",
+    "V1AiVoiceGeneratorCreateBody": ".v1_ai_voice_generator_create_body",
+    "V1AiVoiceGeneratorCreateBodyStyle": ".v1_ai_voice_generator_create_body_style",
+    "V1AnimationCreateBody": ".v1_animation_create_body",
+    "V1AnimationCreateBodyAssets": ".v1_animation_create_body_assets",
+    "V1AnimationCreateBodyStyle": ".v1_animation_create_body_style",
+    "V1AnimationGenerateBodyAssets": ".v1_animation_generate_body_assets",
+    "V1AutoSubtitleGeneratorCreateBody": ".v1_auto_subtitle_generator_create_body",
+    "V1AutoSubtitleGeneratorCreateBodyAssets": ".v1_auto_subtitle_generator_create_body_assets",
+    "V1AutoSubtitleGeneratorCreateBodyStyle": ".v1_auto_subtitle_generator_create_body_style",
+    "V1AutoSubtitleGeneratorCreateBodyStyleCustomConfig": ".v1_auto_subtitle_generator_create_body_style_custom_config",
+    "V1AutoSubtitleGeneratorGenerateBodyAssets": ".v1_auto_subtitle_generator_generate_body_assets",
+    "V1BodySwapCreateBody": ".v1_body_swap_create_body",
+    "V1BodySwapCreateBodyAssets": ".v1_body_swap_create_body_assets",
+    "V1FaceDetectionCreateBody": ".v1_face_detection_create_body",
+    "V1FaceDetectionCreateBodyAssets": ".v1_face_detection_create_body_assets",
+    "V1FaceDetectionGenerateBodyAssets": ".v1_face_detection_generate_body_assets",
+    "V1FaceSwapCreateBody": ".v1_face_swap_create_body",
+    "V1FaceSwapCreateBodyAssets": ".v1_face_swap_create_body_assets",
+    "V1FaceSwapCreateBodyAssetsFaceMappingsItem": ".v1_face_swap_create_body_assets_face_mappings_item",
+    "V1FaceSwapCreateBodyStyle": ".v1_face_swap_create_body_style",
+    "V1FaceSwapGenerateBodyAssets": ".v1_face_swap_generate_body_assets",
+    "V1FaceSwapGenerateBodyAssetsFaceMappingsItem": ".v1_face_swap_generate_body_assets_face_mappings_item",
+    "V1FaceSwapPhotoCreateBody": ".v1_face_swap_photo_create_body",
+    "V1FaceSwapPhotoCreateBodyAssets": ".v1_face_swap_photo_create_body_assets",
+    "V1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem": ".v1_face_swap_photo_create_body_assets_face_mappings_item",
+    "V1FaceSwapPhotoGenerateBodyAssets": ".v1_face_swap_photo_generate_body_assets",
+    "V1FaceSwapPhotoGenerateBodyAssetsFaceMappingsItem": ".v1_face_swap_photo_generate_body_assets_face_mappings_item",
+    "V1FilesUploadUrlsCreateBody": ".v1_files_upload_urls_create_body",
+    "V1FilesUploadUrlsCreateBodyItemsItem": ".v1_files_upload_urls_create_body_items_item",
+    "V1HeadSwapCreateBody": ".v1_head_swap_create_body",
+    "V1HeadSwapCreateBodyAssets": ".v1_head_swap_create_body_assets",
+    "V1HeadSwapGenerateBodyAssets": ".v1_head_swap_generate_body_assets",
+    "V1ImageBackgroundRemoverCreateBody": ".v1_image_background_remover_create_body",
+    "V1ImageBackgroundRemoverCreateBodyAssets": ".v1_image_background_remover_create_body_assets",
+    "V1ImageBackgroundRemoverGenerateBodyAssets": ".v1_image_background_remover_generate_body_assets",
+    "V1ImageToVideoCreateBody": ".v1_image_to_video_create_body",
+    "V1ImageToVideoCreateBodyAssets": ".v1_image_to_video_create_body_assets",
+    "V1ImageToVideoCreateBodyStyle": ".v1_image_to_video_create_body_style",
+    "V1ImageToVideoGenerateBodyAssets": ".v1_image_to_video_generate_body_assets",
+    "V1LipSyncCreateBody": ".v1_lip_sync_create_body",
+    "V1LipSyncCreateBodyAssets": ".v1_lip_sync_create_body_assets",
+    "V1LipSyncCreateBodyStyle": ".v1_lip_sync_create_body_style",
+    "V1LipSyncGenerateBodyAssets": ".v1_lip_sync_generate_body_assets",
+    "V1PhotoColorizerCreateBody": ".v1_photo_colorizer_create_body",
+    "V1PhotoColorizerCreateBodyAssets": ".v1_photo_colorizer_create_body_assets",
+    "V1PhotoColorizerGenerateBodyAssets": ".v1_photo_colorizer_generate_body_assets",
+    "V1TextToVideoCreateBody": ".v1_text_to_video_create_body",
+    "V1TextToVideoCreateBodyStyle": ".v1_text_to_video_create_body_style",
+    "V1VideoToVideoCreateBody": ".v1_video_to_video_create_body",
+    "V1VideoToVideoCreateBodyAssets": ".v1_video_to_video_create_body_assets",
+    "V1VideoToVideoCreateBodyStyle": ".v1_video_to_video_create_body_style",
+    "V1VideoToVideoGenerateBodyAssets": ".v1_video_to_video_generate_body_assets",
+    "_SerializerV1AiClothesChangerCreateBody": ".v1_ai_clothes_changer_create_body",
+    "_SerializerV1AiClothesChangerCreateBodyAssets": ".v1_ai_clothes_changer_create_body_assets",
+    "_SerializerV1AiFaceEditorCreateBody": ".v1_ai_face_editor_create_body",
+    "_SerializerV1AiFaceEditorCreateBodyAssets": ".v1_ai_face_editor_create_body_assets",
+    "_SerializerV1AiFaceEditorCreateBodyStyle": ".v1_ai_face_editor_create_body_style",
+    "_SerializerV1AiGifGeneratorCreateBody": ".v1_ai_gif_generator_create_body",
+    "_SerializerV1AiGifGeneratorCreateBodyStyle": ".v1_ai_gif_generator_create_body_style",
+    "_SerializerV1AiHeadshotGeneratorCreateBody": ".v1_ai_headshot_generator_create_body",
+    "_SerializerV1AiHeadshotGeneratorCreateBodyAssets": ".v1_ai_headshot_generator_create_body_assets",
+    "_SerializerV1AiHeadshotGeneratorCreateBodyStyle": ".v1_ai_headshot_generator_create_body_style",
+    "_SerializerV1AiImageEditorCreateBody": ".v1_ai_image_editor_create_body",
+    "_SerializerV1AiImageEditorCreateBodyAssets": ".v1_ai_image_editor_create_body_assets",
+    "_SerializerV1AiImageEditorCreateBodyStyle": ".v1_ai_image_editor_create_body_style",
+    "_SerializerV1AiImageGeneratorCreateBody": ".v1_ai_image_generator_create_body",
+    "_SerializerV1AiImageGeneratorCreateBodyStyle": ".v1_ai_image_generator_create_body_style",
+    "_SerializerV1AiImageUpscalerCreateBody": ".v1_ai_image_upscaler_create_body",
+    "_SerializerV1AiImageUpscalerCreateBodyAssets": ".v1_ai_image_upscaler_create_body_assets",
+    "_SerializerV1AiImageUpscalerCreateBodyStyle": ".v1_ai_image_upscaler_create_body_style",
+    "_SerializerV1AiMemeGeneratorCreateBody": ".v1_ai_meme_generator_create_body",
+    "_SerializerV1AiMemeGeneratorCreateBodyStyle": ".v1_ai_meme_generator_create_body_style",
+    "_SerializerV1AiQrCodeGeneratorCreateBody": ".v1_ai_qr_code_generator_create_body",
+    "_SerializerV1AiQrCodeGeneratorCreateBodyStyle": ".v1_ai_qr_code_generator_create_body_style",
+    "_SerializerV1AiTalkingPhotoCreateBody": ".v1_ai_talking_photo_create_body",
+    "_SerializerV1AiTalkingPhotoCreateBodyAssets": ".v1_ai_talking_photo_create_body_assets",
+    "_SerializerV1AiTalkingPhotoCreateBodyStyle": ".v1_ai_talking_photo_create_body_style",
+    "_SerializerV1AiVoiceClonerCreateBody": ".v1_ai_voice_cloner_create_body",
+    "_SerializerV1AiVoiceClonerCreateBodyAssets": ".v1_ai_voice_cloner_create_body_assets",
+    "_SerializerV1AiVoiceClonerCreateBodyStyle": ".v1_ai_voice_cloner_create_body_style",
+    "_SerializerV1AiVoiceGeneratorCreateBody": ".v1_ai_voice_generator_create_body",
+    "_SerializerV1AiVoiceGeneratorCreateBodyStyle": ".v1_ai_voice_generator_create_body_style",
+    "_SerializerV1AnimationCreateBody": ".v1_animation_create_body",
+    "_SerializerV1AnimationCreateBodyAssets": ".v1_animation_create_body_assets",
+    "_SerializerV1AnimationCreateBodyStyle": ".v1_animation_create_body_style",
+    "_SerializerV1AutoSubtitleGeneratorCreateBody": ".v1_auto_subtitle_generator_create_body",
+    "_SerializerV1AutoSubtitleGeneratorCreateBodyAssets": ".v1_auto_subtitle_generator_create_body_assets",
+    "_SerializerV1AutoSubtitleGeneratorCreateBodyStyle": ".v1_auto_subtitle_generator_create_body_style",
+    "_SerializerV1AutoSubtitleGeneratorCreateBodyStyleCustomConfig": ".v1_auto_subtitle_generator_create_body_style_custom_config",
+    "_SerializerV1BodySwapCreateBody": ".v1_body_swap_create_body",
+    "_SerializerV1BodySwapCreateBodyAssets": ".v1_body_swap_create_body_assets",
+    "_SerializerV1FaceDetectionCreateBody": ".v1_face_detection_create_body",
+    "_SerializerV1FaceDetectionCreateBodyAssets": ".v1_face_detection_create_body_assets",
+    "_SerializerV1FaceSwapCreateBody": ".v1_face_swap_create_body",
+    "_SerializerV1FaceSwapCreateBodyAssets": ".v1_face_swap_create_body_assets",
+    "_SerializerV1FaceSwapCreateBodyAssetsFaceMappingsItem": ".v1_face_swap_create_body_assets_face_mappings_item",
+    "_SerializerV1FaceSwapCreateBodyStyle": ".v1_face_swap_create_body_style",
+    "_SerializerV1FaceSwapPhotoCreateBody": ".v1_face_swap_photo_create_body",
+    "_SerializerV1FaceSwapPhotoCreateBodyAssets": ".v1_face_swap_photo_create_body_assets",
+    "_SerializerV1FaceSwapPhotoCreateBodyAssetsFaceMappingsItem": ".v1_face_swap_photo_create_body_assets_face_mappings_item",
+    "_SerializerV1FilesUploadUrlsCreateBody": ".v1_files_upload_urls_create_body",
+    "_SerializerV1FilesUploadUrlsCreateBodyItemsItem": ".v1_files_upload_urls_create_body_items_item",
+    "_SerializerV1HeadSwapCreateBody": ".v1_head_swap_create_body",
+    "_SerializerV1HeadSwapCreateBodyAssets": ".v1_head_swap_create_body_assets",
+    "_SerializerV1ImageBackgroundRemoverCreateBody": ".v1_image_background_remover_create_body",
+    "_SerializerV1ImageBackgroundRemoverCreateBodyAssets": ".v1_image_background_remover_create_body_assets",
+    "_SerializerV1ImageToVideoCreateBody": ".v1_image_to_video_create_body",
+    "_SerializerV1ImageToVideoCreateBodyAssets": ".v1_image_to_video_create_body_assets",
+    "_SerializerV1ImageToVideoCreateBodyStyle": ".v1_image_to_video_create_body_style",
+    "_SerializerV1LipSyncCreateBody": ".v1_lip_sync_create_body",
+    "_SerializerV1LipSyncCreateBodyAssets": ".v1_lip_sync_create_body_assets",
+    "_SerializerV1LipSyncCreateBodyStyle": ".v1_lip_sync_create_body_style",
+    "_SerializerV1PhotoColorizerCreateBody": ".v1_photo_colorizer_create_body",
+    "_SerializerV1PhotoColorizerCreateBodyAssets": ".v1_photo_colorizer_create_body_assets",
+    "_SerializerV1TextToVideoCreateBody": ".v1_text_to_video_create_body",
+    "_SerializerV1TextToVideoCreateBodyStyle": ".v1_text_to_video_create_body_style",
+    "_SerializerV1VideoToVideoCreateBody": ".v1_video_to_video_create_body",
+    "_SerializerV1VideoToVideoCreateBodyAssets": ".v1_video_to_video_create_body_assets",
+    "_SerializerV1VideoToVideoCreateBodyStyle": ".v1_video_to_video_create_body_style",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 __all__ = [